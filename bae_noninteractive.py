@@ -3,19 +3,78 @@
 BAE Non-Interactive CLI - For Automated Testing/Benchmarking
 Purpose: Execute single BAE requests without interactive prompts
 Returns: JSON output for programmatic consumption
+
+If a kernel daemon is running (python -m baes.core.kernel_daemon), requests are
+forwarded to it over its Unix socket so the warm kernel is reused; otherwise the
+kernel is built in-process as before.
 """
 
 import argparse
 import json
 import logging
 import os
+import socket
 import sys
 from pathlib import Path
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from bae_chat import BAEConversationalCLI
+DEFAULT_DAEMON_SOCKET = os.getenv("BAE_DAEMON_SOCKET", "/tmp/baes_kernel.sock")  # nosec B108
+
+# Progress categories worth showing to the user (LLM calls and I/O are too chatty)
+PROGRESS_CATEGORIES = {"recognition", "interpretation", "swea", "review", "retry", "server"}
+
+
+def run_via_daemon(args):
+    """
+    Send the request to a running kernel daemon and stream its progress events.
+
+    Returns:
+        The kernel result dict, or None if no compatible daemon is reachable.
+    """
+    socket_path = args.daemon_socket
+    if args.no_daemon or not socket_path or not os.path.exists(socket_path):
+        return None
+
+    message = {
+        "action": "process",
+        "request": args.request,
+        "start_servers": args.start_servers,
+        "context_store": str(Path(args.context_store).resolve()),
+    }
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    except OSError:
+        return None
+
+    with sock, sock.makefile("rwb") as stream:
+        stream.write((json.dumps(message) + "\n").encode("utf-8"))
+        stream.flush()
+        for line in stream:
+            event = json.loads(line.decode("utf-8"))
+            kind = event.get("event")
+            if kind == "result":
+                return event.get("result", {})
+            if kind == "error":
+                if event.get("error") == "CONTEXT_STORE_MISMATCH":
+                    if not args.quiet:
+                        print(f"⚠️  {event.get('message')} - running in-process")
+                    return None
+                return {"success": False, "error": event.get("error"), "message": event.get("message")}
+            if args.quiet:
+                continue
+            if kind == "accepted":
+                print(f"🔗 Kernel daemon accepted job {event.get('job_id')}")
+            elif kind == "progress" and event.get("category") in PROGRESS_CATEGORIES:
+                if event.get("phase") == "start":
+                    print(f"   ▶️  {event.get('name')}")
+                else:
+                    status = "❌" if event.get("error") else "✅"
+                    print(f"   {status} {event.get('name')} ({event.get('duration_ms', 0):.0f}ms)")
+
+    return {"success": False, "error": "DAEMON_CONNECTION_CLOSED"}
 
 
 def main():
@@ -34,6 +93,14 @@ def main():
         "--quiet", action="store_true", help="Suppress progress messages (only output final result)"
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--daemon-socket",
+        default=DEFAULT_DAEMON_SOCKET,
+        help="Kernel daemon socket to use when a daemon is running",
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="Always build the kernel in-process"
+    )
 
     args = parser.parse_args()
 
@@ -55,46 +122,58 @@ def main():
         context_store_path = Path(args.context_store)
         context_store_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize CLI with custom context store path
-        cli = BAEConversationalCLI(context_store_path=str(context_store_path))
-
-        # Check if servers should be started
-        if args.start_servers:
-            server_status = cli.check_servers_running()
-            if not server_status["both_running"]:
-                if not args.quiet:
-                    print("🚀 Starting servers...")
-                # Start servers will happen during first request processing
-
-        # Process the request
         if not args.quiet:
             print(f"📝 Processing request: {args.request}")
 
-        # Execute request through kernel
-        result = cli.kernel.process_natural_language_request(
-            request=args.request, start_servers=args.start_servers
-        )
+        # Fast path: reuse the warm kernel of a running daemon
+        result = run_via_daemon(args)
+        if result is not None:
+            system_state = {
+                "entities": result.get("entities", []),
+                "servers_running": bool(args.start_servers and result.get("servers_started")),
+            }
+        else:
+            # Imported lazily so the daemon client path stays lightweight
+            from bae_chat import BAEConversationalCLI
+
+            # Initialize CLI with custom context store path
+            cli = BAEConversationalCLI(context_store_path=str(context_store_path))
+
+            # Check if servers should be started
+            if args.start_servers:
+                server_status = cli.check_servers_running()
+                if not server_status["both_running"]:
+                    if not args.quiet:
+                        print("🚀 Starting servers...")
+                    # Start servers will happen during first request processing
+
+            # Execute request through kernel
+            result = cli.kernel.process_natural_language_request(
+                request=args.request, start_servers=args.start_servers
+            )
+
+            # Update CLI state
+            if result.get("success"):
+                # Update entity list if new entities were added
+                if "entities" in result:
+                    cli.current_system_state["entities"] = result["entities"]
 
-        # Update CLI state
-        if result.get("success"):
-            # Update entity list if new entities were added
-            if "entities" in result:
-                cli.current_system_state["entities"] = result["entities"]
+                if args.start_servers and result.get("servers_started"):
+                    cli.current_system_state["servers_running"] = True
 
-            if args.start_servers and result.get("servers_started"):
-                cli.current_system_state["servers_running"] = True
+            system_state = {
+                "entities": cli.current_system_state.get("entities", []),
+                "servers_running": cli.current_system_state.get("servers_running", False),
+            }
 
         # Output result
         if args.output_json:
             output = {
                 "success": result.get("success", False),
                 "result": result,
-                "system_state": {
-                    "entities": cli.current_system_state.get("entities", []),
-                    "servers_running": cli.current_system_state.get("servers_running", False),
-                },
+                "system_state": system_state,
             }
-            print(json.dumps(output, indent=2))
+            print(json.dumps(output, indent=2, default=str))
         else:
             if result.get("success"):
                 print(f"✅ Request completed successfully")
@@ -1,11 +1,17 @@
 import json
 import logging
 import os
+import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from baes.core.request_context import KeyedLocks
+
 logger = logging.getLogger(__name__)
 
+# One lock per store file, shared by all ContextStore instances in the process
+_STORE_LOCKS = KeyedLocks()
+
 
 class ContextStore:
     """
@@ -557,29 +563,42 @@ class ContextStore:
         return max(ctx.get("version", 0) for ctx in contexts) + 1
 
     def _save_to_storage(self):
-        """Save context store to persistent storage"""
-        try:
-            # Convert agent_memories to legacy test format for compatibility
-            agents_format = {}
-            for agent_name, agent_data in self.agent_memories.items():
-                agents_format[agent_name] = {"memory": agent_data.get("memory_data", {})}
+        """
+        Save context store to persistent storage
 
-            store_data = {
-                "domain_contexts": self.domain_contexts,
-                "agent_memories": self.agent_memories,
-                "agents": agents_format,  # Legacy format for tests
-                "business_vocabularies": self.business_vocabularies,
-                "entity_relationships": self.entity_relationships,
-                "evolution_history": self.evolution_history,
-                "domain_knowledge": self.domain_knowledge,
-                "last_saved": datetime.now().isoformat(),
-            }
+        Concurrent requests share the store: saves are serialized by the file's lock
+        and written to a temporary sibling that replaces the file atomically.
+        """
+        tmp_path = None
+        try:
+            with _STORE_LOCKS.hold(os.path.abspath(self.storage_path)):
+                # Convert agent_memories to legacy test format for compatibility
+                agents_format = {}
+                for agent_name, agent_data in self.agent_memories.items():
+                    agents_format[agent_name] = {"memory": agent_data.get("memory_data", {})}
+
+                store_data = {
+                    "domain_contexts": self.domain_contexts,
+                    "agent_memories": self.agent_memories,
+                    "agents": agents_format,  # Legacy format for tests
+                    "business_vocabularies": self.business_vocabularies,
+                    "entity_relationships": self.entity_relationships,
+                    "evolution_history": self.evolution_history,
+                    "domain_knowledge": self.domain_knowledge,
+                    "last_saved": datetime.now().isoformat(),
+                }
 
-            with open(self.storage_path, "w") as f:
-                json.dump(store_data, f, indent=2)
+                directory, name = os.path.split(self.storage_path)
+                tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(store_data, f, indent=2)
+                os.replace(tmp_path, self.storage_path)
 
         except Exception as e:
             logger.error(f"Failed to save context store: {str(e)}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _load_from_storage(self):
         """Load context store from persistent storage"""
@@ -1,28 +1,42 @@
 import argparse
 import asyncio
+import contextlib
+import contextvars
 import importlib
 import logging
 import os
 import subprocess  # nosec B404
 import sys
+import threading
 import time
-from collections import defaultdict, deque
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from dotenv import load_dotenv
 
 from baes.core.bae_registry import EnhancedBAERegistry
 from baes.core.context_store import ContextStore
 from baes.core.entity_recognizer import EntityRecognizer
-from baes.core.managed_system_manager import ManagedSystemManager
+from baes.core.managed_system_manager import ManagedSystemManager, write_text_locked
+from baes.core.request_context import (
+    KeyedLocks,
+    RequestContext,
+    current_request_context,
+    request_scope,
+)
 from baes.swea_agents.backend_swea import BackendSWEA
 from baes.swea_agents.database_swea import DatabaseSWEA
 from baes.swea_agents.frontend_swea import FrontendSWEA
 from baes.swea_agents.techlead_swea import TechLeadSWEA
 from baes.swea_agents.test_swea import TestSWEA
+from baes.utils.diff_repair import repair_with_diff, should_repair_with_diff
+from baes.utils.execution_trace import ExecutionTrace, span, start_trace
 from baes.utils.optimization_metrics import (
     PerformanceMetrics,
     log_performance_metrics,
@@ -32,6 +46,8 @@ from baes.utils.presentation_logger import (
     get_presentation_logger,
     is_debug_mode,
 )
+from baes.utils.review_batching import defer_llm_review
+from baes.utils.speculative_execution import run_speculative
 from config import Config
 from config import Config
 
@@ -158,6 +174,112 @@ class TaskDependencyGraph:
         return True
 
 
+@dataclass
+class PipelinedTask:
+    """
+    A coordination task started while TechLeadSWEA reviews an upstream task.
+
+    Attributes:
+        task_index: Position of the task in the coordination plan
+        task_name: "<SWEA>.<task_type>" name of the task
+        dependencies: Plan indexes of the tasks whose artifacts this task consumes
+        future: Future of the task's first SWEA call
+        optimistic: True if started before a dependency was approved
+        stale: Set when a dependency was rejected after the task started
+    """
+    task_index: int
+    task_name: str
+    dependencies: Set[int]
+    future: Future
+    optimistic: bool = False
+    stale: bool = False
+
+
+class ReviewPipeline:
+    """
+    Overlaps TechLeadSWEA reviews with the generation of the next coordination task.
+
+    At most one task runs ahead of the review loop. Its result is consumed as the
+    first attempt of that task, unless a review rejected one of its dependencies in
+    the meantime, in which case the result is discarded and the task re-queued.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.approved: Set[int] = set()
+        self._pending: Dict[int, PipelinedTask] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(
+        self,
+        task_index: int,
+        task_name: str,
+        dependencies: Set[int],
+        optimistic: bool,
+        fn,
+        *args,
+    ) -> PipelinedTask:
+        """Start ``fn(*args)`` in the background for the task at ``task_index``."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="baes-pipeline")
+        # Run in a copy of the caller's context so spans and request state follow the task
+        future = self._executor.submit(contextvars.copy_context().run, fn, *args)
+        pipelined = PipelinedTask(task_index, task_name, dependencies, future, optimistic)
+        self._pending[task_index] = pipelined
+        return pipelined
+
+    def is_pending(self, task_index: int) -> bool:
+        """Whether the task at ``task_index`` has already been started."""
+        return task_index in self._pending
+
+    def reject(self, task_index: int) -> List[PipelinedTask]:
+        """Mark pipelined tasks depending on a rejected task as stale."""
+        invalidated = []
+        for pipelined in self._pending.values():
+            if task_index in pipelined.dependencies and not pipelined.stale:
+                pipelined.stale = True
+                invalidated.append(pipelined)
+        return invalidated
+
+    def take(self, task_index: int) -> Optional[PipelinedTask]:
+        """Remove and return the pipelined task at ``task_index`` once it has finished."""
+        pipelined = self._pending.pop(task_index, None)
+        if pipelined is not None:
+            wait_futures([pipelined.future])
+        return pipelined
+
+    def close(self) -> None:
+        """Wait for in-flight tasks so no artifact is written after the plan finishes."""
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+@dataclass
+class DeferredReview:
+    """
+    A task whose TechLeadSWEA LLM validation waits for the batched review.
+
+    Only tasks whose artifact no later plan task consumes are deferred. A batch
+    rejection re-runs the task through the regular retry loop from this state.
+
+    Attributes:
+        task_index: Position of the task in the coordination plan
+        position: Index of the task's provisional entry in the plan results
+        payload: SWEA payload of the reviewed attempt
+        retry_count: Retry count of the reviewed attempt
+        review_payload: review_and_approve payload of the reviewed attempt
+        review: Batched review verdict, set once the batch has been reviewed
+    """
+    task_index: int
+    position: int
+    payload: Dict[str, Any]
+    retry_count: int
+    review_payload: Dict[str, Any]
+    review: Dict[str, Any] = field(default_factory=dict)
+
+
 class UnknownSWEAAgentError(Exception):
     """Raised when an unknown SWEA agent is requested in coordination plan"""
 
@@ -230,67 +352,111 @@ class EnhancedRuntimeKernel:
         self._test_swea = None
         self._techlead_swea = None
 
-        self.execution_history = []
+        # Kernel-wide state: aggregate of completed requests (history, Phase 3 retry
+        # patterns and failure analytics, metrics of the last request). While a request
+        # is running, the properties below resolve to that request's own RequestContext.
+        self._kernel_state = RequestContext(request_id="kernel", owner=self)
+        self._state_lock = threading.Lock()
 
-        # Performance optimization metrics (Feature 001-performance-optimization)
-        # Initialize metrics collection for each generation request
-        self.current_metrics: PerformanceMetrics = None
+        # Lazy SWEA construction may race when requests run concurrently
+        self._init_lock = threading.RLock()
 
-        # Phase 3: Retry pattern monitoring and prevention
-        self.retry_patterns = defaultdict(
-            lambda: {"count": 0, "last_errors": deque(maxlen=5), "timestamps": deque(maxlen=10)}
-        )
-        self.failure_analytics = {
-            "common_failures": defaultdict(int),
-            "recovery_strategies": defaultdict(int),
-            "success_after_retry": defaultdict(int),
-        }
+        # Requests for the same entity are serialized; different entities run in parallel
+        self.entity_locks = KeyedLocks()
+
+        # Execution trace of the most recent request (None when tracing is disabled)
+        self.last_trace: Optional[ExecutionTrace] = None
 
         logger.debug(
             "Enhanced Runtime Kernel initialized with %d BAEs",
             len(self.bae_registry.get_supported_entities()),
         )
 
+    # ========================================================================
+    # Request-scoped state
+    # ========================================================================
+
+    @property
+    def _state(self) -> RequestContext:
+        """State of the active request, or the kernel-wide aggregate outside a request."""
+        return current_request_context(owner=self) or self._kernel_state
+
+    @property
+    def current_metrics(self) -> Optional[PerformanceMetrics]:
+        """Performance metrics of the active request (last completed request otherwise)"""
+        return self._state.metrics
+
+    @current_metrics.setter
+    def current_metrics(self, metrics: Optional[PerformanceMetrics]) -> None:
+        self._state.metrics = metrics
+
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        """Execution history of the active request (all completed requests otherwise)"""
+        return self._state.execution_history
+
+    @property
+    def retry_patterns(self):
+        """Phase 3 retry patterns of the active request (aggregate otherwise)"""
+        return self._state.retry_patterns
+
+    @property
+    def failure_analytics(self) -> Dict[str, Any]:
+        """Phase 3 failure analytics of the active request (aggregate otherwise)"""
+        return self._state.failure_analytics
+
     @property
     def managed_system_manager(self):
         """Lazy initialization of ManagedSystemManager"""
         if self._managed_system_manager is None:
-            self._managed_system_manager = ManagedSystemManager()
+            with self._init_lock:
+                if self._managed_system_manager is None:
+                    self._managed_system_manager = ManagedSystemManager()
         return self._managed_system_manager
 
     @property
     def database_swea(self):
         """Lazy initialization of DatabaseSWEA"""
         if self._database_swea is None:
-            self._database_swea = DatabaseSWEA()
+            with self._init_lock:
+                if self._database_swea is None:
+                    self._database_swea = DatabaseSWEA()
         return self._database_swea
 
     @property
     def backend_swea(self):
         """Lazy initialization of BackendSWEA"""
         if self._backend_swea is None:
-            self._backend_swea = BackendSWEA()
+            with self._init_lock:
+                if self._backend_swea is None:
+                    self._backend_swea = BackendSWEA()
         return self._backend_swea
 
     @property
     def test_swea(self):
         """Lazy initialization of TestSWEA"""
         if self._test_swea is None:
-            self._test_swea = TestSWEA()
+            with self._init_lock:
+                if self._test_swea is None:
+                    self._test_swea = TestSWEA()
         return self._test_swea
 
     @property
     def frontend_swea(self):
         """Lazy initialization of FrontendSWEA"""
         if self._frontend_swea is None:
-            self._frontend_swea = FrontendSWEA()
+            with self._init_lock:
+                if self._frontend_swea is None:
+                    self._frontend_swea = FrontendSWEA()
         return self._frontend_swea
 
     @property
     def techlead_swea(self):
         """Lazy initialization of TechLeadSWEA"""
         if self._techlead_swea is None:
-            self._techlead_swea = TechLeadSWEA()
+            with self._init_lock:
+                if self._techlead_swea is None:
+                    self._techlead_swea = TechLeadSWEA()
         return self._techlead_swea
 
     # ========================================================================
@@ -480,6 +646,7 @@ class EnhancedRuntimeKernel:
         logger.info(f"🚀 Starting parallel execution: {len(waves)} waves for {entity}")
         
         results = {}
+        reviews = {}
         
         # Execute each wave
         for wave in waves:
@@ -508,6 +675,10 @@ class EnhancedRuntimeKernel:
                         task.result = result
                         results[task.task_id] = result
                         logger.info(f"✅ Task {task.task_id} completed in {task.duration:.2f}s")
+
+                # Review the wave's artifacts together (uncertain ones share one LLM call)
+                if Config.ENABLE_BATCHED_REVIEW:
+                    reviews.update(await self._review_wave(entity, wave))
                 
             except Exception as e:
                 logger.error(f"❌ Wave {wave.wave_number} failed, cancelling remaining tasks")
@@ -525,11 +696,61 @@ class EnhancedRuntimeKernel:
         return {
             "success": True,
             "results": results,
+            "reviews": reviews,
             "execution_time": total_time,
             "waves_executed": len(waves),
             "parallel_execution": True
         }
 
+    # SWEA agent names by TaskNode.swea_type
+    _WAVE_SWEA_AGENTS = {
+        "backend": "BackendSWEA",
+        "database": "DatabaseSWEA",
+        "frontend": "FrontendSWEA",
+        "test": "TestSWEA",
+    }
+
+    async def _review_wave(self, entity: str, wave: ExecutionWave) -> Dict[str, Dict[str, Any]]:
+        """
+        Review the artifacts of a completed wave with one batched TechLeadSWEA task.
+
+        Args:
+            entity: Entity name
+            wave: Completed execution wave
+
+        Returns:
+            Dict of task_id -> review result
+        """
+        tasks = [
+            task for task in wave.tasks
+            if isinstance(task.result, dict) and task.result.get("success", True)
+        ]
+        if not tasks:
+            return {}
+        payloads = [
+            {
+                "entity": entity,
+                "swea_agent": self._WAVE_SWEA_AGENTS.get(task.swea_type, task.swea_type),
+                "task_type": task.task_type,
+                "result": task.result,
+            }
+            for task in tasks
+        ]
+        with span(f"review_wave_{wave.wave_number}", category="review", artifacts=len(tasks)):
+            response = await asyncio.to_thread(
+                self.techlead_swea.handle_task, "review_batch", {"reviews": payloads}
+            )
+
+        reviews = {}
+        for task, payload, review in zip(tasks, payloads, response.get("reviews", [])):
+            approved = review.get("approved", review.get("data", {}).get("overall_approval", False))
+            reason = review.get("data", {}).get("rejection_reason", "")
+            self._record_review_outcome(f"{payload['swea_agent']}.{task.task_type}", approved, reason)
+            reviews[task.task_id] = review
+            status = "approved" if approved else "rejected"
+            logger.info(f"🔍 Wave {wave.wave_number} review: {task.task_id} {status}")
+        return reviews
+
     async def _execute_task_async(self, task: TaskNode) -> Dict[str, Any]:
         """
         Execute a single SWEA task asynchronously.
@@ -562,11 +783,13 @@ class EnhancedRuntimeKernel:
                 raise ValueError(f"Unknown SWEA type: {task.swea_type}")
             
             # Execute task in thread pool to avoid blocking
-            result = await asyncio.to_thread(
-                swea.handle_task,
-                task.task_type,
-                task.payload
-            )
+            # (asyncio.to_thread copies the context, so nested spans join this trace)
+            with span(task.task_id, category="swea", swea_type=task.swea_type):
+                result = await asyncio.to_thread(
+                    swea.handle_task,
+                    task.task_type,
+                    task.payload
+                )
             
             task.end_time = time.time()
             
@@ -627,8 +850,9 @@ class EnhancedRuntimeKernel:
         
         Decision Logic:
         1. Analyze validation feedback to determine issue complexity
-        2. If single localized issue + patch feasibility ≥ 0.7 → targeted patch
-        3. If multiple/structural issues OR patch fails → full regeneration
+        2. If single localized issue + patch feasibility ≥ 0.7, or every issue can be
+           fixed by CodePatcher's structured edits → targeted patch (no model call)
+        3. If structural issues OR patch fails → full regeneration
         
         Args:
             swea_agent: Name of SWEA that generated the code
@@ -652,8 +876,15 @@ class EnhancedRuntimeKernel:
         
         try:
             # Import dependencies
-            from baes.utils.code_patcher import CodePatcher
+            from baes.utils.code_patcher import CodePatcher, is_patchable
             
+            # Review results carry their findings as feedback/technical_feedback
+            if not validation_result.get("issues"):
+                validation_result = {
+                    **validation_result,
+                    "issues": self._feedback_texts(validation_result),
+                }
+
             # Analyze feedback to determine retry strategy
             analysis = self.techlead_swea.analyze_feedback_for_retry_strategy(
                 validation_result,
@@ -669,61 +900,35 @@ class EnhancedRuntimeKernel:
             logger.info(f"   Issue count: {analysis['issue_count']}")
             logger.info(f"   Issue types: {', '.join(analysis['issue_types'])}")
             
-            if retry_strategy == "targeted_patch":
-                # Attempt targeted patch
-                patcher = CodePatcher()
-                
-                # Determine patch type based on issue types
-                issue_types = analysis["issue_types"]
-                patch_result = None
-                
-                if "missing_decorator" in issue_types:
-                    # Try to add @contextmanager decorator
-                    patch_result = patcher.add_decorator(
-                        original_code,
-                        function_name="get_db_connection",
-                        decorator_name="contextmanager"
-                    )
-                    
-                elif "wrong_status_code" in issue_types:
-                    # Try to fix status code
-                    # Extract function name from feedback
-                    function_name = self._extract_function_name_from_feedback(validation_result)
-                    if function_name:
-                        patch_result = patcher.fix_status_code(
-                            original_code,
-                            target_function=function_name,
-                            correct_status=201  # Default to 201 for POST
-                        )
-                        
-                elif "missing_import" in issue_types:
-                    # Try to add missing import
-                    import_statement = self._extract_import_from_feedback(validation_result)
-                    if import_statement:
-                        patch_result = patcher.add_import(
-                            original_code,
-                            import_statement=import_statement
-                        )
-                
-                if patch_result and patch_result.success:
+            if retry_strategy == "targeted_patch" or is_patchable(analysis["issue_types"]):
+                # Fix the localized issues with structured AST edits (no model call)
+                patch_result = CodePatcher().patch_from_feedback(
+                    original_code,
+                    analysis["issue_types"],
+                    self._feedback_texts(validation_result),
+                )
+
+                if patch_result.success:
                     logger.info(f"✅ Targeted patch SUCCESSFUL for {entity} {task_type}")
-                    logger.info(f"   Patch type: {patch_result.patch_type}")
+                    logger.info(f"   Edits: {', '.join(patch_result.applied_operations)}")
                     logger.info(f"   Location: {patch_result.patch_location}")
                     logger.info(f"   Tokens saved: ~{patch_result.tokens_saved}")
-                    
+
                     return {
                         "retry_strategy": "targeted_patch",
                         "retry_method": "targeted_patch",
                         "patch_applied": True,
                         "patched_code": patch_result.patched_code,
                         "patch_type": patch_result.patch_type,
+                        "patch_operations": patch_result.applied_operations,
                         "patch_location": patch_result.patch_location,
+                        "patch_feasibility": patch_feasibility,
                         "tokens_saved": patch_result.tokens_saved,
                         "success": True
                     }
                 else:
                     # Patch failed, fall back to full regeneration
-                    error_msg = patch_result.error_message if patch_result else "No suitable patch found"
+                    error_msg = patch_result.error_message or "No suitable patch found"
                     logger.warning(f"⚠️ Targeted patch FAILED for {entity} {task_type}: {error_msg}")
                     logger.info("   Falling back to full regeneration...")
                     return {
@@ -731,6 +936,7 @@ class EnhancedRuntimeKernel:
                         "retry_method": "full_regeneration",
                         "patch_applied": False,
                         "fallback_reason": error_msg,
+                        "patch_feasibility": patch_feasibility,
                         "tokens_saved": 0
                     }
             
@@ -756,38 +962,137 @@ class EnhancedRuntimeKernel:
                 "tokens_saved": 0
             }
     
-    def _extract_function_name_from_feedback(self, validation_result: Dict[str, Any]) -> Optional[str]:
-        """Extract function name from validation feedback for targeted patching."""
-        feedback = validation_result.get("issues", []) + validation_result.get("suggestions", [])
-        
-        # Look for function names in feedback
-        for item in feedback:
-            feedback_text = str(item)
-            # Match patterns like "create_student" or "get_student"
-            match = re.search(r'\b(create|get|update|delete)_\w+\b', feedback_text)
-            if match:
-                return match.group(0)
-        
-        return None
-    
-    def _extract_import_from_feedback(self, validation_result: Dict[str, Any]) -> Optional[str]:
-        """Extract missing import statement from validation feedback."""
-        feedback = validation_result.get("issues", []) + validation_result.get("suggestions", [])
-        
-        for item in feedback:
-            feedback_text = str(item)
-            # Match import patterns
-            if "contextmanager" in feedback_text.lower():
-                return "from contextlib import contextmanager"
-            elif "httpexception" in feedback_text.lower():
-                return "from fastapi import HTTPException"
-            elif "status" in feedback_text.lower() and "fastapi" in feedback_text.lower():
-                return "from fastapi import status"
-        
-        return None
+    def _feedback_texts(self, validation_result: Dict[str, Any]) -> List[str]:
+        """Issue, suggestion and feedback texts of a review result for targeted patching."""
+        texts = []
+        for key in ("issues", "suggestions", "feedback", "actionable_feedback", "technical_feedback"):
+            items = validation_result.get(key) or []
+            if isinstance(items, list):
+                texts.extend(str(item) for item in items)
+        for item in validation_result.get("categorized_feedback") or []:
+            if isinstance(item, dict):
+                texts.extend(str(item[key]) for key in ("issue", "suggestion") if item.get(key))
+        return list(dict.fromkeys(texts))
+
+    def _apply_patched_code(
+        self, result: Dict[str, Any], patched_code: str, repair_method: str = "targeted_patch"
+    ) -> Dict[str, Any]:
+        """Copy of a rejected SWEA result with its code replaced by the patched code.
+
+        The artifact file is rewritten, so the retry attempt is reviewed (and later
+        served) exactly as if the SWEA had generated the patched code.
+        """
+        data = dict(result.get("data") or {})
+        data["code"] = patched_code
+        data["repair_method"] = repair_method
+        if data.get("file_path"):
+            write_text_locked(Path(data["file_path"]), patched_code)
+        return {**result, "data": data}
+
+
+    def _repair_with_diff(
+        self,
+        agent: Any,
+        swea_agent: str,
+        payload: Dict[str, Any],
+        rejected_result: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Repair a rejected artifact with an LLM unified diff; None to regenerate instead."""
+        data = rejected_result.get("data") or {}
+        llm_client = getattr(agent, "llm_client", None)
+        if llm_client is None or not data.get("code"):
+            return None
+        feedback = list(payload.get("techlead_feedback") or []) + list(
+            payload.get("previous_errors") or []
+        )
+        file_name = Path(data["file_path"]).name if data.get("file_path") else "artifact.py"
+        repair = repair_with_diff(
+            llm_client,
+            data["code"],
+            list(dict.fromkeys(map(str, feedback))),
+            swea_type=swea_agent.replace("SWEA", "").lower(),
+            file_name=file_name,
+        )
+        if self.current_metrics:
+            self.current_metrics.retry_method = (
+                "diff_repair" if repair.success else "full_regeneration"
+            )
+            self.current_metrics.retry_tokens = repair.tokens
+        if not repair.success:
+            return None
+        return self._apply_patched_code(rejected_result, repair.code, "diff_repair")
 
     def process_natural_language_request(
         self, request: str, context: str = "academic", start_servers: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Process natural language request inside its own request-scoped context.
+
+        Metrics, execution history and retry tracking are held per request, so several
+        requests for different entities can run concurrently on the same kernel (requests
+        for the same entity are serialized). When tracing is enabled, the trace (Chrome
+        trace-event JSON) is exported to Config.EXECUTION_TRACE_DIR and its critical-path
+        summary is attached to the result under "execution_trace".
+        """
+        request_context = RequestContext(request=request, owner=self)
+        with request_scope(request_context):
+            if Config.ENABLE_EXECUTION_TRACE:
+                with start_trace(
+                    request_id=request_context.request_id,
+                    name="process_natural_language_request",
+                    context=context,
+                ) as trace:
+                    result = self._process_natural_language_request(request, context, start_servers)
+                self._finalize_execution_trace(trace, result)
+            else:
+                result = self._process_natural_language_request(request, context, start_servers)
+
+        self._complete_request_context(request_context, result)
+        return result
+
+    def _complete_request_context(
+        self, request_context: RequestContext, result: Dict[str, Any]
+    ) -> None:
+        """Record the finished request and fold its state into the kernel-wide aggregate."""
+        request_context.execution_history.append(
+            {
+                "request_id": request_context.request_id,
+                "request": request_context.request,
+                "entity": request_context.entity,
+                "success": bool(isinstance(result, dict) and result.get("success")),
+                "error": result.get("error") if isinstance(result, dict) else None,
+                "started_at": request_context.started_at.isoformat(),
+                "duration_s": (datetime.now() - request_context.started_at).total_seconds(),
+            }
+        )
+        with self._state_lock:
+            request_context.merge_into(self._kernel_state)
+
+    def _finalize_execution_trace(self, trace: ExecutionTrace, result: Dict[str, Any]) -> None:
+        """Export the request trace and attach its critical-path summary (non-fatal)."""
+        self.last_trace = trace
+        try:
+            summary = trace.summary()
+            trace_file = trace.export(Config.EXECUTION_TRACE_DIR)
+            summary["trace_file"] = str(trace_file) if trace_file else None
+
+            if self.current_metrics:
+                self.current_metrics.trace_file = summary["trace_file"]
+                self.current_metrics.critical_path = summary["critical_path"]
+
+            if isinstance(result, dict):
+                result["execution_trace"] = summary
+
+            logger.debug(
+                "🧭 Critical path (%.0fms): %s",
+                summary["total_ms"],
+                " → ".join(summary["critical_path"]),
+            )
+        except Exception as e:
+            logger.warning("⚠️  Failed to finalize execution trace: %s", str(e))
+
+    def _process_natural_language_request(
+        self, request: str, context: str = "academic", start_servers: bool = True
     ) -> Dict[str, Any]:
         """
         Process natural language request with proper entity routing and error handling.
@@ -802,7 +1107,8 @@ class EnhancedRuntimeKernel:
         logger.debug("📥 Processing request: %s", request)
 
         # Step 1: Entity Recognition using OpenAI
-        entity_classification = self.entity_recognizer.recognize_entity(request)
+        with span("entity_recognition", category="recognition"):
+            entity_classification = self.entity_recognizer.recognize_entity(request)
         detected_entity = entity_classification.get("detected_entity", "unknown")
         confidence = entity_classification.get("confidence", 0.0)
 
@@ -817,6 +1123,33 @@ class EnhancedRuntimeKernel:
             logger.warning("❌ Unknown entity requested (cannot classify): %s", detected_entity)
             return error_response
 
+        request_context = current_request_context(owner=self)
+        if request_context is not None:
+            request_context.entity = detected_entity
+
+        # Steps 3-10 mutate the entity's BAE memory and generated artifacts: serialize
+        # requests for the same entity, let different entities proceed in parallel
+        with span("entity_lock_wait", category="lock", entity=detected_entity):
+            entity_lock = self.entity_locks.get(detected_entity.lower())
+            entity_lock.acquire()
+        try:
+            return self._process_recognized_request(
+                request, context, start_servers, detected_entity, entity_classification
+            )
+        finally:
+            entity_lock.release()
+
+    def _process_recognized_request(
+        self,
+        request: str,
+        context: str,
+        start_servers: bool,
+        detected_entity: str,
+        entity_classification: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Route a recognized request to its BAE and execute the coordination plan (Steps 3-10)."""
+        confidence = entity_classification.get("confidence", 0.0)
+
         # Step 3: Route to appropriate BAE (with fallback to GenericBAE)
         target_bae = self.bae_registry.get_bae(detected_entity)
         used_generic_fallback = False
@@ -837,14 +1170,15 @@ class EnhancedRuntimeKernel:
             )
 
         # Step 4: BAE interprets business request
-        interpretation_result = target_bae.handle(
-            "interpret_business_request",
-            {
-                "request": request,
-                "context": context,
-                "entity_classification": entity_classification,
-            },
-        )
+        with span("interpret_business_request", category="interpretation", bae=target_bae.name):
+            interpretation_result = target_bae.handle(
+                "interpret_business_request",
+                {
+                    "request": request,
+                    "context": context,
+                    "entity_classification": entity_classification,
+                },
+            )
 
         if "error" in interpretation_result:
             logger.error("❌ BAE interpretation failed: %s", interpretation_result.get("error"))
@@ -1079,8 +1413,9 @@ class EnhancedRuntimeKernel:
 
         # Step 9: Reload and start servers if requested
         if start_servers and not os.getenv("SKIP_SERVER_START"):
-            self._reload_system_components()
-            self._start_servers()
+            with span("start_servers", category="server"):
+                self._reload_system_components()
+                self._start_servers()
 
         # Step 10: Return comprehensive result with integrated test-driven workflow
         overall_success = True
@@ -1343,7 +1678,26 @@ class EnhancedRuntimeKernel:
         5. Only when tests pass can final approval be given
 
         This ensures NO SUCCESS is declared until ALL tests pass.
+
+        With ENABLE_REVIEW_PIPELINING, the next task's generation overlaps the current
+        task's review (see ReviewPipeline and _pipeline_next_task).
         """
+        pipeline = ReviewPipeline(enabled=Config.ENABLE_REVIEW_PIPELINING)
+        try:
+            return self._run_coordination_plan(
+                coordination_plan, coordinating_bae, context, pipeline
+            )
+        finally:
+            pipeline.close()
+
+    def _run_coordination_plan(
+        self,
+        coordination_plan: List[Dict[str, Any]],
+        coordinating_bae,
+        context: str,
+        pipeline: "ReviewPipeline",
+    ) -> List[Dict[str, Any]]:
+        """Task loop of _execute_coordination_plan (sequential tasks, immediate review)."""
         # Use debug logging for technical details
         if is_debug_mode():
             logger.info(
@@ -1373,8 +1727,28 @@ class EnhancedRuntimeKernel:
         # Get max retries from environment
         max_retries = int(os.getenv("BAE_MAX_RETRIES", "3"))
 
+        # Tasks whose LLM validation waits for one batched review (ENABLE_BATCHED_REVIEW)
+        deferred_reviews: List[DeferredReview] = []
+        # Plan indexes still to run; batch-rejected tasks are re-queued with their state
+        plan_queue: Deque[Tuple[int, Optional[DeferredReview]]] = deque(
+            (task_index, None) for task_index in range(len(coordination_plan))
+        )
+
         # Sequential execution with immediate review
-        for task_index, task in enumerate(coordination_plan):
+        while plan_queue or deferred_reviews:
+            # Deferred artifacts are reviewed before the final system review (or the plan end)
+            if deferred_reviews and (
+                not plan_queue
+                or coordination_plan[plan_queue[0][0]].get("payload", {}).get("final_review", False)
+            ):
+                rejected = self._review_deferred_artifacts(deferred_reviews, results, pipeline)
+                plan_queue.extendleft(
+                    (deferred.task_index, deferred) for deferred in reversed(rejected)
+                )
+                continue
+
+            task_index, replay = plan_queue.popleft()
+            task = coordination_plan[task_index]
             task_name = f"{task.get('swea_agent', 'Unknown')}.{task.get('task_type', 'unknown')}"
 
             # Presentation logging for step start
@@ -1430,6 +1804,20 @@ class EnhancedRuntimeKernel:
             retry_count = 0
             last_error = None
             feedback_history = []
+            patched_result = None
+            diff_repair_source = None
+            provisional = False
+            defer_review = (
+                Config.ENABLE_BATCHED_REVIEW
+                and replay is None
+                and not self._has_plan_consumers(coordination_plan, task_index)
+            )
+            replay_review = None
+            if replay is not None:
+                # Rejected by the batched review: resume the retry loop with its verdict
+                retry_count = replay.retry_count
+                payload = replay.payload
+                replay_review = replay.review
 
             while not task_success and retry_count <= max_retries:
                 try:
@@ -1437,7 +1825,7 @@ class EnhancedRuntimeKernel:
                     result = {}
                     
                     # Show retry if this isn't the first attempt
-                    if retry_count > 0:
+                    if retry_count > 0 and replay_review is None:
                         simplified_name = self._get_simplified_task_name(task_name)
                         presentation_logger.step_retry(
                             task_index + 1, retry_count, max_retries, simplified_name
@@ -1451,19 +1839,48 @@ class EnhancedRuntimeKernel:
                             retry_count + 1,
                             max_retries + 1,
                         )
-                    result = agent.handle_task(task_type, payload)
+                    task_key = f"{swea_agent}.{task_type}"
+                    with span(task_name, category="swea", attempt=retry_count + 1):
+                        if replay_review is not None:
+                            # The batch-reviewed artifact is already written
+                            result = replay.review_payload["result"]
+                        # First attempt may already have run while the previous task was reviewed
+                        elif retry_count == 0:
+                            result = self._take_pipelined_result(pipeline, task_index)
+                        elif patched_result is not None:
+                            # US6: the smart retry already fixed the code, no SWEA call needed
+                            result, patched_result = patched_result, None
+                        elif diff_repair_source is not None:
+                            # Ask for a unified diff of the rejected artifact; regenerate if it fails
+                            with span(f"diff_repair:{task_name}", category="retry"):
+                                result = self._repair_with_diff(
+                                    agent, swea_agent, payload, diff_repair_source
+                                ) or {}
+                            diff_repair_source = None
+                        if not result:
+                            if self._should_speculate(task_key, swea_agent, payload):
+                                result = self._generate_speculatively(
+                                    agent, swea_agent, task_type, payload, task_key
+                                )
+                            else:
+                                result = agent.handle_task(task_type, payload)
 
                     # **CRITICAL FIX: Generate managed system artifacts immediately after each SWEA task**
                     # This ensures TestSWEA has actual artifacts to test
-                    if result.get("success") and swea_agent not in ["TechLeadSWEA"]:
+                    if (
+                        result.get("success")
+                        and swea_agent not in ["TechLeadSWEA"]
+                        and replay_review is None
+                    ):
                         logger.debug(
                             "🏗️  Generating managed system artifacts after %s completion",
                             swea_agent,
                         )
                         try:
                             # Generate managed system artifacts incrementally
-                            self.managed_system_manager.ensure_managed_system_structure()
-                            self.managed_system_manager.update_system_files()
+                            with span("update_system_files", category="io"):
+                                self.managed_system_manager.ensure_managed_system_structure()
+                                self.managed_system_manager.update_system_files()
 
                             logger.debug("✅ Managed system artifacts updated after %s", swea_agent)
                         except Exception as e:
@@ -1529,9 +1946,14 @@ class EnhancedRuntimeKernel:
                             "final_review": True,
                         }
 
-                        review_result = self.techlead_swea.handle_task(
-                            "review_and_approve", review_payload
-                        )
+                        with span(
+                            f"TechLeadSWEA.review:{task_name}",
+                            category="review",
+                            attempt=retry_count + 1,
+                        ):
+                            review_result = self.techlead_swea.handle_task(
+                                "review_and_approve", review_payload
+                            )
 
                         if review_result.get("success") and review_result.get("data", {}).get(
                             "overall_approval", False
@@ -1679,9 +2101,24 @@ class EnhancedRuntimeKernel:
                             "retry_count": retry_count,
                         }
 
-                        review_result = self.techlead_swea.handle_task(
-                            "review_and_approve", review_payload
-                        )
+                        if replay_review is not None:
+                            review_result, replay_review = replay_review, None
+                        else:
+                            # Overlap this review with the next task's generation
+                            self._pipeline_next_task(pipeline, coordination_plan, task_index)
+
+                            # Uncertain unconsumed artifacts wait for one batched LLM review
+                            review_scope = (
+                                defer_llm_review() if defer_review else contextlib.nullcontext()
+                            )
+                            with span(
+                                f"TechLeadSWEA.review:{task_name}",
+                                category="review",
+                                attempt=retry_count + 1,
+                            ), review_scope:
+                                review_result = self.techlead_swea.handle_task(
+                                    "review_and_approve", review_payload
+                                )
 
                         if review_result.get("success") and review_result.get("data", {}).get(
                             "overall_approval", False
@@ -1690,6 +2127,21 @@ class EnhancedRuntimeKernel:
                             quality_score = review_result.get("data", {}).get("quality_score", 0.0)
                             force_accepted = review_result.get("force_accepted", False)
                             simplified_name = self._get_simplified_task_name(task_name)
+                            provisional = review_result.get("data", {}).get(
+                                "llm_review_deferred", False
+                            )
+                            if provisional:
+                                deferred_reviews.append(
+                                    DeferredReview(
+                                        task_index,
+                                        len(results),
+                                        payload,
+                                        retry_count,
+                                        review_payload,
+                                    )
+                                )
+                            else:
+                                self._record_review_outcome(task_key, True)
 
                             # Log force-accept status
                             if force_accepted:
@@ -1724,12 +2176,13 @@ class EnhancedRuntimeKernel:
                                     "task": task_name,
                                     "success": True,
                                     "result": result,
-                                    "techlead_approved": True,
+                                    "techlead_approved": not provisional,
                                     "force_accepted": force_accepted,
                                     "quality_score": quality_score,
                                     "retry_count": retry_count,
                                     # Include force-accept metadata if applicable
-                                    **({"force_accept_metadata": review_result.get("data", {})} if force_accepted else {})
+                                    **({"force_accept_metadata": review_result.get("data", {})} if force_accepted else {}),
+                                    **({"llm_review_deferred": True} if provisional else {}),
                                 }
                             )
                             task_success = True
@@ -1756,6 +2209,10 @@ class EnhancedRuntimeKernel:
                                 primary_reason = feedback_items[0]
                             elif technical_feedback and len(technical_feedback) > 0:
                                 primary_reason = technical_feedback[0]
+                            self._record_review_outcome(
+                                task_key, False, str(primary_reason), retry_count + 1
+                            )
+                            pipeline.reject(task_index)
 
                             logger.warning(
                                 "❌ %s REJECTED by TechLeadSWEA (attempt %d/%d) - %s",
@@ -1782,27 +2239,28 @@ class EnhancedRuntimeKernel:
                                 retry_result = None
                                 if Config.ENABLE_SMART_RETRY and result.get("data", {}).get("code"):
                                     original_code = result.get("data", {}).get("code", "")
-                                    validation_result = individual_review_result.get("data", {})
+                                    validation_result = review_result.get("data", {})
                                     
                                     # Attempt smart retry (T101-T102)
-                                    retry_result = self._try_smart_retry(
-                                        swea_agent=swea_agent,
-                                        task_type=task_type,
-                                        original_code=original_code,
-                                        validation_result=validation_result,
-                                        entity=payload.get("entity", "Unknown"),
-                                        payload=payload
-                                    )
+                                    with span(f"smart_retry:{task_name}", category="retry"):
+                                        retry_result = self._try_smart_retry(
+                                            swea_agent=swea_agent,
+                                            task_type=task_type,
+                                            original_code=original_code,
+                                            validation_result=validation_result,
+                                            entity=payload.get("entity", "Unknown"),
+                                            payload=payload
+                                        )
                                     
                                     # Track metrics
-                                    if hasattr(self, 'optimization_metrics') and self.optimization_metrics:
-                                        self.optimization_metrics.retry_method = retry_result.get("retry_method", "full_regeneration")
-                                        self.optimization_metrics.retry_tokens = (
-                                            500 if retry_result.get("patch_applied") else 2000
+                                    if self.current_metrics:
+                                        self.current_metrics.retry_method = retry_result.get("retry_method", "full_regeneration")
+                                        self.current_metrics.retry_tokens = (
+                                            0 if retry_result.get("patch_applied") else 2000
                                         )
-                                        self.optimization_metrics.retry_success = retry_result.get("success", False)
-                                        self.optimization_metrics.patch_feasibility = retry_result.get("patch_feasibility", 0.0)
-                                        self.optimization_metrics.retry_count = retry_count
+                                        self.current_metrics.retry_success = retry_result.get("success", False)
+                                        self.current_metrics.patch_feasibility = retry_result.get("patch_feasibility", 0.0)
+                                        self.current_metrics.retry_count = retry_count
 
                                 # **CRITICAL FIX: Pass TechLeadSWEA feedback to SWEA agent for retry**
                                 # Enhance payload with TechLeadSWEA feedback for intelligent retry
@@ -1825,9 +2283,14 @@ class EnhancedRuntimeKernel:
                                 # If smart retry produced patched code, use it instead of full regeneration
                                 if retry_result and retry_result.get("patch_applied") and retry_result.get("patched_code"):
                                     logger.info("✅ Using patched code from smart retry (tokens saved: ~%d)", retry_result.get("tokens_saved", 0))
-                                    enhanced_payload["patched_code"] = retry_result["patched_code"]
-                                    enhanced_payload["skip_llm_call"] = True  # Signal to SWEA to use patched code directly
+                                    patched_result = self._apply_patched_code(
+                                        result, retry_result["patched_code"]
+                                    )
                                     enhanced_payload["smart_retry_applied"] = True
+                                elif swea_agent != "TechLeadSWEA" and should_repair_with_diff(
+                                    result.get("data", {}).get("code")
+                                ):
+                                    diff_repair_source = result
 
                                 # Update the task payload for the retry
                                 payload = enhanced_payload
@@ -1967,6 +2430,12 @@ class EnhancedRuntimeKernel:
                             )
                             task_success = True
 
+            if task_success and not provisional:
+                pipeline.approved.add(task_index)
+            if replay is not None:
+                # The re-run replaces the task's provisional result
+                results[replay.position] = results.pop()
+
         # Phase 1 completion logging (generation only - no test execution yet)
         successful_tasks = len([r for r in results if r.get("success", False)])
 
@@ -2516,6 +2985,265 @@ class EnhancedRuntimeKernel:
             f"Retry pattern tracked for {task_key}: {retry_count} attempts, latest error: {error}"
         )
 
+    def _plan_task_dependencies(
+        self, coordination_plan: List[Dict[str, Any]], task_index: int
+    ) -> Set[int]:
+        """
+        Plan indexes of the tasks whose artifacts a coordination task consumes.
+
+        Uses the task's ``depends_on`` list ("<SWEA>.<task_type>" names); tasks that do not
+        declare dependencies are assumed to depend on every earlier task.
+        """
+        declared = coordination_plan[task_index].get("depends_on")
+        if declared is None:
+            return set(range(task_index))
+        latest = {}
+        for index, task in enumerate(coordination_plan[:task_index]):
+            latest[f"{task.get('swea_agent')}.{task.get('task_type')}"] = index
+        return {latest[name] for name in declared if name in latest}
+
+    def _pipeline_next_task(
+        self,
+        pipeline: ReviewPipeline,
+        coordination_plan: List[Dict[str, Any]],
+        reviewing_index: int,
+    ) -> Optional[PipelinedTask]:
+        """
+        Start the task after ``reviewing_index`` while its TechLeadSWEA review is pending.
+
+        Tasks independent of the reviewed task always start. Tasks consuming its artifact
+        start optimistically only if the reviewed task is rarely rejected
+        (PIPELINE_MAX_REJECTION_RATE); a rejection marks them stale and they are re-queued.
+        """
+        next_index = reviewing_index + 1
+        if (
+            not pipeline.enabled
+            or next_index >= len(coordination_plan)
+            or pipeline.is_pending(next_index)
+        ):
+            return None
+
+        reviewing = coordination_plan[reviewing_index]
+        task = coordination_plan[next_index]
+        swea_agent = task.get("swea_agent", "")
+        task_type = task.get("task_type", "")
+        payload = task.get("payload", {})
+        if self._validate_task_attributes(task) or payload.get("final_review"):
+            return None
+
+        # TechLeadSWEA is busy reviewing, and a SWEA instance never runs two tasks at once
+        agent = self._route_to_swea_agent(swea_agent)
+        if (
+            agent is None
+            or agent is self.techlead_swea
+            or agent is self._route_to_swea_agent(reviewing.get("swea_agent", ""))
+        ):
+            return None
+
+        dependencies = self._plan_task_dependencies(coordination_plan, next_index)
+        if not dependencies <= pipeline.approved | {reviewing_index}:
+            return None
+        reviewing_name = f"{reviewing.get('swea_agent')}.{reviewing.get('task_type')}"
+        optimistic = reviewing_index in dependencies
+        if optimistic:
+            _, rejection_rate = self._historical_rejection_rate(reviewing_name)
+            if rejection_rate > Config.PIPELINE_MAX_REJECTION_RATE:
+                return None
+
+        task_name = f"{swea_agent}.{task_type}"
+
+        def run() -> Dict[str, Any]:
+            with span(task_name, category="swea", pipelined=True, optimistic=optimistic):
+                return agent.handle_task(task_type, payload)
+
+        logger.info(
+            "⏩ Starting %s while TechLeadSWEA reviews %s%s",
+            task_name,
+            reviewing_name,
+            " (optimistic)" if optimistic else "",
+        )
+        return pipeline.submit(next_index, task_name, dependencies, optimistic, run)
+
+    def _take_pipelined_result(
+        self, pipeline: ReviewPipeline, task_index: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the pipelined first-attempt result of a task, or None to run it now.
+
+        SWEA errors raised by the pipelined call are re-raised into the retry loop.
+        """
+        pipelined = pipeline.take(task_index)
+        if pipelined is None:
+            return None
+        if pipelined.stale:
+            # Its artifacts are overwritten when the task is executed again
+            logger.info(
+                "↩️  Re-queuing %s: a task it depends on was rejected while it ran ahead",
+                pipelined.task_name,
+            )
+            if self.current_metrics:
+                self.current_metrics.pipelined_tasks_requeued += 1
+            return None
+        if self.current_metrics:
+            self.current_metrics.pipelined_tasks += 1
+        return pipelined.future.result()
+
+    def _record_review_outcome(
+        self, task_key: str, approved: bool, reason: str = "", retry_count: int = 0
+    ):
+        """Count TechLeadSWEA review outcomes per task (drives speculative generation)"""
+        self.failure_analytics["review_attempts"][task_key] += 1
+        if not approved:
+            self.failure_analytics["review_rejections"][task_key] += 1
+            self._track_retry_pattern(task_key, f"TechLead rejection: {reason}", retry_count)
+
+    def _has_plan_consumers(self, coordination_plan: List[Dict[str, Any]], task_index: int) -> bool:
+        """Whether a later task (other than the final review) consumes this task's artifact"""
+        return any(
+            task_index in self._plan_task_dependencies(coordination_plan, later)
+            for later in range(task_index + 1, len(coordination_plan))
+            if not coordination_plan[later].get("payload", {}).get("final_review", False)
+        )
+
+    def _review_deferred_artifacts(
+        self,
+        deferred_reviews: List[DeferredReview],
+        results: List[Dict[str, Any]],
+        pipeline: ReviewPipeline,
+    ) -> List[DeferredReview]:
+        """
+        LLM-review the deferred artifacts with one review_batch task.
+
+        Approved tasks become approved plan results. Rejected tasks are returned with
+        their batch verdict so the plan loop re-runs them through its retry path.
+        Empties ``deferred_reviews``.
+        """
+        pending = list(deferred_reviews)
+        deferred_reviews.clear()
+        logger.info(
+            "👁️  TechLeadSWEA reviewing %d deferred artifact(s) in one batch...", len(pending)
+        )
+        with span("TechLeadSWEA.review_batch", category="review", artifacts=len(pending)):
+            response = self.techlead_swea.handle_task(
+                "review_batch", {"reviews": [deferred.review_payload for deferred in pending]}
+            )
+
+        reviews = response.get("reviews") or []
+        rejected = []
+        for index, deferred in enumerate(pending):
+            review = reviews[index] if index < len(reviews) else {}
+            data = review.get("data", {})
+            if review.get("approved", data.get("overall_approval", False)):
+                payload = deferred.review_payload
+                self._record_review_outcome(f"{payload['swea_agent']}.{payload['task_type']}", True)
+                pipeline.approved.add(deferred.task_index)
+                entry = results[deferred.position]
+                entry.pop("llm_review_deferred", None)
+                entry.update(techlead_approved=True, quality_score=data.get("quality_score", 0.0))
+                continue
+            # The regular rejection handling needs a failed review_and_approve shape
+            deferred.review = {**review, "success": False}
+            rejected.append(deferred)
+        return rejected
+
+    def _historical_rejection_rate(self, task_key: str) -> Tuple[int, float]:
+        """Return (review attempts, rejection rate) for a task across completed and current requests"""
+        with self._state_lock:
+            analytics = self._kernel_state.failure_analytics
+            attempts = analytics["review_attempts"].get(task_key, 0)
+            rejections = analytics["review_rejections"].get(task_key, 0)
+        request_state = self._state
+        if request_state is not self._kernel_state:
+            attempts += request_state.failure_analytics["review_attempts"].get(task_key, 0)
+            rejections += request_state.failure_analytics["review_rejections"].get(task_key, 0)
+        return attempts, (rejections / attempts if attempts else 0.0)
+
+    def _should_speculate(self, task_key: str, swea_agent: str, payload: Dict[str, Any]) -> bool:
+        """Decide whether to generate several candidates concurrently for this task"""
+        if not Config.ENABLE_SPECULATIVE_GENERATION or Config.SPECULATIVE_CANDIDATES < 2:
+            return False
+        if swea_agent == "TechLeadSWEA" or payload.get("skip_llm_call"):
+            return False
+        attempts, rejection_rate = self._historical_rejection_rate(task_key)
+        return (
+            attempts >= Config.SPECULATIVE_MIN_REVIEWS
+            and rejection_rate >= Config.SPECULATIVE_REJECTION_THRESHOLD
+        )
+
+    def _generate_speculatively(
+        self,
+        agent: Any,
+        swea_agent: str,
+        task_type: str,
+        payload: Dict[str, Any],
+        task_key: str,
+    ) -> Dict[str, Any]:
+        """
+        Generate SPECULATIVE_CANDIDATES candidates concurrently and return the first one
+        that passes rule-based screening (or the best-scoring one).
+
+        Losing candidates are cancelled and their file writes skipped; the winner's code
+        is rewritten to its file path in case a slower candidate wrote first.
+        """
+        swea_type = swea_agent.replace("SWEA", "").lower()
+
+        def screen(candidate: Dict[str, Any]) -> Tuple[bool, float]:
+            if not isinstance(candidate, dict) or not candidate.get("success"):
+                return False, float("-inf")
+            code = candidate.get("data", {}).get("code")
+            if not code:
+                return False, 0.0
+            rule_result = self.techlead_swea.validation_engine.validate_code(code, swea_type)
+            return (
+                rule_result.overall_outcome == "confident_approval",
+                rule_result.confidence_score,
+            )
+
+        outcome = run_speculative(
+            lambda _index: agent.handle_task(task_type, payload),
+            screen,
+            candidates=Config.SPECULATIVE_CANDIDATES,
+            temperature=Config.SPECULATIVE_TEMPERATURE,
+            name=task_key,
+        )
+        if self.current_metrics:
+            self.current_metrics.speculative_runs += 1
+            self.current_metrics.speculative_candidates_cancelled += outcome.candidates_cancelled
+
+        if outcome.result is None:
+            logger.warning(
+                "⚠️  Speculative generation for %s produced no candidate (%s) - running once",
+                task_key,
+                "; ".join(outcome.errors) or "no result",
+            )
+            return agent.handle_task(task_type, payload)
+
+        result = outcome.result
+        data = result.get("data", {}) if isinstance(result, dict) else {}
+        if isinstance(data, dict) and data.get("file_path") and data.get("code"):
+            write_text_locked(Path(data["file_path"]), data["code"])
+
+        logger.info(
+            "⚡ Speculative %s: candidate %d selected (%s, score %.2f, %d cancelled, %.0fms)",
+            task_key,
+            outcome.winner_index,
+            "screened" if outcome.accepted else "best effort",
+            outcome.score,
+            outcome.candidates_cancelled,
+            outcome.elapsed_ms,
+        )
+        if isinstance(result, dict):
+            result["speculative"] = {
+                "winner_index": outcome.winner_index,
+                "accepted": outcome.accepted,
+                "score": outcome.score,
+                "candidates_started": outcome.candidates_started,
+                "candidates_completed": outcome.candidates_completed,
+                "candidates_cancelled": outcome.candidates_cancelled,
+                "errors": outcome.errors,
+            }
+        return result
+
     def _get_retry_prevention_strategy(self, task_key: str) -> Dict[str, Any]:
         """Get prevention strategy based on historical retry patterns (Phase 3)"""
         pattern = self.retry_patterns.get(task_key, {})
@@ -0,0 +1,343 @@
+"""
+Long-running kernel daemon for BAES Framework.
+
+Keeps a single warm ``EnhancedRuntimeKernel`` (BAE registry, ContextStore,
+RecognitionCache, SWEAs, imported openai/nltk/jinja2/tiktoken) alive behind a
+local Unix socket so scripted pipelines do not pay interpreter and kernel
+startup on every request.
+
+Protocol (newline-delimited JSON, one request per connection):
+
+    → {"action": "process", "request": "...", "context": "academic",
+       "start_servers": false, "context_store": "database/context_store.json"}
+    ← {"event": "accepted", "job_id": "..."}
+    ← {"event": "progress", "phase": "start", "name": "...", "category": "swea", ...}
+    ← {"event": "progress", "phase": "end", "name": "...", "duration_ms": 1234.5, ...}
+    ← {"event": "result", "job_id": "...", "result": {...}}
+
+Other actions: "ping" (→ "pong" with daemon status and template coverage) and
+"shutdown".
+
+Requests run concurrently in worker threads (bounded by ``max_concurrency``).
+Each request gets its own request-scoped kernel state, and the kernel serializes
+requests that target the same entity.
+
+Usage:
+    python -m baes.core.kernel_daemon --socket /tmp/baes_kernel.sock
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-safe: Per-request errors are reported to the client, never crash the daemon
+- Observability: Progress events are derived from execution trace spans
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+from baes.utils.execution_trace import Span, span_listener, start_trace
+from baes.utils.template_analytics import get_template_analytics
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Maximum size of a single request line (requests are short natural-language prompts)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class KernelDaemon:
+    """Serve ``EnhancedRuntimeKernel`` requests over a local Unix socket."""
+
+    def __init__(
+        self,
+        socket_path: str = Config.DAEMON_SOCKET_PATH,
+        context_store_path: str = "database/context_store.json",
+        max_concurrency: int = Config.DAEMON_MAX_CONCURRENCY,
+        kernel: Optional[EnhancedRuntimeKernel] = None,
+    ):
+        self.socket_path = socket_path
+        self.context_store_path = context_store_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.kernel = kernel
+        self.started_at = time.time()
+        self.active_jobs: Dict[str, Dict[str, Any]] = {}
+        self.completed_jobs = 0
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Warm up the kernel and start listening on the Unix socket."""
+        if self.kernel is None:
+            logger.info(
+                "🔥 Warming up EnhancedRuntimeKernel (context store: %s)", self.context_store_path
+            )
+            self.kernel = await asyncio.to_thread(
+                EnhancedRuntimeKernel, context_store_path=self.context_store_path
+            )
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._stopped = asyncio.Event()
+
+        socket_file = Path(self.socket_path)
+        socket_file.parent.mkdir(parents=True, exist_ok=True)
+        if socket_file.exists():
+            if await _socket_is_live(self.socket_path):
+                raise RuntimeError(f"Kernel daemon already running on {self.socket_path}")
+            # Stale socket left behind by a daemon that did not shut down cleanly
+            socket_file.unlink()
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=self.socket_path, limit=MAX_REQUEST_BYTES
+        )
+        os.chmod(self.socket_path, 0o600)
+        logger.info(
+            "✅ Kernel daemon listening on %s (max concurrency: %d)",
+            self.socket_path,
+            self.max_concurrency,
+        )
+
+    async def serve_forever(self) -> None:
+        """Start the daemon and block until a shutdown request arrives."""
+        await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Stop accepting connections and remove the socket file."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        try:
+            Path(self.socket_path).unlink()
+        except FileNotFoundError:
+            pass
+        logger.info("🛑 Kernel daemon stopped (%d requests served)", self.completed_jobs)
+
+    def status(self) -> Dict[str, Any]:
+        """Daemon status reported by the "ping" action."""
+        return {
+            "pid": os.getpid(),
+            "socket": self.socket_path,
+            "context_store": self.context_store_path,
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "max_concurrency": self.max_concurrency,
+            "active_jobs": list(self.active_jobs.values()),
+            "completed_jobs": self.completed_jobs,
+            "template_coverage": get_template_analytics().coverage_report(),
+        }
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                message = json.loads(line.decode("utf-8"))
+                if not isinstance(message, dict):
+                    raise ValueError("request must be a JSON object")
+            except (ValueError, UnicodeDecodeError) as e:
+                await self._send(
+                    writer, {"event": "error", "error": "INVALID_REQUEST", "message": str(e)}
+                )
+                return
+
+            action = message.get("action", "process")
+            if action == "ping":
+                await self._send(writer, {"event": "pong", **self.status()})
+            elif action == "shutdown":
+                await self._send(writer, {"event": "shutting_down"})
+                self._stopped.set()
+            elif action == "process":
+                await self._process(message, writer)
+            else:
+                await self._send(
+                    writer,
+                    {
+                        "event": "error",
+                        "error": "UNKNOWN_ACTION",
+                        "message": f"Unknown action: {action}",
+                    },
+                )
+        except (ConnectionResetError, BrokenPipeError):
+            logger.debug("Client disconnected before the response was sent")
+        except Exception as e:
+            logger.error("❌ Kernel daemon connection error: %s", str(e))
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _process(self, message: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        request = message.get("request")
+        if not isinstance(request, str) or not request.strip():
+            await self._send(
+                writer,
+                {"event": "error", "error": "INVALID_REQUEST", "message": "Missing 'request'"},
+            )
+            return
+
+        requested_store = message.get("context_store")
+        if requested_store and os.path.abspath(requested_store) != os.path.abspath(
+            self.context_store_path
+        ):
+            await self._send(
+                writer,
+                {
+                    "event": "error",
+                    "error": "CONTEXT_STORE_MISMATCH",
+                    "message": f"Daemon serves context store {self.context_store_path}",
+                },
+            )
+            return
+
+        job_id = str(uuid.uuid4())
+        context = message.get("context", "academic")
+        start_servers = bool(message.get("start_servers", False))
+
+        job_info = {"job_id": job_id, "entity": None, "started_at": None}
+        queue: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def on_span(phase: str, active: Span) -> None:
+            event = {
+                "event": "progress",
+                "job_id": job_id,
+                "phase": phase,
+                "name": active.name,
+                "category": active.category,
+            }
+            if "entity" in active.attributes:
+                event["entity"] = job_info["entity"] = active.attributes["entity"]
+            if phase == "end":
+                event["duration_ms"] = round(active.duration_ms, 1)
+                if "error" in active.attributes:
+                    event["error"] = active.attributes["error"]
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        def run_job() -> Dict[str, Any]:
+            with span_listener(on_span), start_trace(request_id=job_id, name="daemon_job"):
+                return self.kernel.process_natural_language_request(
+                    request, context=context, start_servers=start_servers
+                )
+
+        await self._send(writer, {"event": "accepted", "job_id": job_id})
+
+        async with self._semaphore:
+            job_info["started_at"] = time.time()
+            self.active_jobs[job_id] = job_info
+            job = asyncio.create_task(asyncio.to_thread(run_job))
+            try:
+                while not job.done() or not queue.empty():
+                    getter = asyncio.create_task(queue.get())
+                    done, _ = await asyncio.wait({getter, job}, return_when=asyncio.FIRST_COMPLETED)
+                    if getter in done:
+                        await self._send(writer, getter.result())
+                    else:
+                        getter.cancel()
+                result = job.result()
+            except Exception as e:
+                if not job.done():
+                    # Client went away: let the kernel finish the job, but stop streaming
+                    await asyncio.shield(job)
+                    raise
+                logger.error("❌ Daemon job %s failed: %s", job_id, str(e))
+                result = {
+                    "success": False,
+                    "error": "DAEMON_JOB_ERROR",
+                    "message": str(e),
+                    "error_type": type(e).__name__,
+                }
+            finally:
+                self.active_jobs.pop(job_id, None)
+                self.completed_jobs += 1
+
+        await self._send(writer, {"event": "result", "job_id": job_id, "result": result})
+
+    async def _send(self, writer: asyncio.StreamWriter, event: Dict[str, Any]) -> None:
+        writer.write((json.dumps(event, default=str) + "\n").encode("utf-8"))
+        await writer.drain()
+
+
+async def _socket_is_live(socket_path: str) -> bool:
+    """Return True if another process is accepting connections on ``socket_path``."""
+    try:
+        _, writer = await asyncio.open_unix_connection(socket_path)
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build command line argument parser"""
+    parser = argparse.ArgumentParser(description="Run a warm BAES kernel behind a local socket")
+    parser.add_argument(
+        "--socket", default=Config.DAEMON_SOCKET_PATH, help="Unix socket path to listen on"
+    )
+    parser.add_argument(
+        "--context-store",
+        default="database/context_store.json",
+        help="Path to context store JSON file",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=Config.DAEMON_MAX_CONCURRENCY,
+        help="Maximum number of requests processed at the same time",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+def main():
+    """Daemon entry point"""
+    args = _build_arg_parser().parse_args()
+
+    if args.debug:
+        os.environ["BAE_DEBUG"] = "1"
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logging.getLogger("httpx").setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    Path(args.context_store).parent.mkdir(parents=True, exist_ok=True)
+    daemon = KernelDaemon(
+        socket_path=args.socket,
+        context_store_path=args.context_store,
+        max_concurrency=args.max_concurrency,
+    )
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        try:
+            Path(args.socket).unlink()
+        except FileNotFoundError:
+            pass
+        logger.info("🛑 Kernel daemon interrupted")
+
+
+if __name__ == "__main__":
+    main()
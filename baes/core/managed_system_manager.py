@@ -2,17 +2,44 @@ import logging
 import os
 import subprocess  # nosec B404
 import sys
+import uuid
 from pathlib import Path
 from typing import Any, Dict
 
 from dotenv import load_dotenv
 
+from baes.core.request_context import KeyedLocks
+from baes.utils.speculative_execution import is_cancelled
 from config import Config
 
 load_dotenv(override=True)
 
 logger = logging.getLogger(__name__)
 
+# One lock per managed system file (and one per managed system root for shared files),
+# shared by all ManagedSystemManager instances in the process
+_FILE_LOCKS = KeyedLocks()
+
+
+def write_text_locked(file_path: Path, content: str) -> None:
+    """Write ``content`` atomically while holding the file's lock.
+
+    Content goes to a temporary sibling that is then renamed over the target, so
+    concurrent requests and reloading servers never observe a partially written file.
+    Writes from cancelled speculative candidates are dropped.
+    """
+    with _FILE_LOCKS.hold(str(file_path.resolve())):
+        if is_cancelled():
+            logger.debug("⏭️  Skipping write of %s from cancelled speculative candidate", file_path)
+            return
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
 
 class ManagedSystemManager:
     """
@@ -29,8 +56,9 @@ class ManagedSystemManager:
     def ensure_managed_system_structure(self) -> bool:
         """Ensure the complete managed system directory structure exists."""
         try:
-            self._create_directory_structure()
-            self._create_base_files()
+            with _FILE_LOCKS.hold(str(self.managed_system_path)):
+                self._create_directory_structure()
+                self._create_base_files()
             # Skip virtual environment creation - use main project environment
             # self._ensure_virtual_environment()
             # self._install_dependencies()
@@ -60,7 +88,7 @@ class ManagedSystemManager:
             if directory.startswith(("app", "ui")) and "/" in directory:
                 init_file = self.managed_system_path / directory / "__init__.py"
                 if not init_file.exists():
-                    init_file.write_text("# Auto-generated by BAE Managed System Manager\n")
+                    write_text_locked(init_file, "# Auto-generated by BAE Managed System Manager\n")
 
     def _create_base_files(self):
         """Create base configuration files for the managed system."""
@@ -268,8 +296,8 @@ wait
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write content
-        file_path.write_text(content, encoding="utf-8")
+        # Write content (serialized per file across concurrent requests)
+        write_text_locked(file_path, content)
 
         logger.debug(f"✅ Written {artifact_type} for {entity_name} to {file_path}")
         return str(file_path)
@@ -278,7 +306,7 @@ wait
         """Write content to a file in the managed system."""
         file_path = self.managed_system_path / relative_path
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        write_text_locked(file_path, content)
 
     def _copy_config_file(self):
         """Copy config.py from BAE project root to managed system for centralized configuration access."""
@@ -292,15 +320,15 @@ wait
 
                 # Copy config.py to managed system root
                 dest_config = self.managed_system_path / "config.py"
-                dest_config.write_text(config_content)
+                write_text_locked(dest_config, config_content)
 
                 # Also copy config.py to ui directory for Streamlit access
                 ui_config = self.managed_system_path / "ui" / "config.py"
-                ui_config.write_text(config_content)
+                write_text_locked(ui_config, config_content)
 
                 # Also copy config.py to app directory for API access
                 app_config = self.managed_system_path / "app" / "config.py"
-                app_config.write_text(config_content)
+                write_text_locked(app_config, config_content)
             else:
                 logger.warning(f"⚠️ config.py not found at {source_config}")
         except Exception as e:
@@ -570,9 +598,11 @@ def create_all_tables():
 
     def update_system_files(self):
         """Update main system files to reflect current entities."""
-        self.create_main_app_file()
-        self.create_main_ui_file()
-        self.create_database_connection_file()
+        # Shared files (main.py, app.py, connection.py) are regenerated as a unit
+        with _FILE_LOCKS.hold(str(self.managed_system_path)):
+            self.create_main_app_file()
+            self.create_main_ui_file()
+            self.create_database_connection_file()
 
     def _check_structure_complete(self) -> bool:
         """Check if the managed system structure is complete."""
@@ -0,0 +1,139 @@
+"""
+Request-scoped execution state and keyed locks for EnhancedRuntimeKernel.
+
+Each natural-language request runs inside a ``RequestContext`` that owns the
+mutable state that used to live directly on the kernel (performance metrics,
+execution history, retry patterns, failure analytics). The active context is
+tracked with ``contextvars``, so it follows the request into
+``asyncio.to_thread`` workers and asyncio tasks, and two requests processed by
+the same kernel in different threads never see each other's state.
+
+``KeyedLocks`` provides one re-entrant lock per key (entity name, managed
+system file path) so that requests touching different entities can proceed in
+parallel while writes to the same entity or file are serialized.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Thread safety: No request mutates another request's state
+- DRY: Same locking primitive for entities and managed system files
+"""
+
+import contextvars
+import threading
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from baes.utils.optimization_metrics import PerformanceMetrics
+
+_active_context: contextvars.ContextVar[Optional["RequestContext"]] = contextvars.ContextVar(
+    "baes_request_context", default=None
+)
+
+
+def new_retry_patterns() -> defaultdict:
+    """Create an empty retry-pattern table (Phase 3 retry monitoring)."""
+    return defaultdict(
+        lambda: {"count": 0, "last_errors": deque(maxlen=5), "timestamps": deque(maxlen=10)}
+    )
+
+
+def new_failure_analytics() -> Dict[str, defaultdict]:
+    """Create an empty failure analytics table (Phase 3 retry monitoring)."""
+    return {
+        "common_failures": defaultdict(int),
+        "recovery_strategies": defaultdict(int),
+        "success_after_retry": defaultdict(int),
+        # TechLeadSWEA review outcomes per task key (drive speculative generation)
+        "review_attempts": defaultdict(int),
+        "review_rejections": defaultdict(int),
+    }
+
+
+@dataclass
+class RequestContext:
+    """Mutable execution state owned by a single request.
+
+    Attributes:
+        request_id: Unique identifier of the request
+        request: Original natural-language request
+        owner: Kernel instance that created the context
+        entity: Entity detected for the request (set after recognition)
+        started_at: When the request started
+        metrics: PerformanceMetrics for the request's coordination plan
+        execution_history: Per-request execution records
+        retry_patterns: Retry patterns observed during the request
+        failure_analytics: Failure counters observed during the request
+    """
+
+    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request: str = ""
+    owner: Any = None
+    entity: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.now)
+    metrics: Optional[PerformanceMetrics] = None
+    execution_history: List[Dict[str, Any]] = field(default_factory=list)
+    retry_patterns: defaultdict = field(default_factory=new_retry_patterns)
+    failure_analytics: Dict[str, defaultdict] = field(default_factory=new_failure_analytics)
+
+    def merge_into(self, target: "RequestContext") -> None:
+        """Fold this request's history, retry patterns and analytics into ``target``."""
+        target.execution_history.extend(self.execution_history)
+        for task_key, pattern in self.retry_patterns.items():
+            merged = target.retry_patterns[task_key]
+            merged["count"] = max(merged["count"], pattern["count"])
+            merged["last_errors"].extend(pattern["last_errors"])
+            merged["timestamps"].extend(pattern["timestamps"])
+        for category, counters in self.failure_analytics.items():
+            for key, count in counters.items():
+                target.failure_analytics[category][key] += count
+        if self.metrics is not None:
+            target.metrics = self.metrics
+
+
+def current_request_context(owner: Any = None) -> Optional[RequestContext]:
+    """Return the active request context, optionally only if created by ``owner``."""
+    context = _active_context.get()
+    if context is not None and owner is not None and context.owner is not owner:
+        return None
+    return context
+
+
+@contextmanager
+def request_scope(context: RequestContext) -> Iterator[RequestContext]:
+    """Activate ``context`` for the current thread/task and its children."""
+    token = _active_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_context.reset(token)
+
+
+class KeyedLocks:
+    """Registry of re-entrant locks, one per key.
+
+    Locks are created on first use and kept for the lifetime of the registry;
+    the key space (entities, managed system files) is small and bounded.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, threading.RLock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> threading.RLock:
+        """Return the lock for ``key``, creating it if needed."""
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        """Hold the lock for ``key`` for the duration of the block."""
+        lock = self.get(key)
+        with lock:
+            yield
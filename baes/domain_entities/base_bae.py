@@ -10,8 +10,26 @@ from ..agents.base_agent import BaseAgent
 from ..core.context_store import ContextStore
 from ..core.recognition_cache import RecognitionCache
 from ..llm.openai_client import OpenAIClient
+from ..utils.relationship_compiler import RelationshipSpec, get_relationship_compiler
 from config import Config
 
+# Enumerated attribute types, e.g. "enum[active, inactive]" or "Literal['a', 'b']"
+_ENUM_TYPE_PATTERN = re.compile(r"^\s*(?:enum|literal)\s*[\[(](.*)[\])]\s*$", re.IGNORECASE)
+# Uniqueness rules, e.g. "email must be unique" or "unique email"
+_UNIQUE_RULE_PATTERNS = (
+    re.compile(r"\b(\w+)\s+(?:must|should)\s+be\s+unique\b", re.IGNORECASE),
+    re.compile(r"\bunique\s+(\w+)\b", re.IGNORECASE),
+)
+# Relationship requests, e.g. "add course to student" or "enroll a student in the course"
+_RELATIONSHIP_REQUEST_PATTERN = re.compile(
+    r"^\s*(add|assign|attach|associate|connect|link|enroll|register)\s+(?:an?\s+|the\s+)?(\w+)"
+    r"\s+(?:to|with|in|into)\s+(?:an?\s+|the\s+)?(\w+)(?:\s+entity)?\s*[.!]?\s*$",
+    re.IGNORECASE,
+)
+# Verbs whose first entity gets the foreign key ("enroll student in course": student gets course_id);
+# for the others the second one does ("add course to student": student gets course_id)
+_HOLDER_FIRST_VERBS = {"enroll", "link", "register"}
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,6 +207,11 @@ class BaseBae(BaseAgent):
         - Simple relationships (foreign keys only, no many-to-many)
         - No custom business logic in attributes
 
+        Enumerated attribute types and uniqueness rules are not custom logic: they
+        are returned in "custom_logic" (enum_fields, unique_fields) and composed
+        into the templates from fragments. Foreign keys (foreign_keys) are added by
+        the Backend and Frontend SWEAs from the entity's relationships.
+
         Constitutional compliance:
         - Fail-fast: Misclassification caught by template rendering errors
         - Observability: Classification reason logged for analysis
@@ -203,7 +226,8 @@ class BaseBae(BaseAgent):
                 "entity_type": "STANDARD" | "CUSTOM",
                 "requires_custom_logic": bool,
                 "custom_logic_reasons": List[str],  # Empty for STANDARD
-                "template_eligible": bool
+                "template_eligible": bool,
+                "custom_logic": Dict[str, Any]  # Template-composable logic by kind
             }
 
         Feature: 001-performance-optimization / US1: Template-Based Generation
@@ -211,19 +235,32 @@ class BaseBae(BaseAgent):
         from baes.utils.template_registry import EntityType
 
         custom_logic_reasons = []
+        enum_fields: Dict[str, List[str]] = {}
+        attribute_names = set()
 
         # Check 1: Attribute type complexity
         attributes = schema.get("attributes", [])
         if isinstance(attributes, list):
             for attr in attributes:
                 if isinstance(attr, dict):
+                    attr_name = attr.get("name", "")
                     attr_type = attr.get("type", "str")
                 elif isinstance(attr, str):
                     # Parse "name:str" format
-                    parts = attr.split(":")
-                    attr_type = parts[1] if len(parts) > 1 else "str"
+                    parts = attr.split(":", 1)
+                    attr_name = parts[0].strip()
+                    attr_type = parts[1].strip() if len(parts) > 1 else "str"
                 else:
-                    attr_type = "str"
+                    attr_name, attr_type = "", "str"
+                attribute_names.add(attr_name)
+
+                # Enumerated types are composed from the enum_fields fragment
+                enum_match = _ENUM_TYPE_PATTERN.match(attr_type)
+                if enum_match and attr_name:
+                    values = [v.strip().strip("'\"") for v in re.split(r"[,|]", enum_match.group(1))]
+                    if all(values):
+                        enum_fields[attr_name] = values
+                        continue
 
                 # Check for complex types
                 if attr_type.lower() not in ["str", "string", "text", "int", "integer", "float", "decimal", "bool", "boolean", "date", "datetime", "timestamp"]:
@@ -237,10 +274,22 @@ class BaseBae(BaseAgent):
             if any(keyword in rule_lower for keyword in computed_property_keywords):
                 custom_logic_reasons.append(f"Computed property detected: {rule}")
 
-        # Check 3: Complex validation rules (beyond type checking)
+        # Check 3: Complex validation rules (beyond type checking); uniqueness of an
+        # attribute is composed from the unique_fields fragment
+        unique_fields: List[str] = []
+        names_by_lower = {name.lower(): name for name in attribute_names if name}
         validation_keywords = ["validate", "check", "must be", "should be", "greater than", "less than", "between", "regex", "pattern"]
         for rule in business_rules:
             rule_lower = rule.lower() if isinstance(rule, str) else ""
+            unique_names = [
+                names_by_lower[match.group(1)]
+                for pattern in _UNIQUE_RULE_PATTERNS
+                for match in pattern.finditer(rule_lower)
+                if match.group(1) in names_by_lower
+            ]
+            if unique_names:
+                unique_fields.extend(name for name in unique_names if name not in unique_fields)
+                continue
             if any(keyword in rule_lower for keyword in validation_keywords):
                 # Only flag if validation is complex (not simple "must not be empty")
                 if "not be empty" not in rule_lower and "required" not in rule_lower:
@@ -277,11 +326,18 @@ class BaseBae(BaseAgent):
         if custom_logic_reasons:
             logger.debug("Custom logic reasons for %s: %s", self.entity_name, custom_logic_reasons)
 
+        custom_logic: Dict[str, Any] = {}
+        if enum_fields:
+            custom_logic["enum_fields"] = enum_fields
+        if unique_fields:
+            custom_logic["unique_fields"] = unique_fields
+
         return {
             "entity_type": entity_type.value,
             "requires_custom_logic": requires_custom_logic,
             "custom_logic_reasons": custom_logic_reasons,
             "template_eligible": not requires_custom_logic,
+            "custom_logic": custom_logic,
         }
 
     def handle_task(self, task: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -428,6 +484,57 @@ class BaseBae(BaseAgent):
                 "error": True
             }
 
+    def _match_relationship_request(self, request: str) -> Dict[str, Any]:
+        """
+        Recognize "<verb> <entity> to <entity>" relationship requests without the LLM.
+
+        Both words must name known entities (this BAE's or one in the context store) and
+        this BAE's entity must get the foreign key; the relationship type of a stored
+        relationship record is kept, new relationships are foreign keys.
+
+        Returns:
+            Relationship interpretation (same fields as the LLM interpretation),
+            or an empty dict when the request needs LLM interpretation
+        """
+        match = _RELATIONSHIP_REQUEST_PATTERN.match(request or "")
+        if not match:
+            return {}
+
+        verb, first, second = (group.lower() for group in match.groups())
+        known_entities = {self.entity_name.lower(), *self._get_existing_entities_context()}
+
+        def _entity(word: str) -> str:
+            if word in known_entities:
+                return word
+            return word[:-1] if word.endswith("s") and word[:-1] in known_entities else ""
+
+        first, second = _entity(first), _entity(second)
+        holder, related = (first, second) if verb in _HOLDER_FIRST_VERBS else (second, first)
+        if not holder or not related or holder == related or holder != self.entity_name.lower():
+            return {}
+
+        domain = getattr(self, "domain", "academic")
+        relationship_type = "foreign_key"
+        context_store_path = os.environ.get("BAE_CONTEXT_STORE_PATH", "database/context_store.json")
+        for record in ContextStore(context_store_path).get_entity_relationships(self.entity_name, domain):
+            if record.get("primary_entity") == self.entity_name and str(record.get("related_entity")).lower() == related:
+                relationship_type = record.get("relationship_type") or relationship_type
+
+        related_entity = related.capitalize()
+        logger.info(f"🔗 {self.entity_name}BAE: Relationship request matched deterministically - {related_entity} -> {self.entity_name} ({relationship_type})")
+        return {
+            "operation_type": "relationship",
+            "is_relationship": True,
+            "target_entity": self.entity_name,
+            "related_entity": related_entity,
+            "relationship_type": relationship_type,
+            "relationship_description": f"{self.entity_name} references {related_entity}",
+            "entities_mentioned": [self.entity_name, related_entity],
+            "relationship_direction": f"{related}_id added to {self.entity_name}",
+            "confidence": 1.0,
+            "reasoning": f"Matched '{verb} <entity> <entity>' relationship pattern with known entities",
+        }
+
     def _handle_relationship_request(self, request: str, context: str, relationship_info: Dict[str, Any]) -> Dict[str, Any]:
         """Handle relationship creation request with proper DatabaseSWEA coordination"""
         target_entity = relationship_info["target_entity"]
@@ -481,9 +588,22 @@ class BaseBae(BaseAgent):
             "descriptive_field": "name",  # Default assumption
         }
 
+        # Record the relationship and compile its migration from templates
+        relationship_type = relationship_info.get("relationship_type") or "foreign_key"
+        spec = RelationshipSpec.create(self.entity_name, related_entity, relationship_type)
+        compiled_relationships = []
+        if Config.ENABLE_RELATIONSHIP_COMPILER:
+            context_store_path = os.environ.get("BAE_CONTEXT_STORE_PATH", "database/context_store.json")
+            ContextStore(context_store_path).store_entity_relationship(
+                self.entity_name, spec.secondary, relationship_type, getattr(self, "domain", "academic")
+            )
+            compiled_relationships = [get_relationship_compiler().compile(spec).to_dict()]
 
-        # Ensure we do not duplicate if attribute already present
-        if not any(attr.get("name") == foreign_key_attr_name for attr in existing_attributes):
+        # Ensure we do not duplicate if attribute already present; many-to-many
+        # relationships use a junction table instead of a foreign key column
+        if spec.cardinality == "many" and Config.ENABLE_RELATIONSHIP_COMPILER:
+            updated_attributes = existing_attributes
+        elif not any(attr.get("name") == foreign_key_attr_name for attr in existing_attributes):
             updated_attributes = existing_attributes + [foreign_key_attr]
         else:
             updated_attributes = existing_attributes
@@ -540,6 +660,7 @@ class BaseBae(BaseAgent):
                             "relationship_type": relationship_info["relationship_type"],
                         }
                     ],
+                    "compiled_relationships": compiled_relationships,
                     "preserve_data": True,
                 },
             },
@@ -552,6 +673,7 @@ class BaseBae(BaseAgent):
                     "context": request,
                     "relationship_update": True,
                     "relationships": [relationship_info],
+                    "compiled_relationships": compiled_relationships,
                     "business_vocabulary": True,
                     "domain_focus": True,
                     "semantic_coherence": True,
@@ -809,7 +931,13 @@ class BaseBae(BaseAgent):
             request = payload.get("request", "")
             context = payload.get("context", "academic")
 
-            # Use unified LLM interpretation for ALL requests including relationships
+            # Relationship requests between known entities are compiled without the LLM
+            if Config.ENABLE_RELATIONSHIP_COMPILER:
+                relationship_info = self._match_relationship_request(request)
+                if relationship_info:
+                    return self._handle_relationship_request(request, context, relationship_info)
+
+            # Use unified LLM interpretation for ALL other requests including relationships
             prompt = self._build_unified_interpretation_prompt(request, context)
             
             # Enhanced JSON schema to include relationship detection
@@ -1153,6 +1281,15 @@ class BaseBae(BaseAgent):
             "user_explicitly_specified": True,
             "strict_attribute_compliance": True
         }
+
+        # Template eligibility of the (evolved) schema: STANDARD entities are rendered
+        # from templates, only CUSTOM ones need LLM code generation
+        entity_classification = self._detect_custom_logic(
+            {
+                "attributes": attributes,
+                "relationships": (self.current_schema or {}).get("relationships", {}),
+            }
+        )
         
         return [
             {
@@ -1184,6 +1321,7 @@ class BaseBae(BaseAgent):
                     "business_rules": True,
                     "attribute_constraints": attribute_constraint,
                     "use_only_specified_attributes": True,
+                    "entity_classification": entity_classification,
                 },
             },
             {
@@ -1208,6 +1346,8 @@ class BaseBae(BaseAgent):
                     "entity": self.entity_name,
                     "attributes": attributes,
                     "context": f"{operation_type} operation",
+                    "is_evolution": is_evolution,
+                    "entity_classification": entity_classification,
                     "crud_operations": True,
                     "business_vocabulary": True,
                     "domain_focus": True,
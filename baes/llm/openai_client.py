@@ -8,6 +8,12 @@ from datetime import datetime
 import openai
 from dotenv import load_dotenv
 
+from baes.standards.compressed_standards import estimate_token_counts
+from baes.utils.code_stream import CodeStreamAborted, IncrementalCodeExtractor
+from baes.utils.execution_trace import span
+from baes.utils.speculative_execution import SpeculationCancelled, current_candidate
+from config import Config
+
 load_dotenv(override=True)
 
 # Configure logging
@@ -22,6 +28,167 @@ if os.getenv("BAE_DEBUG", "0").lower() in ("1", "true", "on", "yes"):
 else:
     httpx_logger.setLevel(logging.WARNING)  # Only show warnings and errors
 
+# Prompt layout policy: static text first, request-specific text last. System prompts
+# hold no per-request content and messages end with the variable parts (entity,
+# attributes, context), so every request shares a long identical prefix that the
+# provider's prompt cache can reuse (see usage.prompt_tokens_details.cached_tokens).
+
+BAE_SYSTEM_PROMPT = """
+You are working with Business Autonomous Entities (BAEs) that represent domain entities
+as living, autonomous agents within the system.
+
+Your responsibilities:
+1. Maintain semantic coherence between business vocabulary and technical implementation
+2. Preserve domain knowledge and business rules
+3. Ensure generated artifacts reflect business terminology
+4. Focus on domain entity representation, not software engineering roles
+5. Enable runtime evolution while preserving semantic consistency
+
+Always prioritize business domain understanding and vocabulary preservation.
+"""
+
+FASTAPI_ROUTES_SYSTEM_PROMPT = """
+You are generating FastAPI routes for a domain entity. <Entity> stands for the entity name
+and <entity> for its lowercase form; both are given in the ENTITY section at the end of the request.
+
+CRITICAL REQUIREMENTS:
+- Use APIRouter, NOT FastAPI app
+- Start with: router = APIRouter(prefix="/api", tags=["<Entity>s"])
+- Use sqlite3 for database operations with path: "../database/baes_system.db"
+- Include proper Pydantic models for requests/responses
+- Implement full CRUD: POST, GET (list), GET (single), PUT, DELETE
+- Use /api/<entity>s/ endpoint pattern with:
+  * POST /api/<entity>s/ (create, return with id)
+  * GET /api/<entity>s/ (list all)
+  * GET /api/<entity>s/{id} (get by id)
+  * PUT /api/<entity>s/{id} (update by id)
+  * DELETE /api/<entity>s/{id} (delete by id)
+- Handle database with sqlite3 and proper row_factory
+- Database path must be: os.path.abspath(os.path.join(os.path.dirname(__file__), "../database/baes_system.db"))
+- Add error handling for database connection failures
+- Ensure database file exists before connecting
+- Create separate response model that includes id field for API responses
+- Use 'id' as primary key in all endpoints, not other fields
+- ONLY use the attributes listed in the ENTITY section
+- Do NOT add extra fields beyond what's specified
+- Make all fields required (no Optional fields)
+
+IMPORTANT: Use this database connection pattern:
+```python
+def get_db_connection():
+    db_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../database/baes_system.db"))
+    if not os.path.exists(db_path):
+        raise HTTPException(status_code=500, detail=f"Database not found at {db_path}")
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+```
+
+Generate ONLY the complete Python code, no markdown, no explanations.
+"""
+
+STREAMLIT_UI_SYSTEM_PROMPT = """
+You are generating Streamlit UI for domain entity management. <Entity> stands for the entity name
+and <entity> for its lowercase form; both are given in the ENTITY section at the end of the request.
+
+CRITICAL REQUIREMENTS:
+- Create a complete functional Streamlit interface for <Entity> CRUD operations
+- MUST include these imports at the top of the file:
+  * import streamlit as st
+  * import requests
+  * import pandas as pd
+  * from config import Config
+- MUST use API endpoint from Config.get_api_endpoint_url() method
+- Set API_URL = Config.get_api_endpoint_url("<entity>s") at the top of the file
+- Generate form fields dynamically based on the attributes listed in the ENTITY section
+- Use st.dataframe() with column_config for proper table display with column names
+- Use pandas DataFrame (pd.DataFrame) to properly format data for st.dataframe()
+- Use SAFE attribute access with .get() method for all data fields to avoid KeyError
+- Handle missing or differently named fields gracefully (e.g., 'name' vs 'Name')
+- Implement working edit functionality using session state and forms
+- Implement working delete functionality using session state for confirmation (
+    do NOT use st.confirm which doesn't exist)
+- For delete confirmation, use st.button() with session state to show/hide confirmation buttons
+- Delete confirmation pattern: First button shows "Are you sure?", second button performs actual delete
+- Include proper error handling and success messages
+- Use st.rerun() for real-time updates (NOT st.experimental_rerun which is deprecated) after operations
+- Use business vocabulary and user-friendly labels
+- Follow the EXACT structure from the frontend_gen.txt template
+- ONLY use the attributes listed in the ENTITY section
+- Generate complete form fields for both create and edit operations
+- Do NOT add extra fields beyond what's specified
+
+IMPORTANT: Generate ALL form input fields based on the attributes provided.
+For example, if attributes are ["name: str", "registration_number: str", "course: str"],
+generate text_input fields for each of these in both create and edit forms.
+
+CRITICAL ATTRIBUTE ACCESS PATTERN:
+- ALWAYS use .get() method for accessing dictionary fields: item.get('field_name', 'default_value')
+- NEVER use direct access like item['field_name'] which can cause KeyError
+- For display names in dropdowns/buttons, use fallback pattern:
+  display_name = item.get('name', item.get('title', item.get('Name', f"ID {item['id']}")))
+- Handle both lowercase and capitalized field names gracefully
+
+DELETE CONFIRMATION PATTERN (required):
+```python
+# Example delete confirmation pattern using session state
+# Use safe attribute access to get display name
+display_name = selected_item.get('name', selected_item.get('Name', f"ID {selected_item['id']}"))
+if st.button(f"Delete {display_name}", type="secondary"):
+    st.session_state.confirm_delete_id = selected_item['id']
+
+if hasattr(st.session_state, 'confirm_delete_id') and st.session_state.confirm_delete_id:
+    st.warning("⚠️ Are you sure you want to delete this <entity>?")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("✅ Yes, Delete", type="primary"):
+            # Perform actual delete API call here
+            # Clear confirmation state
+            del st.session_state.confirm_delete_id
+            st.rerun()
+    with col2:
+        if st.button("❌ Cancel"):
+            del st.session_state.confirm_delete_id
+            st.rerun()
+```
+
+Generate ONLY the complete Python Streamlit code, no markdown, no explanations.
+"""
+
+DOMAIN_CODE_SYSTEM_PROMPT = """
+You are a code generation agent working under BAE coordination for a domain entity, described
+(with the code type, attributes and business rules) in the ENTITY section at the end of the request.
+
+Requirements:
+1. Generate clean, professional code of the requested code type
+2. Use business vocabulary in naming and documentation
+3. Include proper validation reflecting business rules
+4. Maintain semantic coherence with domain entity representation
+5. Ensure code is immediately executable and follows best practices
+6. Focus on domain entity operations, not generic CRUD
+
+Return ONLY the code, no explanations or markdown formatting.
+"""
+
+JSON_RESPONSE_INSTRUCTIONS = """
+CRITICAL: You MUST respond with valid JSON only. Do not include any text before or after the JSON.
+Do not use markdown code blocks. Do not include explanations outside the JSON structure.
+
+JSON REQUIREMENTS:
+- Start with { and end with }
+- Use double quotes for all strings
+- Use proper JSON syntax (no trailing commas, valid types)
+- Include all required fields
+- Do not include any text outside the JSON structure
+"""
+
+
+def _cached_prompt_tokens(usage: Any) -> int:
+    """Prompt tokens served from the provider's prompt cache (0 when not reported)"""
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", 0)
+    return cached_tokens if isinstance(cached_tokens, int) else 0
+
 
 class OpenAIClient:
     """
@@ -66,6 +233,35 @@ class OpenAIClient:
 
         return response.strip()
 
+    def _completion_params(self, messages: list, temperature: float, max_tokens: int) -> Dict[str, Any]:
+        """Chat completion parameters for the configured model (raises SpeculationCancelled)"""
+        # Build API parameters conditionally for gpt-4 vs gpt-5 models
+        api_params = {
+            "model": self.model,
+            "messages": messages
+        }
+
+        # Speculative candidates sample with their own temperature and skip the
+        # call entirely once another candidate has been selected
+        candidate = current_candidate()
+        if candidate is not None:
+            if candidate.cancelled:
+                raise SpeculationCancelled()
+            if candidate.temperature is not None:
+                temperature = candidate.temperature
+
+        # gpt-5 models only support temperature=1 (default), so we omit it
+        # gpt-4 models support custom temperature values
+        if not self.model.startswith("gpt-5"):
+            api_params["temperature"] = temperature
+
+        # gpt-5 uses max_completion_tokens, gpt-4 uses max_tokens
+        if self.model.startswith("gpt-5"):
+            api_params["max_completion_tokens"] = max_tokens
+        else:
+            api_params["max_tokens"] = max_tokens
+        return api_params
+
     def generate_response(
         self,
         prompt: str,
@@ -101,26 +297,21 @@ class OpenAIClient:
             else:
                 messages.append({"role": "user", "content": prompt})
 
-            # Build API parameters conditionally for gpt-4 vs gpt-5 models
-            api_params = {
-                "model": self.model,
-                "messages": messages
-            }
-            
-            # gpt-5 models only support temperature=1 (default), so we omit it
-            # gpt-4 models support custom temperature values
-            if not self.model.startswith("gpt-5"):
-                api_params["temperature"] = temperature
-            
-            # gpt-5 uses max_completion_tokens, gpt-4 uses max_tokens
-            if self.model.startswith("gpt-5"):
-                api_params["max_completion_tokens"] = max_tokens
-            else:
-                api_params["max_tokens"] = max_tokens
-            
-            response = self.client.chat.completions.create(**api_params)
+            api_params = self._completion_params(messages, temperature, max_tokens)
+
+            with span("openai.chat.completions", category="llm", model=self.model) as llm_span:
+                response = self.client.chat.completions.create(**api_params)
+                cached_tokens = _cached_prompt_tokens(response.usage)
+                if llm_span is not None:
+                    llm_span.set_attribute("prompt_tokens", response.usage.prompt_tokens)
+                    llm_span.set_attribute("completion_tokens", response.usage.completion_tokens)
+                    llm_span.set_attribute("cached_prompt_tokens", cached_tokens)
             from baes.utils.metrics_tracker import add_tokens
-            add_tokens(response.usage.prompt_tokens, response.usage.completion_tokens)
+            add_tokens(response.usage.prompt_tokens, response.usage.completion_tokens, cached_tokens)
+            if cached_tokens:
+                logger.debug(
+                    f"💾 Prompt cache hit: {cached_tokens}/{response.usage.prompt_tokens} prompt tokens cached"
+                )
 
             response_content = response.choices[0].message.content
 
@@ -130,6 +321,8 @@ class OpenAIClient:
 
             return response_content
 
+        except SpeculationCancelled:
+            raise
         except Exception as e:
             logger.error(f"OpenAI API error: {str(e)}")
             error_response = f"Error generating response: {str(e)}"
@@ -220,18 +413,8 @@ class OpenAIClient:
             )
 
     def _enhance_prompt_for_json(self, prompt: str, json_schema: Optional[Dict[str, Any]] = None) -> str:
-        """Enhance prompt to ensure JSON response format"""
-        json_instructions = """
-CRITICAL: You MUST respond with valid JSON only. Do not include any text before or after the JSON.
-Do not use markdown code blocks. Do not include explanations outside the JSON structure.
-
-JSON REQUIREMENTS:
-- Start with { and end with }
-- Use double quotes for all strings
-- Use proper JSON syntax (no trailing commas, valid types)
-- Include all required fields
-- Do not include any text outside the JSON structure
-"""
+        """Enhance prompt to ensure JSON response format (instructions lead, prompt follows)"""
+        json_instructions = JSON_RESPONSE_INSTRUCTIONS
         
         if json_schema:
             schema_str = json.dumps(json_schema, indent=2)
@@ -242,7 +425,7 @@ EXPECTED JSON STRUCTURE:
 You must follow this exact structure. All fields are required unless marked as optional.
 """
         
-        enhanced_prompt = f"{prompt}\n\n{json_instructions}"
+        enhanced_prompt = f"{json_instructions}\n\n{prompt}"
         return enhanced_prompt
 
     def _ensure_valid_json(self, response: str, json_schema: Optional[Dict[str, Any]] = None) -> str:
@@ -339,23 +522,8 @@ You must follow this exact structure. All fields are required unless marked as o
         temperature: float = 0,
     ) -> str:
         """Generate response with specific domain entity focus and semantic coherence"""
-        system_prompt = f"""
-        You are working with Business Autonomous Entities (BAEs) that represent domain entities
-        as living, autonomous agents within the system.
-
-        Current focus: {entity_type} entity in {context} context
-
-        Your responsibilities:
-        1. Maintain semantic coherence between business vocabulary and technical implementation
-        2. Preserve domain knowledge and business rules
-        3. Ensure generated artifacts reflect business terminology
-        4. Focus on domain entity representation, not software engineering roles
-        5. Enable runtime evolution while preserving semantic consistency
-
-        Always prioritize business domain understanding and vocabulary preservation.
-        """
-
-        return self.generate_response(prompt, system_prompt, temperature)
+        focus = f"Current focus: {entity_type} entity in {context} context"
+        return self.generate_response(f"{prompt}\n\n{focus}\n", BAE_SYSTEM_PROMPT, temperature)
 
     def generate_code_with_domain_focus(
         self, prompt: str, code_type: str, entity_context: Dict[str, Any]
@@ -365,143 +533,116 @@ You must follow this exact structure. All fields are required unless marked as o
         attributes = entity_context.get("attributes", [])
         business_rules = entity_context.get("business_rules", [])
 
+        # Static system prompt by code type; the entity section follows the prompt
+        entity_lines = [
+            f"- {entity} domain entity (<Entity> = {entity}, <entity> = {entity.lower()})",
+            f"- Attributes (use ONLY these): {attributes}",
+        ]
         # Special handling for FastAPI routes to ensure proper router generation
         if "FastAPI" in code_type or "Routes" in code_type or "API" in code_type:
-            system_prompt = f"""
-            You are generating FastAPI routes for {entity} entity.
-
-            CRITICAL REQUIREMENTS:
-            - Use APIRouter, NOT FastAPI app
-            - Start with: router = APIRouter(prefix="/api", tags=["{entity}s"])
-            - Use sqlite3 for database operations with path: "../database/baes_system.db"
-            - Include proper Pydantic models for requests/responses
-            - Implement full CRUD: POST, GET (list), GET (single), PUT, DELETE
-            - Use /api/{entity.lower()}s/ endpoint pattern with:
-              * POST /api/{entity.lower()}s/ (create, return with id)
-              * GET /api/{entity.lower()}s/ (list all)
-              * GET /api/{entity.lower()}s/{{id}} (get by id)
-              * PUT /api/{entity.lower()}s/{{id}} (update by id)
-              * DELETE /api/{entity.lower()}s/{{id}} (delete by id)
-            - Handle database with sqlite3 and proper row_factory
-            - Database path must be: os.path.abspath(os.path.join(os.path.dirname(__file__), "../database/baes_system.db"))
-            - Add error handling for database connection failures
-            - Ensure database file exists before connecting
-            - Create separate response model that includes id field for API responses
-            - Use 'id' as primary key in all endpoints, not other fields
-            - ONLY use the attributes specified: {attributes}
-            - Do NOT add extra fields beyond what's specified
-            - Make all fields required (no Optional fields)
-
-            Entity: {entity}
-            Attributes (use ONLY these): {attributes}
-
-            IMPORTANT: Use this database connection pattern:
-            ```python
-            def get_db_connection():
-                db_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../database/baes_system.db"))
-                if not os.path.exists(db_path):
-                    raise HTTPException(status_code=500, detail=f"Database not found at {{db_path}}")
-                conn = sqlite3.connect(db_path)
-                conn.row_factory = sqlite3.Row
-                return conn
-            ```
-
-            Generate ONLY the complete Python code, no markdown, no explanations.
-            """
+            system_prompt = FASTAPI_ROUTES_SYSTEM_PROMPT
         elif "Streamlit" in code_type or "UI" in code_type or "Frontend" in code_type:
-            system_prompt = f"""
-            You are generating Streamlit UI for {entity} entity management.
-
-            CRITICAL REQUIREMENTS:
-            - Create a complete functional Streamlit interface for {entity} CRUD operations
-            - MUST include these imports at the top of the file:
-              * import streamlit as st
-              * import requests
-              * import pandas as pd
-              * from config import Config
-            - MUST use API endpoint from Config.get_api_endpoint_url() method
-            - Set API_URL = Config.get_api_endpoint_url("{entity.lower()}s") at the top of the file
-            - Generate form fields dynamically based on provided attributes: {attributes}
-            - Use st.dataframe() with column_config for proper table display with column names
-            - Use pandas DataFrame (pd.DataFrame) to properly format data for st.dataframe()
-            - Use SAFE attribute access with .get() method for all data fields to avoid KeyError
-            - Handle missing or differently named fields gracefully (e.g., 'name' vs 'Name')
-            - Implement working edit functionality using session state and forms
-            - Implement working delete functionality using session state for confirmation (
-                do NOT use st.confirm which doesn't exist)
-            - For delete confirmation, use st.button() with session state to show/hide confirmation buttons
-            - Delete confirmation pattern: First button shows "Are you sure?", second button performs actual delete
-            - Include proper error handling and success messages
-            - Use st.rerun() for real-time updates (NOT st.experimental_rerun which is deprecated) after operations
-            - Use business vocabulary and user-friendly labels
-            - Follow the EXACT structure from the frontend_gen.txt template
-            - ONLY use the attributes specified: {attributes}
-            - Generate complete form fields for both create and edit operations
-            - Do NOT add extra fields beyond what's specified
-
-            Entity: {entity}
-            Attributes (use ONLY these): {attributes}
-
-            IMPORTANT: Generate ALL form input fields based on the attributes provided.
-            For example, if attributes are ["name: str", "registration_number: str", "course: str"],
-            generate text_input fields for each of these in both create and edit forms.
-
-            CRITICAL ATTRIBUTE ACCESS PATTERN:
-            - ALWAYS use .get() method for accessing dictionary fields: item.get('field_name', 'default_value')
-            - NEVER use direct access like item['field_name'] which can cause KeyError
-            - For display names in dropdowns/buttons, use fallback pattern:
-              display_name = item.get('name', item.get('title', item.get('Name', f"ID {{item['id']}}")))
-            - Handle both lowercase and capitalized field names gracefully
-
-            DELETE CONFIRMATION PATTERN (required):
-            ```python
-            # Example delete confirmation pattern using session state
-            # Use safe attribute access to get display name
-            display_name = selected_item.get('name', selected_item.get('Name', f"ID {{selected_item['id']}}"))
-            if st.button(f"Delete {{display_name}}", type="secondary"):
-                st.session_state.confirm_delete_id = selected_item['id']
-
-            if hasattr(st.session_state, 'confirm_delete_id') and st.session_state.confirm_delete_id:
-                st.warning("⚠️ Are you sure you want to delete this {entity.lower()}?")
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("✅ Yes, Delete", type="primary"):
-                        # Perform actual delete API call here
-                        # Clear confirmation state
-                        del st.session_state.confirm_delete_id
-                        st.rerun()
-                with col2:
-                    if st.button("❌ Cancel"):
-                        del st.session_state.confirm_delete_id
-                        st.rerun()
-            ```
-
-            Generate ONLY the complete Python Streamlit code, no markdown, no explanations.
-            """
+            system_prompt = STREAMLIT_UI_SYSTEM_PROMPT
         else:
-            system_prompt = f"""
-            You are a code generation agent working under BAE coordination for the {entity} domain entity.
-
-            Code Type: {code_type}
-            Entity Attributes: {attributes}
-            Business Rules: {business_rules}
+            system_prompt = DOMAIN_CODE_SYSTEM_PROMPT
+            entity_lines += [f"- Code Type: {code_type}", f"- Business Rules: {business_rules}"]
+        entity_section = "ENTITY:\n" + "\n".join(entity_lines) + "\n"
 
-            Requirements:
-            1. Generate clean, professional {code_type} code
-            2. Use business vocabulary in naming and documentation
-            3. Include proper validation reflecting business rules
-            4. Maintain semantic coherence with domain entity representation
-            5. Ensure code is immediately executable and follows best practices
-            6. Focus on domain entity operations, not generic CRUD
+        if Config.ENABLE_STREAMING_GENERATION:
+            return self.generate_code_stream(f"{prompt}\n\n{entity_section}", system_prompt, temperature=0)
 
-            Return ONLY the code, no explanations or markdown formatting.
-            """
-
-        response = self.generate_response(prompt, system_prompt, temperature=0)
+        response = self.generate_response(f"{prompt}\n\n{entity_section}", system_prompt, temperature=0)
 
         # Strip markdown formatting if present
         return self._strip_markdown_formatting(response)
 
+    def generate_code_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0,
+        max_tokens: int = 2000,
+        language: str = "python",
+    ) -> str:
+        """
+        Generate code from a streamed completion, checked while it streams.
+
+        The stream is closed as soon as the markdown code block closes (trailing
+        explanations are never waited for) or the partial code is clearly invalid
+        (wrong language, syntax error at a top-level statement boundary).
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            temperature: Sampling temperature (0 for deterministic)
+            max_tokens: Maximum tokens in response
+            language: Expected code language
+
+        Returns:
+            Generated code without markdown formatting
+
+        Raises:
+            CodeStreamAborted: The generated code is invalid
+            SpeculationCancelled: Another speculative candidate was selected
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        api_params = self._completion_params(messages, temperature, max_tokens)
+        api_params["stream"] = True
+        api_params["stream_options"] = {"include_usage": True}
+
+        candidate = current_candidate()
+        extractor = IncrementalCodeExtractor(language)
+        received = []
+        usage = None
+        with span("openai.chat.completions", category="llm", model=self.model, stream=True) as llm_span:
+            stream = self.client.chat.completions.create(**api_params)
+            try:
+                for chunk in stream:
+                    if candidate is not None and candidate.cancelled:
+                        raise SpeculationCancelled()
+                    usage = getattr(chunk, "usage", None) or usage
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    received.append(chunk.choices[0].delta.content)
+                    state = extractor.feed(received[-1])
+                    if state.complete or state.aborted:
+                        break
+            finally:
+                # Stops generation (and billing) of the rest of the completion
+                close = getattr(stream, "close", None)
+                if callable(close):
+                    close()
+
+            # Usage arrives with the last chunk; streams closed early are estimated
+            if usage is not None:
+                prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+            else:
+                *message_tokens, completion_tokens = estimate_token_counts(
+                    [message["content"] for message in messages] + ["".join(received)]
+                )
+                prompt_tokens = sum(message_tokens)
+            cached_tokens = _cached_prompt_tokens(usage)
+            if llm_span is not None:
+                llm_span.set_attribute("prompt_tokens", prompt_tokens)
+                llm_span.set_attribute("completion_tokens", completion_tokens)
+                llm_span.set_attribute("cached_prompt_tokens", cached_tokens)
+                llm_span.set_attribute("stream_complete", extractor.state.complete)
+        from baes.utils.metrics_tracker import add_tokens
+        add_tokens(prompt_tokens, completion_tokens, cached_tokens)
+
+        try:
+            code = extractor.finish()
+        except CodeStreamAborted as e:
+            logger.warning(f"🛑 Code stream aborted after {len(received)} chunks: {e.reason}")
+            raise
+        if extractor.state.complete:
+            logger.debug(f"⚡ Code block complete after {len(received)} chunks; stream closed")
+        return code
+
     def validate_semantic_coherence(
         self, artifact_code: str, artifact_type: str, domain_context: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -510,14 +651,7 @@ You must follow this exact structure. All fields are required unless marked as o
         business_vocabulary = domain_context.get("business_vocabulary", [])
 
         prompt = f"""
-        Validate this {artifact_type} artifact for semantic coherence with {entity} domain entity:
-
-        Artifact Code:
-        {artifact_code}
-
-        Domain Context:
-        - Entity: {entity}
-        - Business Vocabulary: {business_vocabulary}
+        Validate the artifact below for semantic coherence with its domain entity.
 
         Analyze and return JSON with:
         {{
@@ -530,6 +664,17 @@ You must follow this exact structure. All fields are required unless marked as o
         }}
 
         Return ONLY valid JSON.
+
+        Artifact Type: {artifact_type}
+
+        Artifact Code:
+        {artifact_code}
+
+        Domain Context:
+        - Entity: {entity}
+        - Business Vocabulary: {business_vocabulary}
+
+        Current focus: {entity} entity in academic context
         """
 
         # Use the new JSON enforcement functionality
@@ -545,21 +690,7 @@ You must follow this exact structure. All fields are required unless marked as o
         # Use the new generate_json_response method for robust JSON handling
         return self.generate_json_response(
             prompt=prompt,
-            system_prompt=f"""
-            You are working with Business Autonomous Entities (BAEs) that represent domain entities
-            as living, autonomous agents within the system.
-
-            Current focus: {entity} entity in academic context
-
-            Your responsibilities:
-            1. Maintain semantic coherence between business vocabulary and technical implementation
-            2. Preserve domain knowledge and business rules
-            3. Ensure generated artifacts reflect business terminology
-            4. Focus on domain entity representation, not software engineering roles
-            5. Enable runtime evolution while preserving semantic consistency
-
-            Always prioritize business domain understanding and vocabulary preservation.
-            """,
+            system_prompt=BAE_SYSTEM_PROMPT,
             temperature=0,
             json_schema=json_schema,
             fallback_schema={
@@ -577,10 +708,7 @@ You must follow this exact structure. All fields are required unless marked as o
     ) -> Dict[str, Any]:
         """Interpret natural language business request for BAE processing"""
         prompt = f"""
-        As a Business Request Interpreter for BAE systems, analyze this natural language input:
-        "{natural_language_input}"
-
-        Context: {context}
+        As a Business Request Interpreter for BAE systems, analyze the natural language input below.
 
         Extract and return JSON with:
         {{
@@ -598,6 +726,12 @@ You must follow this exact structure. All fields are required unless marked as o
         }}
 
         Return ONLY valid JSON.
+
+        Input: "{natural_language_input}"
+
+        Context: {context}
+
+        Current focus: Business request interpretation in {context} context
         """
 
         # Use the new JSON enforcement functionality
@@ -618,21 +752,7 @@ You must follow this exact structure. All fields are required unless marked as o
         # Use the new generate_json_response method for robust JSON handling
         return self.generate_json_response(
             prompt=prompt,
-            system_prompt=f"""
-            You are working with Business Autonomous Entities (BAEs) that represent domain entities
-            as living, autonomous agents within the system.
-
-            Current focus: Business request interpretation in {context} context
-
-            Your responsibilities:
-            1. Maintain semantic coherence between business vocabulary and technical implementation
-            2. Preserve domain knowledge and business rules
-            3. Ensure generated artifacts reflect business terminology
-            4. Focus on domain entity representation, not software engineering roles
-            5. Enable runtime evolution while preserving semantic consistency
-
-            Always prioritize business domain understanding and vocabulary preservation.
-            """,
+            system_prompt=BAE_SYSTEM_PROMPT,
             temperature=0,
             json_schema=json_schema,
             fallback_schema={
@@ -9,6 +9,7 @@ organized by functionality for clear separation of concerns.
 """
 
 from .base_standards import BaseStandards
+from .code_analysis import CodeAnalysis
 from .backend_standards import BackendStandards
 from .frontend_standards import FrontendStandards
 from .database_standards import DatabaseStandards
@@ -19,5 +20,6 @@ __all__ = [
     "BackendStandards", 
     "FrontendStandards", 
     "DatabaseStandards", 
-    "TestStandards"
+    "TestStandards",
+    "CodeAnalysis",
 ]
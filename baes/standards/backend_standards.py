@@ -8,9 +8,10 @@ These standards directly address the max_retries issue by ensuring alignment
 between code generation and validation expectations.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from .base_standards import BaseStandards
+from .code_analysis import CodeAnalysis
 
 
 class BackendStandards(BaseStandards):
@@ -191,12 +192,13 @@ class BackendStandards(BaseStandards):
 
     # Validation methods specific to backend code
     @classmethod
-    def validate_database_connection(cls, code: str) -> Dict[str, Any]:
+    def validate_database_connection(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate database connection patterns against TechLeadSWEA requirements.
 
         This addresses the main cause of max_retries: improper database connection handling.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -232,12 +234,13 @@ class BackendStandards(BaseStandards):
         }
 
     @classmethod
-    def validate_http_status_codes(cls, code: str) -> Dict[str, Any]:
+    def validate_http_status_codes(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate HTTP status codes against TechLeadSWEA requirements.
 
         Ensures proper status codes, especially 204 for DELETE operations.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -270,10 +273,11 @@ class BackendStandards(BaseStandards):
         }
 
     @classmethod
-    def validate_error_handling(cls, code: str) -> Dict[str, Any]:
+    def validate_error_handling(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate error handling patterns against TechLeadSWEA requirements.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -304,10 +308,13 @@ class BackendStandards(BaseStandards):
         }
 
     @classmethod
-    def validate_api_completeness(cls, code: str, entity: str) -> Dict[str, Any]:
+    def validate_api_completeness(
+        cls, code: Union[str, CodeAnalysis], entity: str
+    ) -> Dict[str, Any]:
         """
         Validate that all required CRUD endpoints are implemented.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -336,10 +343,13 @@ class BackendStandards(BaseStandards):
         }
 
     @classmethod
-    def validate_pydantic_models(cls, code: str, entity: str) -> Dict[str, Any]:
+    def validate_pydantic_models(
+        cls, code: Union[str, CodeAnalysis], entity: str
+    ) -> Dict[str, Any]:
         """
         Validate Pydantic model structure, especially id field handling.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -409,22 +419,23 @@ class BackendStandards(BaseStandards):
         }
 
     @classmethod
-    def get_backend_validation(cls, code: str, entity: str) -> Dict[str, Any]:
+    def get_backend_validation(cls, code: Union[str, CodeAnalysis], entity: str) -> Dict[str, Any]:
         """
         Run comprehensive backend validation against all standards.
 
         This method performs all the validations that TechLeadSWEA should use
         to ensure consistency between generation and validation.
         """
+        analysis = CodeAnalysis.of(code)
         # Run all backend-specific validations
-        db_validation = cls.validate_database_connection(code)
-        status_validation = cls.validate_http_status_codes(code)
-        error_validation = cls.validate_error_handling(code)
-        api_validation = cls.validate_api_completeness(code, entity)
-        models_validation = cls.validate_pydantic_models(code, entity)
+        db_validation = cls.validate_database_connection(analysis)
+        status_validation = cls.validate_http_status_codes(analysis)
+        error_validation = cls.validate_error_handling(analysis)
+        api_validation = cls.validate_api_completeness(analysis, entity)
+        models_validation = cls.validate_pydantic_models(analysis, entity)
 
         # Run base validations
-        base_validation = cls.get_comprehensive_validation(code)
+        base_validation = cls.get_comprehensive_validation(analysis)
 
         # Combine all issues and suggestions
         all_issues = (
@@ -5,7 +5,9 @@ Contains common patterns, validation rules, and requirements that apply
 across all SWEA agents to ensure consistency and quality.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .code_analysis import CodeAnalysis
 
 
 class BaseStandards:
@@ -71,7 +73,7 @@ class BaseStandards:
 
     # Validation methods for common patterns
     @classmethod
-    def validate_imports(cls, code: str) -> Dict[str, Any]:
+    def validate_imports(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate that code contains proper import statements.
 
@@ -81,6 +83,7 @@ class BaseStandards:
         Returns:
             Dict with validation results
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -100,7 +103,7 @@ class BaseStandards:
         return {"is_valid": len(issues) == 0, "issues": issues, "suggestions": suggestions}
 
     @classmethod
-    def validate_error_handling(cls, code: str) -> Dict[str, Any]:
+    def validate_error_handling(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate that code contains proper error handling patterns.
 
@@ -110,6 +113,7 @@ class BaseStandards:
         Returns:
             Dict with validation results
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
 
@@ -128,7 +132,7 @@ class BaseStandards:
         return {"is_valid": len(issues) == 0, "issues": issues, "suggestions": suggestions}
 
     @classmethod
-    def validate_code_quality(cls, code: str) -> Dict[str, Any]:
+    def validate_code_quality(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate general code quality requirements.
 
@@ -138,11 +142,13 @@ class BaseStandards:
         Returns:
             Dict with validation results
         """
+        analysis = CodeAnalysis.of(code)
+        code = analysis.code
         issues = []
         suggestions = []
 
         # Check for docstrings in functions
-        function_lines = [line for line in code.split("\n") if line.strip().startswith("def ")]
+        function_lines = [line for line in analysis.lines if line.strip().startswith("def ")]
         if function_lines:
             # Simple check - look for triple quotes after function definitions
             if '"""' not in code and "'''" not in code:
@@ -156,8 +162,30 @@ class BaseStandards:
 
         return {"is_valid": len(issues) == 0, "issues": issues, "suggestions": suggestions}
 
+    @staticmethod
+    def validate_many(
+        items: Sequence[tuple], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many artifacts with the standards of their SWEA type.
+
+        Each item is ``(code, swea_type)`` or ``(code, swea_type, entity)``; swea_type
+        selects the Backend/Frontend/Database/Test standards (any other type gets the
+        base validation). Large batches run on the shared validation process pool.
+
+        Args:
+            items: Artifacts to validate
+            max_workers: Worker processes (default: VALIDATION_POOL_WORKERS)
+
+        Returns:
+            One validation dict per item, in input order
+        """
+        from .parallel_validation import run_many, validate_standards_chunk
+
+        return run_many(validate_standards_chunk, None, items, max_workers=max_workers)
+
     @classmethod
-    def get_comprehensive_validation(cls, code: str) -> Dict[str, Any]:
+    def get_comprehensive_validation(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Run all base validations and return comprehensive results.
 
@@ -167,9 +195,10 @@ class BaseStandards:
         Returns:
             Dict with comprehensive validation results
         """
-        import_validation = cls.validate_imports(code)
-        error_validation = cls.validate_error_handling(code)
-        quality_validation = cls.validate_code_quality(code)
+        analysis = CodeAnalysis.of(code)
+        import_validation = cls.validate_imports(analysis)
+        error_validation = cls.validate_error_handling(analysis)
+        quality_validation = cls.validate_code_quality(analysis)
 
         all_issues = (
             import_validation["issues"] + error_validation["issues"] + quality_validation["issues"]
@@ -0,0 +1,297 @@
+"""
+Shared Code Analysis for Validators
+
+Every generated artifact is inspected by several validation layers (rule engine,
+AST structure checks, the *Standards classes, CodePatcher syntax checks and the
+TechLeadSWEA context checks). ``CodeAnalysis`` parses and indexes the source once
+and lazily caches each derived view. The rule engine reads the lowercased copy and
+line index, while the AST structure checks, CodePatcher and TechLeadSWEA read the
+parse tree and its definitions. The *Standards validators keep their substring
+checks and share only the source text and the lowercased copy.
+
+Validators accept either a string or a ``CodeAnalysis`` and normalize with
+``CodeAnalysis.of()``, which also memoizes recent analyses by source text so
+that independent callers validating the same artifact reuse one instance.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- DRY: One parse per artifact, shared by the tree-based validators
+- Fail-safe: Syntax errors are recorded, never raised, by the analysis
+"""
+
+import ast
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional, Union
+
+# Non-ASCII characters that IGNORECASE matches against ASCII letters, or whose
+# lowercase form changes length (İ ı ſ K)
+_CASE_FOLD_HAZARDS = ("\u0130", "\u0131", "\u017f", "\u212a")
+
+# HTTP methods recognized on route decorators (@router.get, @app.post, ...)
+_ROUTE_METHODS = frozenset({"get", "post", "put", "patch", "delete", "head", "options"})
+
+# Number of recent analyses memoized by CodeAnalysis.of()
+_MEMO_SIZE = 32
+
+
+def lowercase_for_matching(code: str) -> Optional[str]:
+    """``code.lower()`` if case-folded rule patterns give exact offsets on it, else None"""
+    if code.isascii() or not any(char in code for char in _CASE_FOLD_HAZARDS):
+        return code.lower()
+    return None
+
+
+class LineIndex:
+    """Maps character offsets to 1-based line numbers with a binary search"""
+
+    def __init__(self, code: str):
+        self.line_starts = [0]
+        self.line_starts.extend(m.end() for m in re.finditer("\n", code))
+
+    def line_number(self, offset: int) -> int:
+        """1-based line number containing ``offset``"""
+        return bisect_right(self.line_starts, offset)
+
+
+@dataclass(frozen=True)
+class RouteDecorator:
+    """A FastAPI-style route decorator such as ``@router.post("/", status_code=201)``
+
+    Attributes:
+        target: Object the route is registered on (e.g. "router", "app")
+        method: Lowercase HTTP method (e.g. "post")
+        path: Route path if given as a string literal
+        function: Name of the decorated function
+        line_number: 1-based line of the decorator
+        keywords: Source text of the decorator's keyword arguments
+    """
+
+    target: str
+    method: str
+    path: Optional[str]
+    function: str
+    line_number: int
+    keywords: Dict[str, str]
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """Dotted name of a decorator expression (``router.post`` for ``@router.post(...)``)"""
+    if isinstance(node, ast.Call):
+        node = node.func
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+class CodeAnalysis:
+    """
+    Parse-once view of a source artifact with lazily cached derived data.
+
+    Attributes are computed on first access and cached for the lifetime of the
+    instance. Instances are read-only views of ``code`` and safe to share across
+    threads and validation layers.
+    """
+
+    _memo: "OrderedDict[str, CodeAnalysis]" = OrderedDict()
+    _memo_lock = threading.Lock()
+
+    def __init__(self, code: str):
+        self.code = code
+
+    @classmethod
+    def of(cls, code: Union[str, "CodeAnalysis"]) -> "CodeAnalysis":
+        """Return ``code`` if it is already an analysis, else a (memoized) analysis of it"""
+        if isinstance(code, CodeAnalysis):
+            return code
+        code = code or ""
+        with cls._memo_lock:
+            analysis = cls._memo.get(code)
+            if analysis is not None:
+                cls._memo.move_to_end(code)
+                return analysis
+            analysis = cls._memo[code] = cls(code)
+            if len(cls._memo) > _MEMO_SIZE:
+                cls._memo.popitem(last=False)
+            return analysis
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        """Drop all memoized analyses."""
+        with cls._memo_lock:
+            cls._memo.clear()
+
+    def __str__(self) -> str:
+        return self.code
+
+    def __repr__(self) -> str:
+        return f"CodeAnalysis({len(self.code)} chars)"
+
+    def __contains__(self, fragment: str) -> bool:
+        return fragment in self.code
+
+    # Text views
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Source split on newlines (same as ``code.split("\\n")``)"""
+        return self.code.split("\n")
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased source for case-insensitive substring checks"""
+        return self.code.lower()
+
+    @cached_property
+    def lowered_for_matching(self) -> Optional[str]:
+        """Lowercased source for case-folded rule patterns (see lowercase_for_matching)"""
+        return lowercase_for_matching(self.code)
+
+    @cached_property
+    def line_index(self) -> LineIndex:
+        """Offset to line number index"""
+        return LineIndex(self.code)
+
+    # Syntax tree views
+
+    @cached_property
+    def _parsed(self):
+        try:
+            return ast.parse(self.code), None
+        except (SyntaxError, ValueError) as e:
+            # ValueError: source contains null bytes
+            if not isinstance(e, SyntaxError):
+                e = SyntaxError(str(e))
+            return None, e
+
+    @property
+    def tree(self) -> Optional[ast.Module]:
+        """Parsed module, or None if the code does not parse"""
+        return self._parsed[0]
+
+    @property
+    def syntax_error(self) -> Optional[SyntaxError]:
+        """Syntax error raised by the parser, or None if the code parses"""
+        return self._parsed[1]
+
+    @property
+    def is_valid_syntax(self) -> bool:
+        """Whether the code parses as Python"""
+        return self._parsed[1] is None
+
+    @cached_property
+    def nodes(self) -> List[ast.AST]:
+        """All nodes in ``ast.walk`` order (empty if the code does not parse)"""
+        return list(ast.walk(self.tree)) if self.tree is not None else []
+
+    @cached_property
+    def definitions(self) -> List[ast.AST]:
+        """Function and class definitions in ``ast.walk`` order"""
+        return [
+            node
+            for node in self.nodes
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        ]
+
+    @cached_property
+    def functions(self) -> Dict[str, ast.AST]:
+        """Function definitions (sync and async) by name; the first definition wins"""
+        functions: Dict[str, ast.AST] = {}
+        for node in self.definitions:
+            if not isinstance(node, ast.ClassDef):
+                functions.setdefault(node.name, node)
+        return functions
+
+    @cached_property
+    def classes(self) -> Dict[str, ast.ClassDef]:
+        """Class definitions by name; the first definition wins"""
+        classes: Dict[str, ast.ClassDef] = {}
+        for node in self.definitions:
+            if isinstance(node, ast.ClassDef):
+                classes.setdefault(node.name, node)
+        return classes
+
+    @cached_property
+    def imports(self) -> Dict[str, str]:
+        """Imported names mapped to their qualified origin (``{"Path": "pathlib.Path"}``)"""
+        imports: Dict[str, str] = {}
+        for node in self.nodes:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    bound = alias.asname or alias.name.split(".")[0]
+                    imports[bound] = alias.name if alias.asname else bound
+            elif isinstance(node, ast.ImportFrom):
+                module = "." * node.level + (node.module or "")
+                for alias in node.names:
+                    imports[alias.asname or alias.name] = f"{module}.{alias.name}"
+        return imports
+
+    @cached_property
+    def imported_modules(self) -> frozenset:
+        """Modules referenced by import statements"""
+        modules = set()
+        for node in self.nodes:
+            if isinstance(node, ast.Import):
+                modules.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                modules.add(node.module)
+        return frozenset(modules)
+
+    @cached_property
+    def decorators(self) -> Dict[str, List[str]]:
+        """Dotted decorator names per decorated function or class; the first definition wins"""
+        decorators: Dict[str, List[str]] = {}
+        for node in self.definitions:
+            if node.decorator_list:
+                decorators.setdefault(
+                    node.name, [_dotted_name(decorator) for decorator in node.decorator_list]
+                )
+        return decorators
+
+    @cached_property
+    def route_decorators(self) -> List[RouteDecorator]:
+        """Route decorators (``@<target>.<http method>(...)``) in source order"""
+        routes = []
+        for node in self.definitions:
+            if isinstance(node, ast.ClassDef):
+                continue
+            for decorator in node.decorator_list:
+                if not isinstance(decorator, ast.Call):
+                    continue
+                target, _, method = _dotted_name(decorator).rpartition(".")
+                if not target or method not in _ROUTE_METHODS:
+                    continue
+                path = None
+                if decorator.args and isinstance(decorator.args[0], ast.Constant):
+                    path = (
+                        decorator.args[0].value
+                        if isinstance(decorator.args[0].value, str)
+                        else None
+                    )
+                routes.append(
+                    RouteDecorator(
+                        target=target,
+                        method=method,
+                        path=path,
+                        function=node.name,
+                        line_number=decorator.lineno,
+                        keywords={
+                            kw.arg: ast.unparse(kw.value) for kw in decorator.keywords if kw.arg
+                        },
+                    )
+                )
+        routes.sort(key=lambda route: route.line_number)
+        return routes
+
+    def routes_for(self, method: str) -> List[RouteDecorator]:
+        """Route decorators for one HTTP method"""
+        method = method.lower()
+        return [route for route in self.route_decorators if route.method == method]
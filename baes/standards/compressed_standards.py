@@ -11,8 +11,9 @@ Constitutional Compliance:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -221,6 +222,85 @@ def get_compressed_standard(swea_type: str) -> Optional[CompressedStandard]:
     return standard
 
 
+# Characters per token of the length-based estimate, and the range covering English
+# prose and source code with OpenAI tokenizers (dense symbols/short identifiers low,
+# long words and indentation high)
+CHARS_PER_TOKEN = 4
+CHARS_PER_TOKEN_MIN = 2
+CHARS_PER_TOKEN_MAX = 6
+
+# Batches with at least this many characters are encoded on tiktoken's thread pool
+_THREADED_BATCH_MIN_CHARS = 65536
+
+_encoders: Dict[str, Any] = {}
+_encoders_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TokenEstimate:
+    """Length-based token estimate with error bounds.
+    
+    Attributes:
+        tokens: Estimated token count (~4 characters per token)
+        low: Lower bound (~6 characters per token)
+        high: Upper bound (~2 characters per token)
+    """
+    tokens: int
+    low: int
+    high: int
+
+
+def approximate_token_count(text: str) -> TokenEstimate:
+    """Estimate tokens from text length, without a tokenizer.
+    
+    For budgets and monitoring where exact counts are not needed; use
+    ``high`` when the estimate must not undercount.
+    
+    Args:
+        text: Text to estimate tokens for
+        
+    Returns:
+        TokenEstimate (tokens within [low, high])
+    """
+    length = len(text)
+    return TokenEstimate(
+        tokens=length // CHARS_PER_TOKEN,
+        low=length // CHARS_PER_TOKEN_MAX,
+        high=-(-length // CHARS_PER_TOKEN_MIN),
+    )
+
+
+def get_token_encoder(model: str = "gpt-4") -> Optional[Any]:
+    """Get the tiktoken encoding for a model, loaded once per process.
+    
+    Failures (tiktoken missing, encoding download unavailable, unknown model)
+    are cached too, so the warning is logged once per model.
+    
+    Args:
+        model: OpenAI model name (default: gpt-4)
+        
+    Returns:
+        tiktoken Encoding, or None when token counts must be approximated
+    """
+    with _encoders_lock:
+        if model in _encoders:
+            return _encoders[model]
+        try:
+            import tiktoken
+            encoder = tiktoken.encoding_for_model(model)
+        except ImportError:
+            logger.warning(
+                "tiktoken not installed, using approximate token count (1 token ≈ 4 characters). "
+                "Install tiktoken for accurate counts: pip install tiktoken"
+            )
+            encoder = None
+        except Exception as e:
+            logger.warning(f"Failed to load tiktoken encoding for {model}: {e}, using approximate counts")
+            encoder = None
+        _encoders[model] = encoder
+        return encoder
+
+
 def estimate_token_count(text: str, model: str = "gpt-4") -> int:
     """
     Count tokens in text using tiktoken for OpenAI models.
@@ -235,19 +315,32 @@ def estimate_token_count(text: str, model: str = "gpt-4") -> int:
     Returns:
         Token count (accurate if tiktoken available, approximate otherwise)
     """
-    try:
-        import tiktoken
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except ImportError:
-        logger.warning(
-            "tiktoken not installed, using approximate token count (1 token ≈ 4 characters). "
-            "Install tiktoken for accurate counts: pip install tiktoken"
-        )
-        return len(text) // 4
-    except Exception as e:
-        logger.warning(f"Failed to count tokens with tiktoken: {e}, using approximate count")
-        return len(text) // 4
+    encoder = get_token_encoder(model)
+    if encoder is None:
+        return approximate_token_count(text).tokens
+    return len(encoder.encode_ordinary(text))
+
+
+def estimate_token_counts(texts: Sequence[str], model: str = "gpt-4") -> List[int]:
+    """
+    Count tokens of several texts with one encoder lookup.
+    
+    Large batches are encoded in parallel (tiktoken releases the GIL).
+    
+    Args:
+        texts: Texts to estimate tokens for
+        model: OpenAI model name for encoding (default: gpt-4)
+        
+    Returns:
+        Token count per text, in input order
+    """
+    texts = list(texts)
+    encoder = get_token_encoder(model)
+    if encoder is None:
+        return [approximate_token_count(text).tokens for text in texts]
+    if len(texts) > 1 and sum(len(text) for text in texts) >= _THREADED_BATCH_MIN_CHARS:
+        return [len(tokens) for tokens in encoder.encode_ordinary_batch(texts)]
+    return [len(encoder.encode_ordinary(text)) for text in texts]
 
 
 def calculate_compression_ratio(compressed_tokens: int, full_tokens: int) -> float:
@@ -8,9 +8,10 @@ These standards ensure consistency in database schema generation and eliminate
 validation misalignment for database code.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 from .base_standards import BaseStandards
+from .code_analysis import CodeAnalysis
 
 
 class DatabaseStandards(BaseStandards):
@@ -137,10 +138,11 @@ class DatabaseStandards(BaseStandards):
     
     # Validation methods specific to database code
     @classmethod
-    def validate_schema_structure(cls, code: str) -> Dict[str, Any]:
+    def validate_schema_structure(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate database schema structure and table definitions.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -167,10 +169,11 @@ class DatabaseStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_connection_handling(cls, code: str) -> Dict[str, Any]:
+    def validate_connection_handling(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate database connection patterns and resource management.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -202,10 +205,11 @@ class DatabaseStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_sql_syntax(cls, code: str) -> Dict[str, Any]:
+    def validate_sql_syntax(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate SQL syntax and best practices.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -229,10 +233,13 @@ class DatabaseStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_database_completeness(cls, code: str, entity: str) -> Dict[str, Any]:
+    def validate_database_completeness(
+        cls, code: Union[str, CodeAnalysis], entity: str
+    ) -> Dict[str, Any]:
         """
         Validate that all required database components are implemented.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -262,21 +269,22 @@ class DatabaseStandards(BaseStandards):
         }
     
     @classmethod
-    def get_database_validation(cls, code: str, entity: str) -> Dict[str, Any]:
+    def get_database_validation(cls, code: Union[str, CodeAnalysis], entity: str) -> Dict[str, Any]:
         """
         Run comprehensive database validation against all standards.
         
         This method performs all the validations that TechLeadSWEA should use
         to ensure consistency between generation and validation.
         """
+        analysis = CodeAnalysis.of(code)
         # Run all database-specific validations
-        schema_validation = cls.validate_schema_structure(code)
-        connection_validation = cls.validate_connection_handling(code)
-        sql_validation = cls.validate_sql_syntax(code)
-        db_validation = cls.validate_database_completeness(code, entity)
+        schema_validation = cls.validate_schema_structure(analysis)
+        connection_validation = cls.validate_connection_handling(analysis)
+        sql_validation = cls.validate_sql_syntax(analysis)
+        db_validation = cls.validate_database_completeness(analysis, entity)
         
         # Run base validations
-        base_validation = cls.get_comprehensive_validation(code)
+        base_validation = cls.get_comprehensive_validation(analysis)
         
         # Combine all issues and suggestions
         all_issues = (
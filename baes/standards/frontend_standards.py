@@ -8,10 +8,11 @@ These standards ensure consistency in UI generation and eliminate validation
 misalignment for frontend code.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Union
 import os
 
 from .base_standards import BaseStandards
+from .code_analysis import CodeAnalysis
 
 
 class FrontendStandards(BaseStandards):
@@ -152,10 +153,11 @@ class FrontendStandards(BaseStandards):
     
     # Validation methods specific to frontend code
     @classmethod
-    def validate_streamlit_structure(cls, code: str) -> Dict[str, Any]:
+    def validate_streamlit_structure(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate Streamlit application structure and required components.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -181,10 +183,11 @@ class FrontendStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_api_integration(cls, code: str) -> Dict[str, Any]:
+    def validate_api_integration(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate API integration patterns and error handling.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -211,10 +214,12 @@ class FrontendStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_form_handling(cls, code: str) -> Dict[str, Any]:
+    def validate_form_handling(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate form creation and input validation patterns.
         """
+        analysis = CodeAnalysis.of(code)
+        code = analysis.code
         issues = []
         suggestions = []
         
@@ -230,7 +235,7 @@ class FrontendStandards(BaseStandards):
             suggestions.append("Add unique key parameter to all input widgets")
         
         # Check for proper id field handling
-        if "id" in code.lower():
+        if "id" in analysis.lower:
             import re
             # Check if id is being used as an input field (which is wrong)
             id_input_patterns = [
@@ -247,7 +252,7 @@ class FrontendStandards(BaseStandards):
                     break
             
             # In edit forms, check if id is displayed as read-only
-            if "edit" in code.lower() and "st.write" not in code and "id" in code.lower():
+            if "edit" in analysis.lower and "st.write" not in code and "id" in analysis.lower:
                 issues.append("ID should be displayed as read-only in edit forms")
                 suggestions.append('Display ID as read-only using st.write(f"**ID:** {entity_id}")')
         
@@ -259,10 +264,14 @@ class FrontendStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_ui_completeness(cls, code: str, entity: str) -> Dict[str, Any]:
+    def validate_ui_completeness(
+        cls, code: Union[str, CodeAnalysis], entity: str
+    ) -> Dict[str, Any]:
         """
         Validate that all required UI components are implemented.
         """
+        analysis = CodeAnalysis.of(code)
+        code = analysis.code
         issues = []
         suggestions = []
         
@@ -279,7 +288,7 @@ class FrontendStandards(BaseStandards):
             "st.form(",
             "requests.post("
         ]
-        if not any(pattern in code.lower() for pattern in create_patterns):
+        if not any(pattern in analysis.lower for pattern in create_patterns):
             issues.append(f"Missing create functionality for {entity}")
             suggestions.append(f"Add create section with proper form and API integration")
         
@@ -291,7 +300,7 @@ class FrontendStandards(BaseStandards):
             "requests.get(",
             f"response.json()"
         ]
-        if not any(pattern in code.lower() for pattern in list_patterns):
+        if not any(pattern in analysis.lower for pattern in list_patterns):
             issues.append(f"Missing list functionality for {entity}")
             suggestions.append(f"Add list section to display all {entity_plural}")
         
@@ -303,7 +312,7 @@ class FrontendStandards(BaseStandards):
             "requests.put(",
             f"edit_{entity_lower}_form"
         ]
-        if not any(pattern in code.lower() for pattern in update_patterns):
+        if not any(pattern in analysis.lower for pattern in update_patterns):
             issues.append(f"Missing update functionality for {entity}")
             suggestions.append(f"Add edit section with form and API integration")
         
@@ -315,7 +324,7 @@ class FrontendStandards(BaseStandards):
             "requests.delete(",
             f"delete_{entity_lower}"
         ]
-        if not any(pattern in code.lower() for pattern in delete_patterns):
+        if not any(pattern in analysis.lower for pattern in delete_patterns):
             issues.append(f"Missing delete functionality for {entity}")
             suggestions.append(f"Add delete functionality with API integration")
         
@@ -332,7 +341,7 @@ class FrontendStandards(BaseStandards):
         }
     
     @classmethod
-    def get_frontend_validation(cls, code: str, entity: str) -> Dict[str, Any]:
+    def get_frontend_validation(cls, code: Union[str, CodeAnalysis], entity: str) -> Dict[str, Any]:
         """
         Run comprehensive frontend validation against all standards.
         
@@ -343,11 +352,12 @@ class FrontendStandards(BaseStandards):
         like logger.error(), docstrings, return type hints) as these are not applicable
         to Streamlit frontend applications.
         """
+        analysis = CodeAnalysis.of(code)
         # Run all frontend-specific validations
-        structure_validation = cls.validate_streamlit_structure(code)
-        api_validation = cls.validate_api_integration(code)
-        form_validation = cls.validate_form_handling(code)
-        ui_validation = cls.validate_ui_completeness(code, entity)
+        structure_validation = cls.validate_streamlit_structure(analysis)
+        api_validation = cls.validate_api_integration(analysis)
+        form_validation = cls.validate_form_handling(analysis)
+        ui_validation = cls.validate_ui_completeness(analysis, entity)
         
         # Frontend code does NOT use base standards (backend-specific requirements)
         # Base standards include logger.error(), docstrings, return type hints
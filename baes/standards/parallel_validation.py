@@ -0,0 +1,237 @@
+"""
+Process-Pool Validation of Many Artifacts
+
+Rule-based and standards validation is pure CPU work (regex scans and AST
+parsing). Validating the dozens of files of a multi-entity generation back
+to back on the kernel thread serializes all of it behind the GIL. ``validate_many`` spreads such batches over a shared process
+pool and returns the results in input order.
+
+Items are grouped into contiguous chunks of roughly ``chunk_chars`` source
+characters, so many small files travel to a worker together instead of paying
+one round trip each. Batches below ``min_chars`` (or when only one worker is
+available) are validated inline: for a handful of small files the pool's IPC
+and worker start-up cost more than the validation itself.
+
+Worker processes are started with ``forkserver`` (``spawn`` where unavailable)
+so they never inherit the locks of the multi-threaded kernel process. Each
+worker rebuilds the rule engine once per rule-catalog version.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-safe: Pool failures fall back to inline validation with identical results
+- Observability: Parallel batches log item, chunk and worker counts
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from config import Config
+
+from ..utils.chunking import split_by_budget
+from .code_analysis import CodeAnalysis
+
+logger = logging.getLogger(__name__)
+
+_shared_pool: Optional[ProcessPoolExecutor] = None
+_shared_pool_workers = 0
+_shared_pool_lock = threading.Lock()
+
+# Worker-side rule engine, rebuilt when the parent's catalog version changes
+_worker_engine = None
+_worker_engine_version: Optional[str] = None
+
+
+def pool_worker_count() -> int:
+    """Worker processes for parallel validation (VALIDATION_POOL_WORKERS, 0 = automatic)"""
+    configured = Config.VALIDATION_POOL_WORKERS
+    if configured > 0:
+        return configured
+    return max(1, min(4, (os.cpu_count() or 1) - 1))
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process-wide validation pool, recreated if a different worker count is requested"""
+    global _shared_pool, _shared_pool_workers
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool_workers != workers:
+            if _shared_pool is not None:
+                _shared_pool.shutdown(wait=False)
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _shared_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _shared_pool_workers = workers
+        return _shared_pool
+
+
+def _discard_pool() -> None:
+    """Drop a broken pool so the next batch starts a fresh one"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown(wait=False)
+            _shared_pool = None
+
+
+def shutdown_validation_pool() -> None:
+    """Stop the shared validation pool's worker processes"""
+    _discard_pool()
+
+
+def _code_of(code: Union[str, CodeAnalysis]) -> str:
+    return code.code if isinstance(code, CodeAnalysis) else code
+
+
+def run_many(
+    worker: Callable[[Any, List[Tuple]], List[Any]],
+    context: Any,
+    items: Sequence[Tuple],
+    max_workers: Optional[int] = None,
+    chunk_chars: Optional[int] = None,
+    min_chars: Optional[int] = None,
+    inline: Optional[Callable[[List[Tuple]], List[Any]]] = None,
+) -> List[Any]:
+    """
+    Run ``worker(context, chunk)`` over size-based chunks of ``items``, in order
+
+    ``worker`` must be a module-level function (it is pickled by reference) that
+    returns one result per item of its chunk. The first element of every item is
+    the code (a string or CodeAnalysis; only the string is sent to workers).
+
+    Args:
+        worker: Chunk validation function run in the worker processes
+        context: Picklable state shared by all chunks (e.g. rule specifications)
+        items: Items to validate
+        max_workers: Worker processes (default: VALIDATION_POOL_WORKERS)
+        chunk_chars: Source characters per chunk (default: VALIDATION_POOL_CHUNK_CHARS)
+        min_chars: Total characters below which items are validated inline
+            (default: VALIDATION_POOL_MIN_CHARS)
+        inline: In-process validation of a list of items (default: ``worker``)
+
+    Returns:
+        One result per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+    if inline is None:
+        inline = lambda batch: worker(context, batch)  # noqa: E731
+    workers = max_workers if max_workers is not None else pool_worker_count()
+    chunk_chars = chunk_chars or Config.VALIDATION_POOL_CHUNK_CHARS
+    min_chars = Config.VALIDATION_POOL_MIN_CHARS if min_chars is None else min_chars
+    total_chars = sum(len(_code_of(item[0])) for item in items)
+
+    if not Config.ENABLE_PARALLEL_VALIDATION or workers <= 1 or total_chars < min_chars:
+        return inline(items)
+
+    chunks = split_by_budget(
+        [(_code_of(item[0]),) + tuple(item[1:]) for item in items],
+        cost=lambda item: len(item[0]),
+        budget=chunk_chars,
+    )
+    if len(chunks) < 2:
+        return inline(items)
+
+    workers = min(workers, len(chunks))
+    logger.info(
+        f"⚡ Validating {len(items)} artifact(s) in {len(chunks)} chunk(s) on {workers} worker(s)"
+    )
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(worker, context, chunk) for chunk in chunks]
+        results: List[Any] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+    except Exception as e:
+        logger.warning(f"⚠️  Parallel validation failed, validating inline: {e}")
+        _discard_pool()
+        return inline(items)
+
+
+def rule_engine_context(engine) -> Dict[str, Any]:
+    """Picklable description of ``engine``: catalog version, rule specs and calibration models"""
+    from .validation_rules import ValidationRule
+
+    rule_fields = [f.name for f in fields(ValidationRule) if f.init]
+    calibration = engine.calibration
+    return {
+        "catalog_version": engine.catalog_version(),
+        "rules": {
+            swea_type: [{name: getattr(rule, name) for name in rule_fields} for rule in rules]
+            for swea_type, rules in engine.rules.items()
+        },
+        "calibration_models": dict(calibration.models) if calibration is not None else None,
+    }
+
+
+class _CalibrationSnapshot:
+    """Read-only calibration models shipped to a worker process"""
+
+    def __init__(self, models: Dict[str, Any]):
+        self.models = models
+
+    def model_for(self, swea_type: str, rule_ids: Sequence[str]):
+        model = self.models.get(swea_type)
+        return model if model is not None and model.applies_to(rule_ids) else None
+
+
+def _engine_for(context: Dict[str, Any]):
+    """Worker-side rule engine matching the parent's catalog"""
+    global _worker_engine, _worker_engine_version
+    from .validation_rules import ValidationRule, ValidationRuleEngine
+
+    if _worker_engine is None or _worker_engine_version != context["catalog_version"]:
+        engine = ValidationRuleEngine()
+        if engine.catalog_version() != context["catalog_version"]:
+            engine.rules = {
+                swea_type: [ValidationRule(**spec) for spec in specs]
+                for swea_type, specs in context["rules"].items()
+            }
+        _worker_engine, _worker_engine_version = engine, context["catalog_version"]
+    models = context["calibration_models"]
+    _worker_engine.calibration = _CalibrationSnapshot(models) if models is not None else None
+    return _worker_engine
+
+
+def validate_rule_chunk(context: Dict[str, Any], chunk: List[Tuple]) -> List[Any]:
+    """Rule-based validation of a chunk of (code, swea_type) items (runs in a worker)"""
+    engine = _engine_for(context)
+    results = []
+    for code, swea_type, *_ in chunk:
+        result = engine.validate_code(code, swea_type)
+        result.scan = None  # Incremental-validation state stays in the worker
+        results.append(result)
+    return results
+
+
+def standards_validation(
+    code: Union[str, CodeAnalysis], swea_type: str, entity: str = ""
+) -> Dict[str, Any]:
+    """Validate ``code`` with the *Standards class of ``swea_type`` (base standards otherwise)"""
+    from .backend_standards import BackendStandards
+    from .base_standards import BaseStandards
+    from .database_standards import DatabaseStandards
+    from .frontend_standards import FrontendStandards
+    from .test_standards import TestStandards
+
+    if swea_type == "backend":
+        return BackendStandards.get_backend_validation(code, entity)
+    if swea_type == "frontend":
+        return FrontendStandards.get_frontend_validation(code, entity)
+    if swea_type == "database":
+        return DatabaseStandards.get_database_validation(code, entity)
+    if swea_type == "test":
+        return TestStandards.get_test_validation(code, entity)
+    return BaseStandards.get_comprehensive_validation(code)
+
+
+def validate_standards_chunk(context: Any, chunk: List[Tuple]) -> List[Dict[str, Any]]:
+    """Standards validation of a chunk of (code, swea_type[, entity]) items (runs in a worker)"""
+    return [standards_validation(*item) for item in chunk]
@@ -8,9 +8,10 @@ These standards ensure consistency in test generation and eliminate validation
 misalignment for test code.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 from .base_standards import BaseStandards
+from .code_analysis import CodeAnalysis
 
 
 class TestStandards(BaseStandards):
@@ -176,10 +177,11 @@ class TestStandards(BaseStandards):
     
     # Validation methods specific to test code
     @classmethod
-    def validate_test_structure(cls, code: str) -> Dict[str, Any]:
+    def validate_test_structure(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate test file structure and organization.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -206,10 +208,12 @@ class TestStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_test_coverage(cls, code: str, entity: str) -> Dict[str, Any]:
+    def validate_test_coverage(cls, code: Union[str, CodeAnalysis], entity: str) -> Dict[str, Any]:
         """
         Validate test coverage for CRUD operations.
         """
+        analysis = CodeAnalysis.of(code)
+        code = analysis.code
         issues = []
         suggestions = []
         
@@ -221,7 +225,7 @@ class TestStandards(BaseStandards):
         
         for operation in crud_operations:
             operation_pattern = f"test_{operation}_{entity_lower}"
-            if operation_pattern not in code.lower():
+            if operation_pattern not in analysis.lower:
                 missing_operations.append(operation)
         
         if missing_operations:
@@ -246,10 +250,11 @@ class TestStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_assertions(cls, code: str) -> Dict[str, Any]:
+    def validate_assertions(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate test assertions and verification patterns.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -279,10 +284,11 @@ class TestStandards(BaseStandards):
         }
     
     @classmethod
-    def validate_mocking(cls, code: str) -> Dict[str, Any]:
+    def validate_mocking(cls, code: Union[str, CodeAnalysis]) -> Dict[str, Any]:
         """
         Validate mocking patterns for isolated testing.
         """
+        code = CodeAnalysis.of(code).code
         issues = []
         suggestions = []
         
@@ -309,21 +315,22 @@ class TestStandards(BaseStandards):
         }
     
     @classmethod
-    def get_test_validation(cls, code: str, entity: str) -> Dict[str, Any]:
+    def get_test_validation(cls, code: Union[str, CodeAnalysis], entity: str) -> Dict[str, Any]:
         """
         Run comprehensive test validation against all standards.
         
         This method performs all the validations that TechLeadSWEA should use
         to ensure consistency between generation and validation.
         """
+        analysis = CodeAnalysis.of(code)
         # Run all test-specific validations
-        structure_validation = cls.validate_test_structure(code)
-        coverage_validation = cls.validate_test_coverage(code, entity)
-        assertion_validation = cls.validate_assertions(code)
-        mocking_validation = cls.validate_mocking(code)
+        structure_validation = cls.validate_test_structure(analysis)
+        coverage_validation = cls.validate_test_coverage(analysis, entity)
+        assertion_validation = cls.validate_assertions(analysis)
+        mocking_validation = cls.validate_mocking(analysis)
         
         # Run base validations
-        base_validation = cls.get_comprehensive_validation(code)
+        base_validation = cls.get_comprehensive_validation(analysis)
         
         # Combine all issues and suggestions
         all_issues = (
@@ -0,0 +1,459 @@
+"""
+Validation Micro-Benchmark and Regression Harness
+
+Measures the cost of the rule-based validators as artifacts and rule catalogs
+grow. Synthetic artifacts (generated per SWEA type) and recorded artifacts
+(template-rendered code, or generated files from disk) are scaled from 1 KB to
+1 MB and run through every validator:
+
+- ``rules``: ValidationRuleEngine.validate_code (regex rule catalog)
+- ``structure``: ValidationRuleEngine.validate_code_structure (AST checks)
+- ``standards``: the *Standards validation of the SWEA type
+  (e.g. BackendStandards.get_backend_validation)
+
+Each measurement reports nanoseconds per byte, peak bytes allocated (tracemalloc)
+and rules evaluated per second. Every call starts cold: the CodeAnalysis memo and
+the engine's incremental-validation base are cleared, so parsing and full rule
+scans are always included.
+
+Results can be stored as a budget (ns/byte per validator, SWEA type and size,
+with headroom) and later runs checked against it, failing when a change makes
+validation slower than budgeted.
+
+Usage:
+    python -m baes.standards.validation_benchmark --sizes 1KB,100KB,1MB
+    python -m baes.standards.validation_benchmark --budget budget.json --update-budget
+    python -m baes.standards.validation_benchmark --budget budget.json  # exits 1 on regression
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-fast: Budget violations are reported per validator and size
+- Observability: Tabular report of every measurement
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .code_analysis import CodeAnalysis
+from .parallel_validation import standards_validation
+from .validation_rules import ValidationResult, ValidationRuleEngine
+
+logger = logging.getLogger(__name__)
+
+# Bump when the budget JSON layout changes
+BUDGET_FORMAT_VERSION = 1
+
+SIZE_LABELS = {"1KB": 1024, "10KB": 10 * 1024, "100KB": 100 * 1024, "1MB": 1024 * 1024}
+DEFAULT_SIZES = tuple(SIZE_LABELS)
+SWEA_TYPES = ("backend", "database", "frontend", "test")
+
+Validator = Callable[[str, str], Any]
+
+# One repeatable unit of synthetic code per SWEA type ({i} distinguishes copies)
+_SYNTHETIC_BLOCKS = {
+    "backend": '''
+
+class Item{i}Create(BaseModel):
+    name: str
+    quantity: int = 0
+
+
+@router.post("/items{i}", status_code=201)
+async def create_item_{i}(item: Item{i}Create, db=Depends(get_db)) -> dict:
+    """Create item {i}"""
+    try:
+        cursor = db.execute("INSERT INTO items{i} (name) VALUES (?)", (item.name,))
+        db.commit()
+        return {{"id": cursor.lastrowid, **item.dict()}}
+    except Exception as e:
+        logger.error(f"Error creating item {i}: {{e}}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def helperFunction{i}(value):
+    return value * {i}
+''',
+    "database": '''
+
+def create_items{i}_table(conn) -> None:
+    """Create the items{i} table"""
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS items{i} ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_items{i}_name ON items{i} (name)")
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Failed to create items{i}: {{e}}")
+        raise
+''',
+    "frontend": '''
+
+def render_item_{i}_form() -> None:
+    """Form for item {i}"""
+    with st.form("item_{i}_form"):
+        name = st.text_input("Name {i}")
+        quantity = st.number_input("Quantity {i}", min_value=0)
+        if st.form_submit_button("Save"):
+            if not name:
+                st.error("Name is required")
+            else:
+                response = requests.post(f"{{API_URL}}/items{i}", json={{"name": name}})
+                st.success("Saved") if response.ok else st.error(response.text)
+''',
+    "test": '''
+
+@pytest.mark.integration
+class TestItem{i}:
+    """Lifecycle tests for item {i}"""
+
+    def test_create_item_{i}(self, client):
+        response = client.post("/items{i}", json={{"name": "item {i}"}})
+        assert response.status_code == 201
+        item_id = response.json()["id"]
+        client.delete(f"/items{i}/{{item_id}}")
+''',
+}
+
+_SYNTHETIC_HEADERS = {
+    "backend": (
+        "import logging\n\nfrom fastapi import APIRouter, Depends, HTTPException\n"
+        "from pydantic import BaseModel\n\nlogger = logging.getLogger(__name__)\n"
+        "router = APIRouter()\n"
+    ),
+    "database": "import logging\nimport sqlite3\n\nlogger = logging.getLogger(__name__)\n",
+    "frontend": "import requests\nimport streamlit as st\n\nAPI_URL = 'http://localhost:8100'\n",
+    "test": "import pytest\n",
+}
+
+
+@dataclass
+class BenchmarkArtifact:
+    """Source artifact run through the validators"""
+
+    name: str
+    swea_type: str
+    source: str  # "synthetic" or "recorded"
+    code: str
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.code.encode("utf-8"))
+
+
+@dataclass
+class BenchmarkResult:
+    """One validator measured on one artifact"""
+
+    validator: str
+    swea_type: str
+    source: str
+    size_label: str
+    size_bytes: int
+    repeats: int
+    best_ns: int  # Fastest of ``repeats`` runs (least disturbed by other load)
+    ns_per_byte: float
+    peak_alloc_bytes: int
+    rules_evaluated: int
+    rules_per_second: float
+
+    @property
+    def budget_key(self) -> str:
+        return f"{self.validator}:{self.swea_type}:{self.size_label}"
+
+
+def _scale(header: str, block: Callable[[int], str], size_bytes: int) -> str:
+    """``header`` followed by copies of ``block(i)`` until ``size_bytes`` is reached"""
+    parts, size, index = [header], len(header), 0
+    while size < size_bytes:
+        part = block(index)
+        parts.append(part)
+        size += len(part)
+        index += 1
+    return "".join(parts)
+
+
+def synthetic_artifact(swea_type: str, size_bytes: int) -> BenchmarkArtifact:
+    """Deterministic synthetic artifact of about ``size_bytes`` for ``swea_type``"""
+    template = _SYNTHETIC_BLOCKS[swea_type]
+    code = _scale(_SYNTHETIC_HEADERS[swea_type], lambda i: template.format(i=i), size_bytes)
+    return BenchmarkArtifact(f"synthetic_{swea_type}", swea_type, "synthetic", code)
+
+
+def scale_recorded_artifact(artifact: BenchmarkArtifact, size_bytes: int) -> BenchmarkArtifact:
+    """Grow a recorded artifact by appending renamed copies (whole copies only)"""
+    code = _scale(
+        artifact.code,
+        lambda i: "\n\n" + artifact.code.replace("Student", f"Student{i}"),
+        size_bytes,
+    )
+    return BenchmarkArtifact(artifact.name, artifact.swea_type, artifact.source, code)
+
+
+def recorded_artifacts(paths: Sequence[str] = ()) -> List[BenchmarkArtifact]:
+    """
+    Real generated artifacts: template-rendered code for a Student entity, plus files
+
+    Files under ``paths`` are classified by name (test_*, *ui*/*app*/*streamlit*,
+    *database*/*db*/*schema*, anything else backend). Templates that fail to
+    render are skipped.
+    """
+    from ..utils.template_registry import EntityType, SWEAType, TemplateInput, TemplateRegistry
+
+    artifacts = []
+    registry = TemplateRegistry()
+    attributes = {"name": "str", "email": "str", "age": "int", "gpa": "float"}
+    for swea in (SWEAType.BACKEND, SWEAType.DATABASE, SWEAType.FRONTEND, SWEAType.TEST):
+        output = registry.render_template(
+            TemplateInput("Student", EntityType.STANDARD, swea, attributes)
+        )
+        if output.template_used and output.generated_code:
+            swea_type = swea.value.replace("_swea", "").lower()
+            artifacts.append(
+                BenchmarkArtifact(output.template_id, swea_type, "recorded", output.generated_code)
+            )
+
+    for root in paths:
+        files = [Path(root)] if Path(root).is_file() else sorted(Path(root).rglob("*.py"))
+        for path in files:
+            name = path.name.lower()
+            if name.startswith("test_"):
+                swea_type = "test"
+            elif any(word in name for word in ("ui", "app", "streamlit")):
+                swea_type = "frontend"
+            elif any(word in name for word in ("database", "db", "schema")):
+                swea_type = "database"
+            else:
+                swea_type = "backend"
+            artifacts.append(
+                BenchmarkArtifact(
+                    str(path), swea_type, "recorded", path.read_text(encoding="utf-8")
+                )
+            )
+    return artifacts
+
+
+def default_validators(engine: Optional[ValidationRuleEngine] = None) -> Dict[str, Validator]:
+    """Validators benchmarked by default, keyed by name"""
+    engine = engine or ValidationRuleEngine()
+
+    def rules(code: str, swea_type: str) -> ValidationResult:
+        engine.reset_incremental_state()  # Always measure a full (non-incremental) scan
+        return engine.validate_code(code, swea_type)
+
+    return {
+        "rules": rules,
+        "structure": lambda code, swea_type: engine.validate_code_structure(code),
+        "standards": lambda code, swea_type: standards_validation(code, swea_type, "Student"),
+    }
+
+
+def rules_evaluated(result: Any) -> int:
+    """Rules or checks a validator evaluated, from its result"""
+    if isinstance(result, ValidationResult):
+        return result.passed_count + result.failed_count + result.uncertain_count
+    if isinstance(result, dict):
+        return len(result.get("validation_details", {})) or 1
+    return 1
+
+
+def measure(
+    name: str, validator: Validator, artifact: BenchmarkArtifact, size_label: str, repeats: int = 5
+) -> BenchmarkResult:
+    """Run ``validator`` on ``artifact`` ``repeats`` times, cold each time"""
+    timings = []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    for _ in range(max(1, repeats)):
+        CodeAnalysis.clear_memo()
+        gc.collect()
+        gc.disable()  # Like timeit: collector pauses would dominate small artifacts
+        try:
+            start = time.perf_counter_ns()
+            result = validator(artifact.code, artifact.swea_type)
+            timings.append(time.perf_counter_ns() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    # Allocation profile from one extra (untimed) run: tracemalloc slows execution down
+    CodeAnalysis.clear_memo()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    validator(artifact.code, artifact.swea_type)
+    _, peak = tracemalloc.get_traced_memory()
+    if not already_tracing:
+        tracemalloc.stop()
+
+    best_ns = min(timings)
+    rule_count = rules_evaluated(result)
+    return BenchmarkResult(
+        validator=name,
+        swea_type=artifact.swea_type,
+        source=artifact.source,
+        size_label=size_label,
+        size_bytes=artifact.size_bytes,
+        repeats=len(timings),
+        best_ns=best_ns,
+        ns_per_byte=round(best_ns / max(1, artifact.size_bytes), 3),
+        peak_alloc_bytes=max(0, peak - baseline),
+        rules_evaluated=rule_count,
+        rules_per_second=round(rule_count * 1e9 / max(1, best_ns), 1),
+    )
+
+
+def run_benchmark(
+    sizes: Iterable[str] = DEFAULT_SIZES,
+    swea_types: Iterable[str] = SWEA_TYPES,
+    validators: Optional[Dict[str, Validator]] = None,
+    recorded: Optional[List[BenchmarkArtifact]] = None,
+    repeats: int = 5,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark every validator on synthetic and recorded artifacts of each size
+
+    Args:
+        sizes: Size labels (keys of SIZE_LABELS)
+        swea_types: SWEA types to generate synthetic artifacts for
+        validators: Validators by name (default: default_validators())
+        recorded: Recorded artifacts (default: recorded_artifacts())
+        repeats: Timed runs per measurement (the fastest is reported)
+
+    Returns:
+        One BenchmarkResult per validator, artifact and size
+    """
+    validators = validators or default_validators()
+    recorded = recorded_artifacts() if recorded is None else recorded
+    swea_types = list(swea_types)
+    results = []
+    for size_label in sizes:
+        size_bytes = SIZE_LABELS[size_label]
+        artifacts = [synthetic_artifact(swea_type, size_bytes) for swea_type in swea_types]
+        artifacts += [
+            scale_recorded_artifact(artifact, size_bytes)
+            for artifact in recorded
+            if artifact.swea_type in swea_types
+        ]
+        for artifact in artifacts:
+            for name, validator in validators.items():
+                results.append(measure(name, validator, artifact, size_label, repeats))
+    return results
+
+
+def budget_from_results(
+    results: Sequence[BenchmarkResult], headroom: float = 4.0
+) -> Dict[str, Any]:
+    """Budget document allowing ``headroom`` times the measured ns/byte (worst source per key)"""
+    budgets: Dict[str, float] = {}
+    for result in results:
+        budgets[result.budget_key] = max(budgets.get(result.budget_key, 0.0), result.ns_per_byte)
+    return {
+        "format_version": BUDGET_FORMAT_VERSION,
+        "headroom": headroom,
+        "ns_per_byte": {key: round(value * headroom, 3) for key, value in sorted(budgets.items())},
+    }
+
+
+def check_budget(results: Sequence[BenchmarkResult], budget: Dict[str, Any]) -> List[str]:
+    """Budget violations (one message per measurement over budget); keys without a budget pass"""
+    limits = budget.get("ns_per_byte", {})
+    violations = []
+    for result in results:
+        limit = limits.get(result.budget_key)
+        if limit is not None and result.ns_per_byte > limit:
+            violations.append(
+                f"{result.budget_key} ({result.source}): {result.ns_per_byte:.1f} ns/byte "
+                f"exceeds budget of {limit:.1f} ns/byte"
+            )
+    return violations
+
+
+def load_budget(path: str) -> Dict[str, Any]:
+    """Load a budget document written by ``save_budget``"""
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("format_version") != BUDGET_FORMAT_VERSION:
+        raise ValueError(f"Unsupported validation budget format in {path}")
+    return document
+
+
+def save_budget(path: str, budget: Dict[str, Any]) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Human-readable table of benchmark results"""
+    header = (
+        f"{'validator':<10} {'swea':<9} {'source':<10} {'size':>8} {'ns/byte':>9} "
+        f"{'peak alloc':>11} {'rules':>6} {'rules/s':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.validator:<10} {r.swea_type:<9} {r.source:<10} {r.size_bytes:>8} "
+            f"{r.ns_per_byte:>9.1f} {r.peak_alloc_bytes / 1024:>9.1f}KB {r.rules_evaluated:>6} "
+            f"{r.rules_per_second:>12.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BAES validators")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="e.g. 1KB,100KB,1MB")
+    parser.add_argument("--swea-types", default=",".join(SWEA_TYPES))
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement")
+    parser.add_argument("--recorded", action="append", default=[], help="Generated files or dirs")
+    parser.add_argument("--budget", help="Budget JSON to check against (or to write)")
+    parser.add_argument("--update-budget", action="store_true", help="Write results as budget")
+    parser.add_argument("--headroom", type=float, default=4.0, help="Budget headroom factor")
+    parser.add_argument("--json", help="Write raw results to this JSON file")
+    args = parser.parse_args(argv)
+
+    engine = ValidationRuleEngine()
+    results = run_benchmark(
+        sizes=args.sizes.split(","),
+        swea_types=args.swea_types.split(","),
+        validators=default_validators(engine),
+        recorded=recorded_artifacts(args.recorded),
+        repeats=args.repeat,
+    )
+    print(format_report(results))
+    print("\nEngine validation_time_ms (all runs):")
+    for name, stats in sorted(engine.timing_stats().items()):
+        print(
+            f"  {name:<18} {stats.calls:>5} calls  mean {stats.mean_ms:9.3f} ms  "
+            f"max {stats.max_ms:9.3f} ms  {stats.ns_per_char:8.1f} ns/char"
+        )
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8"
+        )
+
+    if args.budget and args.update_budget:
+        save_budget(args.budget, budget_from_results(results, args.headroom))
+        print(f"\n💾 Budget written to {args.budget}")
+    elif args.budget:
+        violations = check_budget(results, load_budget(args.budget))
+        for violation in violations:
+            print(f"❌ {violation}")
+        if violations:
+            return 1
+        print("\n✅ All validators within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
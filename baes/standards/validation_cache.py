@@ -0,0 +1,356 @@
+"""
+Validation Verdict Cache for TechLeadSWEA Reviews
+
+Retries, final reviews and evolution re-reviews revalidate the same code
+repeatedly, sometimes through the LLM path. This cache stores the verdict of a
+code review so an identical artifact is never paid for twice, within a request,
+across requests or across processes.
+
+Two-tier caching strategy (same layout as the entity recognition cache):
+1. In-memory cache (hot tier): OrderedDict with LRU eviction
+2. SQLite persistent cache (cold tier): WAL mode, LRU eviction by last access
+
+Cache key: sha256 over (sha256(code), swea_type, task_type, entity,
+rule-catalog version, standards version). The rule-catalog version is
+``ValidationRuleEngine.catalog_version()``; the standards version fingerprints
+the standards modules, the TechLeadSWEA validators and the review model, so
+changing any rule, standard, prompt or model invalidates old verdicts.
+
+Constitutional compliance:
+- Observability: cache_stats() reports hit rates and sizes
+- Fail-safe: Cache errors never block validation, they fall back to a miss
+- Generator-first: Only completed verdicts are cached, never validation errors
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached verdict (e.g. when the verdict format changes)
+VERDICT_CACHE_VERSION = "1"
+
+# Modules whose source defines what a verdict means
+_STANDARDS_MODULES = (
+    "baes.standards.base_standards",
+    "baes.standards.backend_standards",
+    "baes.standards.frontend_standards",
+    "baes.standards.database_standards",
+    "baes.standards.test_standards",
+    "baes.swea_agents.techlead_swea",
+)
+
+# Verdict details that mark a failed validation run rather than a verdict
+_ERROR_MARKERS = ("validation error:", "validation response parsing failed")
+
+
+@lru_cache(maxsize=1)
+def standards_version() -> str:
+    """Fingerprint of the validation standards, TechLeadSWEA validators and review model"""
+    digest = hashlib.sha256(f"{VERDICT_CACHE_VERSION}:{Config.OPENAI_MODEL}".encode("utf-8"))
+    for module in _STANDARDS_MODULES:
+        try:
+            spec = importlib.util.find_spec(module)
+            digest.update(Path(spec.origin).read_bytes())
+        except Exception:
+            digest.update(module.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def is_cacheable_verdict(verdict: Dict[str, Any]) -> bool:
+    """Whether a validation result is a real verdict (not an error fallback or deferred review)"""
+    if not isinstance(verdict, dict) or "is_valid" not in verdict:
+        return False
+    if verdict.get("llm_review_deferred"):
+        return False
+    details = str(verdict.get("details", "")).lower()
+    return not any(marker in details for marker in _ERROR_MARKERS)
+
+
+@dataclass
+class VerdictCacheStats:
+    """Verdict cache statistics for observability"""
+
+    memory_size: int  # Number of entries in memory cache
+    persistent_size: int  # Number of entries in SQLite cache
+    memory_hit_count: int  # Total memory cache hits
+    persistent_hit_count: int  # Total persistent cache hits
+    miss_count: int  # Total cache misses (validation executed)
+    hit_rate: float  # Combined hit rate (0.0 to 1.0)
+
+
+class ValidationVerdictCache:
+    """
+    Two-tier validation verdict cache with LRU eviction and SQLite persistence
+
+    Architecture:
+    - Hot tier (memory): OrderedDict with LRU, ``max_memory_entries`` verdicts
+    - Cold tier (SQLite): Persistent storage shared across processes, trimmed to
+      ``max_persistent_entries`` by least recent access
+    - Promotion: Cold hits promoted to hot tier
+    - Thread-safe: Memory tier protected by threading.Lock
+    """
+
+    def __init__(
+        self,
+        cache_db_path: Optional[str] = None,
+        max_memory_entries: int = 256,
+        max_persistent_entries: int = 5000,
+    ):
+        """
+        Initialize verdict cache
+
+        Args:
+            cache_db_path: Path to SQLite database (default: Config.VALIDATION_CACHE_PATH)
+            max_memory_entries: Maximum verdicts kept in memory
+            max_persistent_entries: Maximum verdicts kept on disk
+        """
+        self.cache_db_path = str(cache_db_path or Config.VALIDATION_CACHE_PATH)
+        self.max_memory_entries = max_memory_entries
+        self.max_persistent_entries = max_persistent_entries
+
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+        self._persistent = self._initialize_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.cache_db_path, timeout=5.0)
+
+    def _initialize_database(self) -> bool:
+        """Initialize SQLite database with schema; False disables the cold tier"""
+        try:
+            Path(self.cache_db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS validation_verdicts (
+                        cache_key TEXT PRIMARY KEY,
+                        swea_type TEXT NOT NULL,
+                        task_type TEXT NOT NULL,
+                        verdict TEXT NOT NULL,
+                        cached_at TEXT NOT NULL,
+                        last_accessed TEXT NOT NULL
+                    )
+                    """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_verdict_last_accessed
+                    ON validation_verdicts(last_accessed)
+                    """)
+                conn.commit()
+            finally:
+                conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize validation verdict cache: {e}")
+            return False
+
+    @staticmethod
+    def make_key(
+        code: str,
+        swea_type: str,
+        task_type: str,
+        rule_catalog_version: str,
+        entity: str = "",
+        standards: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key for a verdict
+
+        Args:
+            code: Reviewed source code
+            swea_type: SWEA that produced the code (e.g. "BackendSWEA")
+            task_type: Task that produced the code (e.g. "generate_api")
+            rule_catalog_version: ``ValidationRuleEngine.catalog_version()``
+            entity: Entity the code was generated for (standards checks are entity-specific)
+            standards: Standards version (default: ``standards_version()``)
+
+        Returns:
+            Hex sha256 cache key
+        """
+        code_hash = hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
+        parts = (
+            code_hash,
+            swea_type,
+            task_type,
+            entity,
+            rule_catalog_version,
+            standards or standards_version(),
+        )
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a verdict (memory first, then persistent)
+
+        Returns:
+            A copy of the cached verdict, or None on miss
+        """
+        with self._lock:
+            verdict = self._memory_cache.get(cache_key)
+            if verdict is not None:
+                self._memory_cache.move_to_end(cache_key)
+                self._memory_hits += 1
+                return json.loads(json.dumps(verdict))
+
+        row = None
+        if self._persistent:
+            try:
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        "SELECT verdict FROM validation_verdicts WHERE cache_key = ?",
+                        (cache_key,),
+                    ).fetchone()
+                    if row:
+                        conn.execute(
+                            "UPDATE validation_verdicts SET last_accessed = ? WHERE cache_key = ?",
+                            (datetime.now().isoformat(), cache_key),
+                        )
+                        conn.commit()
+                finally:
+                    conn.close()
+            except Exception as e:
+                logger.error(f"❌ Verdict cache read failed: {e}")
+                row = None
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            verdict = json.loads(row[0])
+            self._remember(cache_key, verdict)
+            self._persistent_hits += 1
+        return json.loads(row[0])
+
+    def put(self, cache_key: str, swea_type: str, task_type: str, verdict: Dict[str, Any]):
+        """Store a verdict in both tiers, evicting least recently used entries"""
+        try:
+            serialized = json.dumps(verdict, default=str)
+        except Exception as e:
+            logger.warning(f"⚠️  Verdict not cacheable ({e})")
+            return
+
+        with self._lock:
+            self._remember(cache_key, json.loads(serialized))
+
+        if not self._persistent:
+            return
+        try:
+            now = datetime.now().isoformat()
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO validation_verdicts
+                    (cache_key, swea_type, task_type, verdict, cached_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (cache_key, swea_type, task_type, serialized, now, now),
+                )
+                # LRU eviction of the persistent tier
+                conn.execute(
+                    """
+                    DELETE FROM validation_verdicts WHERE cache_key IN (
+                        SELECT cache_key FROM validation_verdicts
+                        ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_persistent_entries,),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"❌ Verdict cache write failed: {e}")
+
+    def _remember(self, cache_key: str, verdict: Dict[str, Any]):
+        """Insert into the memory tier (must hold lock)"""
+        self._memory_cache[cache_key] = verdict
+        self._memory_cache.move_to_end(cache_key)
+        while len(self._memory_cache) > self.max_memory_entries:
+            self._memory_cache.popitem(last=False)
+
+    def clear(self):
+        """Remove every cached verdict from both tiers"""
+        with self._lock:
+            self._memory_cache.clear()
+        if not self._persistent:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM validation_verdicts")
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"❌ Verdict cache clear failed: {e}")
+
+    def cache_stats(self) -> VerdictCacheStats:
+        """Get cache statistics for observability"""
+        with self._lock:
+            memory_size = len(self._memory_cache)
+            memory_hits, persistent_hits, misses = (
+                self._memory_hits,
+                self._persistent_hits,
+                self._misses,
+            )
+
+        persistent_size = 0
+        if self._persistent:
+            try:
+                conn = self._connect()
+                try:
+                    persistent_size = conn.execute(
+                        "SELECT COUNT(*) FROM validation_verdicts"
+                    ).fetchone()[0]
+                finally:
+                    conn.close()
+            except Exception as e:
+                logger.error(f"❌ Failed to get verdict cache stats: {e}")
+
+        total = memory_hits + persistent_hits + misses
+        return VerdictCacheStats(
+            memory_size=memory_size,
+            persistent_size=persistent_size,
+            memory_hit_count=memory_hits,
+            persistent_hit_count=persistent_hits,
+            miss_count=misses,
+            hit_rate=(memory_hits + persistent_hits) / total if total else 0.0,
+        )
+
+
+_shared_cache: Optional[ValidationVerdictCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_validation_cache() -> Optional[ValidationVerdictCache]:
+    """Process-wide verdict cache, or None when ENABLE_VALIDATION_CACHE is off"""
+    global _shared_cache
+    if not Config.ENABLE_VALIDATION_CACHE:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ValidationVerdictCache(
+                max_memory_entries=Config.VALIDATION_CACHE_MEMORY_ENTRIES,
+                max_persistent_entries=Config.VALIDATION_CACHE_MAX_ENTRIES,
+            )
+        return _shared_cache
@@ -0,0 +1,429 @@
+"""
+Learned Confidence Calibration for Rule-Based Validation Routing
+
+``ValidationRuleEngine.validate_code`` averages hand-set rule confidences and
+routes on fixed thresholds (>= 0.7 approve, <= -0.3 reject, otherwise LLM).
+Every artifact that falls through to the downstream reviewer (standards or LLM
+validation) yields a labelled example: the rule outcome vector and the verdict
+the reviewer reached. This module records those pairs, fits a per-SWEA logistic
+model over the rule outcomes and picks decision thresholds that maximize the
+share of confident decisions at a target error rate, so fewer uncertain
+artifacts need the downstream review.
+
+Storage:
+- Samples: JSON lines (one recorded pair per line); refits rewrite the file to
+  the most recent ``max_samples`` lines, so it stays bounded
+- Models: JSON document with one model per SWEA type (weights, bias, thresholds)
+
+Models apply only to the uncertain band of the fixed thresholds (where their
+training data comes from) and only while the SWEA's rule set is unchanged.
+Samples are LLM verdicts only: calibration replaces LLM reviews, never the exact
+Standards checks. Refits run on a background thread, off the review path.
+
+Constitutional compliance:
+- Observability: Models record sample counts and their expected coverage
+- Fail-safe: Missing, stale or unreadable models fall back to fixed thresholds
+- Fail-fast: Calibrated rejections still require a failed rule for feedback
+"""
+
+import json
+import logging
+import math
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the model JSON layout changes; older model files are ignored
+CALIBRATION_FORMAT_VERSION = 1
+
+# Logistic regression fit parameters
+_FIT_ITERATIONS = 500
+_LEARNING_RATE = 0.5
+_L2_PENALTY = 0.01
+
+# Thresholds that never trigger (model makes no confident decision on that side)
+_NEVER_APPROVE = 1.01
+_NEVER_REJECT = -0.01
+
+
+def _sigmoid(value: float) -> float:
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp = math.exp(value)
+    return exp / (1.0 + exp)
+
+
+@dataclass
+class CalibrationModel:
+    """
+    Logistic model of P(reviewer approves | rule outcomes) for one SWEA type
+
+    Attributes:
+        swea_type: SWEA type the model applies to (backend, database, ...)
+        rule_ids: Rule ids in feature order; the model applies only to this rule set
+        weights: One weight per rule (feature is +1 if the rule passed, -1 if it failed)
+        bias: Intercept
+        approve_threshold: Approve confidently when P(approve) >= this
+        reject_threshold: Reject confidently when P(approve) <= this
+        sample_count: Number of samples the model was fitted on
+        coverage: Share of training samples decided confidently by the thresholds
+        target_error_rate: Error rate the thresholds were chosen for
+        fitted_at: ISO timestamp of the fit
+    """
+
+    swea_type: str
+    rule_ids: List[str]
+    weights: List[float]
+    bias: float
+    approve_threshold: float = _NEVER_APPROVE
+    reject_threshold: float = _NEVER_REJECT
+    sample_count: int = 0
+    coverage: float = 0.0
+    target_error_rate: float = 0.05
+    fitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def applies_to(self, rule_ids: Sequence[str]) -> bool:
+        """Whether the model was fitted on exactly this rule set"""
+        return list(rule_ids) == self.rule_ids
+
+    def probability(self, passed: Sequence[bool]) -> float:
+        """P(reviewer approves) for a rule outcome vector in ``rule_ids`` order"""
+        score = self.bias + sum(
+            weight * (1.0 if ok else -1.0) for weight, ok in zip(self.weights, passed)
+        )
+        return _sigmoid(score)
+
+    def predict(self, rule_results: Sequence[Any]) -> Optional[float]:
+        """
+        P(reviewer approves) for ``RuleMatch`` results, or None if the rule set differs
+
+        Args:
+            rule_results: RuleMatch objects (``rule_id`` and ``passed`` attributes)
+        """
+        if [match.rule_id for match in rule_results] != self.rule_ids:
+            return None
+        return self.probability([match.passed for match in rule_results])
+
+
+def fit_calibration_model(
+    swea_type: str,
+    rule_ids: List[str],
+    samples: Sequence[Tuple[Sequence[bool], bool]],
+    target_error_rate: float = 0.05,
+) -> CalibrationModel:
+    """
+    Fit a logistic model and choose thresholds for a target error rate
+
+    Samples are aggregated by outcome vector first (rule sets are small, so only
+    a handful of distinct vectors occur), which keeps the fit cheap in pure Python.
+
+    Thresholds are chosen on the fitted probabilities: the approve threshold is
+    the lowest probability such that the (Laplace-smoothed) share of rejected
+    samples at or above it stays within ``target_error_rate``; the reject
+    threshold mirrors this for approved samples at or below it.
+
+    Args:
+        swea_type: SWEA type of the samples
+        rule_ids: Rule ids in feature order
+        samples: (rule outcome vector, reviewer approved) pairs
+        target_error_rate: Maximum tolerated error rate of confident decisions
+
+    Returns:
+        Fitted CalibrationModel
+    """
+    # Aggregate identical outcome vectors: vector -> [approved count, rejected count]
+    patterns: Dict[Tuple[bool, ...], List[int]] = {}
+    for passed, approved in samples:
+        counts = patterns.setdefault(tuple(bool(ok) for ok in passed), [0, 0])
+        counts[0 if approved else 1] += 1
+    total = sum(sum(counts) for counts in patterns.values())
+
+    weights = [0.0] * len(rule_ids)
+    bias = 0.0
+    if total:
+        vectors = [
+            ([1.0 if ok else -1.0 for ok in vector], counts) for vector, counts in patterns.items()
+        ]
+        for _ in range(_FIT_ITERATIONS):
+            grad_w = [_L2_PENALTY * weight for weight in weights]
+            grad_b = 0.0
+            for features, (approved, rejected) in vectors:
+                p = _sigmoid(bias + sum(w * x for w, x in zip(weights, features)))
+                # d(log loss)/d(score) summed over the pattern's samples
+                residual = (p * (approved + rejected) - approved) / total
+                grad_b += residual
+                for index, x in enumerate(features):
+                    grad_w[index] += residual * x
+            bias -= _LEARNING_RATE * grad_b
+            weights = [w - _LEARNING_RATE * g for w, g in zip(weights, grad_w)]
+
+    model = CalibrationModel(
+        swea_type=swea_type,
+        rule_ids=list(rule_ids),
+        weights=[round(weight, 6) for weight in weights],
+        bias=round(bias, 6),
+        sample_count=total,
+        target_error_rate=target_error_rate,
+    )
+
+    # Thresholds: scan patterns by descending (approve) / ascending (reject) probability
+    scored = sorted(
+        ((model.probability(vector), counts) for vector, counts in patterns.items()),
+        key=lambda item: item[0],
+    )
+    approve_covered = reject_covered = 0
+    approved_n = rejected_n = 0
+    for probability, (approved, rejected) in reversed(scored):
+        approved_n += approved
+        rejected_n += rejected
+        if (rejected_n + 1) / (approved_n + rejected_n + 2) <= target_error_rate:
+            model.approve_threshold = probability
+            approve_covered = approved_n + rejected_n
+    approved_n = rejected_n = 0
+    for probability, (approved, rejected) in scored:
+        if probability >= model.approve_threshold:
+            break
+        approved_n += approved
+        rejected_n += rejected
+        if (approved_n + 1) / (approved_n + rejected_n + 2) <= target_error_rate:
+            model.reject_threshold = probability
+            reject_covered = approved_n + rejected_n
+    model.coverage = round((approve_covered + reject_covered) / total, 4) if total else 0.0
+    return model
+
+
+class ValidationCalibration:
+    """
+    Records (rule outcome vector, reviewer verdict) pairs and serves fitted models
+
+    Models are refitted automatically on a background thread every ``refit_every``
+    recorded samples per SWEA type once ``min_samples`` matching samples exist, and
+    persisted as JSON. Thread-safe: sample file access and model updates are
+    protected by a lock; fitting runs outside it.
+    """
+
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        samples_path: Optional[str] = None,
+        target_error_rate: float = 0.05,
+        min_samples: int = 50,
+        refit_every: int = 25,
+        max_samples: int = 5000,
+    ):
+        """
+        Initialize calibration storage
+
+        Args:
+            model_path: JSON model file (default: Config.VALIDATION_CALIBRATION_PATH)
+            samples_path: JSON lines sample file (default: Config.VALIDATION_CALIBRATION_SAMPLES_PATH)
+            target_error_rate: Maximum tolerated error rate of calibrated decisions
+            min_samples: Samples required before a model is fitted
+            refit_every: Refit after this many new samples for a SWEA type
+            max_samples: Most recent samples kept in the sample file and used per fit
+        """
+        self.model_path = Path(model_path or Config.VALIDATION_CALIBRATION_PATH)
+        self.samples_path = Path(samples_path or Config.VALIDATION_CALIBRATION_SAMPLES_PATH)
+        self.target_error_rate = target_error_rate
+        self.min_samples = min_samples
+        self.refit_every = refit_every
+        self.max_samples = max_samples
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, int] = {}
+        self._refit_thread: Optional[threading.Thread] = None
+        self.models: Dict[str, CalibrationModel] = self._load_models()
+
+    def _load_models(self) -> Dict[str, CalibrationModel]:
+        """Load models from JSON; unreadable or outdated files yield no models"""
+        if not self.model_path.exists():
+            return {}
+        try:
+            document = json.loads(self.model_path.read_text(encoding="utf-8"))
+            if document.get("format_version") != CALIBRATION_FORMAT_VERSION:
+                logger.warning("⚠️  Ignoring calibration models with an outdated format")
+                return {}
+            return {
+                swea_type: CalibrationModel(**model)
+                for swea_type, model in document.get("models", {}).items()
+            }
+        except Exception as e:
+            logger.error(f"❌ Failed to load validation calibration models: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Persist the current models as JSON"""
+        document = {
+            "format_version": CALIBRATION_FORMAT_VERSION,
+            "models": {swea_type: asdict(model) for swea_type, model in self.models.items()},
+        }
+        try:
+            self.model_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.model_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+            temp_path.replace(self.model_path)
+        except Exception as e:
+            logger.error(f"❌ Failed to save validation calibration models: {e}")
+
+    def model_for(self, swea_type: str, rule_ids: Sequence[str]) -> Optional[CalibrationModel]:
+        """Model for ``swea_type`` if one was fitted on exactly this rule set"""
+        model = self.models.get(swea_type)
+        return model if model is not None and model.applies_to(rule_ids) else None
+
+    def record(
+        self, swea_type: str, rule_results: Sequence[Any], approved: bool, source: str = ""
+    ) -> None:
+        """
+        Record the reviewer verdict for an artifact the rules were uncertain about
+
+        Args:
+            swea_type: SWEA type the rules ran for
+            rule_results: RuleMatch results of the rule-based validation
+            approved: Whether the downstream reviewer approved the artifact
+            source: Reviewer that produced the verdict (e.g. "LLMValidation")
+        """
+        sample = {
+            "swea_type": swea_type,
+            "rule_ids": [match.rule_id for match in rule_results],
+            "passed": [bool(match.passed) for match in rule_results],
+            "approved": bool(approved),
+            "source": source,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        with self._lock:
+            try:
+                self.samples_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.samples_path.open("a", encoding="utf-8") as samples_file:
+                    samples_file.write(json.dumps(sample) + "\n")
+            except Exception as e:
+                logger.error(f"❌ Failed to record validation calibration sample: {e}")
+                return
+            self._pending[swea_type] = self._pending.get(swea_type, 0) + 1
+            refit = self._pending[swea_type] >= self.refit_every
+            if refit and self._refit_thread is not None and self._refit_thread.is_alive():
+                refit = False  # The running refit picks up the new samples next time
+            if refit:
+                self._refit_thread = threading.Thread(
+                    target=self._refit_in_background,
+                    args=([swea_type],),
+                    name="baes-calibration-refit",
+                    daemon=True,
+                )
+                self._refit_thread.start()
+
+    def _refit_in_background(self, swea_types: Sequence[str]) -> None:
+        """Refit thread body: errors are logged, never raised into a review"""
+        try:
+            self.refit(swea_types)
+        except Exception as e:
+            logger.error(f"❌ Validation calibration refit failed: {e}")
+
+    def wait_for_refit(self, timeout: Optional[float] = None) -> None:
+        """Wait for a background refit started by ``record`` to finish"""
+        thread = self._refit_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def load_samples(self, swea_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent recorded samples (at most ``max_samples``), optionally for one SWEA type"""
+        with self._lock:
+            samples = self._read_samples()
+        if swea_type is not None:
+            samples = [sample for sample in samples if sample.get("swea_type") == swea_type]
+        return samples[-self.max_samples :]
+
+    def _read_samples(self, compact: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parse the sample file (must hold lock)
+
+        With ``compact``, a file longer than ``max_samples`` lines is rewritten to
+        its most recent ``max_samples`` lines.
+        """
+        if not self.samples_path.exists():
+            return []
+        lines = self.samples_path.read_text(encoding="utf-8").splitlines()
+        if compact and len(lines) > self.max_samples:
+            lines = lines[-self.max_samples :]
+            try:
+                temp_path = self.samples_path.with_suffix(".tmp")
+                temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                temp_path.replace(self.samples_path)
+            except Exception as e:
+                logger.error(f"❌ Failed to compact validation calibration samples: {e}")
+        samples = []
+        for line in lines:
+            try:
+                samples.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return samples
+
+    def refit(self, swea_types: Optional[Sequence[str]] = None) -> Dict[str, CalibrationModel]:
+        """
+        Refit models from the recorded samples and persist them
+
+        Each model is fitted on the samples recorded with the SWEA's most recent
+        rule set; SWEA types with fewer than ``min_samples`` such samples are skipped.
+
+        Returns:
+            The models refitted by this call
+        """
+        with self._lock:
+            samples = self._read_samples(compact=True)
+            if swea_types is None:
+                swea_types = sorted({sample["swea_type"] for sample in samples})
+            for swea_type in swea_types:
+                self._pending[swea_type] = 0
+        fitted = {}
+        for swea_type in swea_types:
+            typed = [sample for sample in samples if sample["swea_type"] == swea_type]
+            if not typed:
+                continue
+            rule_ids = typed[-1]["rule_ids"]
+            matching = [
+                (sample["passed"], sample["approved"])
+                for sample in typed
+                if sample["rule_ids"] == rule_ids
+            ]
+            if len(matching) < self.min_samples:
+                continue
+            fitted[swea_type] = fit_calibration_model(
+                swea_type, rule_ids, matching, self.target_error_rate
+            )
+        if not fitted:
+            return fitted
+        with self._lock:
+            for swea_type, model in fitted.items():
+                self.models[swea_type] = model
+                logger.info(
+                    f"📐 Validation calibration refitted for {swea_type}: {model.sample_count} samples, "
+                    f"approve >= {model.approve_threshold:.2f}, reject <= {model.reject_threshold:.2f}, "
+                    f"coverage {model.coverage:.0%}"
+                )
+            self.save()
+        return fitted
+
+
+_shared_calibration: Optional[ValidationCalibration] = None
+_shared_calibration_lock = threading.Lock()
+
+
+def get_validation_calibration() -> Optional[ValidationCalibration]:
+    """Process-wide calibration store, or None when ENABLE_VALIDATION_CALIBRATION is off"""
+    global _shared_calibration
+    if not Config.ENABLE_VALIDATION_CALIBRATION:
+        return None
+    with _shared_calibration_lock:
+        if _shared_calibration is None:
+            _shared_calibration = ValidationCalibration(
+                target_error_rate=Config.VALIDATION_CALIBRATION_TARGET_ERROR,
+                min_samples=Config.VALIDATION_CALIBRATION_MIN_SAMPLES,
+                refit_every=Config.VALIDATION_CALIBRATION_REFIT_EVERY,
+            )
+        return _shared_calibration
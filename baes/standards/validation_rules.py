@@ -26,10 +26,276 @@ Usage:
 """
 
 import ast
+import hashlib
 import re
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+from .code_analysis import CodeAnalysis, lowercase_for_matching
+
+if TYPE_CHECKING:
+    from .validation_calibration import ValidationCalibration
+
+# Flags shared by every rule pattern
+RULE_FLAGS = re.MULTILINE | re.IGNORECASE
+
+# Changed share of an artifact above which incremental validation rescans everything
+INCREMENTAL_MAX_CHANGED_FRACTION = 0.5
+
+# Escapes that never match a newline: word, digit and non-space classes, word
+# boundaries and tab/carriage-return/form-feed literals (escaped punctuation is a literal)
+_LINE_LOCAL_ESCAPES = frozenset("wdSbBtrf")
+
+# Inline flags that keep a pattern line-local (DOTALL and VERBOSE do not)
+_LINE_LOCAL_FLAGS = frozenset("imau-")
+
+# Escapes denoting characters by code (possibly letters the case folding cannot see)
+_UNFOLDABLE_ESCAPES = frozenset("xuUN01234567")
+
+# Constructs that break when a pattern becomes one branch of a combined scan:
+# back-references and conditionals (group numbers shift), named groups (names can
+# collide) and leading global flags
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?<[^=!]|\(\?\(|^\(\?[a-zA-Z]+\)")
+
+
+def _is_line_local_escape(escaped: str) -> bool:
+    """Whether the escape ``\\<escaped>`` can never match a newline"""
+    return escaped in _LINE_LOCAL_ESCAPES or not (escaped.isalnum() or escaped.isspace())
+
+
+def _set_end(pattern: str, start: int) -> int:
+    """Offset of the ``]`` closing the character set opened at ``start``"""
+    index = start + 1
+    if pattern.startswith("^", index):
+        index += 1
+    if pattern.startswith("]", index):
+        index += 1
+    while pattern[index] != "]":
+        index += 2 if pattern[index] == "\\" else 1
+    return index
+
+
+def _fold_range(low: str, high: str) -> Optional[str]:
+    """Character-set range ``low-high`` for lowercased text (None if it mixes letter cases)"""
+    if low.isupper() and high.isupper():
+        return f"{low.lower()}-{high.lower()}"
+    if low.islower() and high.islower():
+        return f"{low}-{high}"
+    if ord(high) < ord("A") or ord("z") < ord(low) or ord("Z") < ord(low) <= ord(high) < ord("a"):
+        return f"{low}-{high}"
+    return None
+
+
+def _fold_set(text: str) -> Optional[str]:
+    """Character set ``[...]`` rewritten for lowercased text (None if not foldable)"""
+    head = 2 if text.startswith("[^") else 1
+    items, folded = text[head:-1], [text[:head]]
+    index = 0
+    while index < len(items):
+        if items[index] == "\\":
+            if items[index + 1] in _UNFOLDABLE_ESCAPES or items.startswith("-", index + 2):
+                return None
+            folded.append(items[index:index + 2])
+            index += 2
+        elif items.startswith("-", index + 1) and index + 2 < len(items):
+            if items[index + 2] == "\\":
+                return None
+            folded_range = _fold_range(items[index], items[index + 2])
+            if folded_range is None:
+                return None
+            folded.append(folded_range)
+            index += 3
+        else:
+            folded.append(items[index].lower())
+            index += 1
+    return "".join(folded) + "]"
+
+
+def fold_pattern(pattern: str) -> Optional[str]:
+    """
+    Rewrite a rule pattern to match lowercased text case-sensitively
+
+    Searching ``lowercase_for_matching(code)`` with the folded pattern gives the same
+    offsets as searching ``code`` with IGNORECASE, but keeps the regex engine's literal
+    fast paths (IGNORECASE scans are several times slower). ASCII letters outside
+    escapes and group names are lowercased. Returns None for patterns that cannot be
+    folded safely (non-ASCII characters, inline flags, escapes denoting characters
+    by code, character-set ranges mixing letter cases).
+    """
+    if not pattern.isascii():
+        return None
+    folded = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if pattern[index + 1] in _UNFOLDABLE_ESCAPES:
+                return None
+            folded.append(pattern[index:index + 2])
+            index += 2
+        elif char == "[":
+            end = _set_end(pattern, index)
+            folded_set = _fold_set(pattern[index:end + 1])
+            if folded_set is None:
+                return None
+            folded.append(folded_set)
+            index = end + 1
+        elif char == "(" and pattern.startswith("?", index + 1):
+            group = pattern[index + 2:]
+            if group.startswith(("P<", "<")) and not group.startswith(("<=", "<!")):
+                end = pattern.index(">", index) + 1  # Named group: keep the name
+            elif group.startswith(("P=", "#", "(")):
+                end = pattern.index(")", index) + 1  # Back-reference, comment, condition
+            elif group[:1].isalpha() or group.startswith("-"):
+                return None  # Inline flags
+            else:
+                end = index + 2
+            folded.append(pattern[index:end])
+            index = end
+        else:
+            folded.append(char.lower())
+            index += 1
+    return "".join(folded)
+
+
+def _is_line_local(pattern: str) -> bool:
+    """
+    Whether a rule pattern (compiled with RULE_FLAGS) can only match within a single line
+
+    Such patterns match at a position depending only on that position's line, so
+    incremental validation only has to rescan edited lines. Conservative check of
+    the pattern text: escapes that may match a newline (``\\s``, ``\\W``, ``\\n``,
+    numeric escapes), character sets matching a newline, string anchors,
+    lookarounds, back-references, conditionals and DOTALL/VERBOSE flags are not
+    line-local.
+    """
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if not _is_line_local_escape(pattern[index + 1:index + 2]):
+                return False
+            index += 2
+        elif char == "[":
+            end = _set_end(pattern, index)
+            if re.match(pattern[index:end + 1], "\n", RULE_FLAGS):
+                return False
+            index = end + 1
+        elif char == "(" and pattern.startswith("?", index + 1):
+            group = pattern[index + 2:]
+            if group.startswith("#"):  # Comment
+                index = pattern.index(")", index) + 1
+                continue
+            if group.startswith(("=", "!", "<=", "<!", "P=", "(")):
+                return False  # Lookaround, back-reference or conditional
+            if group[:1].isalpha() and group[:1] != "P":
+                flags = re.match(r"[a-zA-Z-]*", group).group()
+                if set(flags) - _LINE_LOCAL_FLAGS:
+                    return False
+            index += 2
+        elif char == "\n":
+            return False
+        else:
+            index += 1  # Literals, "." (no DOTALL), anchors, quantifiers, alternation
+    return True
+
+
+@lru_cache(maxsize=256)
+def _combined_pattern(patterns: Tuple[str, ...], flags: int) -> Optional[Pattern]:
+    """One flat alternation of ``patterns`` (None if it fails to compile)"""
+    try:
+        return re.compile("|".join(patterns), flags)
+    except re.error:
+        return None
+
+
+def _first_match_spans(
+    rules: Sequence["ValidationRule"],
+    code: str,
+    lowered: Optional[str] = None,
+    pos: int = 0,
+    endpos: Optional[int] = None,
+) -> List[Optional[Tuple[int, int]]]:
+    """
+    (start, end) of the first match of each rule in ``code[pos:endpos]`` (None if no match)
+
+    Combinable patterns are scanned as one alternation: each search stops at the
+    leftmost position where any rule still without a match matches, the rules
+    matching there are identified by anchored matches, and the scan resumes from
+    that position with the remaining rules. The code is therefore crossed once
+    however many rules there are. The alternation is flat rather than one group
+    per rule, so the regex engine keeps its first-character prefilter. When
+    ``lowered`` (``lowercase_for_matching(code)``) is given and every pattern
+    folds, the folded patterns scan it case-sensitively. Other patterns are
+    searched one by one.
+    """
+    endpos = len(code) if endpos is None else endpos
+    spans: List[Optional[Tuple[int, int]]] = [None] * len(rules)
+    pending = []
+    for index, rule in enumerate(rules):
+        if rule.combinable:
+            pending.append(index)
+        else:
+            spans[index] = rule.search_span(code, lowered, pos, endpos)
+    
+    while pending:
+        folded = lowered is not None and all(
+            rules[index].folded_pattern is not None for index in pending
+        )
+        text = lowered if folded else code
+        combined = _combined_pattern(
+            tuple(rules[i].folded_pattern if folded else rules[i].pattern for i in pending),
+            re.MULTILINE if folded else RULE_FLAGS,
+        )
+        if combined is None:
+            break
+        match = combined.search(text, pos, endpos)
+        if match is None:
+            pending = []
+            break
+        pos = match.start()
+        remaining = []
+        for index in pending:
+            found = rules[index].scan_pattern(folded).match(text, pos, endpos)
+            if found is not None:
+                spans[index] = found.span()
+            else:
+                remaining.append(index)
+        if len(remaining) == len(pending):
+            break  # No rule matched at the stop (cannot happen for valid alternations)
+        pending = remaining
+    
+    # Rules the combined pattern could not scan are searched one by one
+    for index in pending:
+        spans[index] = rules[index].search_span(code, lowered, pos, endpos)
+    return spans
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the common prefix of two strings (binary search over C-level compares)"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of two strings, at most ``limit``"""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
 
 
 class ValidationOutcome(Enum):
@@ -71,6 +337,46 @@ class ValidationResult:
     validation_time_ms: float = 0.0
     requires_llm: bool = False
     feedback_message: str = ""
+    calibrated_probability: Optional[float] = None  # P(reviewer approves) from the calibration model
+    reused_rule_count: int = 0  # Rules whose outcome was reused by incremental validation
+    scan: Optional["RuleScan"] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class ValidationTimingStats:
+    """Aggregated validation_time_ms of one validator (see ValidationRuleEngine.timing_stats)"""
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_chars: int = 0
+    
+    def record(self, elapsed_ms: float, size_chars: int) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.total_chars += size_chars
+    
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+    
+    @property
+    def ns_per_char(self) -> float:
+        return self.total_ms * 1e6 / self.total_chars if self.total_chars else 0.0
+
+
+@dataclass
+class RuleScan:
+    """
+    First-match offsets of every rule of a SWEA type over one artifact
+
+    Kept with each ValidationResult so a patched version of the artifact can be
+    validated incrementally (see ValidationRuleEngine.validate_code).
+    """
+    swea_type: str
+    analysis: CodeAnalysis
+    rule_keys: Tuple[Tuple, ...]  # (rule_id, pattern, pattern_type, enabled) per rule
+    spans: List[Optional[Tuple[int, int]]]  # First match (start, end) per rule
 
 
 @dataclass
@@ -85,34 +391,113 @@ class ValidationRule:
     message: str  # Human-readable message
     suggestion: str = ""  # How to fix the issue
     enabled: bool = True
+    _compiled: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _compiled_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _folded: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _line_local: bool = field(default=False, init=False, repr=False, compare=False)
+    _combinable: bool = field(default=False, init=False, repr=False, compare=False)
     
-    def matches(self, code: str) -> Tuple[bool, Optional[int]]:
+    def __post_init__(self):
+        # Compile eagerly so invalid patterns fail when the rule is defined
+        self.compile()
+    
+    def compile(self) -> Pattern:
+        """Return the compiled pattern, recompiling only if the pattern changed"""
+        if self._compiled is None or self._compiled_source != self.pattern:
+            self._compiled = re.compile(self.pattern, RULE_FLAGS)
+            self._compiled_source = self.pattern
+            folded = fold_pattern(self.pattern)
+            self._folded = re.compile(folded, re.MULTILINE) if folded is not None else None
+            self._line_local = _is_line_local(self.pattern)
+            self._combinable = _UNCOMBINABLE.search(self.pattern) is None
+        return self._compiled
+    
+    @property
+    def line_local(self) -> bool:
+        """Whether the pattern can only match within a single line"""
+        self.compile()
+        return self._line_local
+    
+    @property
+    def folded_pattern(self) -> Optional[str]:
+        """Pattern for lowercased text (see fold_pattern), None if it does not fold"""
+        self.compile()
+        return self._folded.pattern if self._folded is not None else None
+    
+    def scan_pattern(self, folded: bool) -> Pattern:
+        """Compiled pattern for lowercased text if ``folded``, else for the original code"""
+        return self._folded if folded else self.compile()
+    
+    @property
+    def combinable(self) -> bool:
+        """Whether the pattern can be scanned as one alternative of a combined pattern"""
+        self.compile()
+        return self._combinable
+    
+    @property
+    def scan_key(self) -> Tuple:
+        """Identity of the rule's scan (a RuleScan is reusable only for equal keys)"""
+        return (self.rule_id, self.pattern, self.pattern_type, self.enabled)
+    
+    def search(
+        self, code: str, lowered: Optional[str] = None, pos: int = 0, endpos: Optional[int] = None
+    ) -> Optional[int]:
         """
-        Check if pattern matches code
+        Offset of the first match of the pattern in ``code`` (None if no match)
+        
+        Args:
+            code: Source code to scan
+            lowered: ``lowercase_for_matching(code)``; enables the fast case-folded
+                pattern when not None
+            pos: Offset to start scanning at
+            endpos: Offset to stop scanning at (default: end of code)
+        """
+        span = self.search_span(code, lowered, pos, endpos)
+        return span[0] if span else None
+    
+    def search_span(
+        self, code: str, lowered: Optional[str] = None, pos: int = 0, endpos: Optional[int] = None
+    ) -> Optional[Tuple[int, int]]:
+        """(start, end) of the first match of the pattern in ``code`` (see search)"""
+        pattern = self.compile()
+        endpos = len(code) if endpos is None else endpos
+        if lowered is not None and self._folded is not None:
+            match = self._folded.search(lowered, pos, endpos)
+        else:
+            match = pattern.search(code, pos, endpos)
+        return match.span() if match else None
+    
+    def outcome(self, line_number: Optional[int]) -> Tuple[bool, Optional[int]]:
+        """
+        Evaluate the rule given the line of the pattern's first match (None if no match)
         
         Returns:
-            (matches, line_number) tuple
+            (passed, line_number) tuple
         """
         if not self.enabled:
             return (True, None)  # Disabled rules always pass
         
-        pattern = re.compile(self.pattern, re.MULTILINE | re.IGNORECASE)
-        
         if self.pattern_type == "must_have":
-            match = pattern.search(code)
-            if match:
-                line_num = code[:match.start()].count('\n') + 1
-                return (True, line_num)
-            return (False, None)
+            return (True, line_number) if line_number is not None else (False, None)
         
         elif self.pattern_type == "must_not_have":
-            match = pattern.search(code)
-            if match:
-                line_num = code[:match.start()].count('\n') + 1
-                return (False, line_num)
-            return (True, None)
+            return (False, line_number) if line_number is not None else (True, None)
         
         return (True, None)
+    
+    def matches(self, code: str) -> Tuple[bool, Optional[int]]:
+        """
+        Check if pattern matches code
+        
+        Returns:
+            (matches, line_number) tuple
+        """
+        if not self.enabled:
+            return (True, None)  # Disabled rules always pass
+        
+        offset = self.search(code, lowercase_for_matching(code))
+        line_num = code.count("\n", 0, offset) + 1 if offset is not None else None
+        return self.outcome(line_num)
 
 
 class ValidationRuleEngine:
@@ -125,15 +510,23 @@ class ValidationRuleEngine:
     - Frontend validation: Streamlit, form validation, error display
     - Test validation: pytest, lifecycle testing, cleanup
     - AST-based structural validation
+    - Learned calibration of the uncertain band (see validation_calibration)
     """
     
-    def __init__(self):
+    def __init__(self, calibration: Optional["ValidationCalibration"] = None):
         self.rules: Dict[str, List[ValidationRule]] = {
             "backend": [],
             "database": [],
             "frontend": [],
             "test": []
         }
+        # Optional learned models deciding artifacts the fixed thresholds are uncertain about
+        self.calibration = calibration
+        # Most recent scan per SWEA type (base for incremental validation of patched code)
+        self._recent_scans: Dict[str, RuleScan] = {}
+        # validation_time_ms aggregated per validator ("rules:<swea_type>", "structure")
+        self._timing: Dict[str, ValidationTimingStats] = {}
+        self._timing_lock = threading.Lock()
         self._initialize_rules()
     
     def _initialize_rules(self):
@@ -364,13 +757,25 @@ class ValidationRuleEngine:
             ),
         ])
     
-    def validate_code(self, code: str, swea_type: str) -> ValidationResult:
+    def validate_code(
+        self,
+        code: Union[str, CodeAnalysis],
+        swea_type: str,
+        previous: Optional[ValidationResult] = None,
+    ) -> ValidationResult:
         """
         Validate code using rule-based patterns
         
+        Validation is incremental when the code is a local edit (e.g. a CodePatcher
+        patch) of a previously validated artifact: ``previous``, or else the most
+        recent artifact validated for ``swea_type``. Rules whose patterns cannot
+        span lines are re-evaluated only on the edited lines; their outcomes
+        elsewhere are reused. Results are identical to a full scan.
+        
         Args:
-            code: Source code to validate
+            code: Source code to validate (or its shared CodeAnalysis)
             swea_type: Type of SWEA (backend, database, frontend, test)
+            previous: Result for the artifact the code was derived from (optional)
         
         Returns:
             ValidationResult with outcome and detailed rule matches
@@ -395,10 +800,36 @@ class ValidationRuleEngine:
             result.feedback_message = f"No validation rules defined for {swea_type}"
             return result
         
-        # Run each rule
+        # Scan all rules in one combined pass. The lowercased source (for the case-folded
+        # patterns) and the line index come from the shared analysis
+        analysis = CodeAnalysis.of(code)
+        rule_keys = tuple(rule.scan_key for rule in rules)
+        base = previous.scan if previous is not None else None
+        base = base or self._recent_scans.get(swea_type)
+        spans = None
+        if base is not None and base.swea_type == swea_type and base.rule_keys == rule_keys:
+            spans, result.reused_rule_count = self._rescan_incrementally(base, analysis, rules)
+        if spans is None:
+            enabled = [index for index, rule in enumerate(rules) if rule.enabled]
+            spans = [None] * len(rules)
+            for index, span in zip(
+                enabled,
+                _first_match_spans(
+                    [rules[index] for index in enabled],
+                    analysis.code,
+                    analysis.lowered_for_matching,
+                ),
+            ):
+                spans[index] = span
+        result.scan = RuleScan(swea_type, analysis, rule_keys, spans)
+        self._recent_scans[swea_type] = result.scan
+        
         total_confidence = 0.0
-        for rule in rules:
-            passed, line_num = rule.matches(code)
+        for rule, span in zip(rules, spans):
+            offset = span[0] if span else None
+            passed, line_num = rule.outcome(
+                analysis.line_index.line_number(offset) if offset is not None else None
+            )
             
             match = RuleMatch(
                 rule_id=rule.rule_id,
@@ -422,17 +853,31 @@ class ValidationRuleEngine:
         # Calculate overall confidence score
         result.confidence_score = total_confidence / len(rules) if rules else 0.0
         
-        # Determine outcome based on confidence score
+        # Determine outcome based on confidence score (calibrated model for the uncertain band)
         if result.confidence_score >= 0.7:
+            outcome = "confident_approval"
+        elif result.confidence_score <= -0.3:
+            outcome = "confident_rejection"
+        else:
+            outcome = self._calibrated_outcome(swea_type, rules, result)
+        
+        calibration_note = (
+            f" (calibrated approval probability: {result.calibrated_probability:.2f})"
+            if result.calibrated_probability is not None
+            else ""
+        )
+        if outcome == "confident_approval":
             result.overall_outcome = "confident_approval"
             result.requires_llm = False
-            result.feedback_message = f"Code passes {result.passed_count}/{len(rules)} validation rules"
-        elif result.confidence_score <= -0.3:
+            result.feedback_message = (
+                f"Code passes {result.passed_count}/{len(rules)} validation rules{calibration_note}"
+            )
+        elif outcome == "confident_rejection":
             result.overall_outcome = "confident_rejection"
             result.requires_llm = False
             # Build detailed feedback
             failed_rules = [m for m in result.rule_results if not m.passed]
-            feedback_lines = [f"Code validation failed ({len(failed_rules)} issues):"]
+            feedback_lines = [f"Code validation failed ({len(failed_rules)} issues){calibration_note}:"]
             for match in failed_rules:
                 location = f" (line {match.line_number})" if match.line_number else ""
                 feedback_lines.append(f"  - [{match.rule_id}] {match.message}{location}")
@@ -445,10 +890,139 @@ class ValidationRuleEngine:
             result.feedback_message = f"Validation uncertain (score: {result.confidence_score:.2f}), requires LLM review"
         
         result.validation_time_ms = (time.time() - start_time) * 1000
+        self._record_timing(f"rules:{swea_type}", result, analysis)
         
         return result
     
-    def validate_code_structure(self, code: str) -> ValidationResult:
+    def validate_many(
+        self,
+        items: Sequence[Tuple[Union[str, CodeAnalysis], str]],
+        max_workers: Optional[int] = None,
+        chunk_chars: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """
+        Validate many (code, swea_type) artifacts, on a process pool when worthwhile
+        
+        Items are sent to worker processes in chunks of about ``chunk_chars`` source
+        characters; batches too small to amortize the IPC are validated inline (see
+        parallel_validation). Results from workers carry no ``scan``, so they do not
+        serve as a base for incremental validation.
+        
+        Args:
+            items: (code, swea_type) pairs
+            max_workers: Worker processes (default: VALIDATION_POOL_WORKERS)
+            chunk_chars: Source characters per chunk (default: VALIDATION_POOL_CHUNK_CHARS)
+        
+        Returns:
+            One ValidationResult per item, in input order
+        """
+        from .parallel_validation import rule_engine_context, run_many, validate_rule_chunk
+        
+        items = list(items)
+        return run_many(
+            validate_rule_chunk,
+            rule_engine_context(self) if items else None,
+            items,
+            max_workers=max_workers,
+            chunk_chars=chunk_chars,
+            inline=lambda batch: [self.validate_code(code, swea_type) for code, swea_type in batch],
+        )
+    
+    def _calibrated_outcome(
+        self, swea_type: str, rules: List[ValidationRule], result: ValidationResult
+    ) -> str:
+        """
+        Decide an uncertain result with the calibration model for this SWEA type
+        
+        Returns "uncertain" when no model was fitted on the current rule set, or when
+        the calibrated probability lies between the model's thresholds. Calibrated
+        rejections require at least one failed rule so the feedback stays actionable.
+        Models are trained on LLM verdicts: callers whose next step is an exact check
+        (TechLeadSWEA's Standards validators) treat calibrated decisions, marked by
+        ``calibrated_probability``, as uncertain.
+        """
+        if self.calibration is None:
+            return "uncertain"
+        model = self.calibration.model_for(swea_type, [rule.rule_id for rule in rules])
+        if model is None:
+            return "uncertain"
+        probability = model.predict(result.rule_results)
+        if probability is None:
+            return "uncertain"
+        result.calibrated_probability = probability
+        if probability >= model.approve_threshold:
+            return "confident_approval"
+        if probability <= model.reject_threshold and result.failed_count > 0:
+            return "confident_rejection"
+        return "uncertain"
+    
+    def _rescan_incrementally(
+        self, base: RuleScan, analysis: CodeAnalysis, rules: List[ValidationRule]
+    ) -> Tuple[Optional[List[Optional[Tuple[int, int]]]], int]:
+        """
+        First-match spans for ``analysis`` derived from the scan of an earlier version
+        
+        The edit is the span between the common prefix and suffix of both versions,
+        widened to whole lines. Only line-local rules (patterns that cannot span
+        lines) are derived from the earlier scan:
+        - first match ended before the edit: still the first match (the matched
+          text and the character after it are unchanged), so its outcome is reused
+        - else a match in the edited lines, found by a windowed search
+        - else the old match after the edit, shifted by the length change (or, if
+          the old match was inside the edit, a search of the lines after it)
+        Patterns that can span lines are rescanned in full: an edit can complete a
+        new, earlier match that starts before the edited lines.
+        
+        Returns:
+            (spans, reused rule count), or (None, 0) if the edit is too large
+        """
+        old, new = base.analysis.code, analysis.code
+        if old == new:
+            return list(base.spans), len(rules)
+        
+        prefix = _common_prefix_length(old, new)
+        suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+        start = old.rfind("\n", 0, prefix) + 1
+        old_end = old.find("\n", len(old) - suffix)
+        old_end = len(old) if old_end == -1 else old_end
+        new_end = new.find("\n", len(new) - suffix)
+        new_end = len(new) if new_end == -1 else new_end
+        if new_end - start > INCREMENTAL_MAX_CHANGED_FRACTION * max(len(new), 1):
+            return None, 0
+        
+        lowered = analysis.lowered_for_matching
+        delta = len(new) - len(old)
+        spans: List[Optional[Tuple[int, int]]] = [None] * len(rules)
+        rescanned, windowed = [], []
+        reused = 0
+        for index, (rule, old_span) in enumerate(zip(rules, base.spans)):
+            if not rule.enabled:
+                reused += 1
+            elif not rule.line_local:
+                rescanned.append(index)
+            elif old_span is not None and old_span[1] < start:
+                spans[index] = old_span
+                reused += 1
+            else:
+                windowed.append(index)
+                reused += 1
+        
+        # Rules that need a search are scanned together (see _first_match_spans)
+        rescans = _first_match_spans([rules[i] for i in rescanned], new, lowered)
+        for index, span in zip(rescanned, rescans):
+            spans[index] = span
+        window = _first_match_spans([rules[i] for i in windowed], new, lowered, start, new_end)
+        for index, span in zip(windowed, window):
+            old_span = base.spans[index]
+            if span is None and old_span is not None:
+                if old_span[0] >= old_end:
+                    span = (old_span[0] + delta, old_span[1] + delta)
+                else:
+                    span = rules[index].search_span(new, lowered, new_end)
+            spans[index] = span
+        return spans, reused
+    
+    def validate_code_structure(self, code: Union[str, CodeAnalysis]) -> ValidationResult:
         """
         Validate code structure using AST analysis
         
@@ -457,6 +1031,9 @@ class ValidationRuleEngine:
         - Docstrings on classes and functions
         - PEP 8 naming conventions (snake_case functions, PascalCase classes)
         
+        Args:
+            code: Source code to validate (or its shared CodeAnalysis, reusing its parse tree)
+        
         Returns:
             ValidationResult with structural validation results
         """
@@ -469,18 +1046,19 @@ class ValidationRuleEngine:
             rule_results=[]
         )
         
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
+        analysis = CodeAnalysis.of(code)
+        if analysis.syntax_error is not None:
+            e = analysis.syntax_error
             result.overall_outcome = "confident_rejection"
             result.confidence_score = -1.0
             result.failed_count = 1
             result.feedback_message = f"Syntax error at line {e.lineno}: {e.msg}"
             result.validation_time_ms = (time.time() - start_time) * 1000
+            self._record_timing("structure", result, analysis)
             return result
         
         # Check functions and classes
-        for node in ast.walk(tree):
+        for node in analysis.definitions:
             if isinstance(node, ast.FunctionDef):
                 # Check function naming (snake_case)
                 if not self._is_snake_case(node.name) and not node.name.startswith('test_'):
@@ -584,9 +1162,31 @@ class ValidationRuleEngine:
             result.feedback_message = "Code structure validation uncertain, requires LLM review"
         
         result.validation_time_ms = (time.time() - start_time) * 1000
+        self._record_timing("structure", result, analysis)
         
         return result
     
+    def _record_timing(
+        self, validator: str, result: ValidationResult, analysis: CodeAnalysis
+    ) -> None:
+        with self._timing_lock:
+            stats = self._timing.setdefault(validator, ValidationTimingStats())
+            stats.record(result.validation_time_ms, len(analysis.code))
+    
+    def timing_stats(self) -> Dict[str, ValidationTimingStats]:
+        """Aggregated validation times per validator ("rules:<swea_type>", "structure")"""
+        with self._timing_lock:
+            return {name: replace(stats) for name, stats in self._timing.items()}
+    
+    def reset_timing_stats(self) -> None:
+        """Clear the aggregated validation times"""
+        with self._timing_lock:
+            self._timing.clear()
+    
+    def reset_incremental_state(self) -> None:
+        """Forget the recent scans, so the next validate_code() call scans in full"""
+        self._recent_scans.clear()
+    
     def _is_snake_case(self, name: str) -> bool:
         """Check if name follows snake_case convention"""
         return re.match(r'^[a-z_][a-z0-9_]*$', name) is not None
@@ -599,6 +1199,7 @@ class ValidationRuleEngine:
         """Add a new validation rule"""
         swea_type = rule.swea_type.value
         if swea_type in self.rules:
+            rule.compile()
             self.rules[swea_type].append(rule)
     
     def update_rule(self, rule_id: str, **kwargs):
@@ -609,6 +1210,7 @@ class ValidationRuleEngine:
                     for key, value in kwargs.items():
                         if hasattr(rule, key):
                             setattr(rule, key, value)
+                    rule.compile()  # Recompile now if the pattern changed
                     return True
         return False
     
@@ -620,6 +1222,24 @@ class ValidationRuleEngine:
         """Enable a previously disabled rule"""
         return self.update_rule(rule_id, enabled=True)
     
+    def catalog_version(self) -> str:
+        """
+        Fingerprint of the rule catalog (patterns, confidences, messages, enabled flags)
+        
+        Changes whenever a rule is added, updated, enabled or disabled, so cached
+        verdicts produced by an older catalog are never reused.
+        """
+        digest = hashlib.sha256()
+        for swea_type in sorted(self.rules):
+            for rule in self.rules[swea_type]:
+                digest.update(
+                    repr((
+                        swea_type, rule.rule_id, rule.rule_name, rule.pattern, rule.pattern_type,
+                        rule.confidence, rule.message, rule.suggestion, rule.enabled,
+                    )).encode("utf-8")
+                )
+        return digest.hexdigest()[:16]
+    
     def list_rules(self, swea_type: Optional[str] = None) -> List[ValidationRule]:
         """List all rules, optionally filtered by SWEA type"""
         if swea_type:
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from baes.agents.base_agent import BaseAgent
 from baes.llm.openai_client import OpenAIClient
 from baes.core.managed_system_manager import ManagedSystemManager
@@ -11,13 +11,37 @@ from baes.utils.template_registry import (
     SWEAType,
 )
 from baes.utils.presentation_logger import get_presentation_logger
+from baes.standards.code_analysis import CodeAnalysis
 from baes.standards.compressed_standards import get_compressed_standard
+from baes.utils.prompt_fragments import PromptFragment, get_prompt_fragments
 from config import Config
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 presentation_logger = get_presentation_logger()
 
+# Static prompt sections (registered once in the prompt fragment registry)
+MODEL_OPTIONAL_FIELDS_INSTRUCTION = (
+    "\nIMPORTANT: For this proof of concept, EVERY attribute listed below MUST be declared as Optional in the Pydantic model and default to None.\n"
+)
+API_OPTIONAL_FIELDS_INSTRUCTION = (
+    "\nIMPORTANT: For this proof of concept, EVERY attribute listed below MUST be declared as Optional in the Pydantic models (Create, Update, Response) and default to None.\n"
+)
+MODEL_REQUIREMENTS = """
+
+REQUIREMENTS:
+- Use proper type hints and validation
+- Declare every field as Optional[<type>] = None
+- No fallback or placeholder logic
+- Use only the specified attributes
+- No extra fields
+- Must include 'from pydantic import BaseModel' import
+"""
+API_FINAL_WARNING = """
+
+🚨 FINAL WARNING: The user explicitly requested ONLY the attributes listed above. Adding ANY extra fields beyond what's specified will violate user requirements. This is a user-constrained creation - respect their exact specification.
+"""
+
 
 class BackendSWEA(BaseAgent):
     """
@@ -57,13 +81,28 @@ class BackendSWEA(BaseAgent):
             Tuple of (standards_text, standards_type) where standards_type is
             "compressed" or "full"
         """
+        fragment, standards_type = self._get_standards_fragment()
+        return fragment.text, standards_type
+
+    def _get_standards_fragment(self) -> tuple[PromptFragment, str]:
+        """
+        Get coding standards as a prompt fragment (loaded and token-counted once).
+        
+        Returns:
+            Tuple of (fragment, standards_type) where standards_type is
+            "compressed" or "full"
+        """
+        fragments = get_prompt_fragments()
         if Config.ENABLE_COMPRESSED_STANDARDS:
             compressed = get_compressed_standard("backend")
             if compressed:
-                return compressed.content, "compressed"
+                return (
+                    fragments.static(f"standards.backend.compressed.{compressed.version}", compressed.content),
+                    "compressed",
+                )
         
         # Fallback to full standards
-        return self._get_full_standards(), "full"
+        return fragments.static("standards.backend.full", self._get_full_standards), "full"
     
     def _get_full_standards(self) -> str:
         """Get full backend standards text for fallback."""
@@ -71,7 +110,7 @@ class BackendSWEA(BaseAgent):
 CRITICAL REQUIREMENTS (ALL MUST BE IMPLEMENTED):
 - Use APIRouter with correct prefix: prefix="/api/{entity_lower}s"
 - Implement full CRUD endpoints (POST, GET, PUT, DELETE)
-- Use ONLY the attributes listed above - DO NOT ADD EXTRA FIELDS
+- Use ONLY the attributes listed below - DO NOT ADD EXTRA FIELDS
 - Router endpoints should be: /, /{id}, etc. (not full paths)
 - No fallback or placeholder logic
 - ALL Pydantic models MUST declare every attribute as Optional[<type>] = None (including Response model)
@@ -83,8 +122,8 @@ CRITICAL ROUTER CONFIGURATION:
 - This creates routes like /api/{entity_lower}s/, /api/{entity_lower}s/{id}, etc.
 
 CRITICAL PYDANTIC MODELS (ONLY USE SPECIFIED ATTRIBUTES):
-- {entity}Create: Only the attributes listed above (NEVER include id field, no extra fields)
-- {entity}Update: Only the attributes listed above as Optional fields (NEVER include id field, no extra fields)  
+- {entity}Create: Only the attributes listed below (NEVER include id field, no extra fields)
+- {entity}Update: Only the attributes listed below as Optional fields (NEVER include id field, no extra fields)  
 - {entity}Response: All attributes, but new attributes (added during evolution) must be Optional and default to None
 - IMPORTANT: The 'id' field is auto-generated by the database and should NEVER be included in Create or Update models
 - DO NOT add any fields not explicitly specified in the attributes list
@@ -183,7 +222,7 @@ def create_{entity_lower}(data: {entity}Create) -> Dict[str, Any]:
     # Implementation here
 ```
 
-CRITICAL REMINDER: Use ONLY the attributes specified above. Do not add age, created_at, updated_at, or any other fields unless explicitly listed in the attributes.
+CRITICAL REMINDER: Use ONLY the attributes specified below. Do not add age, created_at, updated_at, or any other fields unless explicitly listed in the attributes.
 """
 
     def handle_task(self, task: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -229,76 +268,19 @@ CRITICAL REMINDER: Use ONLY the attributes specified above. Do not add age, crea
         do_not_add_extra = payload.get("do_not_add_extra_fields", False)
         attribute_constraints = payload.get("attribute_constraints", {})
 
-        # Template-based generation (Feature 001-performance-optimization)
-        if Config.ENABLE_TEMPLATES and not is_evolution and not techlead_feedback:
-            # Try template generation for standard CRUD
-            entity_type_classification = payload.get("entity_classification", {})
-            entity_type_str = entity_type_classification.get("entity_type", "STANDARD")
-            entity_type = EntityType.STANDARD if entity_type_str == "STANDARD" else EntityType.CUSTOM
-
-            # Convert attributes to template format
-            attr_dict = {}
-            for attr in attributes:
-                if isinstance(attr, dict):
-                    attr_dict[attr["name"]] = attr.get("type", "str")
-                elif isinstance(attr, str):
-                    parts = attr.split(":")
-                    attr_dict[parts[0]] = parts[1] if len(parts) > 1 else "str"
-
-            template_input = TemplateInput(
-                entity_name=entity,
-                entity_type=entity_type,
-                swea_type=SWEAType.BACKEND,
-                attributes=attr_dict,
+        # Template-based generation (Feature 001-performance-optimization). Schema
+        # evolutions re-render the CRUD router from the evolved attribute set.
+        if Config.ENABLE_TEMPLATES and not techlead_feedback:
+            template_result = self._generate_api_from_template(
+                entity,
+                attributes,
+                payload.get("entity_classification", {}),
+                is_evolution,
+                payload.get("compiled_relationships", []),
             )
+            if template_result is not None:
+                return template_result
 
-            template_output = self.template_registry.render_template(template_input)
-
-            if template_output.template_used:
-                # Template generation successful
-                code = template_output.generated_code
-                file_path = self.managed_system_manager.write_entity_artifact(entity, "routes", code)
-                
-                # Log optimization metrics
-                presentation_logger.template_selected(
-                    "backend",
-                    template_output.template_id,
-                    template_output.token_estimate
-                )
-                
-                logger.info(
-                    "BackendSWEA used template %s for %s (saved ~%d tokens, %.1fms)",
-                    template_output.template_id,
-                    entity,
-                    template_output.token_estimate,
-                    template_output.rendering_time_ms
-                )
-                
-                return self.create_success_response(
-                    "generate_api",
-                    {
-                        "file_path": file_path,
-                        "code": code,
-                        "entity": entity,
-                        "attributes": attributes,
-                        "template_used": True,
-                        "template_id": template_output.template_id,
-                        "token_estimate": template_output.token_estimate,
-                    },
-                )
-            else:
-                # Template fallback to LLM
-                presentation_logger.template_fallback(
-                    "backend",
-                    template_output.template_id or "backend_routes_crud",
-                    template_output.fallback_reason
-                )
-                logger.info(
-                    "BackendSWEA template fallback for %s: %s",
-                    entity,
-                    template_output.fallback_reason
-                )
-        
         # Build prompt with evolution-aware instructions and strict attribute constraints
         prompt = self._build_api_prompt(
             entity,
@@ -324,6 +306,122 @@ CRITICAL REMINDER: Use ONLY the attributes specified above. Do not add age, crea
             {"file_path": file_path, "code": code, "entity": entity, "attributes": attributes, "template_used": False},
         )
 
+    def _generate_api_from_template(
+        self,
+        entity: str,
+        attributes: List[Any],
+        entity_classification: Dict[str, Any],
+        is_evolution: bool = False,
+        compiled_relationships: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Render the managed-system CRUD router for STANDARD entities.
+
+        Args:
+            entity: Entity name
+            attributes: Full (for evolutions: evolved) attribute list
+            entity_classification: BAE classification ({"entity_type": "standard" | "custom", ...})
+            is_evolution: Whether this re-renders an existing entity after a schema change
+            compiled_relationships: RelationshipCompiler output (CompiledRelationship.to_dict())
+                of the entity; adds foreign key handling and join endpoints
+
+        Returns:
+            Success response, or None when the entity needs LLM generation
+        """
+        entity_type_str = str(entity_classification.get("entity_type", "STANDARD")).upper()
+        entity_type = EntityType.CUSTOM if entity_type_str == "CUSTOM" else EntityType.STANDARD
+
+        # Convert attributes to template format
+        attr_dict = {}
+        for attr in attributes:
+            if isinstance(attr, dict):
+                attr_dict[attr["name"]] = attr.get("type", "str")
+            elif isinstance(attr, str):
+                parts = attr.split(":")
+                attr_dict[parts[0]] = parts[1] if len(parts) > 1 else "str"
+
+        # Relationships: join endpoints, and foreign key columns composed as custom logic
+        relationships = {}
+        custom_logic = dict(entity_classification.get("custom_logic") or {})
+        for compiled in compiled_relationships or []:
+            spec = compiled["spec"]
+            relationships[compiled["rel_name"]] = {
+                "type": spec["secondary"],
+                "cardinality": spec["cardinality"],
+            }
+            if compiled["foreign_key"] in attr_dict:
+                custom_logic["foreign_keys"] = {
+                    **custom_logic.get("foreign_keys", {}),
+                    compiled["foreign_key"]: spec["secondary"],
+                }
+
+        template_input = TemplateInput(
+            entity_name=entity,
+            entity_type=entity_type,
+            swea_type=SWEAType.BACKEND,
+            attributes=attr_dict,
+            relationships=relationships,
+            custom_logic=custom_logic,
+            template_id="backend_routes_sqlite",
+        )
+
+        template_output = self.template_registry.render_template(template_input)
+
+        fallback_reason = template_output.fallback_reason
+        if template_output.template_used:
+            # Attribute names such as Python keywords render an invalid router
+            syntax_error = CodeAnalysis.of(template_output.generated_code).syntax_error
+            if syntax_error is not None:
+                fallback_reason = f"rendered router does not parse: {syntax_error}"
+
+        if not template_output.template_used or fallback_reason:
+            # Template fallback to LLM
+            presentation_logger.template_fallback(
+                "backend",
+                template_output.template_id or "backend_routes_sqlite",
+                fallback_reason
+            )
+            logger.info(
+                "BackendSWEA template fallback for %s: %s",
+                entity,
+                fallback_reason
+            )
+            return None
+
+        # Template generation successful
+        code = template_output.generated_code
+        file_path = self.managed_system_manager.write_entity_artifact(entity, "routes", code)
+
+        # Log optimization metrics
+        presentation_logger.template_selected(
+            "backend",
+            template_output.template_id,
+            template_output.token_estimate
+        )
+
+        logger.info(
+            "BackendSWEA used template %s for %s%s (saved ~%d tokens, %.1fms)",
+            template_output.template_id,
+            entity,
+            " evolution" if is_evolution else "",
+            template_output.token_estimate,
+            template_output.rendering_time_ms
+        )
+
+        return self.create_success_response(
+            "generate_api",
+            {
+                "file_path": file_path,
+                "code": code,
+                "entity": entity,
+                "attributes": attributes,
+                "template_used": True,
+                "template_id": template_output.template_id,
+                "token_estimate": template_output.token_estimate,
+                "is_evolution": is_evolution,
+            },
+        )
+
     def _build_model_prompt(self, entity: str, attributes: List[str], context: str, 
                            techlead_feedback: List[str] = None, previous_errors: List[str] = None, 
                            retry_count: int = 0, is_evolution: bool = False, new_attributes: List[str] = None) -> str:
@@ -344,26 +442,23 @@ CRITICAL REMINDER: Use ONLY the attributes specified above. Do not add age, crea
         if retry_count > 0:
             retry_info = f"\nThis is retry attempt #{retry_count}. Please ensure you address the feedback above."
 
-        # All attributes optional instruction for PoC
-        optional_fields_instruction = (
-            "\nIMPORTANT: For this proof of concept, EVERY attribute listed below MUST be declared as Optional in the Pydantic model and default to None.\n"
-        )
-        
-        return f"""
+        # Static sections first (identical across entities), request-specific text last
+        fragments = get_prompt_fragments()
+        return fragments.assemble(
+            [
+                # All attributes optional instruction for PoC
+                fragments.static("backend.model_optional_fields", MODEL_OPTIONAL_FIELDS_INSTRUCTION),
+                fragments.static("backend.model_requirements", MODEL_REQUIREMENTS),
+                f"""- Must have 'class {entity}(BaseModel):' definition
+- Must include proper field definitions with type hints
+
 Generate a Pydantic model for the {entity} entity with the following attributes (ALL OPTIONAL):
 {attributes}
-Context: {context}{feedback_section}{retry_info}{optional_fields_instruction}
-
-REQUIREMENTS:
-- Use proper type hints and validation
-- Declare every field as Optional[<type>] = None
-- No fallback or placeholder logic
-- Use only the specified attributes
-- No extra fields
-- Must include 'from pydantic import BaseModel' import
-- Must have 'class {entity}(BaseModel):' definition
-- Must include proper field definitions with type hints
-"""
+Context: {context}{feedback_section}{retry_info}
+""",
+            ],
+            token_budget=fragments.token_budget,
+        ).text
 
     def _build_api_prompt(self, entity: str, attributes: List[str], context: str,
                           techlead_feedback: List[str] = None, previous_errors: List[str] = None,
@@ -389,11 +484,6 @@ REQUIREMENTS:
         if retry_count > 0:
             retry_info = f"\nThis is retry attempt #{retry_count}. Please ensure you address the feedback above."
 
-        # All attributes optional instruction for PoC
-        optional_fields_instruction = (
-            "\nIMPORTANT: For this proof of concept, EVERY attribute listed below MUST be declared as Optional in the Pydantic models (Create, Update, Response) and default to None.\n"
-        )
-        
         # Format attributes list for clearer display
         attributes_display = "\n".join([f"- {attr}" for attr in attributes])
         entity_lower = entity.lower()
@@ -413,17 +503,27 @@ REQUIREMENTS:
 """
         
         # Get standards (compressed or full) - Feature 001-performance-optimization US4
-        standards_text, standards_type = self._get_standards_text()
+        standards, standards_type = self._get_standards_fragment()
         
-        prompt = f"""
+        # Static sections come from the fragment registry (token counts precomputed) and lead the
+        # prompt, so it shares its prefix with every other entity's; over the token budget the final
+        # warning, which repeats the constraints, is dropped
+        fragments = get_prompt_fragments()
+        prompt = fragments.assemble(
+            [
+                standards,
+                "\n",
+                # All attributes optional instruction for PoC
+                fragments.static("backend.api_optional_fields", API_OPTIONAL_FIELDS_INSTRUCTION),
+                f"""
 Generate FastAPI router code for the {entity} entity with EXACTLY these attributes and NO OTHERS:
 {attributes_display}
-Context: {context}{constraint_warning}{feedback_section}{retry_info}{optional_fields_instruction}
-
-{standards_text}
-
-🚨 FINAL WARNING: The user explicitly requested ONLY the attributes listed above. Adding ANY extra fields beyond what's specified will violate user requirements. This is a user-constrained creation - respect their exact specification.
-"""
+Context: {context}{constraint_warning}{feedback_section}{retry_info}""",
+                fragments.static("backend.api_final_warning", API_FINAL_WARNING),
+            ],
+            token_budget=fragments.token_budget,
+            optional=["backend.api_final_warning"],
+        ).text
         
         # Log standards type for metrics
         presentation_logger.info(f"BackendSWEA using {standards_type} standards for {entity}")
@@ -6,7 +6,7 @@ import sqlite3
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from baes.core.managed_system_manager import ManagedSystemManager
 from baes.domain_entities.base_bae import BaseAgent, is_debug_mode
@@ -14,16 +14,34 @@ from baes.llm.openai_client import OpenAIClient
 from baes.utils.template_registry import (
     TemplateRegistry,
     TemplateInput,
+    TemplateOutput,
     EntityType,
     SWEAType,
 )
 from baes.utils.presentation_logger import get_presentation_logger
+from baes.utils.prompt_fragments import get_prompt_fragments
+from baes.utils.relationship_compiler import RelationshipSpec, get_relationship_compiler
 from config import Config
 
 logger = logging.getLogger(__name__)
 presentation_logger = get_presentation_logger()
 presentation_logger = get_presentation_logger()
 
+# Static prompt sections (registered once in the prompt fragment registry)
+DO_NOT_IGNORE_WARNING = """
+🚨 CRITICAL WARNING: If you ignore ANY of the following instructions, your output will be REJECTED \
+    and you will be required to regenerate it. You MUST address EVERY requirement listed below. \
+    Failure to comply will result in immediate rejection.
+
+⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
+⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
+⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
+⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
+⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
+
+COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
+"""
+
 
 # Stage 2 Improvement #8: Feedback Loop Analytics for DatabaseSWEA
 class FeedbackLoopAnalytics:
@@ -197,19 +215,7 @@ class DatabaseSWEA(BaseAgent):
         Generate standard 'Do Not Ignore' warning text for all LLM prompts.
         Stage 1 Improvement #10: Explicit warnings to prevent LLM from ignoring instructions.
         """
-        return """
-🚨 CRITICAL WARNING: If you ignore ANY of the following instructions, your output will be REJECTED \
-    and you will be required to regenerate it. You MUST address EVERY requirement listed below. \
-    Failure to comply will result in immediate rejection.
-
-⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
-⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
-⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
-⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
-⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
-
-COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
-"""
+        return get_prompt_fragments().static("database.do_not_ignore", DO_NOT_IGNORE_WARNING).text
 
     # Supported task identifiers
     _SUPPORTED_TASKS = {
@@ -474,7 +480,12 @@ Please provide the JSON response with database improvements."""
         return validated
 
     def _apply_database_improvements(
-        self, interpretation: Dict[str, Any], entity: str, db_file: str
+        self,
+        interpretation: Dict[str, Any],
+        entity: str,
+        db_file: str,
+        entity_type: EntityType = EntityType.STANDARD,
+        custom_logic: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Apply the interpreted improvements to the database setup, preserving data if table exists."""
         try:
@@ -495,97 +506,28 @@ Please provide the JSON response with database improvements."""
                 # Use migration logic to preserve data
                 return self._apply_schema_migration(interpretation, entity, db_file)
             else:
-                # Table does not exist, safe to create
-                
-                # Try template-based generation first
-                sql_code = None
-                template_used = False
-                template_id = None
-                if self.template_registry:
-                    try:
-                        # Prepare attributes as dictionary for template
-                        attr_dict = {}
-                        for attr in attributes:
-                            if isinstance(attr, dict):
-                                attr_dict[attr.get("name", "unknown")] = attr.get("type", "str")
-                            elif isinstance(attr, str):
-                                if ":" in attr:
-                                    name, typ = [p.strip() for p in attr.split(":", 1)]
-                                else:
-                                    name, typ = attr.strip(), "str"
-                                attr_dict[name] = typ
-                        
-                        from baes.utils.template_registry import EntityType as TemplateEntityType
-                        
-                        # Create template input
-                        template_input = TemplateInput(
-                            entity_name=entity,
-                            entity_type=TemplateEntityType.STANDARD,
-                            swea_type=SWEAType.DATABASE,
-                            attributes=attr_dict,
-                        )
-                        
-                        # Try to render template
-                        template_output = self.template_registry.render_template(template_input)
-                        
-                        if template_output.template_used:
-                            sql_code = template_output.generated_code
-                            template_used = True
-                            template_id = template_output.template_id
-                            
-                            # Log optimization metrics
-                            presentation_logger.template_selected(
-                                "database",
-                                template_output.template_id,
-                                template_output.token_estimate
-                            )
-                            
-                            logger.info("DatabaseSWEA: Using template %s for %s", template_id, entity)
-                        else:
-                            # Template indicated fallback needed
-                            presentation_logger.template_fallback(
-                                "database",
-                                template_output.template_id or "database_schema_crud",
-                                template_output.fallback_reason or "Unknown reason"
-                            )
-                    except Exception as e:
-                        logger.warning("DatabaseSWEA: Template rendering failed: %s, falling back to direct SQL generation", str(e))
-                
-                # If template didn't work, use direct SQL generation
-                if not template_used:
-                    # Map Python types → SQLite
-                    type_map = {
-                        "str": "TEXT",
-                        "int": "INTEGER",
-                        "float": "REAL",
-                        "date": "TEXT",
-                        "bool": "INTEGER",
-                    }
-                    columns_sql: List[str] = ["id INTEGER PRIMARY KEY AUTOINCREMENT"]
-                    for attr in attributes:
-                        if isinstance(attr, dict):
-                            name = attr.get("name", "unknown_field")
-                            typ = attr.get("type", "str")
-                        elif isinstance(attr, str):
-                            if ":" in attr:
-                                name, typ = [p.strip() for p in attr.split(":", 1)]
-                            else:
-                                name, typ = attr.strip(), "str"
-                        else:
-                            name, typ = str(attr), "str"
-                        name = name.replace(" ", "_").lower()
-                        if name == 'id':
-                            continue
-                        sql_type = type_map.get(typ.replace("Optional[", "").replace("]", ""), "TEXT")
-                        columns_sql.append(f"{name} {sql_type}")
-                    columns_sql_str = ", ".join(columns_sql)
-                    sql_code = f"CREATE TABLE {table_name} ({columns_sql_str})"
-                
-                # Execute the SQL
+                # Table does not exist, safe to create. Template-first: STANDARD entities
+                # get the SQLite schema template, others the direct column mapping below
+                template_output = None
+                if Config.ENABLE_TEMPLATES:
+                    template_output = self._render_schema_template(
+                        entity, attributes, entity_type, custom_logic
+                    )
+                template_used = bool(template_output and template_output.template_used)
+                template_id = template_output.template_id if template_used else None
+
+                if template_used:
+                    sql_code = template_output.generated_code
+                else:
+                    sql_code, columns_sql = self._build_create_table_sql(table_name, attributes)
+
+                # Execute the SQL (the template is a multi-statement script)
                 with sqlite3.connect(db_file) as conn:
                     cursor = conn.cursor()
-                    # Execute main CREATE TABLE statement
-                    cursor.execute(sql_code if template_used else sql_code)
+                    if template_used:
+                        cursor.executescript(sql_code)
+                    else:
+                        cursor.execute(sql_code)
                     # Apply any additional constraints
                     for constraint in constraints:
                         try:
@@ -594,37 +536,10 @@ Please provide the JSON response with database improvements."""
                         except Exception as e:
                             logger.warning(f"Could not apply constraint '{constraint}': {e}")
                     conn.commit()
-                
-                # Build columns list for result
+
                 if template_used:
-                    # Extract columns from SQL code
-                    columns_sql = []
-                    # Simple extraction - in production might want more robust parsing
-                    if "(" in sql_code:
-                        cols_part = sql_code.split("(", 1)[1].rsplit(")", 1)[0]
-                        columns_sql = [col.strip() for col in cols_part.split(",")]
-                else:
-                    columns_sql = []
-                    if not template_used:
-                        columns_sql = ["id INTEGER PRIMARY KEY AUTOINCREMENT"]
-                        for attr in attributes:
-                            if isinstance(attr, dict):
-                                name = attr.get("name", "unknown_field")
-                                typ = attr.get("type", "str")
-                            elif isinstance(attr, str):
-                                if ":" in attr:
-                                    name, typ = [p.strip() for p in attr.split(":", 1)]
-                                else:
-                                    name, typ = attr.strip(), "str"
-                            else:
-                                name, typ = str(attr), "str"
-                            name = name.replace(" ", "_").lower()
-                            if name == 'id':
-                                continue
-                            type_map = {"str": "TEXT", "int": "INTEGER", "float": "REAL", "date": "TEXT", "bool": "INTEGER"}
-                            sql_type = type_map.get(typ.replace("Optional[", "").replace("]", ""), "TEXT")
-                            columns_sql.append(f"{name} {sql_type}")
-                
+                    columns_sql = self._get_current_table_schema(db_file, table_name)
+
                 result = {
                     "database_path": db_file,
                     "table": table_name,
@@ -633,6 +548,7 @@ Please provide the JSON response with database improvements."""
                     "managed_system": True,
                     "template_used": template_used,
                     "template_id": template_id,
+                    "code": sql_code,
                     "improvements_applied": {
                         "attributes": attributes,
                         "additional_requirements": additional_requirements,
@@ -649,6 +565,72 @@ Please provide the JSON response with database improvements."""
             logger.error(f"Attribute types: {[type(attr) for attr in interpretation.get('attributes', [])]}")
             raise DatabaseGenerationError(f"Failed to apply database improvements for {entity}: {e}") from e
 
+    def _render_schema_template(
+        self,
+        entity: str,
+        attributes: List[Dict[str, Any]],
+        entity_type: EntityType,
+        custom_logic: Optional[Dict[str, Any]] = None,
+    ) -> Optional[TemplateOutput]:
+        """
+        Render the SQLite schema template for an entity (Feature 001-performance-optimization).
+
+        Args:
+            entity: Entity name
+            attributes: Normalized attribute dictionaries
+            entity_type: STANDARD entities are rendered, CUSTOM ones fall back
+            custom_logic: Composable custom logic from the BAE classification
+
+        Returns:
+            TemplateOutput (check ``template_used``), or None if rendering raised
+        """
+        attr_dict = {
+            attr["name"].replace(" ", "_").lower(): attr.get("type", "str") for attr in attributes
+        }
+        try:
+            template_output = self.template_registry.render_template(
+                TemplateInput(
+                    entity_name=entity,
+                    entity_type=entity_type,
+                    swea_type=SWEAType.DATABASE,
+                    attributes=attr_dict,
+                    custom_logic=custom_logic or {},
+                    dialect="sqlite",
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "DatabaseSWEA: Template rendering failed: %s, falling back to direct SQL generation",
+                str(e),
+            )
+            return None
+
+        if template_output.template_used:
+            presentation_logger.template_selected(
+                "database", template_output.template_id, template_output.token_estimate
+            )
+            logger.info("DatabaseSWEA: Using template %s for %s", template_output.template_id, entity)
+        else:
+            presentation_logger.template_fallback(
+                "database",
+                template_output.template_id or "database_schema_sqlite",
+                template_output.fallback_reason or "Unknown reason",
+            )
+        return template_output
+
+    def _build_create_table_sql(
+        self, table_name: str, attributes: List[Dict[str, Any]]
+    ) -> Tuple[str, List[str]]:
+        """Plain CREATE TABLE statement and its column definitions (template fallback)"""
+        columns_sql: List[str] = ["id INTEGER PRIMARY KEY AUTOINCREMENT"]
+        for attr in attributes:
+            name = attr.get("name", "unknown_field").replace(" ", "_").lower()
+            if name == "id":
+                continue
+            typ = attr.get("type", "str").replace("Optional[", "").replace("]", "")
+            columns_sql.append(f"{name} {self._convert_type_hint_to_sql(typ)}")
+        return f"CREATE TABLE {table_name} ({', '.join(columns_sql)})", columns_sql
+
     # ------------------------------------------------------------------
     def _setup_database(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create SQLite database and a basic table for the entity with feedback-aware improvements. Only create if not exists."""
@@ -701,6 +683,12 @@ Please provide the JSON response with database improvements."""
             logger.info(f"Managed system database already exists at {db_file}, no changes made.")
             return self.create_success_response("setup_database", result)
         # Table does not exist, proceed to create
+        entity_classification = payload.get("entity_classification") or {}
+        entity_type = (
+            EntityType.CUSTOM
+            if str(entity_classification.get("entity_type", "STANDARD")).upper() == "CUSTOM"
+            else EntityType.STANDARD
+        )
         if use_only_specified or attribute_constraints.get("use_only_specified_attributes"):
             # STRICT MODE: Skip LLM feedback interpretation and use exact attributes
             logger.info(f"🔒 STRICT MODE: Bypassing LLM feedback interpretation, using exact user attributes")
@@ -711,12 +699,29 @@ Please provide the JSON response with database improvements."""
                 "modifications": [],
                 "explanation": f"Using exact user-specified attributes for {entity} (strict mode)"
             }
+        elif (
+            Config.ENABLE_TEMPLATES
+            and entity_type == EntityType.STANDARD
+            and not techlead_feedback
+            and not previous_errors
+        ):
+            # TEMPLATE MODE: The schema template needs no feedback interpretation
+            logger.info(f"📄 TEMPLATE MODE: Bypassing LLM feedback interpretation for {entity}")
+            interpretation = {
+                "attributes": attributes,
+                "additional_requirements": [],
+                "constraints": [],
+                "modifications": [],
+                "explanation": f"Rendering the SQLite schema template for {entity}"
+            }
         else:
             # NORMAL MODE: Use LLM feedback interpretation (may add extra attributes)
             interpretation = self._interpret_feedback_for_database_setup(
                 all_feedback, entity, attributes
             )
-        result = self._apply_database_improvements(interpretation, entity, db_file)
+        result = self._apply_database_improvements(
+            interpretation, entity, db_file, entity_type, entity_classification.get("custom_logic")
+        )
         self.managed_system_manager.ensure_managed_system_structure()
         logger.info(
             f"Managed system database created at {db_file} with feedback-aware improvements"
@@ -775,6 +780,35 @@ Please provide the JSON response with database improvements."""
             all_attributes = list(merged_attributes.values())
             logger.info(f"🔗 Merged attributes for migration: {all_attributes}")
             
+            entity_classification = payload.get("entity_classification") or {}
+            is_standard = (
+                str(entity_classification.get("entity_type", "STANDARD")).upper() != "CUSTOM"
+            )
+            if Config.ENABLE_TEMPLATES and is_standard and not feedback:
+                # TEMPLATE MODE: STANDARD evolutions are plain column additions
+                logger.info(f"📄 MIGRATION TEMPLATE MODE: Bypassing LLM interpretation for {entity}")
+                current_types = {
+                    col_def.split()[0]: col_def.split()[1] for col_def in current_schema_from_db
+                }
+                result = self._apply_additive_migration(
+                    entity, str(db_file), current_types, all_attributes
+                )
+                if result is None:
+                    # A column changed type: rebuild the table from the merged attributes
+                    result = self._apply_schema_migration(
+                        self._validate_interpretation_structure({
+                            "attributes": all_attributes,
+                            "explanation": f"Migration using merged attributes for {entity} (template mode)",
+                        }),
+                        entity,
+                        str(db_file),
+                    )
+                logger.info(f"✅ DatabaseSWEA: Schema migration completed successfully for {entity}")
+                return self.create_success_response("migrate_schema", {
+                    **result,
+                    "file_path": f"migration_{entity.lower()}_{int(time.time())}.sql"
+                })
+
             if use_only_specified or attribute_constraints.get("use_only_specified_attributes"):
                 # STRICT MODE: Skip LLM feedback interpretation for migration
                 logger.info(f"🔒 MIGRATION STRICT MODE: Using exact merged attributes without LLM interpretation")
@@ -822,6 +856,12 @@ Please provide the JSON response with database improvements."""
             table_name = entity.lower() + "s"
             
             logger.info(f"🔗 DatabaseSWEA: Creating relationships for {entity}")
+
+            # Deterministic path: migration rendered by the relationship compiler
+            if Config.ENABLE_RELATIONSHIP_COMPILER:
+                return self._create_relationships_from_compiler(
+                    entity, relationships, attributes, context, db_file
+                )
             
             # Build comprehensive columns map with explicit PRIMARY KEY
             current_columns_map = {'id': 'INTEGER PRIMARY KEY AUTOINCREMENT'}
@@ -841,7 +881,6 @@ Please provide the JSON response with database improvements."""
 
             # Add foreign key columns for relationships
             existing_columns = {}
-            missing_referenced_tables = []
             with sqlite3.connect(db_file) as conn:
                 cursor = conn.cursor()
                 
@@ -863,42 +902,7 @@ Please provide the JSON response with database improvements."""
                             current_columns_map[col_name] = col_type
                 
                 # CRITICAL: Verify that all referenced tables exist before creating foreign keys
-                logger.info("🔍 Validating referenced tables for foreign keys...")
-                for rel in relationships:
-                    target_table = f"{rel['target_entity'].lower()}s"
-                    
-                    # Check if the referenced table exists
-                    cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{target_table}'")
-                    referenced_table_exists = cursor.fetchone() is not None
-                    
-                    if not referenced_table_exists:
-                        logger.error(f"❌ Referenced table '{target_table}' does not exist! Cannot create foreign key.")
-                        missing_referenced_tables.append(target_table)
-                        
-                        # Defensive programming: Auto-create missing table with minimal schema
-                        logger.warning(f"⚠️  Auto-creating missing table: {target_table}")
-                        logger.warning(f"    This indicates entity '{rel['target_entity']}' was not properly created.")
-                        logger.warning(f"    Creating minimal table structure to prevent database corruption.")
-                        
-                        cursor.execute(f"""
-                            CREATE TABLE IF NOT EXISTS {target_table} (
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                name TEXT NOT NULL,
-                                email TEXT,
-                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                            )
-                        """)
-                        conn.commit()
-                        logger.info(f"✅ Created missing table: {target_table} (minimal schema)")
-                        logger.warning(f"⚠️  NOTE: You may need to run 'Create {rel['target_entity']} entity' again with proper attributes")
-                    else:
-                        logger.info(f"✓ Referenced table '{target_table}' exists")
-                
-                # Log summary of validation
-                if missing_referenced_tables:
-                    logger.warning(f"⚠️  Auto-created {len(missing_referenced_tables)} missing tables: {missing_referenced_tables}")
-                else:
-                    logger.info(f"✅ All referenced tables exist")
+                self._ensure_referenced_tables(conn, relationships)
                 
                 # Add foreign key columns to the schema
                 for rel in relationships:
@@ -1125,6 +1129,175 @@ if __name__ == "__main__":
             logger.error(f"❌ Relationship creation failed for {entity}: {str(e)}")
             raise
 
+    def _ensure_referenced_tables(
+        self, conn: sqlite3.Connection, relationships: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Create minimal tables for referenced entities that do not exist yet (returns their names)"""
+        cursor = conn.cursor()
+        missing_referenced_tables = []
+        logger.info("🔍 Validating referenced tables for foreign keys...")
+        for rel in relationships:
+            target_table = f"{rel['target_entity'].lower()}s"
+            
+            # Check if the referenced table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (target_table,))
+            if cursor.fetchone() is not None:
+                logger.info(f"✓ Referenced table '{target_table}' exists")
+                continue
+
+            logger.error(f"❌ Referenced table '{target_table}' does not exist! Cannot create foreign key.")
+            missing_referenced_tables.append(target_table)
+            
+            # Defensive programming: Auto-create missing table with minimal schema
+            logger.warning(f"⚠️  Auto-creating missing table: {target_table}")
+            logger.warning(f"    This indicates entity '{rel['target_entity']}' was not properly created.")
+            logger.warning(f"    Creating minimal table structure to prevent database corruption.")
+            
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {target_table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    email TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+            logger.info(f"✅ Created missing table: {target_table} (minimal schema)")
+            logger.warning(f"⚠️  NOTE: You may need to run 'Create {rel['target_entity']} entity' again with proper attributes")
+        
+        # Log summary of validation
+        if missing_referenced_tables:
+            logger.warning(f"⚠️  Auto-created {len(missing_referenced_tables)} missing tables: {missing_referenced_tables}")
+        else:
+            logger.info(f"✅ All referenced tables exist")
+        return missing_referenced_tables
+
+    def _create_relationships_from_compiler(
+        self,
+        entity: str,
+        relationships: List[Dict[str, Any]],
+        attributes: List[Dict[str, Any]],
+        context: str,
+        db_file: Path,
+    ) -> Dict[str, Any]:
+        """
+        Apply relationships with migrations rendered by the relationship compiler (no LLM).
+
+        Args:
+            entity: Primary entity name
+            relationships: [{"target_entity": Entity, "relationship_type": type}, ...]
+            attributes: Entity attribute dictionaries (used when the entity table does not exist yet)
+            context: Business request (recorded in the result)
+            db_file: Managed system database
+
+        Returns:
+            Result with the executed migration script as ``code``/``sql``
+        """
+        compiler = get_relationship_compiler()
+        specs = [
+            RelationshipSpec.create(entity, rel["target_entity"], rel.get("relationship_type"))
+            for rel in relationships
+        ]
+        foreign_keys = [spec.foreign_key for spec in specs if spec.foreign_key]
+        table_name = entity.lower() + "s"
+
+        scripts = []
+        with sqlite3.connect(db_file) as conn:
+            self._ensure_referenced_tables(conn, relationships)
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")]
+            if not columns:
+                # Entity table missing: create it from its own attributes, the migration adds the keys
+                create_sql, _ = self._build_create_table_sql(
+                    table_name, [attr for attr in attributes if attr["name"] not in foreign_keys]
+                )
+                scripts.append(create_sql + ";")
+                conn.execute(create_sql)
+                columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")]
+
+            for spec in specs:
+                migration_sql = compiler.migration_sql(spec, columns)
+                conn.executescript(migration_sql)
+                scripts.append(migration_sql)
+            conn.commit()
+            final_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")]
+
+        sql_code = "\n".join(scripts)
+        logger.info(f"✅ Relationships compiled for '{table_name}': foreign keys {foreign_keys}")
+        return {
+            "database_path": str(db_file),
+            "table": table_name,
+            "columns": final_columns,
+            "relationships_created": True,
+            "template_used": True,
+            "code": sql_code,
+            "sql": sql_code,
+            "foreign_keys": foreign_keys,
+            "junction_tables": [spec.junction_table for spec in specs if spec.junction_table],
+            "entity": entity,
+            "improvements_applied": {"relationships": relationships, "context": context},
+        }
+
+    def _apply_additive_migration(
+        self,
+        entity: str,
+        db_file: str,
+        current_types: Dict[str, str],
+        attributes: List[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Evolve an existing table with plain ``ALTER TABLE ... ADD COLUMN`` statements.
+
+        Args:
+            entity: Entity name (table is its lowercase plural)
+            db_file: Path to the SQLite database
+            current_types: Existing column name -> SQL type
+            attributes: Merged attribute list for the evolved entity
+
+        Returns:
+            Migration result, or None when the table is missing or an existing
+            column changes type (the caller then rebuilds the table)
+        """
+        if not current_types:
+            return None
+        table_name = entity.lower() + "s"
+        added: Dict[str, str] = {}
+        for attr in attributes:
+            name = attr.get("name", "unknown_field").replace(" ", "_").lower()
+            if name == "id":
+                continue
+            typ = attr.get("type", "str").replace("Optional[", "").replace("]", "")
+            sql_type = self._convert_type_hint_to_sql(typ)
+            if name not in current_types:
+                added[name] = sql_type
+            elif current_types[name].upper() != sql_type:
+                return None
+
+        statements = [
+            f"ALTER TABLE {table_name} ADD COLUMN {name} {sql_type}"
+            for name, sql_type in added.items()
+        ]
+        with sqlite3.connect(db_file) as conn:
+            cursor = conn.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            conn.commit()
+        logger.info(f"🛠️  Added {len(added)} column(s) to {table_name} with ALTER TABLE")
+
+        header = f"-- Schema migration for {entity} entity (additive, data preserved)"
+        sql = "\n".join([header, *(f"{statement};" for statement in statements)])
+        return {
+            "database_path": db_file,
+            "table": table_name,
+            "columns": [*current_types, *added],
+            "added_columns": list(added),
+            "migration_applied": bool(added),
+            "template_used": True,
+            "code": sql,
+            "sql": sql,
+            "data_preserved": True,
+            "preserved_columns": list(current_types),
+        }
+
     def _apply_schema_migration(
         self, interpretation: Dict[str, Any], entity: str, db_file: str
     ) -> Dict[str, Any]:
@@ -17,12 +17,82 @@ from baes.utils.template_registry import (
 )
 from baes.utils.presentation_logger import get_presentation_logger
 from baes.standards.compressed_standards import get_compressed_standard
+from baes.utils.prompt_fragments import PromptFragment, get_prompt_fragments
 from config import Config
 
 logger = logging.getLogger(__name__)
 presentation_logger = get_presentation_logger()
 presentation_logger = get_presentation_logger()
 
+# Static prompt sections (registered once in the prompt fragment registry)
+DO_NOT_IGNORE_WARNING = """
+🚨 CRITICAL WARNING: If you ignore ANY of the following instructions,
+     your output will be REJECTED and you will be required to regenerate it. You MUST address EVERY requirement listed below. Failure to comply will result in immediate rejection.
+
+⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
+⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
+⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
+⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
+⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
+
+COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
+"""
+UI_ROLE_INSTRUCTION = """
+
+You are a FrontendSWEA agent specialized in generating Streamlit UI code for domain entity management.
+
+"""
+UI_FULL_STANDARDS = """CRITICAL REQUIREMENTS - Your code MUST include ALL of the following:
+
+1. **MANDATORY: NO st.set_page_config() in entity pages**
+   - Entity pages are imported into the main app, which already has st.set_page_config()
+   - Do NOT include st.set_page_config() in entity management pages
+
+2. **MANDATORY: API_BASE_URL configuration**
+   - Define: API_BASE_URL = f"http://localhost:{{os.getenv('REALWORLD_FASTAPI_PORT', '8000')}}"
+   - Use this constant for all API calls
+   - Import os at the top of the file
+
+3. **MANDATORY: Proper error handling with response.raise_for_status()**
+   - Add response.raise_for_status() after every API call
+   - Wrap all API calls in try/except blocks
+
+4. **MANDATORY: Complete CRUD functionality**
+   - Create: POST to /api/{entity_lower}s/ with "Add New {entity}" form
+   - Read: GET from /api/{entity_lower}s/ with "List {entity}s" display
+   - Update: PUT to /api/{entity_lower}s/{{id}} with "Edit {entity}" form
+   - Delete: DELETE to /api/{entity_lower}s/{{id}} with delete buttons
+
+5. **MANDATORY: Form validation and error messages**
+   - Validate all required fields
+   - Show st.error() messages for validation failures
+
+6. **MANDATORY: Proper imports**
+   - import os
+   - import streamlit as st
+   - import requests
+   - from typing import List, Dict, Any, Optional
+
+7. **CRITICAL: ID field handling**
+   - NEVER include 'id' field in create/update forms (it's auto-generated)
+   - NEVER include 'id' in data dictionaries sent to API
+   - Display 'id' as read-only text in edit forms only
+   - The 'id' field should NEVER be user-editable
+
+8. **Performance: Stay responsive with large entities**
+   - Share one requests.Session across reruns with @st.cache_resource
+   - Wrap list reads in @st.cache_data(ttl=...) and clear them after create/update/delete
+   - Page the list with skip/limit query parameters (total in the X-Total-Count header)"""
+UI_OUTPUT_FORMAT = """CRITICAL OUTPUT FORMAT:
+- Return ONLY pure Python code
+- DO NOT use markdown code blocks (```python or ```)
+- DO NOT include any explanations or comments outside the code
+- Start directly with import statements
+- Include complete CRUD functionality
+- Use proper error handling with response.raise_for_status()
+- NEVER include 'id' field in forms or data dictionaries
+"""
+
 
 # Stage 2 Improvement #8: Feedback Loop Analytics for FrontendSWEA
 class FeedbackLoopAnalytics:
@@ -197,31 +267,44 @@ class FrontendSWEA(BaseAgent):
             Tuple of (standards_text, standards_type) where standards_type is
             "compressed" or "full"
         """
+        fragment, standards_type = self._get_standards_fragment()
+        return (fragment.text if fragment else ""), standards_type
+
+    def _get_standards_fragment(self) -> tuple[PromptFragment | None, str]:
+        """
+        Get compressed coding standards as a prompt fragment (loaded and token-counted once).
+        
+        Returns:
+            Tuple of (fragment, standards_type); the fragment is None for "full"
+            standards, which _build_prompt embeds itself
+        """
         if Config.ENABLE_COMPRESSED_STANDARDS:
             compressed = get_compressed_standard("frontend")
             if compressed:
-                return compressed.content, "compressed"
+                return (
+                    get_prompt_fragments().static(
+                        f"standards.frontend.compressed.{compressed.version}", compressed.content
+                    ),
+                    "compressed",
+                )
         
         # Fallback to full standards (embedded in prompt)
-        return "", "full"
+        return None, "full"
+
+    def _get_full_standards_fragment(self) -> PromptFragment:
+        """Full UI standards embedded in the prompt when compressed standards are off"""
+        return get_prompt_fragments().static("standards.frontend.full", UI_FULL_STANDARDS)
 
     def _get_do_not_ignore_warning(self) -> str:
         """
         Generate standard 'Do Not Ignore' warning text for all LLM prompts.
         Stage 1 Improvement #10: Explicit warnings to prevent LLM from ignoring instructions.
         """
-        return """
-🚨 CRITICAL WARNING: If you ignore ANY of the following instructions,
-     your output will be REJECTED and you will be required to regenerate it. You MUST address EVERY requirement listed below. Failure to comply will result in immediate rejection.
-
-⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
-⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
-⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
-⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
-⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
+        return self._get_do_not_ignore_fragment().text
 
-COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
-"""
+    def _get_do_not_ignore_fragment(self) -> PromptFragment:
+        """'Do Not Ignore' warning as a prompt fragment (token-counted once)"""
+        return get_prompt_fragments().static("frontend.do_not_ignore", DO_NOT_IGNORE_WARNING)
 
     # Supported task identifiers
     _SUPPORTED_TASKS = {
@@ -337,55 +420,25 @@ COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and
         structured_feedback = self._get_structured_feedback_injection(entity, "FrontendSWEA", "generate_ui")
         
         # Get standards (compressed or full) - Feature 001-performance-optimization US4
-        standards_text, standards_type = self._get_standards_text()
+        standards, standards_type = self._get_standards_fragment()
         
         # Log standards type for metrics
         presentation_logger.info(f"FrontendSWEA using {standards_type} standards for {entity}")
 
-        prompt = f"""
-{self._get_do_not_ignore_warning()}
-
-You are a FrontendSWEA agent specialized in generating Streamlit UI code for domain entity management.
-
+        # Static sections come from the fragment registry (token counts precomputed) and lead the
+        # prompt, so it shares its prefix with every other entity's; request-specific text comes last
+        fragments = get_prompt_fragments()
+        prompt = fragments.assemble(
+            [
+                "\n",
+                self._get_do_not_ignore_fragment(),
+                fragments.static("frontend.ui_role", UI_ROLE_INSTRUCTION),
+                standards or self._get_full_standards_fragment(),
+                "\n\n",
+                fragments.static("frontend.ui_output_format", UI_OUTPUT_FORMAT),
+                f"""
 {structured_feedback}
 
-{standards_text if standards_text else '''CRITICAL REQUIREMENTS - Your code MUST include ALL of the following:
-
-1. **MANDATORY: NO st.set_page_config() in entity pages**
-   - Entity pages are imported into the main app, which already has st.set_page_config()
-   - Do NOT include st.set_page_config() in entity management pages
-
-2. **MANDATORY: API_BASE_URL configuration**
-   - Define: API_BASE_URL = f"http://localhost:{{os.getenv('REALWORLD_FASTAPI_PORT', '8000')}}"
-   - Use this constant for all API calls
-   - Import os at the top of the file
-
-3. **MANDATORY: Proper error handling with response.raise_for_status()**
-   - Add response.raise_for_status() after every API call
-   - Wrap all API calls in try/except blocks
-
-4. **MANDATORY: Complete CRUD functionality**
-   - Create: POST to /api/{entity_lower}s/ with "Add New {entity}" form
-   - Read: GET from /api/{entity_lower}s/ with "List {entity}s" display
-   - Update: PUT to /api/{entity_lower}s/{{id}} with "Edit {entity}" form
-   - Delete: DELETE to /api/{entity_lower}s/{{id}} with delete buttons
-
-5. **MANDATORY: Form validation and error messages**
-   - Validate all required fields
-   - Show st.error() messages for validation failures
-
-6. **MANDATORY: Proper imports**
-   - import os
-   - import streamlit as st
-   - import requests
-   - from typing import List, Dict, Any, Optional
-
-7. **CRITICAL: ID field handling**
-   - NEVER include 'id' field in create/update forms (it's auto-generated)
-   - NEVER include 'id' in data dictionaries sent to API
-   - Display 'id' as read-only text in edit forms only
-   - The 'id' field should NEVER be user-editable'''}
-
 Entity: {entity}
 Attributes: {attributes}
 Context: {context}
@@ -395,16 +448,10 @@ Generate complete Streamlit UI code with CRUD operations:
 - Add New {entity} tab with st.form() and requests.post()
 - Edit {entity} tab with pre-populated form and requests.put()
 - Delete buttons with requests.delete()
-
-CRITICAL OUTPUT FORMAT:
-- Return ONLY pure Python code
-- DO NOT use markdown code blocks (```python or ```)
-- DO NOT include any explanations or comments outside the code
-- Start directly with import statements
-- Include complete CRUD functionality
-- Use proper error handling with response.raise_for_status()
-- NEVER include 'id' field in forms or data dictionaries
-"""
+""",
+            ],
+            token_budget=fragments.token_budget,
+        ).text
         return prompt
 
     def _write_to_managed_system(self, entity: str, code: str) -> str:
@@ -759,42 +806,23 @@ CRITICAL: Return ONLY the JSON object, no markdown formatting or explanations.
             if expected_output:
                 all_feedback.append(f"Expected output: {expected_output}")
 
-            if use_only_specified or attribute_constraints.get("use_only_specified_attributes"):
-                # STRICT MODE: Skip LLM feedback interpretation and use exact attributes for UI
-                logger.info(f"🔒 UI STRICT MODE: Bypassing LLM feedback interpretation, using exact user attributes")
-                
-                # Parse attributes to structured list - CRITICAL: Use exact attributes from payload
-                parsed_attributes = self._parse_attributes(attributes)
-                
-                # Validate that we're using the exact attributes provided
-                logger.info(f"🔍 FrontendSWEA STRICT: Using exact attributes: {parsed_attributes}")
-                
-                # Build Streamlit UI code based on exact attributes (DRY template)
-                code = self._create_streamlit_ui_code(entity, parsed_attributes, context)
-
-                # Sanitize unsupported Streamlit arguments (template shouldn't produce, but keep safe)
-                code = self._sanitize_ui_code(code)
-            
-            # Check if we have feedback and we're NOT in strict mode
-            elif all_feedback:
+            strict_mode = use_only_specified or attribute_constraints.get("use_only_specified_attributes")
+            if all_feedback and not strict_mode:
                 logger.info(f"🔧 FrontendSWEA: Interpreting feedback for {entity}")
                 interpretation = self._interpret_feedback_for_ui_generation(
                     all_feedback, entity, attributes
                 )
                 code = self._apply_ui_improvements(interpretation, entity, context)
             else:
-                # Generate fresh UI code using internal template generator (deterministic)
-                logger.info(
-                    f"🎨 FrontendSWEA: Generating fresh UI code for {entity} using template generator"
-                )
+                # STRICT MODE skips LLM feedback interpretation; both paths render the page template
+                if strict_mode:
+                    logger.info("🔒 UI STRICT MODE: Bypassing LLM feedback interpretation, using exact user attributes")
+                logger.info(f"🎨 FrontendSWEA: Generating UI code for {entity} from the page template")
 
                 # Parse attributes to structured list - CRITICAL: Use exact attributes from payload
                 parsed_attributes = self._parse_attributes(attributes)
-                
-                # Validate that we're using the exact attributes provided
                 logger.info(f"🔍 FrontendSWEA: Using exact attributes: {parsed_attributes}")
-                
-                # Build Streamlit UI code based on attributes (DRY template)
+
                 code = self._create_streamlit_ui_code(entity, parsed_attributes, context)
 
                 # Sanitize unsupported Streamlit arguments (template shouldn't produce, but keep safe)
@@ -960,61 +988,57 @@ CRITICAL: Return ONLY the JSON object, no markdown formatting or explanations.
         attributes: List[Dict[str, str]],
         context: str,
     ) -> str:
-        """Create comprehensive Streamlit UI code using template system or DRY template patterns"""
-        # Try template-based generation first
-        if self.template_registry:
+        """
+        Create the Streamlit management page from the registry page template
+
+        The page reads the list one page at a time (UI_PAGE_SIZE rows, cached for
+        UI_CACHE_TTL_SECONDS) over a pooled requests.Session; foreign key attributes
+        become selectboxes. Falls back to LLM generation when templates are disabled
+        or the template cannot be rendered.
+        """
+        if Config.ENABLE_TEMPLATES:
             try:
-                # Convert attributes list to dictionary for template
                 attr_dict = {}
+                foreign_keys = {}
                 for attr in attributes:
-                    if isinstance(attr, dict):
-                        attr_dict[attr.get("name", "unknown")] = attr.get("type", "str")
-                    else:
-                        attr_dict[str(attr)] = "str"
-                
-                from baes.utils.template_registry import EntityType
-                
-                # Create template input
+                    attr_dict[attr["name"]] = attr.get("type", "str")
+                    if attr.get("is_foreign_key"):
+                        foreign_keys[attr["name"]] = "".join(
+                            part.title() for part in attr["related_entity"].split("_")
+                        )
+
                 template_input = TemplateInput(
                     entity_name=entity,
                     entity_type=EntityType.STANDARD,
                     swea_type=SWEAType.FRONTEND,
                     attributes=attr_dict,
+                    custom_logic={"foreign_keys": foreign_keys} if foreign_keys else {},
+                    additional_context={
+                        "page_size": Config.UI_PAGE_SIZE,
+                        "cache_ttl": Config.UI_CACHE_TTL_SECONDS,
+                    },
+                    template_id="frontend_streamlit_crud",
                 )
-                
-                # Try to render template
                 template_output = self.template_registry.render_template(template_input)
-                
+
                 if template_output.template_used:
-                    # Log optimization metrics
                     presentation_logger.template_selected(
                         "frontend",
                         template_output.template_id,
                         template_output.token_estimate
                     )
-                    
                     logger.info("FrontendSWEA: Using template %s for %s", template_output.template_id, entity)
                     return template_output.generated_code
-                else:
-                    # Template indicated fallback needed
-                    presentation_logger.template_fallback(
-                        "frontend",
-                        template_output.template_id or "frontend_streamlit_crud",
-                        template_output.fallback_reason or "Unknown reason"
-                    )
+
+                presentation_logger.template_fallback(
+                    "frontend",
+                    template_output.template_id or "frontend_streamlit_crud",
+                    template_output.fallback_reason or "Unknown reason"
+                )
             except Exception as e:
-                logger.warning("FrontendSWEA: Template rendering failed: %s, falling back to DRY templates", str(e))
-        
-        # Fallback to existing DRY template patterns
-        from baes.standards.frontend_standards import FrontendStandards
-        
-        # Use DRY principle: Create reusable template components
-        template_parts = self._build_ui_template_parts(entity, attributes, context)
-        
-        # Combine template parts into complete UI code
-        ui_code = self._assemble_ui_template(template_parts, entity)
-        
-        return ui_code
+                logger.warning("FrontendSWEA: Template rendering failed: %s, falling back to LLM", str(e))
+
+        return self._generate_ui_code_directly(entity, attributes, context)
 
     def _generate_ui_code_directly(
         self, entity: str, attributes: List[Dict[str, str]], context: str
@@ -1074,439 +1098,6 @@ CRITICAL: Return ONLY the JSON object, no markdown formatting or explanations.
             components.append("tabs")
         return components
 
-    def _build_ui_template_parts(self, entity: str, attributes: List[Dict[str, str]], context: str) -> Dict[str, str]:
-        """Build reusable UI template parts following DRY principles"""
-        from baes.standards.frontend_standards import FrontendStandards
-        
-        entity_lower = entity.lower()
-        
-        # DRY: Reusable template parts
-        template_parts = {
-            "imports": self._generate_imports_template(),
-            "api_config": self._generate_api_config_template(),
-            "form_fields": self._generate_form_fields_template(attributes),
-            "validation": self._generate_validation_template(attributes),
-            "crud_operations": self._generate_crud_operations_template(entity, entity_lower),
-            "main_function": self._generate_main_function_template(entity, attributes),
-            "attributes": attributes,
-        }
-        
-        return template_parts
-    
-    def _generate_imports_template(self) -> str:
-        """Generate standard imports template (DRY)"""
-        return '''import os
-import json
-import streamlit as st
-import requests
-from typing import List, Dict, Any, Optional'''
-    
-    def _generate_api_config_template(self) -> str:
-        """Generate API configuration template (DRY)"""
-        return '''# API Configuration
-API_PORT = os.getenv("REALWORLD_FASTAPI_PORT", "8000")
-API_BASE_URL = f"http://localhost:{API_PORT}"'''
-    
-    def _generate_form_fields_template(self, attributes: List[Dict[str, str]]) -> str:
-        """Generate form fields template based on attributes (DRY) - excludes primary id, builds dropdown for foreign keys"""
-        form_fields = []
-        for attr in attributes:
-            field_name = attr["name"]
-            field_type = attr.get("type", "str").lower()
-            is_fk = attr.get("is_foreign_key", False)
-            related_entity = attr.get("related_entity", "")
-            descriptive_field = attr.get("descriptive_field", "name")
-
-            # Skip the primary 'id' field - auto-generated
-            if field_name.lower() == "id":
-                continue
-
-            if is_fk and related_entity:
-                related_entity_lower = related_entity.lower()
-                form_fields.append(
-                    f"        # Foreign key: {related_entity}\n"
-                    f"        try:\n"
-                    f"            {related_entity_lower}_resp = requests.get(f'{{API_BASE_URL}}/api/{related_entity_lower}s/')\n"
-                    f"            {related_entity_lower}_resp.raise_for_status()\n"
-                    f"            {related_entity_lower}_data = {related_entity_lower}_resp.json()\n"
-                    f"            {related_entity_lower}_options = {{item['id']: item.get('{descriptive_field}', str(item['id'])) for item in {related_entity_lower}_data}}\n"
-                    f"        except (requests.exceptions.RequestException, json.JSONDecodeError):\n"
-                    f"            {related_entity_lower}_options = {{}}\n"
-                    f"            st.error('Failed to load {related_entity} options')\n"
-                    f"        {field_name} = st.selectbox(\"{related_entity.title()}\", options=list({related_entity_lower}_options.keys()), format_func=lambda o: {related_entity_lower}_options.get(o, str(o)))\n"
-                )
-            else:
-                if field_type in ["email"]:
-                    form_fields.append(
-                        f'        {field_name} = st.text_input("{field_name.title()}", key="{field_name}_input")'
-                    )
-                elif field_type in ["int", "integer"]:
-                    form_fields.append(
-                        f'        {field_name} = st.number_input("{field_name.title()}", min_value=0, key="{field_name}_input")'
-                    )
-                elif field_type in ["date"]:
-                    form_fields.append(
-                        f'        {field_name} = st.date_input("{field_name.title()}", key="{field_name}_input")'
-                    )
-                else:
-                    form_fields.append(
-                        f'        {field_name} = st.text_input("{field_name.title()}", key="{field_name}_input")'
-                    )
-        return '\n'.join(form_fields)
-    
-    def _generate_validation_template(self, attributes: List[Dict[str, str]]) -> str:
-        """Generate validation template based on attributes (DRY) - excludes id field"""
-        validation_rules = []
-        for attr in attributes:
-            field_name = attr["name"]
-            field_type = attr.get("type", "str").lower()
-            
-            # Skip the 'id' field - it should be auto-generated, not validated by user
-            if field_name.lower() == "id":
-                continue
-            
-            if field_type == "email":
-                validation_rules.append(f'            if {field_name} and "@" not in {field_name}:')
-                validation_rules.append('                st.error("Please enter a valid email address")')
-                validation_rules.append("                return")
-            else:
-                validation_rules.append(f"            if not {field_name}:")
-                validation_rules.append(f'                st.error("{field_name.title()} is required")')
-                validation_rules.append("                return")
-        
-        return '\n'.join(validation_rules)
-    
-    def _generate_crud_operations_template(self, entity: str, entity_lower: str) -> str:
-        """Generate CRUD operations template (DRY)"""
-        return f'''def create_{entity_lower}(data: Dict[str, Any]) -> bool:
-    """Create a new {entity}."""
-    try:
-        response = requests.post(f"{{API_BASE_URL}}/api/{entity_lower}s/", json=data)
-        response.raise_for_status()
-        if response.status_code == 201:
-            st.success(f"{entity} created successfully!")
-            return True
-        return False
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error creating {entity_lower}: {{e}}")
-        return False
-
-def get_{entity_lower}s() -> List[Dict[str, Any]]:
-    """Get all {entity}s."""
-    try:
-        response = requests.get(f"{{API_BASE_URL}}/api/{entity_lower}s/")
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching {entity_lower}s: {{e}}")
-        return []
-
-def update_{entity_lower}(id: int, data: Dict[str, Any]) -> bool:
-    """Update an existing {entity}."""
-    try:
-        response = requests.put(f"{{API_BASE_URL}}/api/{entity_lower}s/{{id}}", json=data)
-        response.raise_for_status()
-        if response.status_code == 200:
-            st.success(f"{entity} updated successfully!")
-            return True
-        return False
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error updating {entity_lower}: {{e}}")
-        return False
-
-def delete_{entity_lower}(id: int) -> bool:
-    """Delete a {entity}."""
-    try:
-        response = requests.delete(f"{{API_BASE_URL}}/api/{entity_lower}s/{{id}}")
-        response.raise_for_status()
-        if response.status_code == 204:
-            st.success(f"{entity} deleted successfully!")
-            return True
-        return False
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error deleting {entity_lower}: {{e}}")
-        return False'''
-    
-    def _generate_main_function_template(self, entity: str, attributes: List[Dict[str, str]]) -> str:
-        """Generate main function template (DRY)"""
-        entity_lower = entity.lower()
-
-        # Find a descriptive attribute for the expander title
-        descriptive_attr = "id"
-        for attr in attributes:
-            attr_name = attr.get("name", "").lower()
-            if attr_name == "name":
-                descriptive_attr = attr["name"]
-                break
-            if attr_name == "title":
-                descriptive_attr = attr["name"]
-            if attr_name == "description" and descriptive_attr == "id":
-                descriptive_attr = attr["name"]
-
-        # Generate code to fetch data for all foreign keys
-        fk_fetches = []
-        for attr in attributes:
-            if attr.get("is_foreign_key"):
-                related_entity = attr["related_entity"]
-                related_entity_lower = related_entity.lower()
-                descriptive_field = attr.get("descriptive_field", "name")
-                fk_fetches.append(f'''    # Fetch related data for {related_entity}\n    try:\n        {related_entity_lower}_resp = requests.get(f"{{API_BASE_URL}}/api/{related_entity_lower}s/")\n        {related_entity_lower}_resp.raise_for_status()\n        {related_entity_lower}_data = {related_entity_lower}_resp.json()\n        {related_entity_lower}_options = {{item['id']: item.get('{descriptive_field}', str(item['id'])) for item in {related_entity_lower}_data}}\n    except (requests.exceptions.RequestException, json.JSONDecodeError):\n        {related_entity_lower}_options = {{}}\n        st.warning('Failed to load {related_entity} options')''')
-        fk_fetch_block = "\n".join(fk_fetches)
-
-        # Generate the item display logic
-        item_display_lines = []
-        indent = " " * 20  # 16 (col1) + 4
-        for attr in attributes:
-            attr_name = attr["name"]
-            if attr_name.lower() == 'id':
-                continue
-            if attr.get("is_foreign_key"):
-                related_entity = attr["related_entity"]
-                related_entity_lower = related_entity.lower()
-                options_map_name = f"{related_entity_lower}_options"
-                descriptive_field = attr.get("descriptive_field", "name")
-                item_display_lines.append(
-                    f"{indent}if '{attr_name}' in {entity_lower}:\n{indent}    related_name = {options_map_name}.get({entity_lower}['{attr_name}'], f'ID: {{{entity_lower}['{attr_name}']}}')\n{indent}    st.write(f'**{related_entity.title()}:** {{related_name}}')"
-                )
-            else:
-                item_display_lines.append(
-                    f"{indent}if '{attr_name}' in {entity_lower}:\n{indent}    st.write(f'**{attr_name.replace('_', ' ').title()}:** {{{entity_lower}['{attr_name}']}}')"
-                )
-        item_display_block = "\n".join(item_display_lines)
-        if not item_display_block.strip():
-            item_display_block = indent + "pass"
-
-        return f'''def main():
-    """Main {entity} management interface."""
-    st.title("{entity} Management")
-    
-    # Create tabs for different operations
-    tab1, tab2, tab3 = st.tabs(["List {entity}s", "Add {entity}", "Edit {entity}"])
-    
-    with tab1:
-        show_{entity_lower}_list()
-    
-    with tab2:
-        show_{entity_lower}_form()
-    
-    with tab3:
-        show_{entity_lower}_edit()
-
-def show_{entity_lower}_list():
-    """Display list of {entity}s."""
-    st.header("All {entity}s")
-    
-    if st.button("Refresh", key="refresh_list"):
-        st.rerun()
-    
-    {fk_fetch_block}
-    
-    {entity_lower}s = get_{entity_lower}s()
-    
-    if {entity_lower}s:
-        for {entity_lower} in {entity_lower}s:
-            with st.expander(f"{entity.title()}: {{{entity_lower}.get('{descriptive_attr}', {entity_lower}.get('id', 'N/A'))}}"):
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-{item_display_block}
-                
-                with col2:
-                    if st.button("Edit", key=f"edit_{{{entity_lower}['id']}}"):
-                        st.session_state.edit_{entity_lower}_id = {entity_lower}['id']
-                        st.session_state.edit_{entity_lower}_data = {entity_lower}
-                        st.rerun()
-                
-                with col3:
-                    if st.button("Delete", key=f"delete_{{{entity_lower}['id']}}"):
-                        if delete_{entity_lower}({entity_lower}['id']):
-                            st.rerun()
-    else:
-        st.info("No {entity_lower}s found.")
-
-def show_{entity_lower}_form():
-    """Display form to add new {entity}."""
-    st.header("Add New {entity}")
-    
-    with st.form("add_{entity_lower}_form"):
-{{form_fields}}
-        
-        submitted = st.form_submit_button("Add {entity}")
-        
-        if submitted:
-{{validation}}
-            
-            # Create data dictionary
-            data = {{data_dict}}
-            
-            if create_{entity_lower}(data):
-                st.rerun()
-
-def show_{entity_lower}_edit():
-    """Display form to edit existing {entity}."""
-    st.header("Edit {entity}")
-    
-    if f"edit_{entity_lower}_id" in st.session_state:
-        edit_data = st.session_state.get(f"edit_{entity_lower}_data", {{}})
-        
-        with st.form("edit_{entity_lower}_form"):
-            st.write(f"Editing {entity} ID: {{st.session_state.edit_{entity_lower}_id}}")
-            
-{{edit_form_fields}}
-            
-            submitted = st.form_submit_button("Update {entity}")
-            
-            if submitted:
-{{edit_validation}}
-                
-                # Create data dictionary
-                data = {{edit_data_dict}}
-                
-                if update_{entity_lower}(st.session_state.edit_{entity_lower}_id, data):
-                    # Clear edit state
-                    if f"edit_{entity_lower}_id" in st.session_state:
-                        del st.session_state[f"edit_{entity_lower}_id"]
-                    if f"edit_{entity_lower}_data" in st.session_state:
-                        del st.session_state[f"edit_{entity_lower}_data"]
-                    st.rerun()
-        
-        if st.button("Cancel Edit"):
-            if f"edit_{entity_lower}_id" in st.session_state:
-                del st.session_state[f"edit_{entity_lower}_id"]
-            if f"edit_{entity_lower}_data" in st.session_state:
-                del st.session_state[f"edit_{entity_lower}_data"]
-            st.rerun()
-    else:
-        st.info("Select a {entity_lower} from the list to edit.")
-
-if __name__ == "__main__":
-    main()'''
-    
-    def _assemble_ui_template(self, template_parts: Dict[str, str], entity: str) -> str:
-        """Assemble template parts into complete UI code (DRY)"""
-        # Retrieve full attribute metadata (name/type)
-        attributes_meta = template_parts.get("attributes", [])
-        # Fallback to simple name extraction if metadata missing
-        if not attributes_meta:
-            attributes_names = self._extract_attributes_from_form_fields(template_parts["form_fields"])
-            attributes_meta = [{"name": n, "type": "str"} for n in attributes_names]
-
-        # Helper: determine if type represents a list
-        def _is_list_type(t: str) -> bool:
-            return t.lower().startswith("list") or "[" in t.lower()
-
-        # Build data dictionary for create form – convert list-like fields, exclude 'id' field
-        data_dict_parts = []
-        for attr in attributes_meta:
-            name = attr["name"]
-            atype = attr.get("type", "str")
-            # Skip the 'id' field - it should be auto-generated, not sent in create requests
-            if name.lower() == "id":
-                continue
-            if _is_list_type(atype):
-                data_dict_parts.append(f'"{name}": {name}.split(",")')
-            else:
-                data_dict_parts.append(f'"{name}": {name}')
-        data_dict = "{" + ", ".join(data_dict_parts) + "}"
-
-        # Build edit form fields (pre-populated) - exclude 'id' field from editable fields
-        edit_form_fields_lines = []
-        # First, display the ID as read-only
-        edit_form_fields_lines.append('            st.write(f"**ID:** {st.session_state.edit_' + entity.lower() + '_id}")')
-        
-        for attr in attributes_meta:
-            name = attr["name"]
-            is_fk = attr.get("is_foreign_key", False)
-            related_entity = attr.get("related_entity", "")
-            # Skip the 'id' field - it should be displayed as read-only above, not editable
-            if name.lower() == "id":
-                continue
-            # 12 spaces indentation to align with code inside the "with st.form" block
-            if is_fk and related_entity:
-                edit_form_fields_lines.append(f"""            # Foreign key: {related_entity}
-            try:
-                {related_entity}_resp = requests.get(f"{{API_BASE_URL}}/api/{related_entity}s/")
-                {related_entity}_resp.raise_for_status()
-                {related_entity}_data = {related_entity}_resp.json()
-                {related_entity}_options = {{}}
-                for item in {related_entity}_data:
-                    {related_entity}_options[item['id']] = item.get('name', str(item['id']))
-            except requests.exceptions.RequestException:
-                {related_entity}_options = {{}}
-                st.error("Failed to load {related_entity} options")
-            {name}_edit = st.selectbox("{related_entity.title()}", options=list({related_entity}_options.keys()), index=0 if edit_data.get("{name}") is None else list({related_entity}_options.keys()).index(edit_data.get("{name}")), format_func=lambda o: {related_entity}_options.get(o, str(o)))""")
-            else:
-                edit_form_fields_lines.append(
-                    f'            {name}_edit = st.text_input("{name.title().replace("_"," ")}", value=edit_data.get("{name}", ""), key="{name}_edit")'
-                )
-        edit_form_fields = "\n".join(edit_form_fields_lines)
-
-        # Build edit validation rules - exclude 'id' field
-        edit_validation_lines = []
-        for attr in attributes_meta:
-            name = attr["name"]
-            # Skip the 'id' field - it should not be validated as it's not editable
-            if name.lower() == "id":
-                continue
-            # 16 spaces indent to align inside 'if submitted:' block
-            edit_validation_lines.append(f'                if not {name}_edit:')
-            edit_validation_lines.append(
-                f'                    st.error("{name.title().replace("_"," ")} is required")'
-            )
-            edit_validation_lines.append("                    return")
-        edit_validation = "\n".join(edit_validation_lines)
-
-        # Build edit data dict – convert list-like fields, exclude 'id' field
-        edit_data_dict_parts = []
-        for attr in attributes_meta:
-            name = attr["name"]
-            atype = attr.get("type", "str")
-            # Skip the 'id' field - it should not be sent in update requests
-            if name.lower() == "id":
-                continue
-            if _is_list_type(atype):
-                edit_data_dict_parts.append(f'"{name}": {name}_edit.split(",")')
-            else:
-                edit_data_dict_parts.append(f'"{name}": {name}_edit')
-        edit_data_dict = "{" + ", ".join(edit_data_dict_parts) + "}"
-
-        # Assemble complete code
-        complete_code = f'''{template_parts["imports"]}
-
-{template_parts["api_config"]}
-
-{template_parts["crud_operations"]}
-
-{template_parts["main_function"]}'''
-        
-        # Replace placeholders (support both single and double braces)
-        replacements = {
-            "{form_fields}": template_parts["form_fields"],
-            "{validation}": template_parts["validation"],
-            "{data_dict}": data_dict,
-            "{edit_form_fields}": edit_form_fields,
-            "{edit_validation}": edit_validation,
-            "{edit_data_dict}": edit_data_dict,
-            "{{form_fields}}": template_parts["form_fields"],
-            "{{validation}}": template_parts["validation"],
-            "{{data_dict}}": data_dict,
-            "{{edit_form_fields}}": edit_form_fields,
-            "{{edit_validation}}": edit_validation,
-            "{{edit_data_dict}}": edit_data_dict,
-        }
-        for placeholder, value in replacements.items():
-            complete_code = complete_code.replace(placeholder, value)
-        
-        return complete_code
-    
-    def _extract_attributes_from_form_fields(self, form_fields: str) -> List[str]:
-        """Extract attribute names from form fields template"""
-        import re
-        # Extract variable names from form field assignments
-        pattern = r'(\w+)\s*=\s*st\.'
-        matches = re.findall(pattern, form_fields)
-        return matches
-
     def _clean_llm_response(self, response_text: str) -> str:
         """
         Clean LLM response to remove markdown formatting and ensure valid Python code.
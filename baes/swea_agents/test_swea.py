@@ -10,7 +10,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from baes.core.managed_system_manager import ManagedSystemManager
+from baes.core.managed_system_manager import ManagedSystemManager, write_text_locked
 from baes.domain_entities.base_bae import BaseAgent
 from baes.llm.openai_client import OpenAIClient
 from baes.utils.template_registry import (
@@ -19,11 +19,61 @@ from baes.utils.template_registry import (
     EntityType,
     SWEAType,
 )
+from baes.utils.execution_trace import span
 from baes.utils.presentation_logger import get_presentation_logger
 from baes.standards.compressed_standards import get_compressed_standard
+from baes.utils.prompt_fragments import PromptFragment, get_prompt_fragments
 from config import Config
 
 logger = logging.getLogger(__name__)
+
+# Static prompt sections (registered once in the prompt fragment registry)
+DO_NOT_IGNORE_WARNING = """
+🚨 CRITICAL WARNING: If you ignore ANY of the following instructions,
+     your output will be REJECTED and you will be required to regenerate it. You MUST address EVERY requirement listed below. Failure to comply will result in immediate rejection.
+
+⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
+⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
+⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
+⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
+⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
+
+COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
+"""
+TEST_ROLE_INSTRUCTION = """
+You are a TestSWEA (Test Software Engineering Autonomous Agent) responsible for generating comprehensive tests.
+
+"""
+TEST_FULL_STANDARDS = """CRITICAL REQUIREMENTS:
+1. Use pytest framework with proper fixtures and mocking
+2. Mock external dependencies (OpenAI API, file operations, etc.)
+3. Include both positive and negative test cases
+4. Test edge cases and error conditions
+5. Use proper assertions and test structure
+6. Include setup and teardown as needed
+7. Generate complete, runnable test code
+8. Focus on testing business logic and domain coherence
+9. ALWAYS validate that imports will work before generating tests
+10. Use robust error handling and fallback mechanisms
+11. Use ONLY the actual attributes from the generated code for test data
+12. Follow exact endpoint URL patterns as specified"""
+UI_TESTS_INSTRUCTIONS = """
+Generate SIMPLE UI tests for the Streamlit interface. Focus on basic functionality with minimal complexity.
+
+CRITICAL IMPORT REQUIREMENTS:
+- Use 'import streamlit as st' for Streamlit components
+- Use 'from unittest.mock import patch, MagicMock' for mocking
+- DO NOT import any modules that do not exist (e.g., 'student_page')
+
+SIMPLE TEST STRUCTURE:
+- Test that the Streamlit app can be loaded (mock if necessary)
+- Test that a form with the correct fields can be created
+- Use only simple assertions (e.g., assert True)
+- Avoid any complex user interaction simulation or external imports
+- Keep tests short and readable
+
+Return ONLY complete Python test code with imports and simple test functions.
+"""
 presentation_logger = get_presentation_logger()
 
 
@@ -222,31 +272,40 @@ class TestSWEA(BaseAgent):
             Tuple of (standards_text, standards_type) where standards_type is
             "compressed" or "full"
         """
+        fragment, standards_type = self._get_standards_fragment()
+        return (fragment.text if fragment else ""), standards_type
+
+    def _get_standards_fragment(self) -> tuple[PromptFragment | None, str]:
+        """
+        Get compressed coding standards as a prompt fragment (loaded and token-counted once).
+        
+        Returns:
+            Tuple of (fragment, standards_type); the fragment is None for "full"
+            standards, which _build_test_prompt embeds itself
+        """
         if Config.ENABLE_COMPRESSED_STANDARDS:
             compressed = get_compressed_standard("test")
             if compressed:
-                return compressed.content, "compressed"
+                return (
+                    get_prompt_fragments().static(
+                        f"standards.test.compressed.{compressed.version}", compressed.content
+                    ),
+                    "compressed",
+                )
         
         # Fallback to full standards (embedded in prompt)
-        return "", "full"
+        return None, "full"
 
     def _get_do_not_ignore_warning(self) -> str:
         """
         Generate standard 'Do Not Ignore' warning text for all LLM prompts.
         Stage 1 Improvement #10: Explicit warnings to prevent LLM from ignoring instructions.
         """
-        return """
-🚨 CRITICAL WARNING: If you ignore ANY of the following instructions,
-     your output will be REJECTED and you will be required to regenerate it. You MUST address EVERY requirement listed below. Failure to comply will result in immediate rejection.
+        return self._get_do_not_ignore_fragment().text
 
-⚠️  DO NOT IGNORE ANY INSTRUCTIONS - Your response will be validated against ALL requirements.
-⚠️  DO NOT SKIP ANY STEPS - Every instruction must be implemented exactly as specified.
-⚠️  DO NOT USE PLACEHOLDERS - Generate complete, working code with no TODO comments.
-⚠️  DO NOT OMIT ERROR HANDLING - Implement comprehensive error handling as required.
-⚠️  DO NOT IGNORE FEEDBACK - Implement ALL TechLeadSWEA feedback exactly as provided.
-
-COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and retry.
-"""
+    def _get_do_not_ignore_fragment(self) -> PromptFragment:
+        """'Do Not Ignore' warning as a prompt fragment (token-counted once)"""
+        return get_prompt_fragments().static("test.do_not_ignore", DO_NOT_IGNORE_WARNING)
 
     # Supported task identifiers
     _SUPPORTED_TASKS = {
@@ -631,7 +690,7 @@ COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and
         ]
 
         requirements_content = "\n".join(basic_requirements) + "\n"
-        requirements_file.write_text(requirements_content)
+        write_text_locked(requirements_file, requirements_content)
 
     def _execute_all_tests(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Execute all tests in the managed system."""
@@ -672,13 +731,14 @@ COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and
             logger.info("🧪 Executing tests in: " + str(tests_dir))
             logger.debug("🧪 Test command: " + " ".join(cmd))
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(managed_system_path),
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout for all tests
-            )
+            with span("pytest", category="subprocess", cwd=str(managed_system_path)):
+                result = subprocess.run(
+                    cmd,
+                    cwd=str(managed_system_path),
+                    capture_output=True,
+                    text=True,
+                    timeout=120,  # 2 minute timeout for all tests
+                )
 
             execution_time = time.time() - start_time
 
@@ -1084,50 +1144,33 @@ COMPLIANCE IS MANDATORY - Non-compliance will result in immediate rejection and
         validation_helpers = self._get_validation_helpers(entity, actual_attributes)
         
         # Get standards (compressed or full) - Feature 001-performance-optimization US4
-        standards_text, standards_type = self._get_standards_text()
+        standards, standards_type = self._get_standards_fragment()
         
         # Log standards type for metrics
         presentation_logger.info(f"TestSWEA using {standards_type} standards for {entity}")
 
-        base_prompt = """
-You are a TestSWEA (Test Software Engineering Autonomous Agent) responsible for generating comprehensive tests.
+        # Static sections come from the fragment registry (token counts precomputed) and lead the
+        # prompt, so it shares its prefix with every other entity's; request-specific text comes last
+        fragments = get_prompt_fragments()
+        base_parts = [
+            fragments.static("test.role", TEST_ROLE_INSTRUCTION),
+            standards or fragments.static("standards.test.full", TEST_FULL_STANDARDS),
+            f"""
 
-Entity: %s
-Expected Attributes: %s
-Actual Attributes from Generated Code: %s
-Context: %s
-Test Type: %s
+Entity: {entity}
+Expected Attributes: {attributes}
+Actual Attributes from Generated Code: {actual_attributes}
+Context: {context}
+Test Type: {test_type}
 
 Generated Code to Test:
-%s
-
-%s
+{generated_code}
 
 VALIDATION HELPERS:
-%s
-
-""" % (
-            entity,
-            attributes,
-            actual_attributes,
-            context,
-            test_type,
-            generated_code,
-            standards_text if standards_text else """CRITICAL REQUIREMENTS:
-1. Use pytest framework with proper fixtures and mocking
-2. Mock external dependencies (OpenAI API, file operations, etc.)
-3. Include both positive and negative test cases
-4. Test edge cases and error conditions
-5. Use proper assertions and test structure
-6. Include setup and teardown as needed
-7. Generate complete, runnable test code
-8. Focus on testing business logic and domain coherence
-9. ALWAYS validate that imports will work before generating tests
-10. Use robust error handling and fallback mechanisms
-11. Use ONLY the actual attributes from the generated code for test data
-12. Follow exact endpoint URL patterns as specified""",
-            validation_helpers,
-        )
+{validation_helpers}
+
+""",
+        ]
 
         if test_type == "unit_tests":
             # Get the actual generated model code to extract correct class names
@@ -1156,9 +1199,7 @@ VALIDATION HELPERS:
             simple_test_data = self._generate_simple_test_data(entity, actual_attributes)
             test_data_json = str(simple_test_data).replace("'", '"')
 
-            return (
-                base_prompt
-                + f"""
+            instructions = f"""
 Generate SIMPLE unit tests for the Pydantic model. Focus on basic validation with minimal complexity.
 
 CRITICAL IMPORT REQUIREMENTS:
@@ -1181,7 +1222,6 @@ SIMPLE TEST STRUCTURE:
 
 Return ONLY complete Python test code with imports and simple test functions.
 """
-            )
 
         elif test_type == "integration_tests":
             # Get the actual generated routes code to extract correct class names
@@ -1229,9 +1269,7 @@ CRITICAL API PREFIX INFORMATION:
             simple_test_data = self._generate_simple_test_data(entity, actual_attributes)
             test_data_json = str(simple_test_data).replace("'", '"')
 
-            return (
-                base_prompt
-                + f"""
+            instructions = f"""
 Generate SIMPLE integration tests for the FastAPI routes. Focus on basic CRUD operations with minimal complexity.
 
 CRITICAL IMPORT REQUIREMENTS:
@@ -1266,7 +1304,6 @@ SIMPLE TEST STRUCTURE:
 
 Return ONLY complete Python test code with imports and simple test functions.
 """
-            )
 
         elif test_type == "ui_tests":
             # Get the actual generated UI code to check for correct file structure
@@ -1290,29 +1327,14 @@ Return ONLY complete Python test code with imports and simple test functions.
             else:
                 actual_imports = "# UI file not found: {ui_file}"
 
-            return (
-                base_prompt
-                + f"""
-Generate SIMPLE UI tests for the Streamlit interface. Focus on basic functionality with minimal complexity.
-
-CRITICAL IMPORT REQUIREMENTS:
-- Use 'import streamlit as st' for Streamlit components
-- Use 'from unittest.mock import patch, MagicMock' for mocking
-- DO NOT import any modules that do not exist (e.g., 'student_page')
-
-SIMPLE TEST STRUCTURE:
-- Test that the Streamlit app can be loaded (mock if necessary)
-- Test that a form with the correct fields can be created
-- Use only simple assertions (e.g., assert True)
-- Avoid any complex user interaction simulation or external imports
-- Keep tests short and readable
-
-Return ONLY complete Python test code with imports and simple test functions.
-"""
-            )
+            instructions = fragments.static("test.ui_tests_instructions", UI_TESTS_INSTRUCTIONS)
 
         else:
-            return base_prompt + "Generate appropriate test code based on the context provided."
+            instructions = "Generate appropriate test code based on the context provided."
+
+        return fragments.assemble(
+            base_parts + [instructions], token_budget=fragments.token_budget
+        ).text
 
     def _get_validation_helpers(self, entity: str, attributes: List[str]) -> str:
         """Generate validation helpers for robust test generation."""
@@ -1666,7 +1688,7 @@ VALIDATION HELPERS FOR {entity.upper()}:
                 test_file = tests_dir / f"test_{entity.lower()}_{test_type}.py"
 
             # Write test code
-            test_file.write_text(test_code)
+            write_text_locked(test_file, test_code)
 
             return str(test_file)
         except Exception as e:
@@ -1695,13 +1717,14 @@ VALIDATION HELPERS FOR {entity.upper()}:
             ]
 
             # Use a shorter timeout for the entire process
-            result = subprocess.run(
-                cmd,
-                cwd=str(managed_system_path),
-                capture_output=True,
-                text=True,
-                timeout=45,  # 45 second timeout for entire process
-            )
+            with span("pytest", category="subprocess", cwd=str(managed_system_path)):
+                result = subprocess.run(
+                    cmd,
+                    cwd=str(managed_system_path),
+                    capture_output=True,
+                    text=True,
+                    timeout=45,  # 45 second timeout for entire process
+                )
 
             return {
                 "success": result.returncode == 0,
@@ -2028,13 +2051,14 @@ VALIDATION HELPERS FOR {entity.upper()}:
             logger.info("🧪 Executing tests in: %s", tests_dir)
             logger.debug("🧪 Test command: %s", " ".join(cmd))
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(managed_system_path),
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout for all tests
-            )
+            with span("pytest", category="subprocess", cwd=str(managed_system_path)):
+                result = subprocess.run(
+                    cmd,
+                    cwd=str(managed_system_path),
+                    capture_output=True,
+                    text=True,
+                    timeout=120,  # 2 minute timeout for all tests
+                )
 
             execution_time = time.time() - start_time
 
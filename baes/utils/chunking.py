@@ -0,0 +1,43 @@
+"""
+Budget-Bounded Chunking
+
+Splits an ordered sequence into contiguous chunks whose summed cost stays
+within a budget. Used to size LLM review batches by estimated prompt tokens and
+process-pool validation chunks by source characters.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+"""
+
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def split_by_budget(items: Sequence[T], cost: Callable[[T], int], budget: int) -> List[List[T]]:
+    """
+    Split ``items`` into ordered chunks whose summed ``cost`` stays within ``budget``.
+
+    An item whose cost alone exceeds the budget gets a chunk of its own.
+
+    Args:
+        items: Items to split, in order
+        cost: Cost of one item (e.g. estimated tokens or characters)
+        budget: Maximum summed cost per chunk
+
+    Returns:
+        Non-empty chunks that concatenate back to ``items``
+    """
+    chunks: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+    for item in items:
+        item_cost = cost(item)
+        if current and used + item_cost > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += item_cost
+    if current:
+        chunks.append(current)
+    return chunks
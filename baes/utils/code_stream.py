@@ -0,0 +1,211 @@
+"""
+Incremental Code Extraction for Streamed LLM Completions
+
+Consumes a code generation completion token by token and decides, while it is
+still streaming, whether the code is finished or hopeless:
+- Strips a leading markdown fence (```python) and completes the code block at
+  the closing fence (text after it, usually explanations, is never waited for)
+- Rejects completions in the wrong language (fence tag or first code line)
+- Parses each top-level segment once the next top-level statement starts; a
+  syntax error there cannot be fixed by later tokens, so the stream is aborted
+
+Code that is merely incomplete (open brackets, unterminated triple-quoted
+strings at the segment end) is never treated as invalid.
+
+Constitutional Compliance:
+- Fail-fast: Invalid generations stop after the first broken top-level statement
+- Incremental: Each top-level segment is parsed once (linear in completion size)
+- Observability: Abort reasons name the language or the syntax error and its line
+"""
+
+import ast
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_FENCE_PATTERN = re.compile(r"^\s*```\s*([\w+-]*)\s*$")
+
+# Fence tags accepted per expected language
+_LANGUAGE_TAGS = {"python": {"", "python", "python3", "py"}}
+
+# First code lines that are clearly not Python
+_NON_PYTHON_START = re.compile(
+    r"^\s*(?:"
+    r"import\s+[\w{}\s,*]+\s+from\s+['\"]"  # ES module import
+    r"|(?:const|let|var)\s+\w+\s*="
+    r"|function\s+\w+\s*\("
+    r"|export\s+(?:default|const|function|class)\b"
+    r"|<!DOCTYPE|<html|<\?php"
+    r"|package\s+[\w.]+\s*;"
+    r"|#include\s*[<\"]"
+    r"|public\s+(?:class|static|interface)\b"
+    r"|using\s+System\b"
+    r")",
+    re.IGNORECASE,
+)
+
+# Lines at column 0 that continue the previous statement instead of starting one
+_CONTINUATION_START = re.compile(r"^(?:[)\]}]|else\b|elif\b|except\b|finally\b|#)")
+
+# SyntaxError messages raised only because the segment ends early
+_INCOMPLETE_MARKERS = (
+    "was never closed",
+    "unterminated triple-quoted string",
+    "unexpected EOF",
+    "EOF while scanning",
+)
+
+
+class CodeStreamAborted(RuntimeError):
+    """Raised when a streamed code generation is abandoned as invalid"""
+
+    def __init__(self, reason: str, partial_code: str = ""):
+        super().__init__(f"Code generation aborted: {reason}")
+        self.reason = reason
+        self.partial_code = partial_code
+
+
+@dataclass
+class StreamState:
+    """
+    State of an extraction after the last feed
+
+    Attributes:
+        complete: Closing fence seen (the code block is final)
+        aborted: Code is invalid; stop streaming
+        reason: Abort reason (None unless aborted)
+        checked_lines: Lines verified as complete, valid top-level statements
+    """
+
+    complete: bool = False
+    aborted: bool = False
+    reason: Optional[str] = None
+    checked_lines: int = 0
+
+
+class IncrementalCodeExtractor:
+    """
+    Extracts and checks code from a streamed completion
+
+    Usage:
+        extractor = IncrementalCodeExtractor()
+        for delta in stream:
+            state = extractor.feed(delta)
+            if state.aborted:
+                raise CodeStreamAborted(state.reason, extractor.code)
+            if state.complete:
+                break
+        code = extractor.finish()
+    """
+
+    def __init__(self, language: str = "python"):
+        """
+        Args:
+            language: Expected language; only "python" code is syntax-checked
+        """
+        self.language = language
+        self.state = StreamState()
+        self._buffer = ""  # Text of the line being streamed
+        self._lines: list = []  # Complete code lines (fences excluded)
+        self._fenced: Optional[bool] = None  # Whether the code is inside a markdown fence
+        self._language_checked = False
+        self._segment_start = 0  # First line of the top-level segment not yet verified
+
+    @property
+    def code(self) -> str:
+        """Code extracted so far (complete lines plus the partial last line)"""
+        if self.state.complete:
+            return "\n".join(self._lines)
+        return "\n".join(self._lines + [self._buffer])
+
+    def feed(self, delta: str) -> StreamState:
+        """Add streamed text; returns the updated state"""
+        if self.state.complete or self.state.aborted or not delta:
+            return self.state
+
+        self._buffer += delta
+        while "\n" in self._buffer and not (self.state.complete or self.state.aborted):
+            line, self._buffer = self._buffer.split("\n", 1)
+            self._add_line(line)
+        return self.state
+
+    def finish(self) -> str:
+        """
+        End of stream: flush the last line and verify the trailing segment
+
+        Returns:
+            Extracted code, stripped
+
+        Raises:
+            CodeStreamAborted: The code is invalid
+        """
+        if not self.state.complete and not self.state.aborted:
+            if self._buffer:
+                line, self._buffer = self._buffer, ""
+                self._add_line(line)
+            if not self.state.complete and not self.state.aborted and self.language == "python":
+                self._check_segment(len(self._lines), at_end=True)
+        if self.state.aborted:
+            raise CodeStreamAborted(self.state.reason, self.code)
+        return "\n".join(self._lines).strip()
+
+    def _add_line(self, line: str) -> None:
+        fence = _FENCE_PATTERN.match(line)
+        if self._fenced is None:
+            if not line.strip():
+                return
+            if fence:
+                self._fenced = True
+                self._check_language(fence_tag=fence.group(1).lower())
+                return
+            self._fenced = False
+        elif fence and self._fenced:
+            self.state.complete = True
+            return
+
+        if not self._language_checked and line.strip() and not line.lstrip().startswith("#"):
+            self._check_language(first_line=line)
+            if self.state.aborted:
+                return
+
+        if self.language == "python" and self._lines and self._starts_statement(line):
+            self._check_segment(len(self._lines))
+        self._lines.append(line)
+
+    def _check_language(self, fence_tag: Optional[str] = None, first_line: Optional[str] = None) -> None:
+        accepted_tags = _LANGUAGE_TAGS.get(self.language)
+        if fence_tag is not None:
+            if accepted_tags is not None and fence_tag not in accepted_tags:
+                self._abort(f"expected {self.language} code, got a ```{fence_tag} block")
+            return
+        self._language_checked = True
+        if self.language == "python" and _NON_PYTHON_START.match(first_line or ""):
+            self._abort(f"expected python code, got: {first_line.strip()[:60]}")
+
+    @staticmethod
+    def _starts_statement(line: str) -> bool:
+        """Whether a line at column 0 starts a new top-level statement"""
+        return bool(line) and not line[0].isspace() and not _CONTINUATION_START.match(line)
+
+    def _check_segment(self, end: int, at_end: bool = False) -> None:
+        """Parse lines [segment start, end); advance the segment start when they are valid"""
+        segment = "\n".join(self._lines[self._segment_start:end])
+        if not segment.strip():
+            return
+        if not at_end and segment.rstrip().rsplit("\n", 1)[-1].startswith("@"):
+            return  # Decorators belong to the definition that follows
+        try:
+            ast.parse(segment)
+        except SyntaxError as e:
+            message = str(e.msg)
+            if not at_end and any(marker in message for marker in _INCOMPLETE_MARKERS):
+                return  # The new line continues an open construct; re-check at the next boundary
+            line = self._segment_start + (e.lineno or 1)
+            self._abort(f"syntax error at line {line}: {message}")
+            return
+        self._segment_start = end
+        self.state.checked_lines = end
+
+    def _abort(self, reason: str) -> None:
+        self.state.aborted = True
+        self.state.reason = reason
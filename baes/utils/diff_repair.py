@@ -0,0 +1,269 @@
+"""
+LLM diff repair of rejected artifacts.
+
+When TechLeadSWEA rejects an artifact and no structured CodePatcher edit
+applies, the retry would regenerate the whole file, paying the full output
+token cost again for large Streamlit UIs and test files. Diff repair instead
+sends the rejected code and the review feedback to the SWEA's LLM client and
+asks for a minimal unified diff, so output tokens scale with the size of the
+fix rather than the size of the file.
+
+The diff is applied locally. Hunks are located by their context and removed
+lines: the stated line numbers only break ties between several matches (models
+miscount them), and a hunk that matches nowhere fails the repair.
+Python artifacts must re-parse after the diff is applied. Any failure returns
+an unsuccessful ``DiffRepairResult`` and the caller falls back to full
+regeneration.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-fast: Diffs that do not apply cleanly are rejected, never half-applied
+- Observability: Repairs log hunk counts and response sizes
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from config import Config
+
+from ..standards.code_analysis import CodeAnalysis
+from ..standards.compressed_standards import estimate_token_counts
+
+logger = logging.getLogger(__name__)
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_FENCE = re.compile(r"^\s*```")
+
+DIFF_REPAIR_SYSTEM_PROMPT = (
+    "You repair source files by replying with a unified diff only. "
+    "Never rewrite the whole file and never add explanations."
+)
+
+
+class DiffApplyError(ValueError):
+    """A unified diff that cannot be applied to the given code"""
+
+
+@dataclass
+class DiffHunk:
+    """One ``@@ -a,b +c,d @@`` hunk of a unified diff
+
+    Attributes:
+        old_start: 1-based first line of the hunk in the original file (a hint)
+        lines: Hunk body lines, each prefixed with " ", "-" or "+"
+    """
+
+    old_start: int
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def old_lines(self) -> List[str]:
+        """Context and removed lines (the text the hunk expects to find)"""
+        return [line[1:] for line in self.lines if line[:1] in (" ", "-")]
+
+    @property
+    def new_lines(self) -> List[str]:
+        """Context and added lines (the text that replaces it)"""
+        return [line[1:] for line in self.lines if line[:1] in (" ", "+")]
+
+
+@dataclass
+class DiffRepairResult:
+    """Outcome of one diff repair
+
+    Attributes:
+        success: Whether the diff applied (and the result parses, for Python)
+        code: Repaired code (None on failure)
+        error: Failure reason
+        hunks: Hunks applied
+        response_chars: Size of the model response (proportional to output tokens)
+        tokens: Estimated prompt plus response tokens of the repair request
+    """
+
+    success: bool
+    code: Optional[str] = None
+    error: Optional[str] = None
+    hunks: int = 0
+    response_chars: int = 0
+    tokens: int = 0
+
+
+def parse_unified_diff(diff: str) -> List[DiffHunk]:
+    """
+    Hunks of a unified diff, ignoring Markdown fences and file headers
+
+    Everything before the first ``@@`` line is treated as header text, so
+    ``--- `` and ``+++ `` lines inside a hunk are removed and added lines
+    (e.g. a deleted ``-- comment`` in SQL).
+
+    Raises:
+        DiffApplyError: If the text contains no hunk
+    """
+    hunks: List[DiffHunk] = []
+    for line in diff.splitlines():
+        header = _HUNK_HEADER.match(line)
+        if header:
+            hunks.append(DiffHunk(old_start=int(header.group(1))))
+        elif not hunks or _FENCE.match(line) or line.startswith("\\"):
+            continue
+        elif line[:1] in (" ", "-", "+"):
+            hunks[-1].lines.append(line)
+        elif line == "":
+            hunks[-1].lines.append(" ")  # Editors and models strip the blank context marker
+    hunks = [hunk for hunk in hunks if any(line[:1] in ("-", "+") for line in hunk.lines)]
+    if not hunks:
+        raise DiffApplyError("No unified diff hunks in response")
+    return hunks
+
+
+def _find_hunk(lines: List[str], expected: List[str], hint: int, start: int) -> int:
+    """Index at or after ``start`` where ``expected`` occurs, preferring the one nearest ``hint``"""
+    size = len(expected)
+    for normalize in (lambda text: text, lambda text: text.rstrip()):
+        wanted = [normalize(line) for line in expected]
+        matches = [
+            index
+            for index in range(start, len(lines) - size + 1)
+            if [normalize(line) for line in lines[index : index + size]] == wanted
+        ]
+        if matches:
+            return min(matches, key=lambda index: (abs(index - hint), index))
+    raise DiffApplyError(f"Hunk at line {hint + 1} does not match the code")
+
+
+def apply_unified_diff(code: str, diff: str) -> str:
+    """
+    Apply a unified diff to ``code``
+
+    Hunks are applied in order, each located by its context and removed lines
+    at or after the end of the previous hunk.
+
+    Raises:
+        DiffApplyError: If the diff has no hunks or a hunk does not match
+    """
+    hunks = parse_unified_diff(diff)
+    trailing_newline = code.endswith("\n")
+    lines = code.splitlines()
+    result: List[str] = []
+    position = 0
+    for hunk in hunks:
+        expected = hunk.old_lines
+        if not expected:
+            # Pure insertion: the hint is the line after which the text goes
+            index = max(position, min(hunk.old_start, len(lines)))
+        else:
+            index = _find_hunk(lines, expected, max(hunk.old_start - 1, 0), position)
+        result.extend(lines[position:index])
+        result.extend(hunk.new_lines)
+        position = index + len(expected)
+    result.extend(lines[position:])
+    patched = "\n".join(result)
+    return patched + "\n" if trailing_newline or not code else patched
+
+
+def build_diff_repair_prompt(
+    code: str, feedback: Sequence[str], file_name: str, swea_type: str
+) -> str:
+    """Prompt asking for a minimal unified diff that fixes ``feedback`` in ``code``"""
+    issues = "\n".join(f"- {item}" for item in feedback if str(item).strip())
+    return f"""The {swea_type} file `{file_name}` below was REJECTED by the technical lead.
+
+REVIEW FEEDBACK TO FIX:
+{issues or "- Fix the reported issues"}
+
+CURRENT FILE ({len(code.splitlines())} lines):
+```
+{code}
+```
+
+Reply with ONLY a minimal unified diff against the current file that fixes every issue above:
+- Use `--- a/{file_name}` and `+++ b/{file_name}` headers and `@@ -start,count +start,count @@` hunks
+- Include 3 unchanged context lines around each change, copied exactly (indentation included)
+- Change only what the feedback requires; do not reformat or reorder other code
+- No explanations and no full-file rewrite
+"""
+
+
+def should_repair_with_diff(code: Optional[str]) -> bool:
+    """Whether a rejected artifact is worth a diff repair rather than regeneration"""
+    return (
+        Config.ENABLE_DIFF_REPAIR
+        and isinstance(code, str)
+        and len(code) >= Config.DIFF_REPAIR_MIN_CHARS
+    )
+
+
+def repair_with_diff(
+    llm_client: Any,
+    code: str,
+    feedback: Sequence[str],
+    swea_type: str,
+    file_name: str = "artifact.py",
+    max_tokens: Optional[int] = None,
+) -> DiffRepairResult:
+    """
+    Ask ``llm_client`` for a unified diff fixing ``feedback`` and apply it to ``code``
+
+    Args:
+        llm_client: Client with ``generate_response(prompt, system_prompt=..., max_tokens=...)``
+        code: Rejected artifact
+        feedback: TechLeadSWEA feedback items
+        swea_type: Artifact kind for the prompt (e.g. "frontend")
+        file_name: File name shown in the prompt; ``.py`` files must re-parse
+        max_tokens: Response token limit (default: DIFF_REPAIR_MAX_TOKENS)
+
+    Returns:
+        DiffRepairResult with the repaired code or the failure reason
+    """
+    prompt = build_diff_repair_prompt(code, feedback, file_name, swea_type)
+    try:
+        response = llm_client.generate_response(
+            prompt,
+            system_prompt=DIFF_REPAIR_SYSTEM_PROMPT,
+            max_tokens=max_tokens or Config.DIFF_REPAIR_MAX_TOKENS,
+        )
+    except Exception as e:
+        logger.warning(f"⚠️  Diff repair request failed for {file_name}: {e}")
+        return DiffRepairResult(success=False, error=f"LLM request failed: {e}")
+
+    if not isinstance(response, str):
+        return DiffRepairResult(success=False, error="Empty LLM response")
+    tokens = sum(estimate_token_counts([DIFF_REPAIR_SYSTEM_PROMPT, prompt, response]))
+    try:
+        hunks = parse_unified_diff(response)
+        repaired = apply_unified_diff(code, response)
+    except DiffApplyError as e:
+        logger.info(f"🔄 Diff repair for {file_name} did not apply ({e}), regenerating")
+        return DiffRepairResult(
+            success=False, error=str(e), response_chars=len(response), tokens=tokens
+        )
+
+    if repaired == code:
+        return DiffRepairResult(
+            success=False,
+            error="Diff does not change the code",
+            response_chars=len(response),
+            tokens=tokens,
+        )
+    if file_name.endswith(".py") and not CodeAnalysis.of(repaired).is_valid_syntax:
+        return DiffRepairResult(
+            success=False,
+            error="Repaired code failed syntax validation",
+            hunks=len(hunks),
+            response_chars=len(response),
+            tokens=tokens,
+        )
+
+    logger.info(
+        f"🩹 Diff repair applied {len(hunks)} hunk(s) to {file_name} "
+        f"({len(response)} response chars for a {len(code)}-char file)"
+    )
+    return DiffRepairResult(
+        success=True,
+        code=repaired,
+        hunks=len(hunks),
+        response_chars=len(response),
+        tokens=tokens,
+    )
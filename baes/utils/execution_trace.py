@@ -0,0 +1,409 @@
+"""
+Per-request execution tracing for BAES Framework.
+
+This module provides a lightweight span/trace API used to record where the wall
+time of a single natural-language request is spent (recognition, interpretation,
+SWEA calls, TechLeadSWEA reviews, retries, LLM calls, pytest subprocesses, server
+restarts). Traces can be exported as Chrome trace-event JSON (chrome://tracing,
+Perfetto) and summarized as a critical path.
+
+Spans are tracked with ``contextvars`` so the API is safe to use from threads and
+asyncio tasks: ``asyncio.to_thread`` and task creation copy the current context,
+so spans opened inside worker threads are attached to the request that started
+them. When no trace is active, ``span()`` is a no-op.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Observability: Structured timing for every step of a request
+- Fail-safe: Tracing errors never interrupt generation
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_trace: contextvars.ContextVar[Optional["ExecutionTrace"]] = contextvars.ContextVar(
+    "baes_current_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "baes_current_span", default=None
+)
+_span_listener: contextvars.ContextVar[Optional[Callable[[str, "Span"], None]]] = (
+    contextvars.ContextVar("baes_span_listener", default=None)
+)
+
+
+@dataclass
+class Span:
+    """A single timed operation within an execution trace.
+
+    Attributes:
+        name: Human-readable operation name (e.g., "BackendSWEA.generate_api")
+        category: Coarse grouping used for summaries (e.g., "swea", "llm", "review")
+        span_id: Unique identifier of this span
+        parent_id: Identifier of the enclosing span (None for the root span)
+        start: Start time from ``time.perf_counter()``
+        end: End time from ``time.perf_counter()`` (None while the span is open)
+        thread_id: Native id of the thread that opened the span
+        attributes: Free-form metadata attached to the span
+    """
+
+    name: str
+    category: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float
+    end: Optional[float] = None
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0.0 while the span is still open)."""
+        if self.end is None:
+            return 0.0
+        return (self.end - self.start) * 1000.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach or overwrite a metadata attribute on the span."""
+        self.attributes[key] = value
+
+
+class ExecutionTrace:
+    """Collection of spans recorded for a single request.
+
+    Spans may be appended concurrently from several threads; all mutation goes
+    through an internal lock.
+    """
+
+    def __init__(self, request_id: Optional[str] = None, name: str = "request"):
+        self.request_id = request_id or str(uuid.uuid4())
+        self.name = name
+        self.created_at = datetime.now()
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def open_span(
+        self, name: str, category: str, parent: Optional[Span], attributes: Dict[str, Any]
+    ) -> Span:
+        """Create and register a new open span."""
+        new_span = Span(
+            name=name,
+            category=category,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.perf_counter(),
+            thread_id=threading.get_native_id(),
+            attributes=dict(attributes),
+        )
+        with self._lock:
+            self.spans.append(new_span)
+        return new_span
+
+    def finished_spans(self) -> List[Span]:
+        """Return a snapshot of all closed spans ordered by start time."""
+        with self._lock:
+            spans = [s for s in self.spans if s.end is not None]
+        return sorted(spans, key=lambda s: s.start)
+
+    @property
+    def total_time_ms(self) -> float:
+        """Wall time covered by the trace (first span start to last span end)."""
+        spans = self.finished_spans()
+        if not spans:
+            return 0.0
+        return (max(s.end for s in spans) - min(s.start for s in spans)) * 1000.0
+
+    def time_by_category(self) -> Dict[str, float]:
+        """Sum of exclusive (self) time per span category, in milliseconds."""
+        spans = self.finished_spans()
+        children = self._children_index(spans)
+        totals: Dict[str, float] = {}
+        for s in spans:
+            exclusive = s.duration_ms - _covered_ms(children.get(s.span_id, []), s)
+            totals[s.category] = totals.get(s.category, 0.0) + max(exclusive, 0.0)
+        return {k: round(v, 3) for k, v in sorted(totals.items(), key=lambda kv: -kv[1])}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Export the trace in Chrome trace-event format.
+
+        Each span becomes a complete ("X") event with microsecond timestamps
+        relative to the trace origin. Load the result in chrome://tracing or
+        https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": 0,
+                "args": {"name": f"BAES {self.name} {self.request_id}"},
+            }
+        ]
+        for s in self.finished_spans():
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": round((s.start - self.origin) * 1_000_000, 3),
+                    "dur": round((s.end - s.start) * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": {
+                        "span_id": s.span_id,
+                        "parent_id": s.parent_id,
+                        **{k: _json_safe(v) for k, v in s.attributes.items()},
+                    },
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "request_id": self.request_id,
+                "created_at": self.created_at.isoformat(),
+                "critical_path": self.critical_path(),
+            },
+        }
+
+    def critical_path(self) -> Dict[str, Any]:
+        """Compute the critical path through the recorded spans.
+
+        Starting at the root span(s), the path repeatedly descends into the
+        chain of child spans that determines the parent's end time: the child
+        finishing last, then the latest child that finished before it started,
+        and so on. Time inside a span not covered by its critical children is
+        attributed to the span itself (``self_ms``).
+
+        Returns:
+            Dict with total_ms, the ordered list of path steps, and a per-category
+            breakdown of exclusive time along the path.
+        """
+        spans = self.finished_spans()
+        if not spans:
+            return {"total_ms": 0.0, "path": [], "by_category": {}}
+
+        children = self._children_index(spans)
+        known_ids = {s.span_id for s in spans}
+        roots = [s for s in spans if s.parent_id is None or s.parent_id not in known_ids]
+
+        steps: List[Dict[str, Any]] = []
+        for root in _critical_chain(roots):
+            self._walk_critical(root, children, steps, depth=0)
+
+        by_category: Dict[str, float] = {}
+        for step in steps:
+            by_category[step["category"]] = by_category.get(step["category"], 0.0) + step["self_ms"]
+
+        return {
+            "total_ms": round(self.total_time_ms, 3),
+            "path": steps,
+            "by_category": {
+                k: round(v, 3) for k, v in sorted(by_category.items(), key=lambda kv: -kv[1])
+            },
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact summary suitable for logging and metrics."""
+        critical = self.critical_path()
+        return {
+            "request_id": self.request_id,
+            "span_count": len(self.finished_spans()),
+            "total_ms": critical["total_ms"],
+            "critical_path": [
+                f"{step['name']} ({step['duration_ms']:.0f}ms)" for step in critical["path"]
+            ],
+            "critical_by_category": critical["by_category"],
+            "time_by_category": self.time_by_category(),
+        }
+
+    def export(self, output_dir: str) -> Optional[Path]:
+        """Write the Chrome trace JSON to ``output_dir``.
+
+        Returns:
+            Path of the written file, or None if writing failed (non-fatal).
+        """
+        try:
+            directory = Path(output_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            stamp = self.created_at.strftime("%Y%m%d_%H%M%S")
+            path = directory / f"trace_{stamp}_{self.request_id[:8]}.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_chrome_trace(), f, indent=2)
+            logger.debug("🧭 Execution trace written to %s", path)
+            return path
+        except Exception as e:
+            logger.warning("⚠️  Failed to export execution trace: %s", e)
+            return None
+
+    def _children_index(self, spans: List[Span]) -> Dict[str, List[Span]]:
+        index: Dict[str, List[Span]] = {}
+        for s in spans:
+            if s.parent_id:
+                index.setdefault(s.parent_id, []).append(s)
+        return index
+
+    def _walk_critical(
+        self,
+        node: Span,
+        children: Dict[str, List[Span]],
+        steps: List[Dict[str, Any]],
+        depth: int,
+    ) -> None:
+        chain = _critical_chain(children.get(node.span_id, []))
+        covered = _covered_ms(chain, node)
+        steps.append(
+            {
+                "name": node.name,
+                "category": node.category,
+                "depth": depth,
+                "duration_ms": round(node.duration_ms, 3),
+                "self_ms": round(max(node.duration_ms - covered, 0.0), 3),
+            }
+        )
+        for child in chain:
+            self._walk_critical(child, children, steps, depth + 1)
+
+
+def _critical_chain(candidates: List[Span]) -> List[Span]:
+    """Select the chain of spans that determines when a group finishes.
+
+    Walks backwards from the span that ends last, each time picking the latest
+    span that ended before the current one started. Returned in start order.
+    """
+    if not candidates:
+        return []
+    remaining = sorted(candidates, key=lambda s: s.end, reverse=True)
+    chain = [remaining[0]]
+    for s in remaining[1:]:
+        if s.end <= chain[-1].start:
+            chain.append(s)
+    chain.reverse()
+    return chain
+
+
+def _covered_ms(spans: List[Span], parent: Span) -> float:
+    """Milliseconds of ``parent`` covered by the union of ``spans``."""
+    intervals = sorted(
+        (max(s.start, parent.start), min(s.end, parent.end))
+        for s in spans
+        if s.end is not None and parent.end is not None
+    )
+    covered = 0.0
+    current_start, current_end = None, None
+    for start, end in intervals:
+        if end <= start:
+            continue
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        covered += current_end - current_start
+    return covered * 1000.0
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def current_trace() -> Optional[ExecutionTrace]:
+    """Return the trace active in the current context, if any."""
+    return _current_trace.get()
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span in the current context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span_listener(callback: Callable[[str, Span], None]) -> Iterator[None]:
+    """Register a callback notified with ("start" | "end", span) for spans in this context.
+
+    The listener is inherited by threads started via ``asyncio.to_thread`` and by
+    asyncio tasks, so it may be invoked from worker threads. Listener errors are
+    logged and ignored.
+    """
+    token = _span_listener.set(callback)
+    try:
+        yield
+    finally:
+        _span_listener.reset(token)
+
+
+def _notify(phase: str, active: Span) -> None:
+    listener = _span_listener.get()
+    if listener is None:
+        return
+    try:
+        listener(phase, active)
+    except Exception as e:
+        logger.debug("Span listener failed: %s", e)
+
+
+@contextmanager
+def start_trace(
+    request_id: Optional[str] = None, name: str = "request", **attributes: Any
+) -> Iterator[ExecutionTrace]:
+    """Activate a new execution trace and open its root span.
+
+    Usage:
+        with start_trace(name="process_natural_language_request") as trace:
+            ...
+        trace.to_chrome_trace()
+    """
+    trace = ExecutionTrace(request_id=request_id, name=name)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        with span(name, category="request", **attributes):
+            yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, category: str = "general", **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a block of work as a span of the active trace.
+
+    Yields the open ``Span`` (so callers can attach attributes), or None when no
+    trace is active. Exceptions are recorded as an ``error`` attribute and
+    re-raised unchanged.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    active = trace.open_span(name, category, _current_span.get(), attributes)
+    token = _current_span.set(active)
+    _notify("start", active)
+    try:
+        yield active
+    except BaseException as e:
+        active.attributes["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        active.end = time.perf_counter()
+        _current_span.reset(token)
+        _notify("end", active)
@@ -6,11 +6,14 @@ from pathlib import Path
 from time import time
 import json, threading, os
 
+from .template_analytics import get_template_analytics
+
 _METRICS = {
     "total_wall_seconds": 0.0,
     "clarification_prompts": 0,
     "openai_tokens_in": 0,
     "openai_tokens_out": 0,
+    "openai_cached_tokens_in": 0,       # prompt tokens served from the provider's prefix cache
 }
 _LOCK = threading.Lock()
 _LOG_FILE = Path(os.getenv("BAE_METRICS_LOG", "logs/metrics.jsonl"))
@@ -22,10 +25,11 @@ def add_time(delta: float):             # ⏱
         _METRICS["total_wall_seconds"] += delta
 
 
-def add_tokens(inp: int, out: int):     # 💰
+def add_tokens(inp: int, out: int, cached: int = 0):     # 💰
     with _LOCK:
         _METRICS["openai_tokens_in"]  += inp
         _METRICS["openai_tokens_out"] += out
+        _METRICS["openai_cached_tokens_in"] += cached
 
 
 def inc_clarification():                # ❔
@@ -33,8 +37,20 @@ def inc_clarification():                # ❔
         _METRICS["clarification_prompts"] += 1
 
 
+def get_metrics() -> dict:               # 📊
+    """Cumulative metrics plus the share of prompt tokens served from the prompt cache."""
+    with _LOCK:
+        metrics = dict(_METRICS)
+    tokens_in = metrics["openai_tokens_in"]
+    metrics["openai_cached_prefix_ratio"] = (
+        round(metrics["openai_cached_tokens_in"] / tokens_in, 4) if tokens_in else 0.0
+    )
+    return metrics
+
+
 def flush_snapshot():
-    """Write one JSON line with cumulative metrics."""
+    """Write one JSON line with cumulative metrics and the template coverage report."""
+    metrics = {**get_metrics(), "template_coverage": get_template_analytics().coverage_report()}
     with _LOCK:
         with _LOG_FILE.open("a") as f:
-            f.write(json.dumps(_METRICS, indent=2) + "\n")
\ No newline at end of file
+            f.write(json.dumps(metrics, indent=2) + "\n")
\ No newline at end of file
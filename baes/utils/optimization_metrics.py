@@ -12,7 +12,7 @@ Constitutional Compliance:
 
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -76,6 +76,10 @@ class PerformanceMetrics:
         retry_success: Whether retry successfully resolved the issue
         patch_feasibility: Feasibility score for targeted patch (0.0-1.0)
         retry_count: Number of retry attempts for this request
+        speculative_runs: Number of speculative multi-candidate generations
+        speculative_candidates_cancelled: Candidates cancelled after another was selected
+        pipelined_tasks: Tasks whose generation overlapped the previous task's review
+        pipelined_tasks_requeued: Pipelined tasks discarded because a dependency was rejected
         
         # Validation metrics
         validation_outcome: Classification (confident_approval/confident_rejection/uncertain)
@@ -90,6 +94,10 @@ class PerformanceMetrics:
         approval_granted: Whether TechLeadSWEA approved the code
         test_passed: Whether integration tests passed
         error_count: Number of errors during generation
+        
+        # Execution trace metrics
+        trace_file: Path of the exported Chrome trace JSON (if tracing enabled)
+        critical_path: Critical-path steps of the request ("name (Nms)")
     """
     request_id: str
     entity_name: str
@@ -141,6 +149,10 @@ class PerformanceMetrics:
     retry_success: bool = False  # Whether retry resolved the issue
     patch_feasibility: float = 0.0  # Feasibility score for targeted patch (0.0-1.0)
     retry_count: int = 0  # Number of retry attempts
+    speculative_runs: int = 0  # Speculative multi-candidate generations
+    speculative_candidates_cancelled: int = 0  # Candidates cancelled after selection
+    pipelined_tasks: int = 0  # Generations overlapped with the previous review
+    pipelined_tasks_requeued: int = 0  # Pipelined generations discarded after a rejection
     
     # Validation metrics
     validation_outcome: str = "uncertain"  # confident_approval, confident_rejection, uncertain
@@ -151,6 +163,10 @@ class PerformanceMetrics:
     test_passed: bool = False
     error_count: int = 0
     
+    # Execution trace metrics
+    trace_file: Optional[str] = None
+    critical_path: List[str] = field(default_factory=list)
+    
     def to_dict(self) -> dict:
         """Convert metrics to dictionary for logging/export."""
         return {
@@ -190,11 +206,17 @@ class PerformanceMetrics:
             "retry_success": self.retry_success,
             "patch_feasibility": self.patch_feasibility,
             "retry_count": self.retry_count,
+            "speculative_runs": self.speculative_runs,
+            "speculative_candidates_cancelled": self.speculative_candidates_cancelled,
+            "pipelined_tasks": self.pipelined_tasks,
+            "pipelined_tasks_requeued": self.pipelined_tasks_requeued,
             "validation_outcome": self.validation_outcome,
             "validation_llm_called": self.validation_llm_called,
             "approval_granted": self.approval_granted,
             "test_passed": self.test_passed,
-            "error_count": self.error_count
+            "error_count": self.error_count,
+            "trace_file": self.trace_file,
+            "critical_path": self.critical_path
         }
 
 
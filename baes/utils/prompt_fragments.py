@@ -0,0 +1,254 @@
+"""
+Prompt Fragment Registry for SWEA Prompt Builders
+
+SWEA prompts are mostly static text (coding standards, "do not ignore" warnings,
+output format instructions, validation guidelines) around a few variable parts
+(entity, attributes, feedback, code). The registry loads each static section
+once and counts its tokens once; builders assemble prompts from registered
+fragments and variable strings, so only the variable parts are tokenized per
+prompt and token budgets are checked without re-tokenizing the whole prompt.
+
+Layout policy: builders put static fragments first and variable parts last, so
+prompts for different entities share a long identical prefix that provider-side
+prompt caching can reuse; AssembledPrompt.prefix_tokens reports its length.
+
+Fragment ids are dotted names: "<owner>.<section>" (e.g., "backend.final_warning",
+"standards.frontend.compressed"); files under baes/llm/prompts/ register as
+"prompts.<file stem>".
+
+Constitutional Compliance:
+- DRY: One copy of every static prompt section, shared by all SWEA instances
+- Observability: Static/variable token split per prompt, dropped sections logged
+- Thread-safe: Registrations protected by threading.Lock (SWEAs run concurrently)
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from baes.standards.compressed_standards import estimate_token_count, estimate_token_counts
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "llm" / "prompts"
+
+
+@dataclass(frozen=True)
+class PromptFragment:
+    """
+    Static prompt section with its token count
+
+    Attributes:
+        fragment_id: Registry key (e.g., "backend.final_warning")
+        text: Section text, spliced verbatim into prompts
+        token_count: Tokens of ``text`` (counted once, at registration)
+        digest: SHA-256 prefix of ``text`` (detects re-registration with new text)
+    """
+
+    fragment_id: str
+    text: str
+    token_count: int
+    digest: str
+
+
+# A prompt part: a registered fragment, variable text, or None (skipped)
+PromptPart = Union[PromptFragment, str, None]
+
+
+@dataclass
+class AssembledPrompt:
+    """
+    Prompt built by PromptFragmentRegistry.assemble
+
+    Attributes:
+        text: Full prompt
+        token_count: Static plus variable tokens (sum of parts; may differ from
+            tokenizing ``text`` by a few tokens at part boundaries)
+        static_tokens: Tokens of the fragments included
+        dynamic_tokens: Tokens of the variable parts (the only text tokenized here)
+        prefix_tokens: Tokens of the leading fragments, before the first variable part
+            (the part of the prompt identical across requests)
+        fragment_ids: Fragments included, in prompt order
+        dropped_fragments: Optional fragments left out to meet the token budget
+        token_budget: Budget the prompt was assembled for (None = unbounded)
+    """
+
+    text: str
+    token_count: int
+    static_tokens: int
+    dynamic_tokens: int
+    prefix_tokens: int = 0
+    fragment_ids: List[str] = field(default_factory=list)
+    dropped_fragments: List[str] = field(default_factory=list)
+    token_budget: Optional[int] = None
+
+    @property
+    def within_budget(self) -> bool:
+        """Whether the prompt fits its token budget"""
+        return self.token_budget is None or self.token_count <= self.token_budget
+
+
+class PromptFragmentRegistry:
+    """
+    Registry of static prompt sections with precomputed token counts
+
+    Usage:
+        fragments = get_prompt_fragments()
+        standards = fragments.static("standards.backend", STANDARDS)
+        warning = fragments.static("backend.final_warning", FINAL_WARNING)
+        prompt = fragments.assemble(
+            [standards, f"Generate code for {entity}\\n", warning],
+            token_budget=fragments.token_budget,
+            optional=["backend.final_warning"],
+        ).text
+    """
+
+    def __init__(self, prompts_dir: Optional[Path] = None, token_budget: Optional[int] = None):
+        """
+        Args:
+            prompts_dir: Directory of prompt files for prompt_file() (default: baes/llm/prompts/)
+            token_budget: Token budget of generation prompts (default: Config.GENERATION_PROMPT_TOKEN_BUDGET)
+        """
+        self.prompts_dir = Path(prompts_dir or DEFAULT_PROMPTS_DIR)
+        self.token_budget = token_budget or Config.GENERATION_PROMPT_TOKEN_BUDGET
+        self._fragments: Dict[str, PromptFragment] = {}
+        self._lock = threading.Lock()
+        self._tokenizations = 0  # Static sections tokenized (registrations with new text)
+
+    def register(self, fragment_id: str, text: str) -> PromptFragment:
+        """
+        Register (or replace) a static section, counting its tokens
+
+        Re-registering identical text returns the existing fragment without
+        re-tokenizing it.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            fragment = self._fragments.get(fragment_id)
+            if fragment is not None and fragment.digest == digest:
+                return fragment
+
+        fragment = PromptFragment(fragment_id, text, estimate_token_count(text), digest)
+        with self._lock:
+            self._fragments[fragment_id] = fragment
+            self._tokenizations += 1
+        logger.debug("Registered prompt fragment %s (%d tokens)", fragment_id, fragment.token_count)
+        return fragment
+
+    def static(self, fragment_id: str, source: Union[str, Callable[[], str]]) -> PromptFragment:
+        """
+        Registered fragment ``fragment_id``, registering ``source`` on first use
+
+        Args:
+            fragment_id: Registry key
+            source: Section text, or a loader called only when the fragment is missing
+        """
+        with self._lock:
+            fragment = self._fragments.get(fragment_id)
+        if fragment is not None:
+            return fragment
+        return self.register(fragment_id, source() if callable(source) else source)
+
+    def get(self, fragment_id: str) -> PromptFragment:
+        """Registered fragment (raises KeyError for unknown ids)"""
+        with self._lock:
+            return self._fragments[fragment_id]
+
+    def prompt_file(self, name: str) -> PromptFragment:
+        """Fragment "prompts.<name>" holding prompts_dir/<name>.txt (read once)"""
+        path = self.prompts_dir / f"{name}.txt"
+        return self.static(f"prompts.{name}", lambda: path.read_text(encoding="utf-8"))
+
+    def assemble(
+        self,
+        parts: Sequence[PromptPart],
+        token_budget: Optional[int] = None,
+        optional: Iterable[str] = (),
+    ) -> AssembledPrompt:
+        """
+        Join prompt parts, counting tokens from the fragments' precomputed counts
+
+        Args:
+            parts: Fragments and variable strings in prompt order (None parts are skipped)
+            token_budget: Maximum prompt tokens (None = unbounded)
+            optional: Fragment ids that may be left out, in dropping order, while
+                the prompt exceeds ``token_budget``
+
+        Returns:
+            AssembledPrompt (check ``within_budget``: required parts are never dropped)
+        """
+        parts = [part for part in parts if part is not None]
+        dynamic_tokens = sum(estimate_token_counts([part for part in parts if isinstance(part, str)]))
+        fragments = {part.fragment_id: part for part in parts if isinstance(part, PromptFragment)}
+        static_tokens = sum(fragment.token_count for fragment in fragments.values())
+
+        dropped: List[str] = []
+        if token_budget is not None:
+            for fragment_id in optional:
+                if static_tokens + dynamic_tokens <= token_budget:
+                    break
+                if fragment_id in fragments and fragment_id not in dropped:
+                    dropped.append(fragment_id)
+                    static_tokens -= fragments[fragment_id].token_count
+
+        kept = [
+            part
+            for part in parts
+            if not (isinstance(part, PromptFragment) and part.fragment_id in dropped)
+        ]
+        prefix_tokens = 0
+        for part in kept:
+            if isinstance(part, str):
+                if part.strip():
+                    break
+                continue  # Separators do not end the static prefix
+            prefix_tokens += part.token_count
+        assembled = AssembledPrompt(
+            text="".join(part if isinstance(part, str) else part.text for part in kept),
+            token_count=static_tokens + dynamic_tokens,
+            static_tokens=static_tokens,
+            dynamic_tokens=dynamic_tokens,
+            prefix_tokens=prefix_tokens,
+            fragment_ids=[part.fragment_id for part in kept if isinstance(part, PromptFragment)],
+            dropped_fragments=dropped,
+            token_budget=token_budget,
+        )
+        if dropped:
+            logger.info(
+                "✂️ Prompt over token budget %d: dropped optional sections %s",
+                token_budget,
+                dropped,
+            )
+        if not assembled.within_budget:
+            logger.warning(
+                "⚠️ Prompt has %d tokens, over the %d token budget",
+                assembled.token_count,
+                token_budget,
+            )
+        return assembled
+
+    def stats(self) -> Dict[str, int]:
+        """Registered fragments, their total tokens and static tokenizations so far"""
+        with self._lock:
+            return {
+                "fragments": len(self._fragments),
+                "static_tokens": sum(f.token_count for f in self._fragments.values()),
+                "tokenizations": self._tokenizations,
+            }
+
+
+_prompt_fragments: Optional[PromptFragmentRegistry] = None
+_prompt_fragments_lock = threading.Lock()
+
+
+def get_prompt_fragments() -> PromptFragmentRegistry:
+    """Process-wide registry shared by every SWEA prompt builder"""
+    global _prompt_fragments
+    with _prompt_fragments_lock:
+        if _prompt_fragments is None:
+            _prompt_fragments = PromptFragmentRegistry()
+        return _prompt_fragments
@@ -0,0 +1,223 @@
+"""
+Deterministic Relationship Compiler for BAES Relationship Requests
+
+Compiles a relationship (primary entity, secondary entity, cardinality), as
+recorded in the ContextStore, into a SQLite migration (ALTER TABLE ... ADD
+COLUMN ... REFERENCES, or a junction table) from templates/fragments/relationships.j2,
+without LLM interpretation or generation. The routes template renders the join
+endpoints from the same fragment, given the relationship's template context.
+
+Naming follows the SQLite schema and routes templates, which import the same
+fragment: a "one" relationship adds <secondary>_id to the primary table, a
+"many" relationship the <primary>_<secondary>s junction table.
+
+Constitutional Compliance:
+- Deterministic: Same relationship, same artifacts (recent compilations are memoized)
+- Semantic coherence: Entity names drive table, column, route and widget names
+- Fail-safe: Unknown relationship types compile as foreign keys (the request's default)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from baes.utils.template_registry import TemplateRegistry
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_TEMPLATE = "fragments/relationships.j2"
+
+# Compiled relationships kept per compiler (least recently used are evicted)
+_MEMO_SIZE = 128
+
+# Relationship types (ContextStore records, BAE interpretations) with a junction table
+_MANY_CARDINALITIES = {"many", "many-to-many", "many_to_many", "manytomany", "n:m"}
+
+
+def normalize_cardinality(relationship_type: Optional[str]) -> str:
+    """Map a relationship type ("foreign_key", "many_to_many", ...) to "one" or "many" """
+    return "many" if str(relationship_type or "").strip().lower() in _MANY_CARDINALITIES else "one"
+
+
+@dataclass(frozen=True)
+class RelationshipSpec:
+    """
+    Relationship of ``primary`` to ``secondary``
+
+    Attributes:
+        primary: Entity holding the relationship (e.g., "Student")
+        secondary: Referenced entity (e.g., "Course")
+        cardinality: "one" (foreign key on primary) or "many" (junction table)
+    """
+
+    primary: str
+    secondary: str
+    cardinality: str = "one"
+
+    @classmethod
+    def create(
+        cls, primary: str, secondary: str, relationship_type: Optional[str] = None
+    ) -> "RelationshipSpec":
+        """Spec with capitalized entity names and normalized cardinality"""
+        return cls(
+            primary=primary.strip().capitalize(),
+            secondary=secondary.strip().capitalize(),
+            cardinality=normalize_cardinality(relationship_type),
+        )
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "RelationshipSpec":
+        """Spec from a ContextStore relationship record (see store_entity_relationship)"""
+        return cls.create(
+            record["primary_entity"], record["related_entity"], record.get("relationship_type")
+        )
+
+    @property
+    def rel_name(self) -> str:
+        """Relationship name in templates: "course" (one) or "courses" (many)"""
+        secondary_lower = self.secondary.lower()
+        return secondary_lower if self.cardinality == "one" else secondary_lower + "s"
+
+    @property
+    def foreign_key(self) -> Optional[str]:
+        """Foreign key column on the primary table (None for junction tables)"""
+        return f"{self.rel_name}_id" if self.cardinality == "one" else None
+
+    @property
+    def junction_table(self) -> Optional[str]:
+        """Junction table name (None for foreign keys)"""
+        return f"{self.primary.lower()}_{self.rel_name}" if self.cardinality == "many" else None
+
+    @property
+    def field_name(self) -> str:
+        """Request/form field carrying the relationship: "course_id" or "course_ids" """
+        return self.foreign_key or f"{self.secondary.lower()}_ids"
+
+    def template_relationships(self) -> Dict[str, Dict[str, str]]:
+        """Entry of the ``relationships`` context of the schema and routes templates"""
+        return {self.rel_name: {"type": self.secondary, "cardinality": self.cardinality}}
+
+
+@dataclass
+class CompiledRelationship:
+    """
+    Artifacts of one relationship
+
+    Attributes:
+        spec: Compiled relationship
+        migration_sql: SQLite script adding the foreign key column or junction table
+        compile_time_ms: Rendering time
+    """
+
+    spec: RelationshipSpec
+    migration_sql: str
+    compile_time_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form for SWEA task payloads"""
+        data = asdict(self)
+        data.update(
+            rel_name=self.spec.rel_name,
+            foreign_key=self.spec.foreign_key,
+            junction_table=self.spec.junction_table,
+            field_name=self.spec.field_name,
+        )
+        return data
+
+
+class RelationshipCompiler:
+    """
+    Renders relationship artifacts from the relationships fragment
+
+    Usage:
+        compiler = get_relationship_compiler()
+        compiled = compiler.compile(RelationshipSpec.create("Student", "Course"))
+        conn.executescript(compiler.migration_sql(compiled.spec, existing_columns))
+    """
+
+    def __init__(self, registry: Optional[TemplateRegistry] = None):
+        """
+        Args:
+            registry: Registry whose Jinja2 environment (filters, bytecode cache) renders
+                the fragment (default: a new TemplateRegistry)
+        """
+        self.registry = registry or TemplateRegistry()
+        self._memo: "OrderedDict[RelationshipSpec, CompiledRelationship]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def _macros(self):
+        """Module of the relationships fragment (macros are its attributes)"""
+        return self.registry.env.get_template(FRAGMENT_TEMPLATE).module
+
+    def compile(self, spec: RelationshipSpec) -> CompiledRelationship:
+        """
+        Compile every artifact of ``spec``
+
+        Args:
+            spec: Relationship to compile
+
+        Returns:
+            CompiledRelationship (the migration assumes the foreign key column is missing;
+            use migration_sql() against an existing table)
+        """
+        with self._lock:
+            compiled = self._memo.get(spec)
+            if compiled is not None:
+                self._memo.move_to_end(spec)
+                return compiled
+
+        start_time = time.perf_counter()
+        compiled = CompiledRelationship(
+            spec=spec,
+            migration_sql=self.migration_sql(spec),
+            compile_time_ms=(time.perf_counter() - start_time) * 1000,
+        )
+        with self._lock:
+            self._memo[spec] = compiled
+            if len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+        logger.info(
+            "🔗 Compiled relationship %s -> %s (%s) in %.1fms",
+            spec.primary,
+            spec.secondary,
+            spec.cardinality,
+            compiled.compile_time_ms,
+        )
+        return compiled
+
+    def compile_records(self, records: Iterable[Dict[str, Any]]) -> List[CompiledRelationship]:
+        """Compile ContextStore relationship records"""
+        return [self.compile(RelationshipSpec.from_record(record)) for record in records]
+
+    def migration_sql(self, spec: RelationshipSpec, existing_columns: Iterable[str] = ()) -> str:
+        """
+        SQLite script applying ``spec`` (idempotent given the current columns)
+
+        Args:
+            spec: Relationship to apply
+            existing_columns: Current columns of the primary table; the ALTER TABLE
+                statement is left out when the foreign key column already exists
+        """
+        add_column = spec.foreign_key not in set(existing_columns)
+        return str(
+            self._macros.sql_migration(
+                spec.primary, spec.rel_name, spec.secondary, spec.cardinality, add_column
+            )
+        )
+
+
+_relationship_compiler: Optional[RelationshipCompiler] = None
+_relationship_compiler_lock = threading.Lock()
+
+
+def get_relationship_compiler() -> RelationshipCompiler:
+    """Process-wide compiler (shares the compiled fragment and the artifact memo)"""
+    global _relationship_compiler
+    with _relationship_compiler_lock:
+        if _relationship_compiler is None:
+            _relationship_compiler = RelationshipCompiler()
+        return _relationship_compiler
@@ -0,0 +1,172 @@
+"""
+Batched LLM review of concurrently reviewed artifacts.
+
+When TechLeadSWEA reviews several artifacts of one execution wave, every
+artifact whose rule-based verdict is uncertain would otherwise cost its own
+LLM validation round trip. ``ReviewBatch`` is a barrier-style collector: each
+concurrent review registers as a participant, and when it reaches the LLM
+validation step it submits a request and blocks. Once every unfinished
+participant is waiting, the pending requests are flushed together through one
+callback (a single structured JSON call with per-artifact verdicts) and each
+participant receives its own verdict.
+
+Reviews whose verdicts are decided without the LLM (rules, standards, verdict
+cache) simply ``leave()`` the batch, so they never hold the others back. A
+participant that waits longer than ``max_wait`` flushes whatever is pending, so
+a slow or blocked peer can delay a batch but never deadlock it.
+
+The sequential coordination loop reviews one artifact at a time, so there are
+no concurrent peers to batch with. Inside ``defer_llm_review()`` TechLeadSWEA
+does not call the LLM for an uncertain artifact: it returns a provisional
+verdict marked ``llm_review_deferred``. The kernel defers only artifacts that no
+later plan task consumes, sends them through one ``review_batch`` task before the
+final system review, and re-runs rejected ones through its regular retry loop.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-safe: Flush errors are delivered to every waiting participant
+- Observability: Batch sizes are logged per flush
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_batch: contextvars.ContextVar[Optional["ReviewBatch"]] = contextvars.ContextVar(
+    "baes_review_batch", default=None
+)
+
+
+def current_review_batch() -> Optional["ReviewBatch"]:
+    """The review batch the current review participates in, if any."""
+    return _current_batch.get()
+
+
+_deferring_llm_review: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "baes_defer_llm_review", default=False
+)
+
+
+def llm_review_deferred() -> bool:
+    """Whether LLM validations of the current review are postponed to a later batch."""
+    return _deferring_llm_review.get()
+
+
+@contextlib.contextmanager
+def defer_llm_review() -> Iterator[None]:
+    """Postpone the LLM validations of the enclosed review to a later review_batch task."""
+    token = _deferring_llm_review.set(True)
+    try:
+        yield
+    finally:
+        _deferring_llm_review.reset(token)
+
+
+@contextlib.contextmanager
+def review_batch_scope(batch: "ReviewBatch") -> Iterator["ReviewBatch"]:
+    """Run a participant's review inside ``batch`` and leave it when the review ends."""
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _current_batch.reset(token)
+        batch.leave()
+
+
+@dataclass(eq=False)
+class _PendingReview:
+    """A submitted review request and, once flushed, its result."""
+
+    request: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class ReviewBatch:
+    """
+    Collects review requests from concurrent participants and flushes them together.
+
+    Args:
+        participants: Number of concurrent reviews that may submit requests
+        flush: Callback reviewing a list of requests, returning one result per request
+        max_wait: Seconds a participant waits for its peers before flushing on its own
+    """
+
+    def __init__(
+        self,
+        participants: int,
+        flush: Callable[[List[Any]], List[Any]],
+        max_wait: float = 30.0,
+    ):
+        self._active = participants
+        self._flush = flush
+        self._max_wait = max_wait
+        self._pending: List[_PendingReview] = []
+        self._lock = threading.Lock()
+        self.flush_sizes: List[int] = []
+
+    def submit(self, request: Any) -> Any:
+        """Queue ``request`` and block until the batch containing it has been reviewed."""
+        entry = _PendingReview(request)
+        with self._lock:
+            self._pending.append(entry)
+            ready = self._take_ready()
+        if ready:
+            self._run(ready)
+
+        if not entry.done.wait(self._max_wait):
+            with self._lock:
+                ready = self._take_all() if entry in self._pending else []
+            if ready:
+                logger.info("⏱️  Review batch timed out, flushing %d pending review(s)", len(ready))
+                self._run(ready)
+            entry.done.wait()
+
+        if entry.error is not None:
+            raise entry.error
+        return entry.result
+
+    def leave(self) -> None:
+        """Mark one participant as finished; flushes if everyone left is waiting."""
+        with self._lock:
+            self._active -= 1
+            ready = self._take_ready()
+        if ready:
+            self._run(ready)
+
+    def _take_ready(self) -> List[_PendingReview]:
+        """Pending requests if every active participant is waiting (must hold lock)"""
+        if self._pending and len(self._pending) >= self._active:
+            return self._take_all()
+        return []
+
+    def _take_all(self) -> List[_PendingReview]:
+        """Remove and return all pending requests (must hold lock)"""
+        ready, self._pending = self._pending, []
+        return ready
+
+    def _run(self, entries: List[_PendingReview]) -> None:
+        """Review ``entries`` through the flush callback and wake their participants."""
+        self.flush_sizes.append(len(entries))
+        logger.info("📦 Reviewing %d artifact(s) in one batch", len(entries))
+        try:
+            results = self._flush([entry.request for entry in entries])
+            if len(results) != len(entries):
+                raise ValueError(
+                    f"Batch review returned {len(results)} results for {len(entries)} requests"
+                )
+            for entry, result in zip(entries, results):
+                entry.result = result
+        except BaseException as e:
+            for entry in entries:
+                entry.error = e
+        finally:
+            for entry in entries:
+                entry.done.set()
+
@@ -0,0 +1,200 @@
+"""
+Speculative parallel execution of candidate generations.
+
+For tasks whose artifacts are frequently rejected by TechLeadSWEA, the kernel can
+generate several candidates concurrently, screen them with a cheap validator
+(the rule engine) and forward the first acceptable one to review. Remaining
+candidates are cancelled cooperatively:
+
+- Each candidate runs with a ``CandidateToken`` in its context (``contextvars``).
+- ``OpenAIClient.generate_response`` consults the token: candidates other than the
+  first are sampled with a higher temperature for diversity, and cancelled
+  candidates skip their LLM calls (raising ``SpeculationCancelled``).
+- Managed system file writes are skipped for cancelled candidates, so a losing
+  candidate can never overwrite the selected artifact.
+
+Constitutional Compliance:
+- PEP 8: Type hints, docstrings, snake_case naming
+- Fail-safe: Candidate failures are collected, never propagated to the caller
+- Observability: Every candidate runs inside its own execution trace span
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+from baes.utils.execution_trace import span
+
+logger = logging.getLogger(__name__)
+
+_current_candidate: contextvars.ContextVar[Optional["CandidateToken"]] = contextvars.ContextVar(
+    "baes_speculative_candidate", default=None
+)
+
+
+class SpeculationCancelled(Exception):
+    """Raised inside a candidate whose speculative generation was cancelled."""
+
+
+@dataclass
+class CandidateToken:
+    """Identity and cancellation state of one speculative candidate.
+
+    Attributes:
+        index: Candidate number (0 is the baseline candidate)
+        temperature: Sampling temperature override for LLM calls (None keeps the default)
+        cancel_event: Set when another candidate has been selected
+    """
+
+    index: int
+    temperature: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether this candidate has been cancelled."""
+        return self.cancel_event.is_set()
+
+
+@dataclass
+class SpeculativeOutcome:
+    """Result of a speculative generation round.
+
+    Attributes:
+        result: Selected candidate result (None if every candidate failed)
+        winner_index: Index of the selected candidate (-1 if none)
+        accepted: Whether the selected candidate passed the screening predicate
+        score: Screening score of the selected candidate
+        candidates_started: Number of candidates launched
+        candidates_completed: Number of candidates that finished before selection
+        candidates_cancelled: Number of candidates cancelled after selection
+        elapsed_ms: Wall time until a candidate was selected
+        errors: Error messages of failed candidates
+    """
+
+    result: Optional[Any] = None
+    winner_index: int = -1
+    accepted: bool = False
+    score: float = float("-inf")
+    candidates_started: int = 0
+    candidates_completed: int = 0
+    candidates_cancelled: int = 0
+    elapsed_ms: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+def current_candidate() -> Optional[CandidateToken]:
+    """Return the speculative candidate running in this context, if any."""
+    return _current_candidate.get()
+
+
+def is_cancelled() -> bool:
+    """True when running inside a speculative candidate that has been cancelled."""
+    candidate = _current_candidate.get()
+    return candidate is not None and candidate.cancelled
+
+
+def run_speculative(
+    generate: Callable[[int], Any],
+    screen: Callable[[Any], Tuple[bool, float]],
+    candidates: int,
+    temperature: Optional[float] = None,
+    name: str = "speculative",
+) -> SpeculativeOutcome:
+    """Run ``candidates`` generations concurrently and select one.
+
+    Args:
+        generate: Callable producing a candidate result, given its index
+        screen: Callable returning (accepted, score) for a candidate result
+        candidates: Number of concurrent candidates (k)
+        temperature: Sampling temperature for candidates other than the first
+        name: Span name prefix used in the execution trace
+
+    Returns:
+        SpeculativeOutcome with the first accepted candidate, or the best-scoring
+        candidate when none is accepted.
+    """
+    outcome = SpeculativeOutcome(candidates_started=max(1, candidates))
+    tokens = [
+        CandidateToken(index=i, temperature=None if i == 0 else temperature)
+        for i in range(outcome.candidates_started)
+    ]
+    start = time.perf_counter()
+
+    def run_candidate(token: CandidateToken) -> Any:
+        _current_candidate.set(token)
+        with span(f"{name}:candidate{token.index}", category="speculative"):
+            if token.cancelled:
+                raise SpeculationCancelled()
+            return generate(token.index)
+
+    executor = ThreadPoolExecutor(
+        max_workers=outcome.candidates_started, thread_name_prefix="baes-speculative"
+    )
+    futures: dict = {}
+    try:
+        for token in tokens:
+            # Each candidate gets its own copy of the caller's context (trace, request scope)
+            context = contextvars.copy_context()
+            futures[executor.submit(context.run, run_candidate, token)] = token
+
+        pending = set(futures)
+        best: Optional[Tuple[float, int, Any]] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: futures[f].index):
+                token = futures[future]
+                result, error = _future_result(future)
+                if error is not None:
+                    outcome.errors.append(f"candidate {token.index}: {error}")
+                    continue
+                outcome.candidates_completed += 1
+                try:
+                    accepted, score = screen(result)
+                except Exception as e:
+                    outcome.errors.append(f"candidate {token.index}: screening failed: {e}")
+                    continue
+                if accepted:
+                    outcome.result, outcome.winner_index = result, token.index
+                    outcome.accepted, outcome.score = True, score
+                    pending = set()
+                    break
+                if best is None or score > best[0]:
+                    best = (score, token.index, result)
+
+        if not outcome.accepted and best is not None:
+            outcome.score, outcome.winner_index, outcome.result = best
+    finally:
+        # Cancel everything that was not selected; running LLM calls finish in the
+        # background, but their results and file writes are discarded.
+        for future, token in futures.items():
+            if token.index != outcome.winner_index and not future.done():
+                token.cancel_event.set()
+                future.cancel()
+                outcome.candidates_cancelled += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+        outcome.elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    logger.debug(
+        "⚡ Speculative %s: winner=%d accepted=%s completed=%d cancelled=%d (%.0fms)",
+        name,
+        outcome.winner_index,
+        outcome.accepted,
+        outcome.candidates_completed,
+        outcome.candidates_cancelled,
+        outcome.elapsed_ms,
+    )
+    return outcome
+
+
+def _future_result(future: Future) -> Tuple[Any, Optional[str]]:
+    try:
+        return future.result(), None
+    except SpeculationCancelled:
+        return None, "cancelled"
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
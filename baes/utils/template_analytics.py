@@ -0,0 +1,156 @@
+"""
+Template Coverage Analytics for BAES Template-Based Generation
+
+Records every template decision made by TemplateRegistry.render_template: which
+template served an artifact (and the tokens it saved), or why generation fell
+back to the LLM. Fallbacks are grouped by reason, so the coverage report ranks
+the missing templates and custom-logic fragments by the generation tokens they
+cost, pointing at the next template worth writing. The report is published in
+the metrics snapshots (metrics_tracker.flush_snapshot) and the kernel daemon's
+"ping" status.
+
+Fallback reasons are normalized to stable keys:
+- "custom_entity": Entity classified CUSTOM
+- "unsupported_logic:<kind>": Custom logic kind no template composes
+- "no_template": No template for the SWEA type (or requested id/dialect)
+- "template_error:<template_id>": Missing file, missing context or rendering error
+
+Constitutional Compliance:
+- Observability: Template-served share and token cost of fallbacks per SWEA
+- Fail-safe: Recording never raises into template rendering
+- Thread-safe: Counters protected by threading.Lock (SWEAs run concurrently)
+"""
+
+import logging
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Generation tokens of an LLM-generated artifact (same baseline as TemplateRegistry savings)
+BASELINE_GENERATION_TOKENS = 1500
+
+
+class TemplateCoverageAnalytics:
+    """
+    Per-template hit and per-reason fallback counters
+
+    Usage:
+        analytics = get_template_analytics()
+        analytics.record_hit("backend", "backend_routes_sqlite", 1500, ["enum_fields"])
+        analytics.record_fallback("frontend", "unsupported_logic:state_machine")
+        report = analytics.coverage_report()
+    """
+
+    def __init__(self, baseline_tokens: int = BASELINE_GENERATION_TOKENS):
+        self.baseline_tokens = baseline_tokens
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()  # (swea_type, template_id) -> renders
+        self._tokens_saved: Counter = Counter()  # (swea_type, template_id) -> tokens
+        self._fragments: Counter = Counter()  # custom logic kind -> composed renders
+        self._fallbacks: Counter = Counter()  # (swea_type, reason_key) -> fallbacks
+
+    def record_hit(
+        self,
+        swea_type: str,
+        template_id: str,
+        tokens_saved: int,
+        logic_kinds: Iterable[str] = (),
+    ):
+        """Record an artifact served by ``template_id`` (composing ``logic_kinds`` fragments)"""
+        with self._lock:
+            self._hits[(swea_type, template_id)] += 1
+            self._tokens_saved[(swea_type, template_id)] += tokens_saved
+            for kind in logic_kinds:
+                self._fragments[kind] += 1
+
+    def record_fallback(self, swea_type: str, reason_key: str):
+        """Record an artifact that needs LLM generation, by normalized reason"""
+        with self._lock:
+            self._fallbacks[(swea_type, reason_key)] += 1
+        logger.debug("Template fallback recorded: %s (%s)", reason_key, swea_type)
+
+    def coverage_report(self) -> Dict[str, Any]:
+        """
+        Template-served share per SWEA type and fallbacks ranked by token cost
+
+        Returns:
+            {
+                "served_share": float,  # Share of artifacts served by templates
+                "by_swea": {swea_type: {"served": int, "fallbacks": int, "served_share": float}},
+                "templates": [{"swea_type", "template_id", "renders", "tokens_saved"}, ...],
+                "fragments": {logic_kind: composed renders},
+                "fallbacks": [{"swea_type", "reason", "count", "estimated_tokens"}, ...],
+            }
+        """
+        with self._lock:
+            hits = dict(self._hits)
+            tokens_saved = dict(self._tokens_saved)
+            fragments = dict(self._fragments)
+            fallbacks = dict(self._fallbacks)
+
+        by_swea: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"served": 0, "fallbacks": 0})
+        for (swea_type, _), count in hits.items():
+            by_swea[swea_type]["served"] += count
+        for (swea_type, _), count in fallbacks.items():
+            by_swea[swea_type]["fallbacks"] += count
+        for stats in by_swea.values():
+            stats["served_share"] = _share(stats["served"], stats["fallbacks"])
+
+        served = sum(hits.values())
+        return {
+            "served_share": _share(served, sum(fallbacks.values())),
+            "by_swea": dict(by_swea),
+            "templates": sorted(
+                (
+                    {
+                        "swea_type": swea_type,
+                        "template_id": template_id,
+                        "renders": count,
+                        "tokens_saved": tokens_saved.get((swea_type, template_id), 0),
+                    }
+                    for (swea_type, template_id), count in hits.items()
+                ),
+                key=lambda entry: -entry["tokens_saved"],
+            ),
+            "fragments": fragments,
+            "fallbacks": sorted(
+                (
+                    {
+                        "swea_type": swea_type,
+                        "reason": reason,
+                        "count": count,
+                        "estimated_tokens": count * self.baseline_tokens,
+                    }
+                    for (swea_type, reason), count in fallbacks.items()
+                ),
+                key=lambda entry: -entry["estimated_tokens"],
+            ),
+        }
+
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self._hits.clear()
+            self._tokens_saved.clear()
+            self._fragments.clear()
+            self._fallbacks.clear()
+
+
+def _share(served: int, fallbacks: int) -> float:
+    total = served + fallbacks
+    return served / total if total else 0.0
+
+
+_template_analytics: Optional[TemplateCoverageAnalytics] = None
+_template_analytics_lock = threading.Lock()
+
+
+def get_template_analytics() -> TemplateCoverageAnalytics:
+    """Process-wide analytics shared by every TemplateRegistry"""
+    global _template_analytics
+    with _template_analytics_lock:
+        if _template_analytics is None:
+            _template_analytics = TemplateCoverageAnalytics()
+        return _template_analytics
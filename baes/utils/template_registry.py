@@ -4,6 +4,17 @@ Template Registry for BAES Performance Optimization
 This module implements template-based code generation using Jinja2 templates,
 reducing token consumption by 40-60% for standard CRUD operations.
 
+Standard CRUD templates compose small custom-logic fragments (enum fields,
+uniqueness checks, foreign keys; baes/templates/fragments/),
+and selection ranks every template able to serve an entity by suitability.
+Each decision is recorded in the template coverage analytics.
+
+Templates are selected through an index by (SWEA type, entity type), compiled
+templates persist in a Jinja2 bytecode cache on disk, and rendered output is
+memoized by (template_id, mtimes of the template and the fragments it imports,
+canonicalized context), so repeated
+renders during batch generation skip Jinja2 entirely.
+
 Constitutional Compliance:
 - PEP 8: All templates follow PEP 8 style guide (snake_case, 4-space indent)
 - DRY: Centralized template storage prevents duplicate generation logic
@@ -17,15 +28,23 @@ Author: BAES Development Team
 Created: 2025
 """
 
+import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import jinja2
+import jinja2.meta
+
+from config import Config
+
+from .template_analytics import get_template_analytics
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +80,8 @@ class TemplateMetadata:
         target_token_savings: Estimated token reduction vs LLM generation (percentage)
         version: Template version for cache invalidation
         created_at: Template creation timestamp
+        dialect: Target SQL dialect for database templates (None = dialect-independent)
+        supported_logic: Custom logic kinds the template composes from fragments
     """
 
     template_id: str
@@ -72,6 +93,8 @@ class TemplateMetadata:
     target_token_savings: float = 0.5  # Default 50% savings
     version: str = "1.0.0"
     created_at: datetime = field(default_factory=datetime.now)
+    dialect: Optional[str] = None
+    supported_logic: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -85,8 +108,12 @@ class TemplateInput:
         swea_type: Target SWEA agent type
         attributes: Entity attributes with types (e.g., {"name": "str", "gpa": "float"})
         relationships: Entity relationships (e.g., {"courses": {"type": "Course", "cardinality": "many"}})
-        custom_logic: Dictionary of custom business rules (empty for standard entities)
+        custom_logic: Custom logic by kind, composed from template fragments when supported:
+            {"enum_fields": {"status": ["active", "inactive"]}, "unique_fields": ["email"],
+             "foreign_keys": {"course_id": "Course"}}
         additional_context: Extra context variables for template rendering
+        template_id: Explicit template to render (None = select by SWEA type)
+        dialect: Required SQL dialect (e.g., "sqlite"); None = any dialect
     """
 
     entity_name: str
@@ -96,6 +123,8 @@ class TemplateInput:
     relationships: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     custom_logic: Dict[str, Any] = field(default_factory=dict)
     additional_context: Dict[str, Any] = field(default_factory=dict)
+    template_id: Optional[str] = None
+    dialect: Optional[str] = None
 
 
 @dataclass
@@ -147,12 +176,15 @@ class TemplateRegistry:
             print(f"Fallback to LLM: {output.fallback_reason}")
     """
 
-    def __init__(self, template_base_dir: Optional[Path] = None):
+    def __init__(
+        self, template_base_dir: Optional[Path] = None, bytecode_cache_dir: Optional[Path] = None
+    ):
         """
         Initialize TemplateRegistry with Jinja2 environment
 
         Args:
             template_base_dir: Base directory for template files (default: baes/templates/)
+            bytecode_cache_dir: Jinja2 bytecode cache directory (default: TEMPLATE_BYTECODE_CACHE_DIR)
         """
         if template_base_dir is None:
             # Default to baes/templates/ relative to this file's location
@@ -162,6 +194,16 @@ class TemplateRegistry:
 
         self.template_base_dir = template_base_dir
 
+        # Bytecode cache: compiled templates are reused across processes and registries
+        bytecode_cache = None
+        if Config.ENABLE_TEMPLATE_CACHE:
+            cache_dir = Path(bytecode_cache_dir or Config.TEMPLATE_BYTECODE_CACHE_DIR)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+            except OSError as e:
+                logger.warning("Template bytecode cache disabled (%s): %s", cache_dir, e)
+
         # Jinja2 environment configuration for code generation
         self.env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(template_base_dir)),
@@ -169,10 +211,20 @@ class TemplateRegistry:
             lstrip_blocks=True,  # Strip leading whitespace from block
             keep_trailing_newline=True,  # Preserve final newline (PEP 8)
             autoescape=False,  # Disable HTML escaping for code generation
+            bytecode_cache=bytecode_cache,
         )
 
-        # Template metadata catalog (populated lazily)
+        # Rendered output memo (LRU): (template_id, template and import mtimes, canonical context) -> code
+        self._render_cache: "OrderedDict[Tuple[str, Tuple[int, ...], str], str]" = OrderedDict()
+        # Templates imported/included by each template, with the template mtime they were parsed at
+        self._template_references: Dict[str, Tuple[int, List[str]]] = {}
+        self._render_cache_lock = threading.Lock()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+
+        # Template metadata catalog and selection index (populated lazily)
         self._template_catalog: Dict[str, TemplateMetadata] = {}
+        self._template_index: Dict[Tuple[SWEAType, EntityType], List[TemplateMetadata]] = {}
         self._load_template_catalog()
 
         # Register custom Jinja2 filters for code generation
@@ -192,6 +244,7 @@ class TemplateRegistry:
         - snake_case: Convert string to snake_case (e.g., "StudentName" -> "student_name")
         - pascal_case: Convert string to PascalCase (e.g., "student_name" -> "StudentName")
         - python_type: Convert simple type string to Python type hint (e.g., "string" -> "str")
+        - python_string / sql_string: Quote a value as a Python / SQL string literal
         """
 
         def snake_case_filter(value: str) -> str:
@@ -243,6 +296,8 @@ class TemplateRegistry:
         self.env.filters["snake_case"] = snake_case_filter
         self.env.filters["pascal_case"] = pascal_case_filter
         self.env.filters["python_type"] = python_type_filter
+        self.env.filters["python_string"] = lambda value: json.dumps(str(value))
+        self.env.filters["sql_string"] = lambda value: "'" + str(value).replace("'", "''") + "'"
 
         logger.debug("Registered custom Jinja2 filters: snake_case, pascal_case, python_type")
 
@@ -255,14 +310,21 @@ class TemplateRegistry:
             backend/
                 model_crud.py.j2
                 routes_crud.py.j2
+                routes_sqlite.py.j2
             database/
+                schema_sqlite.sql.j2
                 schema_crud.sql.j2
             frontend/
+                streamlit_page.py.j2
                 streamlit_form.py.j2
                 streamlit_table.py.j2
             tests/
                 integration_crud.py.j2
+            fragments/
+                enum_fields.j2, unique_fields.j2, foreign_keys.j2,
+                integrity_errors.j2, streamlit.j2
         """
+        composable_logic = ["enum_fields", "unique_fields", "foreign_keys"]
         # Define expected templates (will be created in subsequent tasks)
         expected_templates = [
             TemplateMetadata(
@@ -283,14 +345,46 @@ class TemplateRegistry:
                 optional_context={"base_path": "/api", "pagination": True},
                 target_token_savings=0.6,
             ),
+            TemplateMetadata(
+                template_id="backend_routes_sqlite",
+                swea_type=SWEAType.BACKEND,
+                description="Self-contained FastAPI CRUD router with Pydantic models and sqlite3 (managed system)",
+                file_path=self.template_base_dir / "backend" / "routes_sqlite.py.j2",
+                required_context=["entity_name", "attributes"],
+                optional_context={"custom_logic": {}},
+                target_token_savings=1.0,
+                supported_logic=composable_logic,
+            ),
+            TemplateMetadata(
+                template_id="database_schema_sqlite",
+                swea_type=SWEAType.DATABASE,
+                description="SQLite CREATE TABLE with updated_at trigger and relationship tables",
+                file_path=self.template_base_dir / "database" / "schema_sqlite.sql.j2",
+                required_context=["entity_name", "attributes"],
+                optional_context={"indexes": []},
+                target_token_savings=1.0,
+                dialect="sqlite",
+                supported_logic=composable_logic,
+            ),
             TemplateMetadata(
                 template_id="database_schema_crud",
                 swea_type=SWEAType.DATABASE,
-                description="PostgreSQL/SQLite CREATE TABLE with indexes and constraints",
+                description="PostgreSQL CREATE TABLE with indexes, constraints and plpgsql trigger",
                 file_path=self.template_base_dir / "database" / "schema_crud.sql.j2",
                 required_context=["entity_name", "attributes"],
                 optional_context={"indexes": [], "constraints": []},
                 target_token_savings=0.4,
+                dialect="postgresql",
+            ),
+            TemplateMetadata(
+                template_id="frontend_streamlit_crud",
+                swea_type=SWEAType.FRONTEND,
+                description="Streamlit management page: cached, paginated list with create/edit/delete",
+                file_path=self.template_base_dir / "frontend" / "streamlit_page.py.j2",
+                required_context=["entity_name", "attributes"],
+                optional_context={"custom_logic": {}, "page_size": 50, "cache_ttl": 30},
+                target_token_savings=1.0,
+                supported_logic=["foreign_keys"],
             ),
             TemplateMetadata(
                 template_id="frontend_streamlit_form",
@@ -298,17 +392,24 @@ class TemplateRegistry:
                 description="Streamlit create/update form with validation",
                 file_path=self.template_base_dir / "frontend" / "streamlit_form.py.j2",
                 required_context=["entity_name", "attributes"],
-                optional_context={"form_mode": "create", "validation_rules": {}},
+                optional_context={
+                    "custom_logic": {},
+                    "form_mode": "create",
+                    "page_size": 50,
+                    "cache_ttl": 30,
+                },
                 target_token_savings=0.5,
+                supported_logic=["foreign_keys"],
             ),
             TemplateMetadata(
                 template_id="frontend_streamlit_table",
                 swea_type=SWEAType.FRONTEND,
-                description="Streamlit list view with pagination and filters",
+                description="Streamlit list view with cached, paginated reads",
                 file_path=self.template_base_dir / "frontend" / "streamlit_table.py.j2",
                 required_context=["entity_name", "attributes"],
-                optional_context={"page_size": 20, "sortable": True},
+                optional_context={"custom_logic": {}, "page_size": 50, "cache_ttl": 30},
                 target_token_savings=0.5,
+                supported_logic=["foreign_keys"],
             ),
             TemplateMetadata(
                 template_id="test_integration_crud",
@@ -321,8 +422,13 @@ class TemplateRegistry:
             ),
         ]
 
+        # Index by (swea_type, entity_type) in catalog order; templates only serve STANDARD
+        # entities, so CUSTOM keys stay empty
         for metadata in expected_templates:
             self._template_catalog[metadata.template_id] = metadata
+            self._template_index.setdefault((metadata.swea_type, EntityType.STANDARD), []).append(
+                metadata
+            )
 
         logger.debug("Loaded %d template metadata entries", len(self._template_catalog))
 
@@ -355,15 +461,43 @@ class TemplateRegistry:
             templates = [t for t in templates if t.swea_type == swea_type]
         return templates
 
+    def _candidate_templates(self, template_input: TemplateInput) -> List[TemplateMetadata]:
+        """Templates of the input's SWEA type (or the requested one) matching its SQL dialect"""
+        if template_input.template_id is not None:
+            requested = self._template_catalog.get(template_input.template_id)
+            candidates = (
+                [requested] if requested and requested.swea_type == template_input.swea_type else []
+            )
+        else:
+            candidates = self._template_index.get(
+                (template_input.swea_type, template_input.entity_type), []
+            )
+        return [t for t in candidates if template_input.dialect in (None, t.dialect)]
+
+    def _missing_logic(self, template_input: TemplateInput) -> List[str]:
+        """Custom logic kinds that the best-covering candidate template cannot compose"""
+        required_logic = set(template_input.custom_logic)
+        candidates = self._candidate_templates(template_input)
+        if not required_logic or not candidates:
+            return []
+        best = max(candidates, key=lambda t: len(required_logic & set(t.supported_logic)))
+        return sorted(required_logic - set(best.supported_logic))
+
+    @staticmethod
+    def _suitability(metadata: TemplateMetadata) -> float:
+        """Suitability score: expected share of the generation served by the template"""
+        return metadata.target_token_savings
+
     def select_template(self, template_input: TemplateInput) -> Optional[TemplateMetadata]:
         """
         Select appropriate template based on entity characteristics
 
         Selection logic:
         1. Check entity_type: CUSTOM entities require LLM generation (no template)
-        2. Match swea_type: Find templates for target SWEA agent
-        3. Verify custom_logic: Non-empty custom_logic triggers LLM fallback
-        4. Return first matching template
+        2. Match swea_type: Find templates for target SWEA agent (and SQL dialect)
+        3. Verify custom_logic: Every custom logic kind must be composable from
+           fragments the template supports, otherwise LLM fallback
+        4. Rank eligible templates by suitability (catalog order breaks ties)
 
         Args:
             template_input: Entity characteristics and context
@@ -381,7 +515,7 @@ class TemplateRegistry:
             ... )
             >>> template = registry.select_template(input)
             >>> template.template_id
-            'backend_model_crud'
+            'backend_routes_sqlite'
 
             # Custom entity -> No template
             >>> input = TemplateInput(
@@ -403,36 +537,37 @@ class TemplateRegistry:
             )
             return None
 
-        # Rule 2: Non-empty custom_logic requires LLM generation
-        if template_input.custom_logic:
-            logger.debug(
-                "Template selection: custom_logic present (%d rules), requires LLM generation for %s",
-                len(template_input.custom_logic),
-                template_input.entity_name,
+        # Rule 2: Find templates matching swea_type (or the explicitly requested one)
+        # and, for database templates, the requested SQL dialect
+        candidates = self._candidate_templates(template_input)
+        if not candidates:
+            logger.warning(
+                "Template selection: no templates found for swea_type=%s%s%s",
+                template_input.swea_type,
+                f" and template_id={template_input.template_id}" if template_input.template_id else "",
+                f" and dialect={template_input.dialect}" if template_input.dialect else "",
             )
             return None
 
-        # Rule 3: Find template matching swea_type
-        matching_templates = [
-            t
-            for t in self._template_catalog.values()
-            if t.swea_type == template_input.swea_type
-        ]
-
-        if not matching_templates:
-            logger.warning(
-                "Template selection: no templates found for swea_type=%s",
-                template_input.swea_type,
+        # Rule 3: Custom logic must be composable from the template's fragments
+        required_logic = set(template_input.custom_logic)
+        eligible = [t for t in candidates if required_logic <= set(t.supported_logic)]
+        if not eligible:
+            logger.debug(
+                "Template selection: custom logic %s not composable, requires LLM generation for %s",
+                self._missing_logic(template_input),
+                template_input.entity_name,
             )
             return None
 
-        # Select first matching template (in future, could rank by suitability)
-        selected_template = matching_templates[0]
+        # Rule 4: Highest suitability wins (max keeps the first of equal scores)
+        selected_template = max(eligible, key=self._suitability)
         logger.info(
-            "Template selected: %s for %s (%s)",
+            "Template selected: %s for %s (%s%s)",
             selected_template.template_id,
             template_input.entity_name,
             template_input.swea_type.value,
+            f", logic: {', '.join(sorted(required_logic))}" if required_logic else "",
         )
         return selected_template
 
@@ -484,6 +619,35 @@ class TemplateRegistry:
             >>> output.fallback_reason
             'Entity type CUSTOM requires LLM generation'
         """
+        output = self._render(template_input)
+        self._record_decision(template_input, output)
+        return output
+
+    def _record_decision(self, template_input: TemplateInput, output: TemplateOutput):
+        """Record a template hit or the normalized fallback reason in the coverage analytics"""
+        swea_type = template_input.swea_type.value
+        try:
+            analytics = get_template_analytics()
+            if output.template_used:
+                analytics.record_hit(
+                    swea_type, output.template_id, output.token_estimate, template_input.custom_logic
+                )
+                return
+            missing_logic = self._missing_logic(template_input)
+            if output.template_id:
+                reason_key = f"template_error:{output.template_id}"
+            elif template_input.entity_type == EntityType.CUSTOM:
+                reason_key = "custom_entity"
+            elif missing_logic:
+                reason_key = f"unsupported_logic:{','.join(missing_logic)}"
+            else:
+                reason_key = "no_template"
+            analytics.record_fallback(swea_type, reason_key)
+        except Exception as e:
+            logger.debug("Template analytics recording failed: %s", e)
+
+    def _render(self, template_input: TemplateInput) -> TemplateOutput:
+        """Select and render a template (see render_template)"""
         import time
 
         start_time = time.time()
@@ -492,10 +656,11 @@ class TemplateRegistry:
         selected_template = self.select_template(template_input)
         if selected_template is None:
             # Determine fallback reason
+            missing_logic = self._missing_logic(template_input)
             if template_input.entity_type == EntityType.CUSTOM:
                 reason = f"Entity type {template_input.entity_type.value.upper()} requires LLM generation"
-            elif template_input.custom_logic:
-                reason = f"Custom logic present ({len(template_input.custom_logic)} rules) requires LLM generation"
+            elif missing_logic:
+                reason = f"Custom logic not composable from template fragments: {', '.join(missing_logic)}"
             else:
                 reason = f"No template available for {template_input.swea_type.value}"
 
@@ -520,13 +685,14 @@ class TemplateRegistry:
                 rendering_time_ms=(time.time() - start_time) * 1000,
             )
 
-        # Step 3: Build rendering context
+        # Step 3: Build rendering context (template defaults first, caller context wins)
         rendering_context = {
+            **selected_template.optional_context,
             "entity_name": template_input.entity_name,
             "attributes": template_input.attributes,
             "relationships": template_input.relationships,
+            "custom_logic": template_input.custom_logic,
             **template_input.additional_context,
-            **selected_template.optional_context,
         }
 
         # Validate required context variables present
@@ -549,12 +715,16 @@ class TemplateRegistry:
                 rendering_time_ms=(time.time() - start_time) * 1000,
             )
 
-        # Step 4: Render template
+        # Step 4: Render template (or reuse the memoized output for the same context)
         try:
-            template = self.env.get_template(
-                str(selected_template.file_path.relative_to(self.template_base_dir))
-            )
-            generated_code = template.render(**rendering_context)
+            cache_key = self._render_cache_key(selected_template, rendering_context)
+            generated_code = self._get_cached_render(cache_key)
+            if generated_code is None:
+                template = self.env.get_template(
+                    str(selected_template.file_path.relative_to(self.template_base_dir))
+                )
+                generated_code = template.render(**rendering_context)
+                self._store_render(cache_key, generated_code)
 
             # Estimate token savings (baseline: 1500 tokens for LLM generation)
             baseline_tokens = 1500
@@ -622,5 +792,92 @@ class TemplateRegistry:
                 rendering_time_ms=(time.time() - start_time) * 1000,
             )
 
+    def _render_cache_key(
+        self, metadata: TemplateMetadata, context: Dict[str, Any]
+    ) -> Optional[Tuple[str, Tuple[int, ...], str]]:
+        """
+        Memo key for rendering ``metadata`` with ``context``
 
+        Top-level context keys are sorted; nested values keep their order because
+        attribute order determines field and column order in the output.
 
+        Returns:
+            (template_id, mtimes of the template and its imports, canonical context),
+            or None when the output is not memoized (cache disabled, context not
+            JSON-serializable)
+        """
+        if not Config.ENABLE_TEMPLATE_CACHE or Config.TEMPLATE_RENDER_CACHE_ENTRIES <= 0:
+            return None
+        try:
+            canonical_context = json.dumps(sorted(context.items()))
+            mtimes = self._template_mtimes(
+                metadata.file_path.relative_to(self.template_base_dir).as_posix()
+            )
+        except (TypeError, ValueError, OSError):
+            return None
+        return (metadata.template_id, mtimes, canonical_context)
+
+    def _template_mtimes(self, name: str) -> Tuple[int, ...]:
+        """mtimes of template ``name`` and of every template it imports or includes"""
+        mtimes = []
+        pending, seen = [name], set()
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            path = self.template_base_dir / current
+            mtime_ns = path.stat().st_mtime_ns
+            mtimes.append(mtime_ns)
+            pending.extend(self._referenced_templates(current, path, mtime_ns))
+        return tuple(mtimes)
+
+    def _referenced_templates(self, name: str, path: Path, mtime_ns: int) -> List[str]:
+        """Templates ``name`` imports or includes (parsed again only when it changes)"""
+        cached = self._template_references.get(name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        source = path.read_text(encoding="utf-8")
+        references = [
+            reference
+            for reference in jinja2.meta.find_referenced_templates(self.env.parse(source))
+            if reference is not None  # Dynamic names cannot be resolved statically
+        ]
+        self._template_references[name] = (mtime_ns, references)
+        return references
+
+    def _get_cached_render(
+        self, cache_key: Optional[Tuple[str, Tuple[int, ...], str]]
+    ) -> Optional[str]:
+        """Memoized output for ``cache_key`` (None on a miss)"""
+        if cache_key is None:
+            return None
+        with self._render_cache_lock:
+            generated_code = self._render_cache.get(cache_key)
+            if generated_code is None:
+                self._render_cache_misses += 1
+                return None
+            self._render_cache.move_to_end(cache_key)
+            self._render_cache_hits += 1
+            return generated_code
+
+    def _store_render(
+        self, cache_key: Optional[Tuple[str, Tuple[int, ...], str]], generated_code: str
+    ):
+        """Memoize rendered output, evicting the least recently used entries"""
+        if cache_key is None:
+            return
+        with self._render_cache_lock:
+            self._render_cache[cache_key] = generated_code
+            self._render_cache.move_to_end(cache_key)
+            while len(self._render_cache) > Config.TEMPLATE_RENDER_CACHE_ENTRIES:
+                self._render_cache.popitem(last=False)
+
+    def render_cache_stats(self) -> Dict[str, int]:
+        """Rendered output memo statistics (hits, misses, entries)"""
+        with self._render_cache_lock:
+            return {
+                "hits": self._render_cache_hits,
+                "misses": self._render_cache_misses,
+                "entries": len(self._render_cache),
+            }
@@ -63,7 +63,17 @@ class Config:
     
     # Template-based code generation: Use Jinja2 templates for standard CRUD operations (40-60% token savings)
     ENABLE_TEMPLATES = os.getenv("ENABLE_TEMPLATES", "true").lower() in ("true", "1", "yes", "on")
-    
+
+    # Template render cache: Jinja2 bytecode cache on disk (warm starts skip template compilation) and an
+    # in-memory LRU of rendered output keyed by (template_id, template and import mtimes, canonicalized context)
+    ENABLE_TEMPLATE_CACHE = os.getenv("ENABLE_TEMPLATE_CACHE", "true").lower() in ("true", "1", "yes", "on")
+    TEMPLATE_BYTECODE_CACHE_DIR = os.getenv("TEMPLATE_BYTECODE_CACHE_DIR", str(Path("database") / "template_bytecode"))
+    TEMPLATE_RENDER_CACHE_ENTRIES = int(os.getenv("TEMPLATE_RENDER_CACHE_ENTRIES", "512"))
+
+    # Relationship compiler: Recognize "add <entity> to <entity>" requests deterministically and render the
+    # migration, model fields, join endpoints and UI selectors from templates (no LLM interpretation)
+    ENABLE_RELATIONSHIP_COMPILER = os.getenv("ENABLE_RELATIONSHIP_COMPILER", "true").lower() in ("true", "1", "yes", "on")
+
     # Rule-based validation: Use regex/AST patterns for confident approval/rejection (20-30% token savings)
     ENABLE_RULE_VALIDATION = os.getenv("ENABLE_RULE_VALIDATION", "true").lower() in ("true", "1", "yes", "on")
     
@@ -72,13 +82,84 @@ class Config:
     
     # Compressed prompts: Use token-efficient coding standards (15-20% token savings)
     ENABLE_COMPRESSED_STANDARDS = os.getenv("ENABLE_COMPRESSED_STANDARDS", "true").lower() in ("true", "1", "yes", "on")
+
+    # Prompt fragments: Static prompt sections (standards, warnings, format instructions) are loaded and
+    # token-counted once; generation prompts over the budget drop their optional sections first
+    GENERATION_PROMPT_TOKEN_BUDGET = int(os.getenv("GENERATION_PROMPT_TOKEN_BUDGET", "8000"))
+
+    # Streaming code generation: Stream code completions through an incremental extractor that stops at the
+    # closing markdown fence and aborts on the wrong language or a syntax error at a top-level statement
+    ENABLE_STREAMING_GENERATION = os.getenv("ENABLE_STREAMING_GENERATION", "true").lower() in ("true", "1", "yes", "on")
+
+    # Generated Streamlit pages: rows per list page (fetched with skip/limit) and seconds that
+    # st.cache_data keeps list reads before refetching (writes clear the cache immediately)
+    UI_PAGE_SIZE = int(os.getenv("UI_PAGE_SIZE", "50"))
+    UI_CACHE_TTL_SECONDS = int(os.getenv("UI_CACHE_TTL_SECONDS", "30"))
+
+    # Validation verdict cache: Reuse TechLeadSWEA verdicts (rule-based and LLM) for identical code,
+    # keyed by code hash, SWEA/task, rule-catalog and standards versions; persisted in SQLite with LRU eviction
+    ENABLE_VALIDATION_CACHE = os.getenv("ENABLE_VALIDATION_CACHE", "true").lower() in ("true", "1", "yes", "on")
+    VALIDATION_CACHE_PATH = os.getenv("VALIDATION_CACHE_PATH", str(Path("database") / "validation_cache.db"))
+    VALIDATION_CACHE_MEMORY_ENTRIES = int(os.getenv("VALIDATION_CACHE_MEMORY_ENTRIES", "256"))
+    VALIDATION_CACHE_MAX_ENTRIES = int(os.getenv("VALIDATION_CACHE_MAX_ENTRIES", "5000"))
+    
+    # Validation calibration: Record (rule outcomes, LLM verdict) pairs for uncertain rule results and fit
+    # per-SWEA logistic models (JSON, refitted in the background) that replace LLM reviews at a target error rate
+    ENABLE_VALIDATION_CALIBRATION = os.getenv("ENABLE_VALIDATION_CALIBRATION", "true").lower() in ("true", "1", "yes", "on")
+    VALIDATION_CALIBRATION_PATH = os.getenv("VALIDATION_CALIBRATION_PATH", str(Path("database") / "validation_calibration.json"))
+    VALIDATION_CALIBRATION_SAMPLES_PATH = os.getenv(
+        "VALIDATION_CALIBRATION_SAMPLES_PATH", str(Path("database") / "validation_calibration_samples.jsonl")
+    )
+    VALIDATION_CALIBRATION_TARGET_ERROR = float(os.getenv("VALIDATION_CALIBRATION_TARGET_ERROR", "0.05"))
+    VALIDATION_CALIBRATION_MIN_SAMPLES = int(os.getenv("VALIDATION_CALIBRATION_MIN_SAMPLES", "50"))
+    VALIDATION_CALIBRATION_REFIT_EVERY = int(os.getenv("VALIDATION_CALIBRATION_REFIT_EVERY", "25"))
+    
+    # Parallel validation: Validate batches of artifacts (validate_many) on a process pool, in chunks of about
+    # VALIDATION_POOL_CHUNK_CHARS source characters; batches under VALIDATION_POOL_MIN_CHARS run inline (0 workers = auto)
+    ENABLE_PARALLEL_VALIDATION = os.getenv("ENABLE_PARALLEL_VALIDATION", "true").lower() in ("true", "1", "yes", "on")
+    VALIDATION_POOL_WORKERS = int(os.getenv("VALIDATION_POOL_WORKERS", "0"))
+    VALIDATION_POOL_CHUNK_CHARS = int(os.getenv("VALIDATION_POOL_CHUNK_CHARS", "65536"))
+    VALIDATION_POOL_MIN_CHARS = int(os.getenv("VALIDATION_POOL_MIN_CHARS", "262144"))
     
     # Parallel SWEA execution: Run independent SWEAs concurrently (30-40% time savings, no token impact)
     ENABLE_PARALLEL_EXECUTION = os.getenv("ENABLE_PARALLEL_EXECUTION", "true").lower() in ("true", "1", "yes", "on")
+
+    # Review pipelining: Start the next coordination task while TechLeadSWEA reviews the current one
+    # (tasks depending on the reviewed artifact start only if it is rarely rejected, and are re-queued on rejection)
+    ENABLE_REVIEW_PIPELINING = os.getenv("ENABLE_REVIEW_PIPELINING", "true").lower() in ("true", "1", "yes", "on")
+    PIPELINE_MAX_REJECTION_RATE = float(os.getenv("PIPELINE_MAX_REJECTION_RATE", "0.3"))
+    
+    # Batched review: Review the artifacts of a parallel execution wave together, validating all
+    # uncertain artifacts in one structured LLM call (split when the prompt exceeds the token budget)
+    ENABLE_BATCHED_REVIEW = os.getenv("ENABLE_BATCHED_REVIEW", "true").lower() in ("true", "1", "yes", "on")
+    LLM_REVIEW_BATCH_TOKEN_BUDGET = int(os.getenv("LLM_REVIEW_BATCH_TOKEN_BUDGET", "12000"))
+    LLM_REVIEW_BATCH_MAX_WAIT = float(os.getenv("LLM_REVIEW_BATCH_MAX_WAIT", "30"))
     
     # Smart retry with exponential backoff: Reduce retry overhead (5-10% time savings on retries)
     ENABLE_SMART_RETRY = os.getenv("ENABLE_SMART_RETRY", "true").lower() in ("true", "1", "yes", "on")
 
+    # Diff repair: When no structured patch applies, ask the SWEA for a minimal unified diff of
+    # the rejected artifact (applied locally) instead of regenerating the whole file
+    ENABLE_DIFF_REPAIR = os.getenv("ENABLE_DIFF_REPAIR", "true").lower() in ("true", "1", "yes", "on")
+    DIFF_REPAIR_MIN_CHARS = int(os.getenv("DIFF_REPAIR_MIN_CHARS", "1500"))  # Smaller files are regenerated
+    DIFF_REPAIR_MAX_TOKENS = int(os.getenv("DIFF_REPAIR_MAX_TOKENS", "1500"))
+
+    # Execution tracing: Record per-request spans and export Chrome trace JSON + critical path
+    ENABLE_EXECUTION_TRACE = os.getenv("ENABLE_EXECUTION_TRACE", "true").lower() in ("true", "1", "yes", "on")
+    EXECUTION_TRACE_DIR = os.getenv("EXECUTION_TRACE_DIR", "logs/traces")
+
+    # Speculative generation: For tasks with high historical rejection rates, generate k candidates
+    # concurrently, screen them with the rule engine and forward the first passing one to review
+    ENABLE_SPECULATIVE_GENERATION = os.getenv("ENABLE_SPECULATIVE_GENERATION", "false").lower() in ("true", "1", "yes", "on")
+    SPECULATIVE_CANDIDATES = int(os.getenv("SPECULATIVE_CANDIDATES", "3"))
+    SPECULATIVE_REJECTION_THRESHOLD = float(os.getenv("SPECULATIVE_REJECTION_THRESHOLD", "0.5"))
+    SPECULATIVE_MIN_REVIEWS = int(os.getenv("SPECULATIVE_MIN_REVIEWS", "3"))
+    SPECULATIVE_TEMPERATURE = float(os.getenv("SPECULATIVE_TEMPERATURE", "0.7"))
+
+    # Kernel daemon: Keep a warm EnhancedRuntimeKernel behind a local Unix socket
+    DAEMON_SOCKET_PATH = os.getenv("BAE_DAEMON_SOCKET", "/tmp/baes_kernel.sock")  # nosec B108
+    DAEMON_MAX_CONCURRENCY = int(os.getenv("BAE_DAEMON_MAX_CONCURRENCY", "4"))
+
     # Managed System Configuration
     @classmethod
     def get_managed_system_path(cls) -> Path:
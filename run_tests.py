@@ -205,7 +205,7 @@ def main():
     parser = argparse.ArgumentParser(description="Run BAE system tests")
     parser.add_argument(
         "test_type",
-        choices=["all", "unit", "integration", "slow", "scenario"],
+        choices=["all", "unit", "integration", "slow", "scenario", "performance"],
         help="Type of tests to run",
     )
     parser.add_argument(
@@ -240,9 +240,13 @@ def main():
     elif args.test_type == "scenario":
         cmd.extend(["-m", "scenario"])
         cmd.extend(["tests/integration/"])
+    elif args.test_type == "performance":
+        # Validation benchmark and stored-budget regression checks
+        cmd.extend(["-m", "performance"])
+        cmd.extend(["tests/performance/"])
     else:
         print(f"❌ Unknown test type: {args.test_type}")
-        print("Valid types: unit, integration, all, slow, scenario")
+        print("Valid types: unit, integration, all, slow, scenario, performance")
         return False
 
     # Handle verbosity and progress reporting
@@ -264,6 +268,7 @@ def main():
         "all": "🚀 Running all tests (excluding slowest realworld tests)",
         "slow": "🐌 Running slow realworld tests (with actual servers)",
         "scenario": "📋 Running scenario tests (proof of concept validation)",
+        "performance": "⏱️  Running validation performance benchmarks and budget checks",
     }
 
     print(f"📋 Test Plan: {test_descriptions.get(args.test_type, 'Unknown test type')}")
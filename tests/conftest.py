@@ -8,6 +8,7 @@ in the BAE (Business Autonomous Entities) test suite.
 import os
 import shutil
 import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import Dict
@@ -24,6 +25,15 @@ REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, o
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
+# Validation verdicts are cached on disk and shared across processes; keep test runs
+# independent of each other (verdict cache tests enable it explicitly)
+os.environ.setdefault("ENABLE_VALIDATION_CACHE", "false")
+# Likewise, do not record calibration samples or load calibration models from disk
+os.environ.setdefault("ENABLE_VALIDATION_CALIBRATION", "false")
+# Compiled template bytecode goes to a temporary directory instead of database/template_bytecode
+TEMPLATE_BYTECODE_DIR = tempfile.mkdtemp(prefix="baes-template-bytecode-")
+os.environ.setdefault("TEMPLATE_BYTECODE_CACHE_DIR", TEMPLATE_BYTECODE_DIR)
+
 # Global temp directory management
 TESTS_TEMP_DIR = Path(__file__).parent / ".temp"
 
@@ -63,6 +73,7 @@ def pytest_collection_modifyitems(config, items):
 
 def pytest_unconfigure(config):
     """Clean up global temp directory after all tests complete"""
+    shutil.rmtree(TEMPLATE_BYTECODE_DIR, ignore_errors=True)
     # Don't clean up .temp directory for realworld tests - files should persist for inspection
     # Cleanup will be handled by run_tests.py before next realworld test cycle
     if TESTS_TEMP_DIR.exists():
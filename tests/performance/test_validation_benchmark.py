@@ -0,0 +1,71 @@
+"""
+Performance tests for the validation benchmark harness (baes.standards.validation_benchmark).
+
+Tests that synthetic artifacts reach their target sizes, that measurements
+report ns/byte, allocations and rules/second, that budget checks flag
+regressions, and that the validators stay within the stored budget
+(tests/performance/validation_budget.json, refreshed with
+``python -m baes.standards.validation_benchmark --budget ... --update-budget``).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from baes.standards.validation_benchmark import (
+    BenchmarkArtifact,
+    budget_from_results,
+    check_budget,
+    load_budget,
+    measure,
+    run_benchmark,
+    synthetic_artifact,
+)
+from baes.standards.validation_rules import ValidationRuleEngine
+
+BUDGET_PATH = Path(__file__).parent / "validation_budget.json"
+
+
+@pytest.mark.performance
+class TestBenchmarkHarness:
+    """Test artifact generation, measurement and budget checks"""
+
+    def test_synthetic_artifacts_reach_target_size(self):
+        """Synthetic artifacts should be valid Python of at least the requested size"""
+        for swea_type in ("backend", "database", "frontend", "test"):
+            artifact = synthetic_artifact(swea_type, 10 * 1024)
+            assert 10 * 1024 <= artifact.size_bytes < 12 * 1024
+            compile(artifact.code, swea_type, "exec")
+
+    def test_measure_reports_rates_and_allocations(self):
+        """Measurements should count evaluated rules and allocated bytes"""
+        engine = ValidationRuleEngine()
+        artifact = synthetic_artifact("backend", 4096)
+        result = measure(
+            "rules", lambda code, swea: engine.validate_code(code, swea), artifact, "4KB", 2
+        )
+
+        assert result.rules_evaluated == len(engine.list_rules("backend"))
+        assert result.ns_per_byte > 0 and result.rules_per_second > 0
+        assert result.peak_alloc_bytes > 0
+        assert engine.timing_stats()["rules:backend"].calls == 3
+
+    def test_budget_flags_slower_validators(self):
+        """A validator slower than its budget should be reported"""
+        artifact = BenchmarkArtifact("x", "backend", "synthetic", "x = 1\n" * 100)
+        results = [measure("noop", lambda code, swea: None, artifact, "1KB", 1)]
+        budget = budget_from_results(results, headroom=2.0)
+        assert check_budget(results, budget) == []
+
+        budget["ns_per_byte"]["noop:backend:1KB"] = results[0].ns_per_byte / 10
+        (violation,) = check_budget(results, budget)
+        assert violation.startswith("noop:backend:1KB")
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_validators_within_stored_budget():
+    """Every validator should stay within the stored ns/byte budget"""
+    results = run_benchmark(sizes=("1KB", "100KB"), repeats=3)
+    assert {result.validator for result in results} == {"rules", "structure", "standards"}
+    assert check_budget(results, load_budget(str(BUDGET_PATH))) == []
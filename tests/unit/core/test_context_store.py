@@ -7,6 +7,8 @@ agent memory management, and data persistence operations.
 
 import json
 import os
+import threading
+from unittest.mock import patch
 
 import pytest
 
@@ -277,3 +279,39 @@ class TestContextStore:
         # Verify data persists
         assert context_store2.get_agent_memory("TestAgent", "persistent") == "data"
         assert context_store2.get_domain_knowledge("Student")["entity"] == "Student"
+
+    def test_concurrent_saves_keep_valid_file(self, temp_database_path):
+        """Saves from concurrent requests should never leave a torn or partial file"""
+        context_store = ContextStore(temp_database_path)
+        context_store.preserve_domain_knowledge("Student", {"entity": "Student", "notes": "x" * 5000})
+
+        threads = [
+            threading.Thread(
+                target=lambda: [context_store._save_to_storage() for _ in range(20)]
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        with open(temp_database_path, "r") as f:
+            assert json.load(f)["domain_knowledge"]["Student"]["entity"] == "Student"
+        directory, name = os.path.split(temp_database_path)
+        assert not [entry for entry in os.listdir(directory) if entry.startswith(f".{name}.")]
+
+    def test_failed_save_keeps_previous_file(self, temp_database_path):
+        """A save interrupted mid-write should leave the last complete store in place"""
+        context_store = ContextStore(temp_database_path)
+        context_store.preserve_domain_knowledge("Student", {"entity": "Student"})
+
+        def interrupted_dump(data, f, **kwargs):
+            f.write('{"domain_contexts": ')
+            raise OSError("disk full")
+
+        with patch("baes.core.context_store.json.dump", side_effect=interrupted_dump):
+            context_store.preserve_domain_knowledge("Course", {"entity": "Course"})
+
+        with open(temp_database_path, "r") as f:
+            assert set(json.load(f)["domain_knowledge"]) == {"Student"}
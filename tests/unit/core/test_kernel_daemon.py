@@ -0,0 +1,138 @@
+"""
+Unit tests for the kernel daemon (baes.core.kernel_daemon).
+
+Tests the NDJSON Unix-socket protocol, progress event streaming and concurrent
+execution of requests. A lightweight fake kernel is injected so no LLM calls are
+made (per-entity serialization is covered by the request context tests).
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from baes.core.kernel_daemon import KernelDaemon
+from baes.utils.execution_trace import span
+
+
+class FakeKernel:
+    """Records the time window of each request to detect overlap."""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.windows = []
+        self._lock = threading.Lock()
+
+    def process_natural_language_request(self, request, context="academic", start_servers=True):
+        start = time.perf_counter()
+        with span("entity_lock_wait", category="lock", entity=request.split()[1]):
+            pass
+        with span("BackendSWEA.generate_api", category="swea"):
+            time.sleep(self.delay)
+        with self._lock:
+            self.windows.append((request, start, time.perf_counter()))
+        return {"success": True, "entity": request.split()[1], "message": "done"}
+
+
+async def _call(socket_path, message):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write((json.dumps(message) + "\n").encode())
+    await writer.drain()
+    events = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        events.append(json.loads(line))
+    writer.close()
+    return events
+
+
+def _run(daemon, scenario):
+    async def main():
+        await daemon.start()
+        try:
+            return await scenario()
+        finally:
+            await daemon.stop()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+class TestKernelDaemon:
+    """Test suite for the kernel daemon"""
+
+    @pytest.fixture
+    def daemon(self, tmp_path):
+        return KernelDaemon(
+            socket_path=str(tmp_path / "kernel.sock"),
+            context_store_path=str(tmp_path / "context_store.json"),
+            max_concurrency=4,
+            kernel=FakeKernel(),
+        )
+
+    def test_ping_reports_status(self, daemon):
+        """ping should return daemon status without touching the kernel"""
+        events = _run(daemon, lambda: _call(daemon.socket_path, {"action": "ping"}))
+        assert events[0]["event"] == "pong"
+        assert events[0]["context_store"] == daemon.context_store_path
+        assert events[0]["active_jobs"] == []
+        assert "served_share" in events[0]["template_coverage"]
+
+    def test_process_streams_progress_and_result(self, daemon):
+        """A process request should stream accepted, progress and result events"""
+        events = _run(
+            daemon,
+            lambda: _call(daemon.socket_path, {"action": "process", "request": "create student"}),
+        )
+        kinds = [e["event"] for e in events]
+        assert kinds[0] == "accepted"
+        assert kinds[-1] == "result"
+        progress = [e for e in events if e["event"] == "progress"]
+        assert any(e.get("entity") == "student" for e in progress)
+        assert {"start", "end"} <= {e["phase"] for e in progress}
+        assert any(e["name"] == "BackendSWEA.generate_api" for e in progress)
+        assert events[-1]["result"]["success"] is True
+
+    def test_invalid_request_rejected(self, daemon):
+        """Malformed or empty requests should return an error event"""
+
+        async def scenario():
+            reader, writer = await asyncio.open_unix_connection(daemon.socket_path)
+            writer.write(b"not json\n")
+            await writer.drain()
+            bad_json = json.loads(await reader.readline())
+            writer.close()
+            missing = await _call(daemon.socket_path, {"action": "process"})
+            return bad_json, missing[0]
+
+        bad_json, missing = _run(daemon, scenario)
+        assert bad_json["error"] == "INVALID_REQUEST"
+        assert missing["error"] == "INVALID_REQUEST"
+
+    def test_context_store_mismatch(self, daemon):
+        """Requests for a different context store must not be served by this daemon"""
+        events = _run(
+            daemon,
+            lambda: _call(
+                daemon.socket_path,
+                {"request": "create student", "context_store": "/elsewhere/store.json"},
+            ),
+        )
+        assert events[0]["error"] == "CONTEXT_STORE_MISMATCH"
+
+    def test_different_entities_run_concurrently(self, daemon):
+        """Requests for different entities should overlap in time"""
+
+        async def scenario():
+            await asyncio.gather(
+                _call(daemon.socket_path, {"request": "create student"}),
+                _call(daemon.socket_path, {"request": "create course"}),
+            )
+
+        _run(daemon, scenario)
+        (_, s1, e1), (_, s2, e2) = daemon.kernel.windows
+        assert s2 < e1 and s1 < e2
@@ -0,0 +1,156 @@
+"""
+Unit tests for request-scoped execution state (baes.core.request_context).
+
+Tests request context isolation, keyed locks, merging of per-request state into
+the kernel-wide aggregate, and concurrent request processing on a single
+EnhancedRuntimeKernel (different entities in parallel, same entity serialized).
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+from baes.core.managed_system_manager import write_text_locked
+from baes.core.request_context import (
+    KeyedLocks,
+    RequestContext,
+    current_request_context,
+    request_scope,
+)
+from baes.utils.optimization_metrics import PerformanceMetrics
+
+
+@pytest.mark.unit
+class TestRequestContext:
+    """Test RequestContext and KeyedLocks primitives"""
+
+    def test_request_scope_sets_and_resets(self):
+        """request_scope should only expose the context inside the block"""
+        context = RequestContext(request="create student")
+        assert current_request_context() is None
+        with request_scope(context):
+            assert current_request_context() is context
+        assert current_request_context() is None
+
+    def test_owner_filter(self):
+        """Contexts created by another owner should not be visible"""
+        owner, other = object(), object()
+        with request_scope(RequestContext(owner=owner)):
+            assert current_request_context(owner=owner) is not None
+            assert current_request_context(owner=other) is None
+
+    def test_merge_into_aggregates_state(self):
+        """Merging should combine retry patterns, analytics, history and metrics"""
+        aggregate = RequestContext(request_id="kernel")
+        context = RequestContext()
+        context.retry_patterns["BackendSWEA.generate_api"]["count"] = 2
+        context.retry_patterns["BackendSWEA.generate_api"]["last_errors"].append("boom")
+        context.failure_analytics["common_failures"]["json_parse_error"] += 1
+        context.execution_history.append({"request_id": context.request_id})
+        context.metrics = PerformanceMetrics(request_id="r", entity_name="Student", entity_type="X")
+
+        context.merge_into(aggregate)
+        context.merge_into(aggregate)
+
+        pattern = aggregate.retry_patterns["BackendSWEA.generate_api"]
+        assert pattern["count"] == 2
+        assert list(pattern["last_errors"]) == ["boom", "boom"]
+        assert aggregate.failure_analytics["common_failures"]["json_parse_error"] == 2
+        assert len(aggregate.execution_history) == 2
+        assert aggregate.metrics is context.metrics
+
+    def test_keyed_locks_share_lock_per_key(self):
+        """The same key should always map to the same re-entrant lock"""
+        locks = KeyedLocks()
+        assert locks.get("student") is locks.get("student")
+        assert locks.get("student") is not locks.get("course")
+        with locks.hold("student"):
+            with locks.hold("student"):  # re-entrant
+                pass
+
+    def test_write_text_locked_is_atomic(self, tmp_path):
+        """Locked writes should leave only the final file behind"""
+        target = tmp_path / "app.py"
+        threads = [
+            threading.Thread(target=write_text_locked, args=(target, f"content {i}\n"))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert target.read_text().startswith("content ")
+        assert [p.name for p in tmp_path.iterdir()] == ["app.py"]
+
+
+@pytest.mark.unit
+class TestConcurrentKernelRequests:
+    """Test that one kernel can process independent requests concurrently"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            kernel = EnhancedRuntimeKernel(context_store_path=temp_database_path)
+
+        kernel.windows = []
+        kernel.seen_metrics = {}
+
+        def recognize(request):
+            return {"detected_entity": request.split()[1], "confidence": 0.9}
+
+        def process(request, context, start_servers, detected_entity, classification):
+            start = time.perf_counter()
+            kernel.current_metrics = PerformanceMetrics(
+                request_id=request, entity_name=detected_entity, entity_type="GenericBae"
+            )
+            kernel._track_retry_pattern(f"{detected_entity}.task", "error", 1)
+            time.sleep(0.2)
+            kernel.seen_metrics[request] = kernel.current_metrics.request_id
+            kernel.windows.append((request, start, time.perf_counter()))
+            return {"success": True, "entity": detected_entity}
+
+        kernel.entity_recognizer.recognize_entity = recognize
+        kernel._process_recognized_request = process
+        return kernel
+
+    def _run_concurrently(self, kernel, requests):
+        with patch("baes.core.enhanced_runtime_kernel.Config") as config:
+            config.ENABLE_EXECUTION_TRACE = False
+            threads = [
+                threading.Thread(target=kernel.process_natural_language_request, args=(r,))
+                for r in requests
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+    def test_different_entities_overlap_with_isolated_metrics(self, kernel):
+        """Requests for different entities should run in parallel without sharing metrics"""
+        self._run_concurrently(kernel, ["create student", "create course"])
+
+        (_, s1, e1), (_, s2, e2) = kernel.windows
+        assert s2 < e1 and s1 < e2
+        assert kernel.seen_metrics == {
+            "create student": "create student",
+            "create course": "create course",
+        }
+
+    def test_same_entity_is_serialized(self, kernel):
+        """Requests for the same entity should never overlap"""
+        self._run_concurrently(kernel, ["create student", "evolve student"])
+
+        first, second = sorted(kernel.windows, key=lambda w: w[1])
+        assert second[1] >= first[2]
+
+    def test_completed_requests_merge_into_kernel_state(self, kernel):
+        """After requests finish, kernel-level state should aggregate them"""
+        self._run_concurrently(kernel, ["create student", "create course"])
+
+        assert {"student.task", "course.task"} <= set(kernel.retry_patterns)
+        assert len(kernel.execution_history) == 2
+        assert {h["entity"] for h in kernel.execution_history} == {"student", "course"}
+        assert kernel.current_metrics is not None
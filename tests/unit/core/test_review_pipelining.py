@@ -0,0 +1,157 @@
+"""
+Unit tests for review pipelining in EnhancedRuntimeKernel._execute_coordination_plan.
+
+Tests that the next coordination task is generated while TechLeadSWEA reviews the
+current one, that tasks depending on a rejected artifact are discarded and
+re-queued, and that dependent tasks are not started for frequently rejected tasks.
+Fake SWEAs are injected so no LLM calls are made.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+
+
+class FakeSWEA:
+    """Records handle_task calls with their time windows."""
+
+    def __init__(self, name, log, delay=0.05):
+        self.name = name
+        self.log = log
+        self.delay = delay
+
+    def handle_task(self, task_type, payload):
+        start = time.perf_counter()
+        time.sleep(self.delay)
+        self.log.append((f"{self.name}.{task_type}", start, time.perf_counter()))
+        return {"success": True, "data": {"entity": payload.get("entity")}}
+
+
+class FakeTechLead:
+    """Approves reviews after a delay, rejecting tasks listed in ``reject_once`` once."""
+
+    def __init__(self, log, delay=0.2, reject_once=()):
+        self.log = log
+        self.delay = delay
+        self.reject_once = set(reject_once)
+
+    def handle_task(self, task_type, payload):
+        start = time.perf_counter()
+        time.sleep(self.delay)
+        name = f"{payload['swea_agent']}.{payload['task_type']}"
+        self.log.append((f"review:{name}", start, time.perf_counter()))
+        if name in self.reject_once:
+            self.reject_once.discard(name)
+            return {"success": True, "data": {"overall_approval": False, "feedback": ["fix it"]}}
+        return {"success": True, "data": {"overall_approval": True, "quality_score": 0.9}}
+
+
+def _task(swea_agent, task_type, depends_on=None):
+    task = {
+        "swea_agent": swea_agent,
+        "task_type": task_type,
+        "payload": {"entity": "Student", "attributes": [], "context": "academic"},
+    }
+    if depends_on is not None:
+        task["depends_on"] = depends_on
+    return task
+
+
+class MockBAE:
+    entity_name = "Student"
+
+
+@pytest.mark.unit
+class TestReviewPipelining:
+    """Test suite for overlapping TechLeadSWEA reviews with generation"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            kernel = EnhancedRuntimeKernel(context_store_path=temp_database_path)
+        kernel.log = []
+        kernel._backend_swea = FakeSWEA("BackendSWEA", kernel.log)
+        kernel._database_swea = FakeSWEA("DatabaseSWEA", kernel.log)
+        kernel._frontend_swea = FakeSWEA("FrontendSWEA", kernel.log)
+        kernel._techlead_swea = FakeTechLead(kernel.log)
+        kernel._managed_system_manager = MagicMock()
+        return kernel
+
+    def _entries(self, kernel, name):
+        return [entry for entry in kernel.log if entry[0] == name]
+
+    def test_plan_task_dependencies(self, kernel):
+        """Declared depends_on should be resolved, undeclared means all earlier tasks"""
+        plan = [
+            _task("BackendSWEA", "generate_api"),
+            _task("DatabaseSWEA", "setup_database"),
+            _task("FrontendSWEA", "generate_ui", ["BackendSWEA.generate_api"]),
+            _task("DatabaseSWEA", "setup_database", []),
+        ]
+        assert kernel._plan_task_dependencies(plan, 1) == {0}
+        assert kernel._plan_task_dependencies(plan, 2) == {0}
+        assert kernel._plan_task_dependencies(plan, 3) == set()
+
+    def test_independent_task_runs_during_review(self, kernel):
+        """The next task should be generated while the previous review is pending"""
+        plan = [
+            _task("BackendSWEA", "generate_api", []),
+            _task("DatabaseSWEA", "setup_database", []),
+            _task("FrontendSWEA", "generate_ui", ["BackendSWEA.generate_api"]),
+        ]
+        results = kernel._execute_coordination_plan(plan, MockBAE(), "academic")
+
+        assert all(r["success"] for r in results)
+        ((_, db_start, _),) = self._entries(kernel, "DatabaseSWEA.setup_database")
+        ((_, _, review_end),) = self._entries(kernel, "review:BackendSWEA.generate_api")
+        assert db_start < review_end
+        assert len(self._entries(kernel, "FrontendSWEA.generate_ui")) == 1
+        assert kernel.current_metrics.pipelined_tasks == 2
+
+    def test_dependent_task_requeued_after_rejection(self, kernel):
+        """A task started optimistically should be re-run once its dependency is rejected"""
+        kernel._techlead_swea.reject_once = {"BackendSWEA.generate_api"}
+        plan = [
+            _task("BackendSWEA", "generate_api", []),
+            _task("FrontendSWEA", "generate_ui", ["BackendSWEA.generate_api"]),
+        ]
+        results = kernel._execute_coordination_plan(plan, MockBAE(), "academic")
+
+        assert all(r["success"] for r in results)
+        frontend_runs = self._entries(kernel, "FrontendSWEA.generate_ui")
+        assert len(frontend_runs) == 2
+        # The re-queued run starts after the backend retry was approved
+        approved_review = self._entries(kernel, "review:BackendSWEA.generate_api")[-1]
+        assert frontend_runs[-1][1] >= approved_review[2]
+        assert kernel.current_metrics.pipelined_tasks_requeued == 1
+
+    def test_dependent_task_waits_for_frequently_rejected_task(self, kernel):
+        """Dependent tasks should not start optimistically after frequent rejections"""
+        for _ in range(3):
+            kernel._record_review_outcome("BackendSWEA.generate_api", False, "missing models")
+        plan = [
+            _task("BackendSWEA", "generate_api", []),
+            _task("FrontendSWEA", "generate_ui", ["BackendSWEA.generate_api"]),
+        ]
+        kernel._execute_coordination_plan(plan, MockBAE(), "academic")
+
+        ((_, frontend_start, _),) = self._entries(kernel, "FrontendSWEA.generate_ui")
+        ((_, _, review_end),) = self._entries(kernel, "review:BackendSWEA.generate_api")
+        assert frontend_start >= review_end
+        assert kernel.current_metrics.pipelined_tasks == 0
+
+    def test_pipelining_disabled(self, kernel):
+        """With pipelining disabled, tasks should strictly follow their predecessor's review"""
+        plan = [
+            _task("BackendSWEA", "generate_api", []),
+            _task("DatabaseSWEA", "setup_database", []),
+        ]
+        with patch("baes.core.enhanced_runtime_kernel.Config.ENABLE_REVIEW_PIPELINING", False):
+            kernel._execute_coordination_plan(plan, MockBAE(), "academic")
+
+        ((_, db_start, _),) = self._entries(kernel, "DatabaseSWEA.setup_database")
+        ((_, _, review_end),) = self._entries(kernel, "review:BackendSWEA.generate_api")
+        assert db_start >= review_end
@@ -193,3 +193,45 @@ class TestOpenAIClient:
         assert "EXPECTED JSON STRUCTURE" in enhanced
         assert '"name": "string"' in enhanced
         assert '"age": "number"' in enhanced
+
+    def test_code_generation_prompts_keep_static_prefix(self, mock_openai):
+        """Test that system prompts are entity-independent and the entity section comes last"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "router = APIRouter()"
+        mock_response.usage = Mock(prompt_tokens=1500, completion_tokens=100, prompt_tokens_details=None)
+        mock_openai.chat.completions.create.return_value = mock_response
+
+        client = OpenAIClient()
+        messages = []
+        for entity in ("Student", "Course"):
+            with patch("baes.llm.openai_client.Config.ENABLE_STREAMING_GENERATION", False):
+                client.generate_code_with_domain_focus(
+                    "STATIC STANDARDS", "FastAPI Routes", {"entity": entity, "attributes": ["name: str"]}
+                )
+            messages.append(mock_openai.chat.completions.create.call_args[1]["messages"])
+
+        assert messages[0][0] == messages[1][0]
+        assert messages[0][1]["content"].startswith("STATIC STANDARDS")
+        assert messages[1][1]["content"].rstrip().endswith("- Attributes (use ONLY these): ['name: str']")
+        assert "Course domain entity" in messages[1][1]["content"]
+
+    def test_cached_prompt_tokens_metric(self, mock_openai):
+        """Test that cached prefix tokens from response usage are recorded"""
+        from baes.utils.metrics_tracker import get_metrics
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "ok"
+        mock_response.usage = Mock(
+            prompt_tokens=2048, completion_tokens=10, prompt_tokens_details=Mock(cached_tokens=1536)
+        )
+        mock_openai.chat.completions.create.return_value = mock_response
+        before = get_metrics()
+
+        assert OpenAIClient().generate_response("Test prompt") == "ok"
+
+        after = get_metrics()
+        assert after["openai_cached_tokens_in"] - before["openai_cached_tokens_in"] == 1536
+        assert after["openai_tokens_in"] - before["openai_tokens_in"] == 2048
+        assert 0 < after["openai_cached_prefix_ratio"] <= 1
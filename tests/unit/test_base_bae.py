@@ -435,3 +435,44 @@ class TestPerformance:
         
         assert duration_ms < 10, f"Detection took {duration_ms:.2f}ms, expected <10ms"
         assert "entity_type" in result
+
+
+class TestCustomLogicDetectionComposableLogic:
+    """Test detection of custom logic that templates compose from fragments"""
+
+    @pytest.fixture
+    def bae_instance(self):
+        return StudentBae()
+
+    def test_enum_attribute_stays_standard(self, bae_instance):
+        """Enumerated attribute types should become enum_fields, not custom logic"""
+        schema = {
+            "attributes": [
+                {"name": "name", "type": "str"},
+                {"name": "status", "type": "enum[active, graduated]"},
+                "level:Literal['junior', 'senior']",
+            ],
+            "relationships": {},
+        }
+
+        result = bae_instance._detect_custom_logic(schema)
+
+        assert result["entity_type"] == EntityType.STANDARD.value
+        assert result["custom_logic"] == {
+            "enum_fields": {"status": ["active", "graduated"], "level": ["junior", "senior"]}
+        }
+
+    def test_uniqueness_rule_stays_standard(self, bae_instance):
+        """Uniqueness rules on attributes should become unique_fields"""
+        schema = {
+            "attributes": [{"name": "email", "type": "str"}, {"name": "gpa", "type": "float"}],
+            "business_rules": ["Email must be unique", "GPA should be between 0 and 4"],
+            "relationships": {},
+        }
+
+        result = bae_instance._detect_custom_logic(schema)
+
+        assert result["custom_logic"] == {"unique_fields": ["email"]}
+        assert result["custom_logic_reasons"] == [
+            "Complex validation rule: GPA should be between 0 and 4"
+        ]
@@ -0,0 +1,21 @@
+"""
+Unit tests for budget-bounded chunking (baes.utils.chunking).
+"""
+
+import pytest
+
+from baes.utils.chunking import split_by_budget
+
+
+@pytest.mark.unit
+class TestSplitByBudget:
+    """Test split_by_budget"""
+
+    def test_chunks_stay_within_budget_in_order(self):
+        """Chunks should stay within budget, keep order and isolate oversized items"""
+        chunks = split_by_budget([3, 4, 2, 9, 1], cost=lambda item: item, budget=7)
+        assert chunks == [[3, 4], [2], [9], [1]]
+
+    def test_empty_input(self):
+        """No items should give no chunks"""
+        assert split_by_budget([], cost=len, budget=10) == []
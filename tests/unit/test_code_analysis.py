@@ -0,0 +1,146 @@
+"""
+Unit tests for the shared code analysis (baes.standards.code_analysis).
+
+Tests the lazily cached views (tree, lines, functions, classes, imports,
+decorators, route decorators), memoization by source text, and that the rule
+engine, standards and CodePatcher share one analysis instead of re-parsing.
+"""
+
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards import BackendStandards, CodeAnalysis
+from baes.standards.validation_rules import ValidationRuleEngine
+from baes.utils.code_patcher import CodePatcher
+
+SAMPLE_API = '''
+import logging
+from contextlib import contextmanager
+from fastapi import APIRouter, HTTPException, status as http_status
+
+router = APIRouter()
+
+
+@contextmanager
+def get_db_connection():
+    yield None
+
+
+class StudentCreate:
+    """Create payload"""
+
+
+@router.post("/", status_code=201)
+async def create_student(student: StudentCreate) -> dict:
+    """Create a student"""
+    return {}
+
+
+@router.delete("/{id}")
+def delete_student(id: int) -> None:
+    """Delete a student"""
+'''
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    CodeAnalysis.clear_memo()
+    yield
+    CodeAnalysis.clear_memo()
+
+
+@pytest.mark.unit
+class TestCodeAnalysis:
+    """Test the parse-once analysis views"""
+
+    def test_definitions_and_imports(self):
+        """Functions, classes and imports should be indexed from one parse"""
+        analysis = CodeAnalysis(SAMPLE_API)
+
+        assert analysis.is_valid_syntax
+        assert set(analysis.functions) == {
+            "get_db_connection",
+            "create_student",
+            "delete_student",
+        }
+        assert isinstance(analysis.functions["create_student"], ast.AsyncFunctionDef)
+        assert set(analysis.classes) == {"StudentCreate"}
+        assert analysis.imports["contextmanager"] == "contextlib.contextmanager"
+        assert analysis.imports["http_status"] == "fastapi.status"
+        assert analysis.imports["logging"] == "logging"
+        assert {"logging", "contextlib", "fastapi"} <= analysis.imported_modules
+
+    def test_decorators_and_routes(self):
+        """Decorators should be dotted names and routes should expose method, path and keywords"""
+        analysis = CodeAnalysis(SAMPLE_API)
+
+        assert analysis.decorators["get_db_connection"] == ["contextmanager"]
+        assert analysis.decorators["create_student"] == ["router.post"]
+        post, delete = analysis.route_decorators
+        assert (post.method, post.path, post.function) == ("post", "/", "create_student")
+        assert post.keywords == {"status_code": "201"}
+        assert (delete.method, delete.path) == ("delete", "/{id}")
+        assert analysis.routes_for("DELETE") == [delete]
+
+    def test_views_are_cached(self):
+        """The tree and derived views should be computed once"""
+        analysis = CodeAnalysis(SAMPLE_API)
+        with patch("baes.standards.code_analysis.ast.parse", wraps=ast.parse) as parse:
+            assert analysis.tree is analysis.tree
+            assert analysis.functions is analysis.functions
+            assert analysis.lines is analysis.lines
+        assert parse.call_count == 1
+
+    def test_syntax_error_is_recorded(self):
+        """Unparseable code should expose the error and empty structural views"""
+        analysis = CodeAnalysis("def broken(:\n    pass")
+        assert analysis.tree is None
+        assert not analysis.is_valid_syntax
+        assert analysis.syntax_error.lineno == 1
+        assert analysis.functions == {}
+        assert analysis.route_decorators == []
+
+    def test_of_memoizes_by_source(self):
+        """CodeAnalysis.of should return the same instance for the same source"""
+        analysis = CodeAnalysis.of(SAMPLE_API)
+        assert CodeAnalysis.of(SAMPLE_API) is analysis
+        assert CodeAnalysis.of(analysis) is analysis
+        assert CodeAnalysis.of("x = 1") is not analysis
+        assert CodeAnalysis.of(None).code == ""
+
+
+@pytest.mark.unit
+class TestSharedAnalysisConsumers:
+    """Test that validators reuse one analysis per artifact"""
+
+    def test_validators_parse_once(self):
+        """Rule engine, structure checks, standards and CodePatcher should share one parse"""
+        engine = ValidationRuleEngine()
+        with patch("baes.standards.code_analysis.ast.parse", wraps=ast.parse) as parse:
+            analysis = CodeAnalysis.of(SAMPLE_API)
+            engine.validate_code(analysis, "backend")
+            engine.validate_code_structure(SAMPLE_API)
+            BackendStandards.get_backend_validation(SAMPLE_API, "Student")
+            assert CodePatcher()._validate_syntax(SAMPLE_API)
+        assert parse.call_count == 1
+
+    def test_results_match_plain_strings(self):
+        """Passing an analysis should give the same results as passing the source"""
+        engine = ValidationRuleEngine()
+        analysis = CodeAnalysis(SAMPLE_API)
+
+        by_string = engine.validate_code(SAMPLE_API, "backend")
+        by_analysis = engine.validate_code(analysis, "backend")
+        assert by_analysis.rule_results == by_string.rule_results
+        assert (
+            BackendStandards.get_backend_validation(analysis, "Student")
+            == BackendStandards.get_backend_validation(SAMPLE_API, "Student")
+        )
+
+    def test_structure_validation_reports_syntax_errors(self):
+        """validate_code_structure should use the analysis' recorded syntax error"""
+        result = ValidationRuleEngine().validate_code_structure("def broken(:\n    pass")
+        assert result.overall_outcome == "confident_rejection"
+        assert result.feedback_message.startswith("Syntax error at line 1")
@@ -0,0 +1,247 @@
+"""
+Unit tests for AST-based targeted patching (baes.utils.code_patcher).
+
+Tests the structured edits (imports, decorators, keyword arguments, renames,
+model fields, route handlers, docstrings), that patched code is verified by
+re-parsing and failed multi-edit patches leave the code unchanged, and that
+the kernel's smart retry fixes localized review feedback without an agent call.
+"""
+
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from baes.utils.code_patcher import CodePatcher, PatchOperation, is_patchable
+
+ROUTES = '''"""Student routes."""
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class StudentCreate(BaseModel):
+    """Student payload."""
+    name: str  # required
+
+
+def get_db_connection():
+    connection = object()
+    yield connection
+
+
+@router.post("/")
+def create_student(student: StudentCreate):
+    with get_db_connection() as connection:
+        return {"name": student.name}
+
+
+@router.delete("/{student_id}")
+def delete_student(student_id: int):
+    return None
+'''
+
+
+@pytest.fixture
+def patcher():
+    return CodePatcher()
+
+
+@pytest.mark.unit
+class TestStructuredEdits:
+    """Test the individual structured edits"""
+
+    def test_add_import_merges_into_existing_from_import(self, patcher):
+        """Names from an already imported module should join its import line"""
+        result = patcher.add_import(ROUTES, "from fastapi import status, Depends")
+
+        assert result.success and result.validation_passed
+        assert "from fastapi import APIRouter, Depends, status\n" in result.patched_code
+        assert patcher.add_import(result.patched_code, "from fastapi import status").tokens_saved == 0
+
+    def test_add_import_after_last_import(self, patcher):
+        """New modules should be imported after the existing imports"""
+        result = patcher.add_import(ROUTES, "from contextlib import contextmanager")
+        lines = result.patched_code.splitlines()
+        assert lines[3] == "from contextlib import contextmanager"
+        assert patcher.add_import("x = 1\n", "import os").patched_code == "import os\nx = 1\n"
+
+    def test_add_decorator_keeps_comments_and_layout(self, patcher):
+        """Only the decorator line should be added"""
+        result = patcher.add_decorator(ROUTES, "get_db_connection", "contextmanager")
+
+        assert "@contextmanager\ndef get_db_connection():" in result.patched_code
+        assert result.patched_code.replace("@contextmanager\n", "") == ROUTES
+        assert patcher.add_decorator(ROUTES, "missing", "contextmanager").success is False
+
+    def test_fix_status_code_adds_or_replaces_keyword(self, patcher):
+        """The route decorator's status_code should be set, also across lines"""
+        result = patcher.fix_status_code(ROUTES, "create_student", "status.HTTP_201_CREATED")
+        assert '@router.post("/", status_code=status.HTTP_201_CREATED)' in result.patched_code
+
+        multiline = ROUTES.replace('@router.post("/")', '@router.post(\n    "/",\n    status_code=200,\n)')
+        result = patcher.fix_status_code(multiline, "create_student", 201)
+        assert "    status_code=201,\n" in result.patched_code
+
+    def test_add_keyword_argument_to_call_in_body(self, patcher):
+        """Calls inside the function body should be patchable too"""
+        code = "def load():\n    return open('data.txt')\n"
+        result = patcher.add_keyword_argument(code, "load", "open", "encoding", '"utf-8"')
+        assert result.patched_code == "def load():\n    return open('data.txt', encoding=\"utf-8\")\n"
+
+    def test_rename_symbol(self, patcher):
+        """Definitions, references and annotations should be renamed, attributes kept"""
+        result = patcher.rename_symbol(ROUTES, "StudentCreate", "StudentIn")
+        tree = ast.parse(result.patched_code)
+
+        assert "StudentCreate" not in result.patched_code
+        assert "class StudentIn(BaseModel):" in result.patched_code
+        assert "student: StudentIn" in result.patched_code
+        assert any(isinstance(n, ast.ClassDef) and n.name == "StudentIn" for n in tree.body)
+
+        aliased = patcher.rename_symbol(ROUTES, "APIRouter", "Router").patched_code
+        assert "from fastapi import APIRouter as Router, Depends" in aliased
+        assert "router = Router()" in aliased
+
+    def test_rename_symbol_refuses_conflicts(self, patcher):
+        """Renaming onto a bound name or an unknown symbol should fail"""
+        assert not patcher.rename_symbol(ROUTES, "StudentCreate", "router").success
+        assert not patcher.rename_symbol(ROUTES, "Unknown", "Other").success
+        assert not patcher.rename_symbol(ROUTES, "router", "class").success
+
+    def test_add_model_field(self, patcher):
+        """Fields should follow the last field; a lone pass should be replaced"""
+        result = patcher.add_model_field(ROUTES, "StudentCreate", "email", "Optional[str]", "None")
+        assert "    name: str  # required\n    email: Optional[str] = None\n" in result.patched_code
+
+        empty = "class Student(BaseModel):\n    pass\n"
+        result = patcher.add_model_field(empty, "Student", "age", "int")
+        assert result.patched_code == "class Student(BaseModel):\n    age: int\n"
+
+    def test_add_route_handler(self, patcher):
+        """Handlers should follow the last route and bring their imports"""
+        result = patcher.add_route_handler(
+            ROUTES,
+            "get",
+            "/{student_id}",
+            "get_student",
+            "return {'id': student_id}",
+            parameters="student_id: int",
+            status_code=200,
+        )
+
+        assert result.success
+        assert result.patched_code.endswith(
+            '\n\n\n@router.get("/{student_id}", status_code=status.HTTP_200_OK)\n'
+            "def get_student(student_id: int):\n    return {'id': student_id}\n"
+        )
+        assert "from fastapi import APIRouter, Depends, status" in result.patched_code
+        duplicate = patcher.add_route_handler(ROUTES, "post", "/", "create_again", "pass")
+        assert not duplicate.success
+
+    def test_add_docstring(self, patcher):
+        """A docstring derived from the name should be inserted"""
+        result = patcher.add_docstring(ROUTES, "create_student")
+        assert 'def create_student(student: StudentCreate):\n    """Create student."""\n' in (
+            result.patched_code
+        )
+
+
+@pytest.mark.unit
+class TestPatchVerification:
+    """Test re-parse verification and multi-edit patches"""
+
+    def test_invalid_original_is_rejected(self, patcher):
+        """Broken input should fail instead of being patched"""
+        result = patcher.add_import("def broken(:\n", "import os")
+        assert not result.success
+        assert "Syntax error" in result.error_message
+
+    def test_invalid_patch_output_is_rejected(self, patcher):
+        """Edits that produce invalid code should fail validation"""
+        result = patcher.add_decorator(ROUTES, "create_student", "router.post(")
+        assert not result.success
+
+    def test_apply_patches_is_atomic(self, patcher):
+        """A failing edit should leave the code unchanged"""
+        operations = [
+            PatchOperation("add_import", {"import_statement": "import os"}),
+            PatchOperation("add_docstring", {"name": "does_not_exist"}),
+        ]
+        result = patcher.apply_patches(ROUTES, operations)
+
+        assert not result.success
+        assert result.patched_code is None
+        assert result.applied_operations == ["add_import"]
+        assert patcher.apply_patch(ROUTES, "unknown_patch").success is False
+
+
+@pytest.mark.unit
+class TestPatchFromFeedback:
+    """Test feedback-driven patch plans"""
+
+    def test_fixes_decorator_and_status_codes(self, patcher):
+        """Localized review findings should be fixed in one multi-edit patch"""
+        feedback = [
+            "get_db_connection must be decorated with @contextmanager",
+            "POST endpoint must return status code 201 and DELETE 204",
+        ]
+        issue_types = ["missing_decorator", "wrong_status_code", "multiple_endpoints"]
+        result = patcher.patch_from_feedback(ROUTES, issue_types, feedback)
+
+        assert result.success
+        assert result.applied_operations == [
+            "add_decorator",
+            "fix_status_code",
+            "fix_status_code",
+            "add_missing_imports",
+        ]
+        assert "@contextmanager\ndef get_db_connection" in result.patched_code
+        assert "status_code=status.HTTP_201_CREATED" in result.patched_code
+        assert "status_code=status.HTTP_204_NO_CONTENT" in result.patched_code
+        assert "from contextlib import contextmanager" in result.patched_code
+        assert "from fastapi import APIRouter, Depends, status" in result.patched_code
+
+    def test_structural_issues_are_not_patched(self, patcher):
+        """Issue types outside the structured edits should fall back to regeneration"""
+        assert not is_patchable(["missing_decorator", "architecture"])
+        assert not is_patchable(["multiple_endpoints"])
+        result = patcher.patch_from_feedback(ROUTES, ["architecture"], ["Refactor the module"])
+        assert not result.success
+
+
+@pytest.mark.unit
+class TestKernelSmartRetry:
+    """Test that the kernel applies structured patches instead of regenerating"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            return EnhancedRuntimeKernel(context_store_path=temp_database_path)
+
+    def test_review_feedback_is_patched_locally(self, kernel, tmp_path):
+        """Review feedback should yield patched code and rewrite the artifact"""
+        review_data = {
+            "feedback": ["POST endpoint create_student should use status code 201"],
+            "technical_feedback": ["POST endpoint create_student should use status code 201"],
+        }
+        with patch("baes.core.enhanced_runtime_kernel.Config") as config:
+            config.ENABLE_SMART_RETRY = True
+            retry = kernel._try_smart_retry(
+                "BackendSWEA", "generate_api", ROUTES, review_data, "Student", {}
+            )
+
+        assert retry["patch_applied"] is True
+        assert "status_code=status.HTTP_201_CREATED" in retry["patched_code"]
+
+        artifact = tmp_path / "student_routes.py"
+        artifact.write_text(ROUTES)
+        result = {"success": True, "data": {"code": ROUTES, "file_path": str(artifact)}}
+        patched = kernel._apply_patched_code(result, retry["patched_code"])
+
+        assert patched["data"]["code"] == retry["patched_code"]
+        assert artifact.read_text() == retry["patched_code"]
+        assert result["data"]["code"] == ROUTES
@@ -0,0 +1,148 @@
+"""
+Unit tests for streaming code generation.
+
+Tests that the incremental extractor strips markdown fences, completes the code
+block at the closing fence, aborts on the wrong language or an unrecoverable
+syntax error (but not on code that is merely incomplete), and that
+OpenAIClient closes the stream as soon as the code block is complete or invalid.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from baes.utils.code_stream import CodeStreamAborted, IncrementalCodeExtractor
+
+ROUTES = '''```python
+"""
+Student routes
+"""
+from typing import (
+    List,
+)
+
+@router.get("/")
+@cached
+def list_students() -> List[dict]:
+    return [
+        {"id": 1},
+    ]
+
+# Helpers
+if DEBUG:
+    pass
+else:
+    pass
+```
+This router implements CRUD endpoints for Student.
+'''
+
+
+def feed_all(extractor, text, chunk_size=5):
+    """Feed text in fixed-size chunks until the extractor completes or aborts"""
+    for start in range(0, len(text), chunk_size):
+        state = extractor.feed(text[start : start + chunk_size])
+        if state.complete or state.aborted:
+            return start + chunk_size
+    return len(text)
+
+
+@pytest.mark.unit
+class TestIncrementalCodeExtractor:
+    """Test fence handling and early validation"""
+
+    def test_code_block_completes_at_closing_fence(self):
+        extractor = IncrementalCodeExtractor()
+        consumed = feed_all(extractor, ROUTES)
+
+        assert extractor.state.complete and not extractor.state.aborted
+        assert consumed < ROUTES.index("CRUD endpoints")
+        code = extractor.finish()
+        assert code.startswith('"""\nStudent routes') and code.endswith("    pass")
+
+    def test_unfenced_code_is_checked_at_end(self):
+        extractor = IncrementalCodeExtractor()
+        feed_all(extractor, "import os\n\ndef f():\n    return os.getcwd()")
+
+        assert not extractor.state.complete
+        assert extractor.finish().endswith("return os.getcwd()")
+
+    @pytest.mark.parametrize(
+        "completion",
+        ["```javascript\nconst x = 1;\n```", "const router = express.Router();\nmodule.exports = router;\n"],
+    )
+    def test_wrong_language_aborts(self, completion):
+        extractor = IncrementalCodeExtractor()
+        feed_all(extractor, completion)
+
+        assert extractor.state.aborted
+        assert "expected python code" in extractor.state.reason
+
+    def test_syntax_error_aborts_at_next_top_level_statement(self):
+        completion = "import os\ndef broken(:\n    pass\nimport sys\n" + "x = 1\n" * 100
+        extractor = IncrementalCodeExtractor()
+        consumed = feed_all(extractor, completion)
+
+        assert extractor.state.aborted
+        assert consumed < completion.index("x = 1") + 10
+        with pytest.raises(CodeStreamAborted, match="line 2"):
+            extractor.finish()
+
+    def test_truncated_code_fails_at_finish_only(self):
+        extractor = IncrementalCodeExtractor()
+        feed_all(extractor, "def f():\n    return 1\n\ndef g(\n")
+
+        assert not extractor.state.aborted
+        with pytest.raises(CodeStreamAborted, match="never closed"):
+            extractor.finish()
+
+
+def stream_chunks(text, chunk_size=8, usage=None):
+    """OpenAI-style stream chunks for ``text`` followed by a usage chunk"""
+    chunks = [
+        Mock(choices=[Mock(delta=Mock(content=text[i : i + chunk_size]))], usage=None)
+        for i in range(0, len(text), chunk_size)
+    ]
+    chunks.append(Mock(choices=[], usage=usage))
+    return chunks
+
+
+@pytest.mark.unit
+class TestStreamingCodeGeneration:
+    """Test OpenAIClient streaming code generation"""
+
+    @pytest.fixture
+    def mock_openai(self):
+        with patch("baes.llm.openai_client.openai") as mock_openai, patch(
+            "baes.llm.openai_client.estimate_token_counts", side_effect=lambda texts: [len(t) for t in texts]
+        ):
+            mock_client = Mock()
+            mock_openai.OpenAI.return_value = mock_client
+            yield mock_client
+
+    def test_stream_closed_at_end_of_code_block(self, mock_openai):
+        from baes.llm.openai_client import OpenAIClient
+
+        stream = Mock()
+        stream.__iter__ = Mock(return_value=iter(stream_chunks(ROUTES)))
+        mock_openai.chat.completions.create.return_value = stream
+
+        with patch("baes.llm.openai_client.Config.ENABLE_STREAMING_GENERATION", True):
+            code = OpenAIClient().generate_code_with_domain_focus(
+                "Generate routes", "FastAPI Routes", {"entity": "Student", "attributes": ["name: str"]}
+            )
+
+        assert code.startswith('"""\nStudent routes') and "```" not in code
+        assert mock_openai.chat.completions.create.call_args[1]["stream"] is True
+        stream.close.assert_called_once()
+
+    def test_invalid_code_aborts_stream(self, mock_openai):
+        from baes.llm.openai_client import OpenAIClient
+
+        usage = Mock(prompt_tokens=100, completion_tokens=20, prompt_tokens_details=None)
+        mock_openai.chat.completions.create.return_value = iter(
+            stream_chunks("```js\nconst x = 1;\n```", usage=usage)
+        )
+
+        with pytest.raises(CodeStreamAborted, match="js"):
+            OpenAIClient().generate_code_stream("Generate routes", "system")
@@ -0,0 +1,184 @@
+"""
+Unit tests for the SQLite schema template and template-first DatabaseSWEA.
+
+Tests that the registry selects schema templates by SQL dialect, that the
+SQLite script executes (trigger, relationship tables), and that DatabaseSWEA
+creates and evolves standard entity tables without an LLM call.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from baes.utils.template_registry import EntityType, SWEAType, TemplateInput, TemplateRegistry
+
+ATTRIBUTES = [
+    {"name": "name", "type": "str"},
+    {"name": "gpa", "type": "float"},
+    {"name": "active", "type": "bool"},
+]
+
+
+def _schema_input(dialect=None, **kwargs):
+    return TemplateInput(
+        entity_name="Student",
+        entity_type=EntityType.STANDARD,
+        swea_type=SWEAType.DATABASE,
+        attributes={"id": "int", "name": "str", "active": "bool"},
+        dialect=dialect,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestSchemaTemplates:
+    """Test dialect-aware schema template selection and the SQLite script"""
+
+    def test_selects_by_dialect(self):
+        """SQLite is the default dialect, PostgreSQL stays available"""
+        registry = TemplateRegistry()
+        assert registry.select_template(_schema_input()).template_id == "database_schema_sqlite"
+        assert registry.select_template(_schema_input("sqlite")).template_id == "database_schema_sqlite"
+        assert registry.select_template(_schema_input("postgresql")).template_id == "database_schema_crud"
+        assert registry.select_template(_schema_input("mysql")) is None
+
+    def test_sqlite_script_executes(self):
+        """The script should create the table, trigger and relationship tables"""
+        output = TemplateRegistry().render_template(
+            _schema_input(
+                "sqlite",
+                relationships={
+                    "course": {"type": "Course", "cardinality": "one"},
+                    "clubs": {"type": "Club", "cardinality": "many"},
+                },
+            )
+        )
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(output.generated_code)
+
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(students)")]
+        assert columns == ["id", "name", "active", "course_id", "created_at", "updated_at"]
+        assert "WITHOUT ROWID" in output.generated_code
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'student_clubs'").fetchone()
+
+        conn.execute("INSERT INTO students (name, active) VALUES ('Ada', 1)")
+        conn.execute("UPDATE students SET updated_at = '2000-01-01'")
+        conn.execute("UPDATE students SET name = 'Grace'")
+        assert conn.execute("SELECT updated_at FROM students").fetchone()[0] != "2000-01-01"
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO students (name, active) VALUES ('Bob', 2)")
+
+        # Re-running the script is a no-op
+        conn.executescript(output.generated_code)
+
+
+@pytest.mark.unit
+class TestTemplateFirstDatabaseSWEA:
+    """Test DatabaseSWEA's template-first table creation"""
+
+    @pytest.fixture
+    def database(self):
+        from baes.swea_agents.database_swea import DatabaseSWEA
+
+        with patch("baes.swea_agents.database_swea.OpenAIClient"):
+            swea = DatabaseSWEA()
+        with patch.object(type(swea), "managed_system_manager"):
+            yield swea
+
+    def test_standard_entity_uses_template_without_llm(self, database, tmp_path):
+        """Standard entities should not need feedback interpretation"""
+        db_file = tmp_path / "baes_system.db"
+        result = database.handle_task(
+            "setup_database",
+            {
+                "entity": "Student",
+                "attributes": ATTRIBUTES,
+                "database_path": str(db_file),
+                "expected_output": "Student table",
+            },
+        )
+
+        assert result["success"]
+        assert result["data"]["template_id"] == "database_schema_sqlite"
+        assert "CREATE TRIGGER" in result["data"]["code"]
+        assert "gpa REAL" in result["data"]["columns"]
+        database.llm_client.generate_json_response.assert_not_called()
+
+    def test_custom_entity_falls_back_to_direct_sql(self, database, tmp_path):
+        """CUSTOM entities should be created without the template"""
+        result = database.handle_task(
+            "setup_database",
+            {
+                "entity": "Student",
+                "attributes": ATTRIBUTES,
+                "database_path": str(tmp_path / "baes_system.db"),
+                "use_only_specified_attributes": True,
+                "entity_classification": {"entity_type": "custom"},
+            },
+        )
+
+        assert result["success"] and result["data"]["template_used"] is False
+        assert result["data"]["code"].startswith("CREATE TABLE students (id INTEGER PRIMARY KEY")
+
+
+@pytest.mark.unit
+class TestSchemaEvolution:
+    """Test DatabaseSWEA's LLM-free migration path for STANDARD entities"""
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        from baes.swea_agents.database_swea import DatabaseSWEA
+
+        with patch("baes.swea_agents.database_swea.OpenAIClient"):
+            swea = DatabaseSWEA()
+        with patch.object(type(swea), "managed_system_manager"):
+            swea.managed_system_manager.managed_system_path = tmp_path
+            db_file = tmp_path / "app" / "database" / "baes_system.db"
+            db_file.parent.mkdir(parents=True)
+            with sqlite3.connect(db_file) as conn:
+                conn.execute("CREATE TABLE students (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)")
+                conn.execute("INSERT INTO students (name) VALUES ('Ada')")
+            yield swea, db_file
+
+    def _migrate(self, swea, attributes, entity_type="standard"):
+        with patch.object(swea, "_interpret_feedback_for_database_setup") as interpret:
+            interpret.return_value = {"attributes": attributes}
+            result = swea.handle_task(
+                "migrate_schema",
+                {
+                    "entity": "Student",
+                    "attributes": attributes,
+                    "entity_classification": {"entity_type": entity_type},
+                },
+            )
+        return result, interpret
+
+    def test_standard_evolution_adds_columns(self, database):
+        """New columns should be added in place, keeping existing rows"""
+        swea, db_file = database
+        result, interpret = self._migrate(swea, [{"name": "email", "type": "str"}])
+
+        assert result["success"] and result["data"]["template_used"]
+        assert "ALTER TABLE students ADD COLUMN email TEXT;" in result["data"]["code"]
+        interpret.assert_not_called()
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("SELECT id, name, email FROM students").fetchall() == [(1, "Ada", None)]
+
+    def test_type_change_rebuilds_table(self, database):
+        """A changed column type should rebuild the table, still without the LLM"""
+        swea, db_file = database
+        result, interpret = self._migrate(swea, [{"name": "name", "type": "int"}])
+
+        assert result["success"] and "RENAME TO students_backup" in result["data"]["sql"]
+        interpret.assert_not_called()
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM students").fetchone()[0] == 1
+
+    def test_custom_entity_uses_llm(self, database):
+        """CUSTOM entity evolutions should still be interpreted by the LLM"""
+        swea, _ = database
+        result, interpret = self._migrate(swea, [{"name": "email", "type": "str"}], "custom")
+
+        assert result["success"]
+        interpret.assert_called_once()
@@ -0,0 +1,173 @@
+"""
+Unit tests for LLM diff repair of rejected artifacts (baes.utils.diff_repair).
+
+Tests unified-diff parsing and context-located application, that repairs
+which do not apply or do not parse fail (so the kernel regenerates), and the
+kernel's use of the SWEA's LLM client for the retry.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baes.standards.compressed_standards import estimate_token_counts
+from baes.utils.diff_repair import (
+    DIFF_REPAIR_SYSTEM_PROMPT,
+    DiffApplyError,
+    apply_unified_diff,
+    parse_unified_diff,
+    repair_with_diff,
+    should_repair_with_diff,
+)
+
+UI_CODE = """import streamlit as st
+import requests
+
+API_BASE_URL = "http://localhost:8000"
+
+
+def show_students():
+    response = requests.get(f"{API_BASE_URL}/students/")
+    st.dataframe(response.json())
+
+
+def main():
+    st.title("Students")
+    show_students()
+"""
+
+TIMEOUT_DIFF = """```diff
+--- a/student_management.py
++++ b/student_management.py
+@@ -7,3 +7,3 @@
+ def show_students():
+-    response = requests.get(f"{API_BASE_URL}/students/")
++    response = requests.get(f"{API_BASE_URL}/students/", timeout=10)
+     st.dataframe(response.json())
+```"""
+
+
+@pytest.mark.unit
+class TestApplyUnifiedDiff:
+    """Test parsing and applying unified diffs"""
+
+    def test_applies_fenced_diff(self):
+        """Markdown fences and file headers should be ignored"""
+        patched = apply_unified_diff(UI_CODE, TIMEOUT_DIFF)
+        assert patched == UI_CODE.replace('/students/")', '/students/", timeout=10)')
+
+    def test_wrong_line_numbers_are_located_by_context(self):
+        """Hunks should be found by their content when the line numbers are off"""
+        diff = TIMEOUT_DIFF.replace("@@ -7,3 +7,3 @@", "@@ -40,3 +40,3 @@")
+        assert "timeout=10" in apply_unified_diff(UI_CODE, diff)
+
+    def test_multiple_hunks_and_insertions(self):
+        """Several hunks should apply in order, including blank context lines"""
+        diff = """@@ -1,2 +1,3 @@
+ import streamlit as st
+ import requests
++import logging
+@@ -12,3 +13,4 @@
+ def main():
+     st.title("Students")
++    st.caption("Manage students")
+     show_students()
+"""
+        patched = apply_unified_diff(UI_CODE, diff)
+        assert patched.splitlines()[2] == "import logging"
+        assert '    st.caption("Manage students")\n    show_students()\n' in patched
+
+    def test_header_like_lines_inside_hunks(self):
+        """``--- `` and ``+++ `` lines after the first hunk header are changes"""
+        sql = "CREATE TABLE students (id INTEGER);\n-- legacy index\nCREATE INDEX ix ON students (id);\n"
+        diff = """--- a/schema.sql
++++ b/schema.sql
+@@ -1,3 +1,3 @@
+ CREATE TABLE students (id INTEGER);
+--- legacy index
++++ primary index
+ CREATE INDEX ix ON students (id);
+"""
+        (hunk,) = parse_unified_diff(diff)
+        assert hunk.old_lines[1] == "-- legacy index"
+        assert apply_unified_diff(sql, diff) == sql.replace("-- legacy", "++ primary")
+
+    def test_mismatched_or_empty_diff_fails(self):
+        """Diffs that match nowhere or contain no hunk should raise"""
+        with pytest.raises(DiffApplyError):
+            apply_unified_diff(UI_CODE, TIMEOUT_DIFF.replace("show_students", "list_students"))
+        with pytest.raises(DiffApplyError):
+            parse_unified_diff("Here is the fixed file:\nimport streamlit as st\n")
+
+
+@pytest.mark.unit
+class TestRepairWithDiff:
+    """Test the LLM repair round trip"""
+
+    def test_successful_repair(self):
+        """The model's diff should be applied and reported"""
+        client = MagicMock()
+        client.generate_response.return_value = TIMEOUT_DIFF
+        result = repair_with_diff(
+            client, UI_CODE, ["Add timeouts to requests"], "frontend", "student_management.py"
+        )
+
+        assert result.success and result.hunks == 1
+        assert "timeout=10" in result.code
+        prompt = client.generate_response.call_args.args[0]
+        assert "Add timeouts to requests" in prompt and UI_CODE in prompt
+        assert result.tokens == sum(
+            estimate_token_counts([DIFF_REPAIR_SYSTEM_PROMPT, prompt, TIMEOUT_DIFF])
+        )
+
+    def test_unparsable_result_fails(self):
+        """Repairs producing invalid Python should fall back to regeneration"""
+        client = MagicMock()
+        client.generate_response.return_value = TIMEOUT_DIFF.replace("timeout=10)", "timeout=10")
+        result = repair_with_diff(client, UI_CODE, ["Add timeouts"], "frontend", "ui.py")
+        assert not result.success
+        assert "syntax" in result.error
+
+    def test_size_threshold(self):
+        """Small artifacts should be regenerated rather than diff-repaired"""
+        with patch("baes.utils.diff_repair.Config") as config:
+            config.ENABLE_DIFF_REPAIR = True
+            config.DIFF_REPAIR_MIN_CHARS = 100
+            assert should_repair_with_diff(UI_CODE)
+            assert not should_repair_with_diff("x = 1\n")
+            config.ENABLE_DIFF_REPAIR = False
+            assert not should_repair_with_diff(UI_CODE)
+
+
+@pytest.mark.unit
+class TestKernelDiffRepair:
+    """Test the kernel's diff repair retry"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            return EnhancedRuntimeKernel(context_store_path=temp_database_path)
+
+    def test_repaired_artifact_replaces_rejected_one(self, kernel, tmp_path):
+        """A repaired artifact should be written and returned without regeneration"""
+        artifact = tmp_path / "student_management.py"
+        artifact.write_text(UI_CODE)
+        agent = MagicMock()
+        agent.llm_client.generate_response.return_value = TIMEOUT_DIFF
+        rejected = {"success": True, "data": {"code": UI_CODE, "file_path": str(artifact)}}
+        kernel.current_metrics = MagicMock()
+
+        result = kernel._repair_with_diff(
+            agent, "FrontendSWEA", {"techlead_feedback": ["Add timeouts"]}, rejected
+        )
+
+        assert result["data"]["repair_method"] == "diff_repair"
+        assert artifact.read_text() == result["data"]["code"]
+        assert "timeout=10" in result["data"]["code"]
+        assert kernel.current_metrics.retry_tokens > len(UI_CODE) // 4
+        agent.handle_task.assert_not_called()
+
+        agent.llm_client.generate_response.return_value = "I could not produce a diff."
+        assert kernel._repair_with_diff(agent, "FrontendSWEA", {}, rejected) is None
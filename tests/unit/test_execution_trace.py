@@ -0,0 +1,186 @@
+"""
+Unit tests for per-request execution tracing (baes.utils.execution_trace)
+
+Tests cover:
+- span() is a no-op without an active trace
+- Span nesting and parent/child relationships
+- Context propagation across asyncio.to_thread and concurrent tasks
+- Chrome trace-event export format
+- Critical-path computation for sequential and concurrent spans
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from baes.utils.execution_trace import (
+    ExecutionTrace,
+    current_span,
+    current_trace,
+    span,
+    start_trace,
+)
+
+
+class TestSpanBasics:
+    """Test span recording and nesting"""
+
+    def test_span_without_trace_is_noop(self):
+        """span() should yield None and record nothing when no trace is active"""
+        assert current_trace() is None
+        with span("orphan") as s:
+            assert s is None
+
+    def test_start_trace_opens_root_span(self):
+        """start_trace should create a root span named after the trace"""
+        with start_trace(name="request") as trace:
+            assert current_trace() is trace
+            assert current_span().name == "request"
+        assert current_trace() is None
+        spans = trace.finished_spans()
+        assert len(spans) == 1
+        assert spans[0].parent_id is None
+        assert spans[0].category == "request"
+
+    def test_nested_spans_record_parent(self):
+        """Nested spans should reference the enclosing span as parent"""
+        with start_trace() as trace:
+            with span("outer", category="swea") as outer:
+                with span("inner", category="llm", model="gpt") as inner:
+                    pass
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes["model"] == "gpt"
+        assert len(trace.finished_spans()) == 3
+
+    def test_span_records_error_and_reraises(self):
+        """Exceptions inside a span should be recorded and propagated"""
+        with pytest.raises(ValueError):
+            with start_trace() as trace:
+                with span("failing"):
+                    raise ValueError("boom")
+        failing = [s for s in trace.finished_spans() if s.name == "failing"][0]
+        assert "ValueError: boom" in failing.attributes["error"]
+        assert failing.end is not None
+
+
+class TestContextPropagation:
+    """Test thread and asyncio safety"""
+
+    def test_spans_in_to_thread_join_trace(self):
+        """Spans opened inside asyncio.to_thread workers should attach to the trace"""
+
+        def work(label):
+            with span(f"thread:{label}", category="swea"):
+                time.sleep(0.01)
+
+        async def run():
+            with span("wave", category="wave") as wave:
+                await asyncio.gather(
+                    asyncio.to_thread(work, "a"), asyncio.to_thread(work, "b")
+                )
+            return wave
+
+        with start_trace() as trace:
+            wave = asyncio.run(run())
+
+        thread_spans = [s for s in trace.finished_spans() if s.name.startswith("thread:")]
+        assert len(thread_spans) == 2
+        assert all(s.parent_id == wave.span_id for s in thread_spans)
+
+    def test_concurrent_traces_are_isolated(self):
+        """Two traces running in separate tasks should not share spans"""
+
+        async def request(label):
+            with start_trace(name=label) as trace:
+                with span(f"{label}-work"):
+                    await asyncio.sleep(0.01)
+            return trace
+
+        async def run():
+            return await asyncio.gather(request("first"), request("second"))
+
+        first, second = asyncio.run(run())
+        assert {s.name for s in first.finished_spans()} == {"first", "first-work"}
+        assert {s.name for s in second.finished_spans()} == {"second", "second-work"}
+
+
+class TestExport:
+    """Test Chrome trace-event export"""
+
+    def test_chrome_trace_format(self):
+        """Export should contain complete events with microsecond timing"""
+        with start_trace(request_id="req-1") as trace:
+            with span("step", category="swea"):
+                time.sleep(0.005)
+
+        data = trace.to_chrome_trace()
+        events = [e for e in data["traceEvents"] if e["ph"] == "X"]
+        assert {e["name"] for e in events} == {"request", "step"}
+        step = [e for e in events if e["name"] == "step"][0]
+        assert step["cat"] == "swea"
+        assert step["dur"] >= 5000
+        assert data["otherData"]["request_id"] == "req-1"
+        json.dumps(data)  # must be serializable
+
+    def test_export_writes_file(self, tmp_path):
+        """export() should write a JSON file into the target directory"""
+        with start_trace() as trace:
+            with span("step"):
+                pass
+        path = trace.export(str(tmp_path))
+        assert path is not None and path.exists()
+        assert "traceEvents" in json.loads(path.read_text())
+
+
+class TestCriticalPath:
+    """Test critical-path computation"""
+
+    def test_empty_trace(self):
+        """An empty trace should produce an empty critical path"""
+        assert ExecutionTrace().critical_path()["path"] == []
+
+    def test_sequential_spans_all_on_path(self):
+        """Sequential children should all lie on the critical path"""
+        with start_trace() as trace:
+            with span("recognition", category="recognition"):
+                time.sleep(0.005)
+            with span("generation", category="swea"):
+                time.sleep(0.01)
+
+        names = [step["name"] for step in trace.critical_path()["path"]]
+        assert names == ["request", "recognition", "generation"]
+
+    def test_concurrent_spans_pick_longest(self):
+        """Of overlapping children, only the one finishing last is on the path"""
+
+        def work(label, delay):
+            with span(label, category="swea"):
+                time.sleep(delay)
+
+        async def run():
+            await asyncio.gather(
+                asyncio.to_thread(work, "fast", 0.005),
+                asyncio.to_thread(work, "slow", 0.05),
+            )
+
+        with start_trace() as trace:
+            asyncio.run(run())
+
+        critical = trace.critical_path()
+        names = [step["name"] for step in critical["path"]]
+        assert "slow" in names
+        assert "fast" not in names
+        assert critical["by_category"]["swea"] >= 40
+
+    def test_summary_contains_category_breakdown(self):
+        """summary() should expose critical path strings and exclusive time per category"""
+        with start_trace() as trace:
+            with span("llm-call", category="llm"):
+                time.sleep(0.005)
+
+        summary = trace.summary()
+        assert summary["span_count"] == 2
+        assert summary["critical_path"][1].startswith("llm-call")
+        assert "llm" in summary["time_by_category"]
@@ -0,0 +1,127 @@
+"""
+Unit tests for process-pool validation of many artifacts (baes.standards.parallel_validation).
+
+Tests that ValidationRuleEngine.validate_many and the *Standards validate_many
+return the same results as one-by-one validation, in order; that small batches
+are validated inline; that workers follow rule-catalog changes; and that pool
+failures fall back to inline validation.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards import BackendStandards, BaseStandards, FrontendStandards
+from baes.standards.validation_rules import ValidationRuleEngine
+
+BACKEND = """
+from fastapi import APIRouter, HTTPException, Depends
+import logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/students")
+def list_students(db=Depends(get_db)):
+    try:
+        return db.execute("SELECT * FROM students").fetchall()
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+"""
+
+FRONTEND = """
+import streamlit as st
+
+st.title("Students")
+name = st.text_input("Name")
+if st.button("Save"):
+    st.success("Saved")
+"""
+
+ITEMS = [(BACKEND + f"\n# {index}\n", "backend") for index in range(6)] + [
+    (FRONTEND, "frontend"),
+    (BACKEND, "database"),
+]
+
+
+def _summary(result):
+    return (result.overall_outcome, result.confidence_score, result.rule_results)
+
+
+def _parallel_config(config, min_chars=0, chunk_chars=1):
+    config.ENABLE_PARALLEL_VALIDATION = True
+    config.VALIDATION_POOL_MIN_CHARS = min_chars
+    config.VALIDATION_POOL_CHUNK_CHARS = chunk_chars
+    config.VALIDATION_POOL_WORKERS = 2
+
+
+@pytest.mark.unit
+class TestRuleEngineValidateMany:
+    """Test ValidationRuleEngine.validate_many"""
+
+    def test_small_batches_are_validated_inline(self):
+        """Batches under the size threshold should never start the pool"""
+        engine = ValidationRuleEngine()
+        with (
+            patch("baes.standards.parallel_validation.Config") as config,
+            patch("baes.standards.parallel_validation._get_pool") as get_pool,
+        ):
+            _parallel_config(config, min_chars=10**9)
+            results = engine.validate_many(ITEMS)
+
+        get_pool.assert_not_called()
+        expected = [ValidationRuleEngine().validate_code(code, swea) for code, swea in ITEMS]
+        assert [_summary(r) for r in results] == [_summary(r) for r in expected]
+        assert engine.validate_many([]) == []
+
+    def test_worker_results_match_inline_and_follow_catalog(self):
+        """Process-pool results should equal inline results, in order, for the current catalog"""
+        engine = ValidationRuleEngine()
+        engine.disable_rule(engine.list_rules("backend")[0].rule_id)
+        expected = [engine.validate_code(code, swea) for code, swea in ITEMS]
+
+        with patch("baes.standards.parallel_validation.Config") as config:
+            _parallel_config(config, chunk_chars=len(BACKEND) * 3)
+            results = engine.validate_many(ITEMS, max_workers=2)
+
+        assert [_summary(r) for r in results] == [_summary(r) for r in expected]
+        assert all(result.scan is None for result in results)
+
+    def test_pool_failure_falls_back_inline(self):
+        """A broken pool should not lose results"""
+        engine = ValidationRuleEngine()
+        with (
+            patch("baes.standards.parallel_validation.Config") as config,
+            patch(
+                "baes.standards.parallel_validation._get_pool",
+                side_effect=OSError("no processes"),
+            ),
+        ):
+            _parallel_config(config)
+            results = engine.validate_many(ITEMS, max_workers=2)
+
+        assert [r.overall_outcome for r in results] == [
+            engine.validate_code(code, swea).overall_outcome for code, swea in ITEMS
+        ]
+
+
+@pytest.mark.unit
+class TestStandardsValidateMany:
+    """Test validate_many on the *Standards classes"""
+
+    def test_dispatches_by_swea_type_in_order(self):
+        """Each item should be validated by the standards of its SWEA type"""
+        items = [
+            (BACKEND, "backend", "Student"),
+            (FRONTEND, "frontend", "Student"),
+            (BACKEND, "custom"),
+        ]
+        results = BackendStandards.validate_many(items)
+
+        assert results == [
+            BackendStandards.get_backend_validation(BACKEND, "Student"),
+            FrontendStandards.get_frontend_validation(FRONTEND, "Student"),
+            BaseStandards.get_comprehensive_validation(BACKEND),
+        ]
@@ -0,0 +1,147 @@
+"""
+Unit tests for the prompt fragment registry.
+
+Tests that static prompt sections are token-counted once, that assembled prompts
+count only their variable parts and drop optional sections over the token
+budget, and that SWEA prompt builders assemble their prompts from fragments.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from baes.utils.prompt_fragments import PromptFragmentRegistry
+
+
+@pytest.fixture
+def count_tokens():
+    """Deterministic token counter (one token per character)"""
+    with patch(
+        "baes.utils.prompt_fragments.estimate_token_count", side_effect=len
+    ) as counter, patch(
+        "baes.utils.prompt_fragments.estimate_token_counts",
+        side_effect=lambda texts: [counter(text) for text in texts],
+    ):
+        yield counter
+
+
+@pytest.mark.unit
+class TestPromptFragmentRegistry:
+    """Test fragment registration and prompt assembly"""
+
+    def test_static_fragment_is_tokenized_once(self, count_tokens):
+        registry = PromptFragmentRegistry()
+        loader_calls = []
+
+        def load():
+            loader_calls.append(1)
+            return "STANDARDS"
+
+        fragment = registry.static("standards.backend", load)
+        assert registry.static("standards.backend", load) is fragment
+        assert registry.register("standards.backend", "STANDARDS") is fragment
+        assert (fragment.text, fragment.token_count) == ("STANDARDS", 9)
+        assert len(loader_calls) == 1
+        assert count_tokens.call_count == 1
+
+        # New text replaces the fragment
+        assert registry.register("standards.backend", "NEW").token_count == 3
+        assert registry.stats() == {"fragments": 1, "static_tokens": 3, "tokenizations": 2}
+
+    def test_assemble_counts_only_variable_parts(self, count_tokens):
+        registry = PromptFragmentRegistry()
+        header = registry.register("test.header", "HEADER\n")
+        count_tokens.reset_mock()
+
+        prompt = registry.assemble([header, "Entity: Student", None])
+
+        assert prompt.text == "HEADER\nEntity: Student"
+        assert (prompt.static_tokens, prompt.dynamic_tokens, prompt.token_count) == (7, 15, 22)
+        assert prompt.fragment_ids == ["test.header"]
+        count_tokens.assert_called_once_with("Entity: Student")
+
+    def test_optional_fragments_dropped_over_budget(self, count_tokens):
+        registry = PromptFragmentRegistry()
+        standards = registry.register("test.standards", "S" * 50)
+        warning = registry.register("test.warning", "W" * 20)
+
+        fits = registry.assemble(["code", standards, warning], token_budget=100, optional=["test.warning"])
+        assert fits.dropped_fragments == []
+
+        trimmed = registry.assemble(["code", standards, warning], token_budget=60, optional=["test.warning"])
+        assert trimmed.text == "code" + "S" * 50
+        assert trimmed.dropped_fragments == ["test.warning"]
+        assert trimmed.within_budget
+
+        # Required fragments are kept even when the prompt stays over budget
+        over = registry.assemble(["code", standards, warning], token_budget=10, optional=["test.warning"])
+        assert over.fragment_ids == ["test.standards"]
+        assert not over.within_budget
+
+    def test_prompt_file_is_read_once(self, tmp_path, count_tokens):
+        (tmp_path / "backend_gen.txt").write_text("Generate {entity} routes", encoding="utf-8")
+        registry = PromptFragmentRegistry(prompts_dir=tmp_path)
+
+        fragment = registry.prompt_file("backend_gen")
+        (tmp_path / "backend_gen.txt").unlink()
+
+        assert registry.prompt_file("backend_gen") is fragment
+        assert fragment.fragment_id == "prompts.backend_gen"
+        assert fragment.text == "Generate {entity} routes"
+
+
+@pytest.mark.unit
+class TestSWEAPromptFragments:
+    """Test SWEA prompt builders on the shared registry"""
+
+    def test_backend_api_prompt_drops_final_warning_over_budget(self, count_tokens):
+        from baes.swea_agents.backend_swea import BackendSWEA
+
+        with patch("baes.swea_agents.backend_swea.OpenAIClient"):
+            backend = BackendSWEA()
+        registry = PromptFragmentRegistry(token_budget=100_000)
+        with patch("baes.swea_agents.backend_swea.get_prompt_fragments", return_value=registry), patch(
+            "baes.swea_agents.backend_swea.Config"
+        ) as config:
+            config.ENABLE_COMPRESSED_STANDARDS = True
+            full = backend._build_api_prompt("Student", ["name: str"], "academic")
+            registry.token_budget = len(full) - 10
+            trimmed = backend._build_api_prompt("Student", ["name: str"], "academic")
+
+        assert "FINAL WARNING" in full
+        assert "FINAL WARNING" not in trimmed
+        assert trimmed.startswith(full[: len(full) // 2])
+        assert any(
+            fragment_id.startswith("standards.backend.compressed.") for fragment_id in registry._fragments
+        )
+
+    def test_do_not_ignore_warning_is_shared(self):
+        from baes.swea_agents.frontend_swea import FrontendSWEA
+
+        with patch("baes.swea_agents.frontend_swea.OpenAIClient"):
+            first, second = FrontendSWEA(), FrontendSWEA()
+
+        assert first._get_do_not_ignore_fragment() is second._get_do_not_ignore_fragment()
+        assert "DO NOT IGNORE ANY INSTRUCTIONS" in first._get_do_not_ignore_warning()
+
+    def test_prompts_share_static_prefix_across_entities(self, count_tokens):
+        import os
+
+        from baes.swea_agents.frontend_swea import FrontendSWEA
+
+        with patch("baes.swea_agents.frontend_swea.OpenAIClient"):
+            frontend = FrontendSWEA()
+        registry = PromptFragmentRegistry()
+        with patch("baes.swea_agents.frontend_swea.get_prompt_fragments", return_value=registry):
+            student = frontend._build_prompt("Student", ["name: str"], "academic")
+            course = frontend._build_prompt("Course", ["title: str"], "academic")
+
+        shared_prefix = os.path.commonprefix([student, course])
+        # Everything up to the request-specific feedback and entity sections is shared
+        assert "NEVER include 'id' field in forms or data dictionaries\n" in shared_prefix
+        assert "Student" not in shared_prefix
+
+        prompt = registry.assemble(
+            [registry.get("frontend.do_not_ignore"), "\n", registry.get("frontend.ui_output_format"), "Entity"]
+        )
+        assert prompt.prefix_tokens == prompt.static_tokens
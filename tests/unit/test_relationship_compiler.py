@@ -0,0 +1,211 @@
+"""
+Unit tests for the deterministic relationship compiler.
+
+Tests that relationships compile into an executable, idempotent SQLite migration
+and join endpoints, that BAEs recognize relationship requests between known
+entities without the LLM, and that DatabaseSWEA and BackendSWEA apply the
+compiled relationships.
+"""
+
+import ast
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from baes.core.context_store import ContextStore
+from baes.utils.relationship_compiler import (
+    RelationshipCompiler,
+    RelationshipSpec,
+    normalize_cardinality,
+)
+
+TABLES = """
+CREATE TABLE courses (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE students (id INTEGER PRIMARY KEY, name TEXT);
+"""
+
+
+@pytest.fixture(scope="module")
+def compiler():
+    return RelationshipCompiler()
+
+
+@pytest.mark.unit
+class TestRelationshipSpec:
+    """Test relationship specs built from ContextStore records"""
+
+    def test_cardinality_normalization(self):
+        assert normalize_cardinality("foreign_key") == "one"
+        assert normalize_cardinality("one_to_one") == "one"
+        assert normalize_cardinality(None) == "one"
+        assert normalize_cardinality("many_to_many") == "many"
+        assert normalize_cardinality("Many-To-Many") == "many"
+
+    def test_from_record(self):
+        spec = RelationshipSpec.from_record(
+            {
+                "primary_entity": "Student",
+                "related_entity": "course",
+                "relationship_type": "foreign_key",
+            }
+        )
+        assert spec == RelationshipSpec("Student", "Course", "one")
+        assert (spec.foreign_key, spec.junction_table, spec.field_name) == ("course_id", None, "course_id")
+
+        many = RelationshipSpec.create("Student", "Course", "many_to_many")
+        assert (many.foreign_key, many.junction_table, many.field_name) == (
+            None,
+            "student_courses",
+            "course_ids",
+        )
+
+
+@pytest.mark.unit
+class TestRelationshipCompiler:
+    """Test the artifacts rendered for a relationship"""
+
+    def test_foreign_key_migration_is_idempotent(self, compiler):
+        spec = RelationshipSpec.create("Student", "Course")
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(TABLES)
+
+        conn.executescript(compiler.compile(spec).migration_sql)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(students)")]
+        assert columns == ["id", "name", "course_id"]
+
+        # Against the migrated table only the index statement is left
+        rerun = compiler.migration_sql(spec, columns)
+        assert "ALTER TABLE" not in rerun
+        conn.executescript(rerun)
+
+    def test_compilations_are_memoized(self):
+        compiler = RelationshipCompiler()
+        compiled = compiler.compile(RelationshipSpec.create("Student", "Course"))
+        assert compiler.compile(RelationshipSpec.create("Student", "Course")) is compiled
+        assert compiled.to_dict()["foreign_key"] == "course_id"
+
+        with patch("baes.utils.relationship_compiler._MEMO_SIZE", 2):
+            compiler.compile(RelationshipSpec.create("Student", "Club"))
+            compiler.compile(RelationshipSpec.create("Student", "Course"))  # Most recently used
+            compiler.compile(RelationshipSpec.create("Student", "Teacher"))
+        assert [spec.secondary for spec in compiler._memo] == ["Course", "Teacher"]
+
+    def test_many_to_many_migration(self, compiler):
+        compiled = compiler.compile(RelationshipSpec.create("Student", "Course", "many_to_many"))
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(TABLES)
+        conn.executescript(compiled.migration_sql)
+        conn.executescript(compiled.migration_sql)
+
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'student_courses'").fetchone()
+
+    def test_routes_template_renders_join_endpoints(self):
+        from baes.utils.template_registry import (
+            EntityType,
+            SWEAType,
+            TemplateInput,
+            TemplateRegistry,
+        )
+
+        output = TemplateRegistry().render_template(
+            TemplateInput(
+                entity_name="Student",
+                entity_type=EntityType.STANDARD,
+                swea_type=SWEAType.BACKEND,
+                attributes={"name": "str", "course_id": "int"},
+                relationships=RelationshipSpec.create("Student", "Course").template_relationships(),
+                custom_logic={"foreign_keys": {"course_id": "Course"}},
+            )
+        )
+
+        assert output.template_used
+        ast.parse(output.generated_code)
+        assert "def get_student_course(student_id: int)" in output.generated_code
+        assert '@router.get("/{student_id}/course")' in output.generated_code
+
+        many = RelationshipSpec.create("Student", "Course", "many_to_many")
+        output = TemplateRegistry().render_template(
+            TemplateInput(
+                entity_name="Student",
+                entity_type=EntityType.STANDARD,
+                swea_type=SWEAType.BACKEND,
+                attributes={"name": "str"},
+                relationships=many.template_relationships(),
+            )
+        )
+        ast.parse(output.generated_code)
+        assert '@router.put("/{student_id}/courses/{course_id}"' in output.generated_code
+        assert 'conn.execute("PRAGMA foreign_keys = ON")' in output.generated_code
+
+
+@pytest.mark.unit
+class TestRelationshipRequests:
+    """Test deterministic relationship requests from BAE to SWEAs"""
+
+    @pytest.fixture
+    def bae(self, tmp_path, monkeypatch):
+        from baes.domain_entities.academic.student_bae import StudentBae
+
+        store_path = str(tmp_path / "context_store.json")
+        monkeypatch.setenv("BAE_CONTEXT_STORE_PATH", store_path)
+        ContextStore(store_path).store_agent_memory(
+            "CourseBAE", {"current_schema": {"entity": "Course", "attributes": ["name: str"]}}
+        )
+        with patch("baes.domain_entities.base_bae.OpenAIClient"):
+            bae = StudentBae()
+        bae.current_schema = {
+            "attributes": [{"name": "id", "type": "int"}, {"name": "name", "type": "str"}]
+        }
+        return bae
+
+    def test_request_matching(self, bae):
+        assert bae._match_relationship_request("add course to student")["related_entity"] == "Course"
+        assert bae._match_relationship_request("Enroll a student in the courses")["related_entity"] == "Course"
+        # Unknown entity (an attribute) or another entity holding the key need the LLM
+        assert bae._match_relationship_request("add email to student") == {}
+        assert bae._match_relationship_request("add student to course") == {}
+
+    def test_relationship_request_without_llm(self, bae, tmp_path):
+        interpretation = bae._interpret_business_request(
+            {"request": "add course to student", "context": "academic"}
+        )
+
+        bae.llm.generate_json_response.assert_not_called()
+        plan = {task["swea_agent"]: task["payload"] for task in interpretation["swea_coordination"][1:4]}
+        assert plan["DatabaseSWEA"]["compiled_relationships"][0]["foreign_key"] == "course_id"
+        assert plan["BackendSWEA"]["attributes"][-1]["name"] == "course_id"
+
+        (record,) = ContextStore(str(tmp_path / "context_store.json")).get_entity_relationships("Student")
+        assert (record["related_entity"], record["relationship_type"]) == ("Course", "foreign_key")
+
+    def test_swea_tasks_apply_compiled_relationship(self, bae, tmp_path):
+        from baes.swea_agents.backend_swea import BackendSWEA
+        from baes.swea_agents.database_swea import DatabaseSWEA
+
+        interpretation = bae._interpret_business_request({"request": "add course to student"})
+        plan = {task["swea_agent"]: task["payload"] for task in interpretation["swea_coordination"][1:4]}
+
+        db_file = tmp_path / "app" / "database" / "baes_system.db"
+        db_file.parent.mkdir(parents=True)
+        sqlite3.connect(db_file).executescript(TABLES)
+        with patch("baes.swea_agents.database_swea.OpenAIClient"):
+            database = DatabaseSWEA()
+        with patch.object(type(database), "managed_system_manager") as manager:
+            manager.managed_system_path = tmp_path
+            result = database.handle_task("create_relationships", plan["DatabaseSWEA"])
+        assert result["columns"] == ["id", "name", "course_id"]
+        assert result["foreign_keys"] == ["course_id"]
+
+        with patch("baes.swea_agents.backend_swea.OpenAIClient"):
+            backend = BackendSWEA()
+        backend._managed_system_manager = type(
+            "Manager", (), {"write_entity_artifact": lambda self, e, k, c: str(tmp_path / "r.py")}
+        )()
+        with patch("baes.swea_agents.backend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = True
+            api = backend.handle_task("generate_api", plan["BackendSWEA"])
+        assert api["data"]["template_used"]
+        assert '@router.get("/{student_id}/course")' in api["data"]["code"]
+        backend.llm_client.generate_code_with_domain_focus.assert_not_called()
+
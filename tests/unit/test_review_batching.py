@@ -0,0 +1,323 @@
+"""
+Unit tests for batched TechLeadSWEA reviews (baes.utils.review_batching).
+
+Tests the barrier-style batch collector, that a
+review_batch task validates all uncertain artifacts with one structured JSON
+call, that the kernel reviews a completed wave with one batched task, and that
+the coordination loop defers its uncertain LLM reviews into one batch.
+"""
+
+import asyncio
+import re
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baes.standards.compressed_standards import estimate_token_count
+from baes.utils.review_batching import ReviewBatch, review_batch_scope
+
+ARTIFACT_PATTERN = re.compile(r"ARTIFACT (artifact_\d+):.*?```python\s*(.*?)```", re.DOTALL)
+
+
+def _verdicts_from_prompt(prompt, **kwargs):
+    """Fake batched LLM response: artifacts whose code mentions 'good' are valid"""
+    return {
+        "verdicts": [
+            {
+                "artifact_id": artifact_id,
+                "is_valid": "good" in code,
+                "quality_score": 0.9 if "good" in code else 0.3,
+                "details": f"reviewed {code.strip()}",
+                "issues": [] if "good" in code else ["incomplete"],
+                "suggestions": [],
+            }
+            for artifact_id, code in ARTIFACT_PATTERN.findall(prompt)
+        ]
+    }
+
+
+@pytest.mark.unit
+class TestReviewBatch:
+    """Test the batch collector and splitter"""
+
+    def test_concurrent_submissions_flush_once(self):
+        """Requests from all waiting participants should be reviewed in one flush"""
+        flushed = []
+        batch = ReviewBatch(4, lambda requests: flushed.append(list(requests)) or requests)
+        results = {}
+
+        def participant(value):
+            with review_batch_scope(batch):
+                if value is not None:
+                    results[value] = batch.submit(value)
+
+        threads = [threading.Thread(target=participant, args=(v,)) for v in (1, 2, 3, None)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == {1: 1, 2: 2, 3: 3}
+        assert len(flushed) == 1 and sorted(flushed[0]) == [1, 2, 3]
+        assert batch.flush_sizes == [3]
+
+    def test_flush_errors_reach_every_participant(self):
+        """A failing flush should raise in each waiting participant"""
+
+        def failing_flush(requests):
+            raise RuntimeError("llm down")
+
+        batch = ReviewBatch(1, failing_flush)
+        with pytest.raises(RuntimeError, match="llm down"):
+            with review_batch_scope(batch):
+                batch.submit("x")
+
+
+@pytest.mark.unit
+class TestTechLeadBatchedReview:
+    """Test that TechLeadSWEA validates uncertain artifacts of a batch together"""
+
+    @pytest.fixture
+    def techlead(self):
+        from baes.swea_agents.techlead_swea import TechLeadSWEA
+
+        techlead = TechLeadSWEA()
+        techlead.llm_client = MagicMock()
+        techlead.llm_client.generate_json_response.side_effect = (
+            lambda prompt, **kwargs: _verdicts_from_prompt(prompt)
+        )
+        return techlead
+
+    def _review(self, code):
+        return {
+            "entity": "Student",
+            "swea_agent": "CustomSWEA",
+            "task_type": "generate",
+            "result": {"data": {"code": code, "file_path": "x.py"}},
+        }
+
+    def test_uncertain_artifacts_share_one_llm_call(self, techlead):
+        """Three reviews needing the LLM should produce one JSON call with per-artifact verdicts"""
+        codes = ["value = 'good one'\n", "value = 'bad'\n", "value = 'good two'\n"]
+        response = techlead.handle_task(
+            "review_batch", {"reviews": [self._review(code) for code in codes]}
+        )
+
+        assert techlead.llm_client.generate_json_response.call_count == 1
+        techlead.llm_client.generate_response.assert_not_called()
+        approvals = [review["approved"] for review in response["reviews"]]
+        assert approvals == [True, False, True]
+        assert response["approved"] is False
+        assert response["data"]["llm_batches"] == [3]
+
+    def test_batch_splits_when_token_budget_exceeded(self, techlead):
+        """Requests exceeding the token budget should be reviewed in several calls"""
+        requests = [
+            {
+                "entity": "Student",
+                "swea_agent": "CustomSWEA",
+                "task_type": "generate",
+                "code": f"value = 'good {index}'\n",
+                "file_path": "x.py",
+            }
+            for index in range(4)
+        ]
+        header = estimate_token_count(techlead._build_batch_validation_prompt([], []))
+        per_item = estimate_token_count(requests[0]["code"]) + 80
+        with patch(
+            "baes.swea_agents.techlead_swea.Config.LLM_REVIEW_BATCH_TOKEN_BUDGET",
+            header + 2 * per_item,
+        ):
+            results = techlead._validate_batch_with_llm(requests)
+
+        assert techlead.llm_client.generate_json_response.call_count == 2
+        assert [result["is_valid"] for result in results] == [True] * 4
+        assert results[3]["details"] == "reviewed value = 'good 3'"
+
+    def test_missing_verdict_falls_back_to_single_review(self, techlead):
+        """Artifacts without a batched verdict should be validated individually"""
+        techlead.llm_client.generate_json_response.side_effect = lambda prompt, **kwargs: {
+            "verdicts": _verdicts_from_prompt(prompt)["verdicts"][:1]
+        }
+        requests = [
+            {
+                "entity": "Student",
+                "swea_agent": "CustomSWEA",
+                "task_type": "generate",
+                "code": code,
+                "file_path": "x.py",
+            }
+            for code in ("value = 'good'\n", "value = 'other'\n")
+        ]
+        single = {"is_valid": False, "quality_score": 0.1, "details": "single", "issues": []}
+        with patch.object(techlead, "_validate_single_with_llm", return_value=single) as fallback:
+            results = techlead._validate_batch_with_llm(requests)
+
+        fallback.assert_called_once()
+        assert results[0]["is_valid"] is True
+        assert results[1] == single
+
+
+@pytest.mark.unit
+class TestWaveReview:
+    """Test that the kernel reviews each parallel wave with one batched task"""
+
+    def test_wave_reviewed_with_one_task(self, temp_database_path):
+        from baes.core.enhanced_runtime_kernel import (
+            EnhancedRuntimeKernel,
+            ExecutionWave,
+            TaskNode,
+        )
+
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            kernel = EnhancedRuntimeKernel(context_store_path=temp_database_path)
+        techlead = MagicMock()
+        techlead.handle_task.return_value = {
+            "reviews": [
+                {"approved": True, "data": {"overall_approval": True}},
+                {"approved": False, "data": {"rejection_reason": "missing ui"}},
+            ]
+        }
+        kernel._techlead_swea = techlead
+        wave = ExecutionWave(
+            wave_number=1,
+            tasks=[
+                TaskNode(
+                    "database_setup", "database", "setup_database", {}, result={"success": True}
+                ),
+                TaskNode("frontend_ui", "frontend", "generate_ui", {}, result={"success": True}),
+            ],
+        )
+
+        reviews = asyncio.run(kernel._review_wave("Student", wave))
+
+        techlead.handle_task.assert_called_once()
+        task, payload = techlead.handle_task.call_args.args
+        assert task == "review_batch"
+        assert [review["swea_agent"] for review in payload["reviews"]] == [
+            "DatabaseSWEA",
+            "FrontendSWEA",
+        ]
+        assert reviews["frontend_ui"]["approved"] is False
+        analytics = kernel.failure_analytics
+        assert analytics["review_rejections"]["FrontendSWEA.generate_ui"] == 1
+        assert analytics["review_attempts"]["DatabaseSWEA.setup_database"] == 1
+
+
+class FakeCodeSWEA:
+    """Returns the next of ``codes`` as the generated artifact."""
+
+    def __init__(self, *codes):
+        self.codes = list(codes)
+        self.calls = 0
+
+    def handle_task(self, task_type, payload):
+        code = self.codes[min(self.calls, len(self.codes) - 1)]
+        self.calls += 1
+        return {"success": True, "data": {"code": code, "file_path": "x.py"}}
+
+
+@pytest.mark.unit
+class TestCoordinationPlanBatchedReview:
+    """Test that the coordination loop LLM-reviews its uncertain artifacts in one batch"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+        from baes.swea_agents.techlead_swea import TechLeadSWEA
+
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            kernel = EnhancedRuntimeKernel(context_store_path=temp_database_path)
+        techlead = TechLeadSWEA()
+        techlead.llm_client = MagicMock()
+        techlead.llm_client.generate_json_response.side_effect = (
+            lambda prompt, **kwargs: _verdicts_from_prompt(prompt)
+        )
+        # Rules and standards are inconclusive for every artifact: each one needs the LLM
+        techlead._validate_code_verdict = (
+            lambda entity, swea_agent, task_type, code, analysis, file_path: (
+                techlead._validate_with_llm(entity, swea_agent, task_type, code, file_path)
+            )
+        )
+        kernel._techlead_swea = techlead
+        kernel._managed_system_manager = MagicMock()
+        return kernel
+
+    def _run(self, kernel, frontend_depends_on=()):
+        plan = [
+            {
+                "swea_agent": swea_agent,
+                "task_type": task_type,
+                "payload": {"entity": "Student", "attributes": [], "context": "academic"},
+                "depends_on": list(depends_on),
+            }
+            for swea_agent, task_type, depends_on in (
+                ("BackendSWEA", "generate_api", ()),
+                ("FrontendSWEA", "generate_ui", frontend_depends_on),
+            )
+        ]
+        entity = type("MockBAE", (), {"entity_name": "Student"})()
+        with patch("baes.core.enhanced_runtime_kernel.Config.ENABLE_BATCHED_REVIEW", True), patch(
+            "baes.core.enhanced_runtime_kernel.Config.ENABLE_REVIEW_PIPELINING", False
+        ), patch("baes.core.enhanced_runtime_kernel.Config.ENABLE_SMART_RETRY", False):
+            return kernel._execute_coordination_plan(plan, entity, "academic")
+
+    def _single_review(self, kernel):
+        single = {
+            "is_valid": True,
+            "quality_score": 0.8,
+            "details": "single",
+            "issues": [],
+            "suggestions": [],
+        }
+        return patch.object(kernel.techlead_swea, "_validate_single_with_llm", return_value=single)
+
+    def test_uncertain_artifacts_share_one_llm_call(self, kernel):
+        """Unconsumed artifacts should defer their LLM validation to one batched call"""
+        kernel._backend_swea = FakeCodeSWEA("api = 'good api'\n")
+        kernel._frontend_swea = FakeCodeSWEA("ui = 'good ui'\n")
+
+        results = self._run(kernel)
+
+        llm_client = kernel.techlead_swea.llm_client
+        assert llm_client.generate_json_response.call_count == 1
+        llm_client.generate_response.assert_not_called()
+        assert [result["techlead_approved"] for result in results] == [True, True]
+        assert [result["quality_score"] for result in results] == [0.9, 0.9]
+        assert not any("llm_review_deferred" in result for result in results)
+        assert kernel.failure_analytics["review_attempts"]["BackendSWEA.generate_api"] == 1
+
+    def test_consumed_artifact_is_reviewed_immediately(self, kernel):
+        """An artifact a later task builds on should not be approved provisionally"""
+        kernel._backend_swea = FakeCodeSWEA("api = 'good api'\n")
+        kernel._frontend_swea = FakeCodeSWEA("ui = 'good ui'\n")
+
+        with self._single_review(kernel) as single_review:
+            self._run(kernel, frontend_depends_on=["BackendSWEA.generate_api"])
+
+        # The backend is reviewed on its own; the frontend alone is left for the batch
+        reviewed = [call.args[1] for call in single_review.call_args_list]
+        assert reviewed == ["BackendSWEA", "FrontendSWEA"]
+        kernel.techlead_swea.llm_client.generate_json_response.assert_not_called()
+
+    def test_batch_rejection_reruns_task_through_retry_loop(self, kernel):
+        """An artifact rejected by the batch should be retried and replace its result"""
+        kernel._backend_swea = FakeCodeSWEA("api = 'bad api'\n", "api = 'fixed'\n")
+        kernel._frontend_swea = FakeCodeSWEA("ui = 'good ui'\n")
+
+        with self._single_review(kernel) as single_review:
+            results = self._run(kernel)
+
+        assert kernel.techlead_swea.llm_client.generate_json_response.call_count == 1
+        single_review.assert_called_once()
+        assert kernel.backend_swea.calls == 2
+        assert [result["task"] for result in results] == [
+            "BackendSWEA.generate_api",
+            "FrontendSWEA.generate_ui",
+        ]
+        assert results[0]["result"]["data"]["code"] == "api = 'fixed'\n"
+        assert results[0]["retry_count"] == 1 and results[0]["quality_score"] == 0.8
+        analytics = kernel.failure_analytics
+        assert analytics["review_rejections"]["BackendSWEA.generate_api"] == 1
+        assert analytics["review_attempts"]["BackendSWEA.generate_api"] == 2
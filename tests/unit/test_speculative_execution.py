@@ -0,0 +1,160 @@
+"""
+Unit tests for speculative parallel generation (baes.utils.speculative_execution).
+
+Tests candidate selection (first accepted, best-score fallback), cooperative
+cancellation of losing candidates, and the kernel's rejection-rate trigger.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baes.core.managed_system_manager import write_text_locked
+from baes.utils.speculative_execution import (
+    SpeculationCancelled,
+    current_candidate,
+    is_cancelled,
+    run_speculative,
+)
+
+
+@pytest.mark.unit
+class TestRunSpeculative:
+    """Test the speculative candidate runner"""
+
+    def test_first_accepted_candidate_wins_and_others_are_cancelled(self):
+        """The fastest accepted candidate should be returned and slower ones cancelled"""
+        release = threading.Event()
+
+        def generate(index):
+            if index == 1:
+                return {"code": "good", "index": index}
+            release.wait(2)
+            return {"code": "slow", "index": index}
+
+        outcome = run_speculative(
+            generate, lambda r: (r["code"] == "good", 1.0), candidates=3, name="t"
+        )
+        release.set()
+
+        assert outcome.accepted is True
+        assert outcome.winner_index == 1
+        assert outcome.result["index"] == 1
+        assert outcome.candidates_cancelled == 2
+
+    def test_best_score_is_used_when_none_accepted(self):
+        """Without an accepted candidate, the best-scoring one should be selected"""
+        outcome = run_speculative(lambda i: i, lambda r: (False, float(r)), candidates=3)
+        assert outcome.accepted is False
+        assert outcome.winner_index == 2
+        assert outcome.candidates_completed == 3
+
+    def test_candidate_errors_are_collected(self):
+        """Failing candidates should be recorded without failing the round"""
+
+        def generate(index):
+            if index == 0:
+                raise RuntimeError("boom")
+            return index
+
+        outcome = run_speculative(generate, lambda r: (True, 1.0), candidates=2)
+        assert outcome.winner_index == 1
+        assert any("boom" in error for error in outcome.errors)
+
+    def test_candidates_get_temperature_override(self):
+        """Only non-baseline candidates should carry the diversity temperature"""
+        seen = {}
+
+        def generate(index):
+            seen[index] = current_candidate().temperature
+            return index
+
+        run_speculative(generate, lambda r: (False, 0.0), candidates=3, temperature=0.7)
+        assert seen == {0: None, 1: 0.7, 2: 0.7}
+
+    def test_cancelled_candidate_skips_file_writes(self, tmp_path):
+        """A losing candidate must not overwrite the selected artifact"""
+        target = tmp_path / "routes.py"
+        cancelled = threading.Event()
+        started = threading.Event()
+
+        def generate(index):
+            if index == 0:
+                started.wait(2)
+                write_text_locked(target, "winner")
+                return "winner"
+            started.set()
+            while not is_cancelled():
+                time.sleep(0.01)
+            write_text_locked(target, "loser")
+            cancelled.set()
+            return "loser"
+
+        outcome = run_speculative(generate, lambda r: (r == "winner", 1.0), candidates=2)
+        assert cancelled.wait(2)
+        assert outcome.result == "winner"
+        assert target.read_text() == "winner"
+
+    def test_llm_calls_raise_when_cancelled(self):
+        """OpenAIClient should refuse to call the API for cancelled candidates"""
+        from baes.llm.openai_client import OpenAIClient
+
+        client = OpenAIClient.__new__(OpenAIClient)
+        client.client = MagicMock()
+        client.model = "gpt-4o-mini"
+        errors = []
+        started = threading.Event()
+
+        def generate(index):
+            if index == 0:
+                started.wait(2)
+                return "done"
+            started.set()
+            while not is_cancelled():
+                time.sleep(0.01)
+            try:
+                client.generate_response("prompt")
+            except SpeculationCancelled:
+                errors.append(index)
+            return "late"
+
+        run_speculative(generate, lambda r: (r == "done", 1.0), candidates=2)
+        time.sleep(0.2)
+        assert errors == [1]
+        client.client.chat.completions.create.assert_not_called()
+
+
+@pytest.mark.unit
+class TestKernelSpeculationTrigger:
+    """Test when the kernel decides to speculate"""
+
+    @pytest.fixture
+    def kernel(self, temp_database_path):
+        from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+
+        with patch("baes.core.enhanced_runtime_kernel.Config"):
+            return EnhancedRuntimeKernel(context_store_path=temp_database_path)
+
+    def test_speculates_only_for_frequently_rejected_tasks(self, kernel):
+        """Speculation requires enough reviews and a high rejection rate"""
+        with patch("baes.core.enhanced_runtime_kernel.Config") as config:
+            config.ENABLE_SPECULATIVE_GENERATION = True
+            config.SPECULATIVE_CANDIDATES = 3
+            config.SPECULATIVE_MIN_REVIEWS = 3
+            config.SPECULATIVE_REJECTION_THRESHOLD = 0.5
+
+            task_key = "BackendSWEA.generate_api"
+            kernel._record_review_outcome(task_key, False, "missing validation", 1)
+            kernel._record_review_outcome(task_key, False, "missing validation", 2)
+            assert not kernel._should_speculate(task_key, "BackendSWEA", {})
+
+            kernel._record_review_outcome(task_key, True)
+            assert kernel._historical_rejection_rate(task_key) == (3, pytest.approx(2 / 3))
+            assert kernel._should_speculate(task_key, "BackendSWEA", {})
+            assert not kernel._should_speculate(task_key, "TechLeadSWEA", {})
+            assert not kernel._should_speculate(task_key, "BackendSWEA", {"skip_llm_call": True})
+
+            config.ENABLE_SPECULATIVE_GENERATION = False
+            assert not kernel._should_speculate(task_key, "BackendSWEA", {})
@@ -0,0 +1,177 @@
+"""
+Unit tests for template-based Streamlit UI generation.
+
+Tests that the frontend templates render valid, standards-compliant pages with
+cached, paginated data access, that FrontendSWEA renders the page template
+instead of calling the LLM, and that the managed-system list endpoint serves
+the pages the UI asks for.
+"""
+
+import ast
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards.frontend_standards import FrontendStandards
+from baes.utils.template_registry import EntityType, SWEAType, TemplateInput, TemplateRegistry
+
+ATTRIBUTES = {"id": "int", "name": "str", "email": "email", "enrolled": "date", "course_id": "int"}
+
+
+def render(template_id=None, **context):
+    """Render a frontend template for Student with a course_id foreign key"""
+    return TemplateRegistry().render_template(
+        TemplateInput(
+            entity_name="Student",
+            entity_type=EntityType.STANDARD,
+            swea_type=SWEAType.FRONTEND,
+            attributes=ATTRIBUTES,
+            custom_logic={"foreign_keys": {"course_id": "Course"}},
+            additional_context=context,
+            template_id=template_id,
+        )
+    )
+
+
+@pytest.mark.unit
+class TestStreamlitTemplates:
+    """Test the Streamlit page, form and table templates"""
+
+    def test_page_template_is_selected_for_frontend(self):
+        output = render(page_size=100, cache_ttl=15)
+
+        assert output.template_used and output.template_id == "frontend_streamlit_crud"
+        code = output.generated_code
+        ast.parse(code)
+        assert FrontendStandards.get_frontend_validation(code, "Student")["is_valid"]
+        assert "def main() -> None:" in code
+
+    def test_page_reads_are_cached_and_paginated(self):
+        code = render(page_size=100, cache_ttl=15).generated_code
+
+        assert "PAGE_SIZE = 100" in code and "CACHE_TTL_SECONDS = 15" in code
+        assert "@st.cache_data(ttl=CACHE_TTL_SECONDS" in code
+        assert "@st.cache_resource\ndef get_session() -> requests.Session:" in code
+        assert 'params={"skip": skip, "limit": limit}' in code
+        # Writes go through the shared session and invalidate the cached pages
+        assert "requests.post(" not in code and "requests.get(" not in code
+        assert code.count("fetch_student_page.clear()") == 3
+
+    def test_page_fields(self):
+        code = render().generated_code
+
+        assert 'fetch_options("courses")' in code
+        assert '"enrolled": enrolled.isoformat()' in code
+        assert '"id":' not in code
+        assert 'st.text_input("Id"' not in code
+
+    def test_foreign_key_lookup_is_bounded(self):
+        """Selectors should load one bounded page and check larger collections by ID"""
+        code = render().generated_code
+
+        assert 'params={"skip": 0, "limit": OPTIONS_LIMIT}' in code
+        assert "items[:OPTIONS_LIMIT]" in code
+        assert "if len(course_options) < course_total:" in code
+        assert 'st.number_input(\n                    "Course ID"' in code
+        assert code.count('fetch_option_label("courses", course_id)') == 1
+        assert code.count('fetch_option_label("courses", course_id_edit)') == 1
+
+    @pytest.mark.parametrize(
+        "template_id, context, entry_point",
+        [
+            ("frontend_streamlit_form", {}, "show_student_form()"),
+            ("frontend_streamlit_form", {"form_mode": "update"}, "show_student_edit()"),
+            ("frontend_streamlit_table", {}, "show_student_list()"),
+        ],
+    )
+    def test_form_and_table_templates(self, template_id, context, entry_point):
+        output = render(template_id, **context)
+
+        assert output.template_used
+        tree = ast.parse(output.generated_code)
+        functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+        assert {"main", "get_session"} <= functions
+        assert entry_point in output.generated_code
+
+
+@pytest.mark.unit
+class TestFrontendTemplateGeneration:
+    """Test FrontendSWEA's template path"""
+
+    @pytest.fixture
+    def frontend(self, tmp_path):
+        from baes.swea_agents.frontend_swea import FrontendSWEA
+
+        with patch("baes.swea_agents.frontend_swea.OpenAIClient"):
+            swea = FrontendSWEA()
+        swea._managed_system_manager = type(
+            "Manager", (), {"write_entity_artifact": lambda self, e, k, c: str(tmp_path / "ui.py")}
+        )()
+        return swea
+
+    def test_generate_ui_renders_page_template(self, frontend):
+        with patch("baes.swea_agents.frontend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = True
+            config.UI_PAGE_SIZE = 25
+            config.UI_CACHE_TTL_SECONDS = 60
+            result = frontend.handle_task(
+                "generate_ui",
+                {
+                    "entity": "Student",
+                    "attributes": [{"name": "name", "type": "str"}, {"name": "course_id", "type": "int"}],
+                    "context": "academic",
+                },
+            )
+
+        code = result["data"]["code"]
+        assert result["success"]
+        assert "PAGE_SIZE = 25" in code and "CACHE_TTL_SECONDS = 60" in code
+        assert 'fetch_options("courses")' in code
+        frontend.llm_client.generate_response.assert_not_called()
+
+    def test_templates_disabled_uses_llm(self, frontend):
+        frontend.llm_client.generate_response.return_value = "import streamlit as st"
+        with patch("baes.swea_agents.frontend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = False
+            config.ENABLE_COMPRESSED_STANDARDS = False
+            result = frontend.handle_task(
+                "generate_ui", {"entity": "Student", "attributes": [{"name": "name", "type": "str"}]}
+            )
+
+        assert result["data"]["code"] == "import streamlit as st"
+        frontend.llm_client.generate_response.assert_called_once()
+
+
+@pytest.mark.unit
+def test_list_endpoint_pages_with_total_count(tmp_path, monkeypatch):
+    """The managed-system list endpoint should serve skip/limit pages with X-Total-Count"""
+    from fastapi import Response
+
+    code = (
+        TemplateRegistry()
+        .render_template(
+            TemplateInput(
+                entity_name="Student",
+                entity_type=EntityType.STANDARD,
+                swea_type=SWEAType.BACKEND,
+                attributes={"id": "int", "name": "str"},
+                template_id="backend_routes_sqlite",
+            )
+        )
+        .generated_code
+    )
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "app" / "database").mkdir(parents=True)
+    with sqlite3.connect(tmp_path / "app" / "database" / "baes_system.db") as db:
+        db.execute("CREATE TABLE students (id INTEGER PRIMARY KEY, name TEXT)")
+        db.executemany("INSERT INTO students (name) VALUES (?)", [(f"s{i}",) for i in range(7)])
+    namespace = {}
+    exec(compile(code, "student_routes.py", "exec"), namespace)
+
+    response = Response()
+    page = namespace["list_students"](response, skip=2, limit=3)
+    assert [row["name"] for row in page] == ["s2", "s3", "s4"]
+    assert response.headers["X-Total-Count"] == "7"
+    # Without a limit every row is returned
+    assert len(namespace["list_students"](Response(), skip=0, limit=None)) == 7
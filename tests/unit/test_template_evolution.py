@@ -0,0 +1,143 @@
+"""
+Unit tests for template-based rendering of schema evolutions.
+
+Tests that the managed-system CRUD router template renders valid, standards-
+compliant code, that BackendSWEA re-renders it for evolved STANDARD entities
+without an LLM call (CUSTOM entities still use the LLM), and that BAE
+coordination plans carry the evolution flag and the entity classification.
+"""
+
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards import BackendStandards
+from baes.utils.template_registry import EntityType, SWEAType, TemplateInput, TemplateRegistry
+
+EVOLVED_ATTRIBUTES = [
+    {"name": "id", "type": "int"},
+    {"name": "name", "type": "str"},
+    {"name": "email", "type": "str"},
+    {"name": "birth_date", "type": "date"},
+]
+
+
+@pytest.mark.unit
+class TestRoutesTemplate:
+    """Test the managed-system CRUD router template"""
+
+    def test_renders_valid_standard_compliant_router(self):
+        """The explicitly requested template should render compliant code"""
+        output = TemplateRegistry().render_template(
+            TemplateInput(
+                entity_name="Student",
+                entity_type=EntityType.STANDARD,
+                swea_type=SWEAType.BACKEND,
+                attributes={"id": "int", "name": "str", "birth_date": "date"},
+                template_id="backend_routes_sqlite",
+            )
+        )
+
+        assert output.template_used and output.template_id == "backend_routes_sqlite"
+        ast.parse(output.generated_code)
+        assert 'COLUMNS = ["name", "birth_date"]' in output.generated_code
+        assert "birth_date: datetime.date" in output.generated_code
+        assert BackendStandards.get_backend_validation(output.generated_code, "Student")["is_valid"]
+
+    def test_unknown_template_id_falls_back(self):
+        """Requesting a template of another SWEA type should not render anything"""
+        output = TemplateRegistry().render_template(
+            TemplateInput(
+                entity_name="Student",
+                entity_type=EntityType.STANDARD,
+                swea_type=SWEAType.BACKEND,
+                attributes={"name": "str"},
+                template_id="database_schema_crud",
+            )
+        )
+        assert not output.template_used
+
+
+@pytest.mark.unit
+class TestBackendEvolution:
+    """Test BackendSWEA's template path for schema evolutions"""
+
+    @pytest.fixture
+    def backend(self, tmp_path):
+        from baes.swea_agents.backend_swea import BackendSWEA
+
+        with patch("baes.swea_agents.backend_swea.OpenAIClient"):
+            swea = BackendSWEA()
+        swea._managed_system_manager = type(
+            "Manager", (), {"write_entity_artifact": lambda self, e, k, c: str(tmp_path / "r.py")}
+        )()
+        return swea
+
+    def _payload(self, entity_type):
+        return {
+            "entity": "Student",
+            "attributes": EVOLVED_ATTRIBUTES,
+            "is_evolution": True,
+            "new_attributes": ["birth_date"],
+            "entity_classification": {"entity_type": entity_type},
+        }
+
+    def test_standard_evolution_uses_template(self, backend):
+        """Evolved STANDARD entities should be re-rendered without generation tokens"""
+        with patch("baes.swea_agents.backend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = True
+            result = backend.handle_task("generate_api", self._payload("standard"))
+
+        assert result["success"]
+        assert result["data"]["template_used"] and result["data"]["is_evolution"]
+        assert "birth_date: datetime.date" in result["data"]["code"]
+        backend.llm_client.generate_code_with_domain_focus.assert_not_called()
+
+    def test_unparsable_router_uses_llm(self, backend):
+        """A router that does not parse (keyword attribute name) should not be written"""
+        backend.llm_client.generate_code_with_domain_focus.return_value = "router = None\n"
+        payload = {
+            **self._payload("standard"),
+            "attributes": [*EVOLVED_ATTRIBUTES, {"name": "class", "type": "str"}],
+        }
+        with patch("baes.swea_agents.backend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = True
+            config.ENABLE_COMPRESSED_STANDARDS = False
+            result = backend.handle_task("generate_api", payload)
+
+        assert result["data"]["template_used"] is False
+        backend.llm_client.generate_code_with_domain_focus.assert_called_once()
+
+    def test_custom_entity_uses_llm(self, backend):
+        """CUSTOM entities should still be generated by the LLM"""
+        backend.llm_client.generate_code_with_domain_focus.return_value = "router = None\n"
+        with patch("baes.swea_agents.backend_swea.Config") as config:
+            config.ENABLE_TEMPLATES = True
+            config.ENABLE_COMPRESSED_STANDARDS = False
+            result = backend.handle_task("generate_api", self._payload("custom"))
+
+        assert result["data"]["template_used"] is False
+        backend.llm_client.generate_code_with_domain_focus.assert_called_once()
+
+
+@pytest.mark.unit
+class TestCoordinationPlan:
+    """Test that BAE coordination plans describe the evolved schema"""
+
+    def test_generate_api_payload_carries_classification(self):
+        from baes.domain_entities.academic.student_bae import StudentBae
+
+        with patch("baes.domain_entities.base_bae.OpenAIClient"):
+            bae = StudentBae()
+        plan = bae._create_unified_coordination_plan(EVOLVED_ATTRIBUTES, True, "evolve")
+        (api_task,) = [task for task in plan if task["task_type"] == "generate_api"]
+
+        assert api_task["payload"]["is_evolution"] is True
+        assert api_task["payload"]["entity_classification"]["entity_type"] == "standard"
+
+        custom = bae._create_unified_coordination_plan(
+            EVOLVED_ATTRIBUTES + [{"name": "courses", "type": "List[Course]"}], True, "evolve"
+        )
+        (api_task,) = [task for task in custom if task["task_type"] == "generate_api"]
+        assert api_task["payload"]["entity_classification"]["entity_type"] == "custom"
@@ -9,8 +9,11 @@ Tests cover:
 - Token estimation and rendering time tracking
 """
 
+import os
+
 import pytest
 from pathlib import Path
+from baes.utils.template_analytics import TemplateCoverageAnalytics
 from baes.utils.template_registry import (
     TemplateRegistry,
     TemplateInput,
@@ -388,3 +391,169 @@ class TestTemplateIntegration:
         # Baseline LLM call for backend CRUD ~8000 tokens
         # Template should save 40-60% (3200-4800 tokens)
         assert output.token_estimate > 0
+
+
+class TestTemplateCache:
+    """Test the selection index, bytecode cache and rendered output memo"""
+
+    @staticmethod
+    def _input(**attributes):
+        return TemplateInput(
+            entity_name="Student",
+            entity_type=EntityType.STANDARD,
+            swea_type=SWEAType.DATABASE,
+            attributes=attributes or {"name": "str", "gpa": "float"},
+        )
+
+    def test_index_selects_most_suitable_template(self):
+        """Indexed selection should pick the best-ranked catalog template of the SWEA type"""
+        registry = TemplateRegistry()
+        for swea_type in SWEAType:
+            templates = registry.list_templates(swea_type)
+            expected = max(templates, key=lambda t: t.target_token_savings)
+            selected = registry.select_template(
+                TemplateInput("Student", EntityType.STANDARD, swea_type, {"name": "str"})
+            )
+            assert selected is expected
+
+    def test_repeated_render_is_memoized(self, tmp_path):
+        """Identical renders should reuse the output; other contexts should not"""
+        registry = TemplateRegistry(bytecode_cache_dir=tmp_path)
+        first = registry.render_template(self._input())
+        second = registry.render_template(self._input())
+        reordered = registry.render_template(self._input(gpa="float", name="str"))
+
+        assert second.generated_code == first.generated_code
+        assert reordered.generated_code != first.generated_code
+        assert registry.render_cache_stats() == {"hits": 1, "misses": 2, "entries": 2}
+        assert list(tmp_path.iterdir()), "compiled template should be in the bytecode cache"
+
+    def test_modified_template_is_rerendered(self, tmp_path):
+        """Changing the template file should invalidate memoized output"""
+        template_dir = tmp_path / "templates"
+        (template_dir / "database").mkdir(parents=True)
+        template_file = template_dir / "database" / "schema_sqlite.sql.j2"
+        template_file.write_text("-- v1 {{ entity_name }}\n")
+        registry = TemplateRegistry(template_dir, bytecode_cache_dir=tmp_path / "bytecode")
+
+        assert registry.render_template(self._input()).generated_code == "-- v1 Student\n"
+        template_file.write_text("-- v2 {{ entity_name }}\n")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.render_template(self._input()).generated_code == "-- v2 Student\n"
+
+    def test_modified_fragment_is_rerendered(self, tmp_path):
+        """Changing a fragment imported by the template should invalidate memoized output"""
+        template_dir = tmp_path / "templates"
+        (template_dir / "database").mkdir(parents=True)
+        (template_dir / "fragments").mkdir()
+        fragment_file = template_dir / "fragments" / "header.j2"
+        fragment_file.write_text("{% macro header(name) %}-- v1 {{ name }}{% endmacro %}")
+        (template_dir / "database" / "schema_sqlite.sql.j2").write_text(
+            '{% import "fragments/header.j2" as fragments %}{{ fragments.header(entity_name) }}\n'
+        )
+        registry = TemplateRegistry(template_dir, bytecode_cache_dir=tmp_path / "bytecode")
+
+        assert registry.render_template(self._input()).generated_code == "-- v1 Student\n"
+        fragment_file.write_text("{% macro header(name) %}-- v2 {{ name }}{% endmacro %}")
+        stat = fragment_file.stat()
+        os.utime(fragment_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.render_template(self._input()).generated_code == "-- v2 Student\n"
+
+
+class TestCustomLogicComposition:
+    """Test suitability-ranked selection with custom logic fragments"""
+
+    LOGIC = {
+        "enum_fields": {"status": ["active", "graduated"]},
+        "unique_fields": ["email"],
+        "foreign_keys": {"course_id": "Course"},
+    }
+    ATTRIBUTES = {"name": "str", "email": "str", "status": "str", "course_id": "int"}
+
+    def _input(self, swea_type, custom_logic):
+        return TemplateInput(
+            entity_name="Student",
+            entity_type=EntityType.STANDARD,
+            swea_type=swea_type,
+            attributes=self.ATTRIBUTES,
+            custom_logic=custom_logic,
+        )
+
+    def test_schema_composes_fragments(self):
+        """The SQLite schema should enforce every composed fragment"""
+        import sqlite3
+
+        output = TemplateRegistry().render_template(self._input(SWEAType.DATABASE, self.LOGIC))
+        assert output.template_id == "database_schema_sqlite"
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript("CREATE TABLE courses (id INTEGER PRIMARY KEY);" + output.generated_code)
+        conn.execute("INSERT INTO courses (id) VALUES (1)")
+        conn.execute(
+            "INSERT INTO students (name, email, status, course_id) VALUES ('Ada', 'a@x', 'active', 1)"
+        )
+        assert conn.execute("SELECT name FROM students").fetchone() == ("Ada",)
+        for values in (
+            "('Bob', 'a@x', 'active', 1)",  # unique email
+            "('Bob', 'b@x', 'expelled', 1)",  # enum value
+            "('Bob', 'b@x', 'active', 2)",  # foreign key
+        ):
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute(f"INSERT INTO students (name, email, status, course_id) VALUES {values}")
+
+    def test_routes_compose_fragments(self):
+        """The router should type enums and map conflicts to 409"""
+        import ast
+
+        output = TemplateRegistry().render_template(self._input(SWEAType.BACKEND, self.LOGIC))
+        ast.parse(output.generated_code)
+
+        assert 'status: Literal["active", "graduated"]' in output.generated_code
+        assert 'conn.execute("PRAGMA foreign_keys = ON")' in output.generated_code
+        assert output.generated_code.count("status.HTTP_409_CONFLICT") == 2
+
+    def test_unsupported_logic_falls_back(self):
+        """Logic kinds no template composes should fall back with the kind as reason"""
+        output = TemplateRegistry().render_template(
+            self._input(SWEAType.BACKEND, {"unique_fields": ["email"], "state_machine": {}})
+        )
+        assert not output.template_used
+        assert output.fallback_reason.endswith(": state_machine")
+
+    def test_coverage_analytics(self, monkeypatch):
+        """Hits and fallbacks should be recorded and ranked by token cost"""
+        analytics = TemplateCoverageAnalytics()
+        monkeypatch.setattr(
+            "baes.utils.template_registry.get_template_analytics", lambda: analytics
+        )
+        registry = TemplateRegistry()
+        registry.render_template(self._input(SWEAType.DATABASE, {"unique_fields": ["email"]}))
+        registry.render_template(self._input(SWEAType.FRONTEND, {"unique_fields": ["email"]}))
+        registry.render_template(self._input(SWEAType.FRONTEND, {"unique_fields": ["email"]}))
+        registry.render_template(self._input(SWEAType.BACKEND, {"state_machine": {}}))
+
+        report = analytics.coverage_report()
+        assert report["served_share"] == 0.25
+        assert report["fragments"] == {"unique_fields": 1}
+        assert report["templates"][0]["template_id"] == "database_schema_sqlite"
+        assert [(f["swea_type"], f["reason"], f["count"]) for f in report["fallbacks"]] == [
+            ("frontend", "unsupported_logic:unique_fields", 2),
+            ("backend", "unsupported_logic:state_machine", 1),
+        ]
+
+    def test_coverage_published_in_metrics_snapshot(self, monkeypatch, tmp_path):
+        """Metrics snapshots should include the template coverage report"""
+        import json
+
+        from baes.utils import metrics_tracker
+
+        analytics = TemplateCoverageAnalytics()
+        analytics.record_fallback("backend", "custom_entity")
+        monkeypatch.setattr(metrics_tracker, "get_template_analytics", lambda: analytics)
+        monkeypatch.setattr(metrics_tracker, "_LOG_FILE", tmp_path / "metrics.jsonl")
+
+        metrics_tracker.flush_snapshot()
+        snapshot = json.loads((tmp_path / "metrics.jsonl").read_text())
+        assert snapshot["template_coverage"] == analytics.coverage_report()
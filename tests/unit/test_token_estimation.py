@@ -0,0 +1,74 @@
+"""
+Unit tests for token estimation in compressed standards.
+
+Tests that tiktoken encoders (and encoder load failures) are cached per model,
+that batched counts match single counts, and that the length-based estimate
+stays within its bounds.
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from baes.standards import compressed_standards
+from baes.standards.compressed_standards import (
+    TokenEstimate,
+    approximate_token_count,
+    estimate_token_count,
+    estimate_token_counts,
+    get_token_encoder,
+)
+
+
+@pytest.fixture(autouse=True)
+def encoders(monkeypatch):
+    """Empty encoder cache per test"""
+    monkeypatch.setattr(compressed_standards, "_encoders", {})
+
+
+def word_encoder():
+    """Fake tiktoken encoding with one token per whitespace-separated word"""
+    encoder = Mock()
+    encoder.encode_ordinary.side_effect = lambda text: text.split()
+    encoder.encode_ordinary_batch.side_effect = lambda texts: [text.split() for text in texts]
+    return encoder
+
+
+@pytest.mark.unit
+class TestTokenEstimation:
+    """Test cached encoders, batched counts and the length-based estimate"""
+
+    def test_encoder_loaded_once_per_model(self):
+        with patch("tiktoken.encoding_for_model", return_value=word_encoder()) as load:
+            assert estimate_token_count("one two three") == 3
+            assert estimate_token_count("four five") == 2
+            get_token_encoder("gpt-4o-mini")
+
+        assert [call.args[0] for call in load.call_args_list] == ["gpt-4", "gpt-4o-mini"]
+
+    def test_encoder_failure_warns_once(self, caplog):
+        with patch("tiktoken.encoding_for_model", side_effect=ConnectionError("offline")) as load:
+            with caplog.at_level(logging.WARNING, logger=compressed_standards.__name__):
+                counts = [estimate_token_count("x" * 40) for _ in range(3)]
+
+        assert counts == [10, 10, 10]
+        assert load.call_count == 1
+        assert len(caplog.records) == 1
+
+    def test_batched_counts_match_single_counts(self):
+        texts = ["alpha beta", "", "gamma delta epsilon"]
+        with patch("tiktoken.encoding_for_model", return_value=word_encoder()):
+            assert estimate_token_counts(texts) == [estimate_token_count(text) for text in texts] == [2, 0, 3]
+
+            large = ["word " * 20000, "word " * 10]
+            assert estimate_token_counts(large) == [20000, 10]
+            get_token_encoder().encode_ordinary_batch.assert_called_once_with(large)
+
+    def test_approximate_count_bounds(self):
+        text = "def create_student(name: str) -> Student:\n"
+        estimate = approximate_token_count(text)
+
+        assert estimate == TokenEstimate(tokens=len(text) // 4, low=len(text) // 6, high=-(-len(text) // 2))
+        assert estimate.low <= estimate.tokens <= estimate.high
+        assert approximate_token_count("") == TokenEstimate(0, 0, 0)
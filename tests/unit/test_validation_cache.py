@@ -0,0 +1,122 @@
+"""
+Unit tests for the validation verdict cache (baes.standards.validation_cache).
+
+Tests key composition (code, SWEA/task, rule-catalog and standards versions),
+two-tier LRU behavior, persistence across cache instances (processes), and
+that TechLeadSWEA reuses verdicts instead of re-running LLM validation.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards.validation_cache import (
+    ValidationVerdictCache,
+    is_cacheable_verdict,
+    standards_version,
+)
+from baes.standards.validation_rules import ValidationRuleEngine
+
+VERDICT = {"is_valid": False, "quality_score": 0.4, "details": "Missing models", "issues": ["x"]}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "validation_cache.db")
+
+
+@pytest.mark.unit
+class TestValidationVerdictCache:
+    """Test the two-tier verdict cache"""
+
+    def test_key_depends_on_every_component(self):
+        """Changing code, SWEA, task, entity or versions should change the key"""
+        base = ("code", "BackendSWEA", "generate_api", "rules-1", "Student", "std-1")
+        key = ValidationVerdictCache.make_key(*base)
+        assert key == ValidationVerdictCache.make_key(*base)
+        for index, value in enumerate(
+            ["code2", "FrontendSWEA", "generate_ui", "rules-2", "Course", "std-2"]
+        ):
+            changed = list(base)
+            changed[index] = value
+            assert ValidationVerdictCache.make_key(*changed) != key
+
+    def test_rule_catalog_version_tracks_rule_changes(self):
+        """Updating or disabling a rule should change the catalog version"""
+        engine = ValidationRuleEngine()
+        version = engine.catalog_version()
+        assert version == ValidationRuleEngine().catalog_version()
+        rule_id = engine.list_rules("backend")[0].rule_id
+        engine.disable_rule(rule_id)
+        assert engine.catalog_version() != version
+        engine.enable_rule(rule_id)
+        assert engine.catalog_version() == version
+        assert standards_version() == standards_version()
+
+    def test_persists_across_instances(self, cache_path):
+        """A verdict written by one cache instance should be served by another"""
+        ValidationVerdictCache(cache_path).put("k", "BackendSWEA", "generate_api", VERDICT)
+
+        other = ValidationVerdictCache(cache_path)
+        assert other.get("k") == VERDICT
+        assert other.get("k") == VERDICT
+        stats = other.cache_stats()
+        assert (stats.persistent_hit_count, stats.memory_hit_count) == (1, 1)
+        assert other.get("missing") is None
+
+    def test_returned_verdicts_are_copies(self, cache_path):
+        """Mutating a returned verdict must not corrupt the cache"""
+        cache = ValidationVerdictCache(cache_path)
+        cache.put("k", "BackendSWEA", "generate_api", VERDICT)
+        cache.get("k")["issues"].append("mutated")
+        assert cache.get("k") == VERDICT
+
+    def test_lru_eviction(self, cache_path):
+        """Both tiers should evict the least recently used verdicts"""
+        cache = ValidationVerdictCache(cache_path, max_memory_entries=2, max_persistent_entries=2)
+        cache.put("a", "s", "t", {"is_valid": True})
+        cache.put("b", "s", "t", {"is_valid": True})
+        assert cache.get("a") is not None  # "a" is now the most recently used
+        cache.put("c", "s", "t", {"is_valid": True})
+
+        assert list(cache._memory_cache) == ["a", "c"]
+        fresh = ValidationVerdictCache(cache_path)
+        assert fresh.cache_stats().persistent_size == 2
+
+    def test_error_results_are_not_cacheable(self):
+        """Validation failures (exceptions, unparsable LLM output) should never be cached"""
+        assert is_cacheable_verdict(VERDICT)
+        assert not is_cacheable_verdict(
+            {"is_valid": False, "details": "LLM validation error: timeout"}
+        )
+        assert not is_cacheable_verdict(
+            {"is_valid": False, "details": "Validation response parsing failed"}
+        )
+        assert not is_cacheable_verdict({"details": "no verdict"})
+
+
+@pytest.mark.unit
+class TestTechLeadVerdictCache:
+    """Test that TechLeadSWEA reuses cached verdicts"""
+
+    def test_llm_verdict_is_reused(self, cache_path):
+        """Revalidating identical code should not call the LLM validator again"""
+        from baes.swea_agents.techlead_swea import TechLeadSWEA
+
+        techlead = TechLeadSWEA()
+        cache = ValidationVerdictCache(cache_path)
+        result = {"data": {"code": "def handler():\n    return 1\n", "file_path": "x.py"}}
+
+        with (
+            patch("baes.swea_agents.techlead_swea.get_validation_cache", return_value=cache),
+            patch.object(techlead, "_validate_with_llm", return_value=dict(VERDICT)) as llm,
+        ):
+            first = techlead._validate_code_artifact("Student", "CustomSWEA", "generate", result)
+            second = techlead._validate_code_artifact("Student", "CustomSWEA", "generate", result)
+            third = techlead._validate_code_artifact("Course", "CustomSWEA", "generate", result)
+
+        assert llm.call_count == 2  # Student once, Course once
+        assert first == VERDICT
+        assert second["verdict_cache_hit"] is True
+        assert second["issues"] == VERDICT["issues"]
+        assert "verdict_cache_hit" not in third
@@ -0,0 +1,241 @@
+"""
+Unit tests for learned validation routing calibration (baes.standards.validation_calibration).
+
+Tests the logistic fit and target-error thresholds, JSON persistence,
+background refits and sample file compaction, that the rule engine decides
+uncertain results with a matching model, and that TechLeadSWEA labels uncertain
+rule outcomes with LLM verdicts only and never lets calibration replace its
+Standards checks.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from baes.standards.validation_calibration import (
+    CalibrationModel,
+    ValidationCalibration,
+    fit_calibration_model,
+)
+from baes.standards.validation_rules import RuleMatch, ValidationRuleEngine
+
+RULE_IDS = ["R1", "R2", "R3"]
+
+# Passes BE002, BE004, BE005 and BE006 but fails BE001 and BE003: uncertain (score 0.28)
+UNCERTAIN_BACKEND = """
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+def get_db():
+    return None
+"""
+
+
+def _samples():
+    """All rules pass: approved; R1 fails: rejected; only R2 fails: mixed"""
+    return (
+        [([True, True, True], True)] * 40
+        + [([False, True, True], False)] * 40
+        + [([True, False, True], True)] * 10
+        + [([True, False, True], False)] * 10
+    )
+
+
+def _matches(passed):
+    return [RuleMatch(rule_id, rule_id, ok, 0.9) for rule_id, ok in zip(RULE_IDS, passed)]
+
+
+@pytest.fixture
+def calibration(tmp_path):
+    return ValidationCalibration(
+        model_path=str(tmp_path / "calibration.json"),
+        samples_path=str(tmp_path / "samples.jsonl"),
+        min_samples=10,
+        refit_every=10,
+    )
+
+
+@pytest.mark.unit
+class TestCalibrationFit:
+    """Test the logistic fit and threshold selection"""
+
+    def test_thresholds_cover_separable_patterns(self):
+        """Clear-cut outcome vectors should be decided, mixed ones left to the reviewer"""
+        model = fit_calibration_model("backend", RULE_IDS, _samples(), target_error_rate=0.05)
+
+        assert model.predict(_matches([True, True, True])) >= model.approve_threshold
+        assert model.predict(_matches([False, True, True])) <= model.reject_threshold
+        mixed = model.predict(_matches([True, False, True]))
+        assert model.reject_threshold < mixed < model.approve_threshold
+        assert model.coverage == 0.8
+        assert model.sample_count == 100
+
+    def test_no_confident_decisions_without_evidence(self):
+        """Mixed verdicts should produce thresholds that never trigger"""
+        samples = [([True, True, True], True), ([True, True, True], False)] * 20
+        model = fit_calibration_model("backend", RULE_IDS, samples)
+        assert model.approve_threshold > 1.0
+        assert model.reject_threshold < 0.0
+        assert model.coverage == 0.0
+
+    def test_predict_requires_same_rule_set(self):
+        """Models should not apply once the SWEA's rules change"""
+        model = fit_calibration_model("backend", RULE_IDS, _samples())
+        assert model.predict(_matches([True, True])) is None
+        assert not model.applies_to(["R1", "R2", "R4"])
+
+
+@pytest.mark.unit
+class TestValidationCalibrationStore:
+    """Test sample recording, refits and JSON persistence"""
+
+    def test_refits_and_persists_models(self, calibration, tmp_path):
+        """Recording enough samples should refit, save JSON and load in a new instance"""
+        for passed, approved in _samples()[::5]:
+            calibration.record("backend", _matches(passed), approved, source="LLMValidation")
+        calibration.wait_for_refit(timeout=10)
+
+        assert calibration.model_for("backend", RULE_IDS) is not None
+        assert len(calibration.load_samples("backend")) == 20
+        document = json.loads((tmp_path / "calibration.json").read_text())
+        assert document["models"]["backend"]["rule_ids"] == RULE_IDS
+
+        reloaded = ValidationCalibration(
+            model_path=str(tmp_path / "calibration.json"),
+            samples_path=str(tmp_path / "samples.jsonl"),
+        )
+        assert reloaded.models["backend"] == calibration.models["backend"]
+        assert reloaded.model_for("backend", ["R1"]) is None
+
+    def test_refit_compacts_sample_file(self, calibration, tmp_path):
+        """Refits should keep only the most recent max_samples lines on disk"""
+        calibration.max_samples = 30
+        for passed, approved in _samples()[:60]:
+            calibration.record("frontend", _matches(passed), approved)
+        calibration.wait_for_refit(timeout=10)
+        calibration.refit()
+
+        lines = (tmp_path / "samples.jsonl").read_text().splitlines()
+        assert len(lines) == 30
+        assert len(calibration.load_samples("frontend")) == 30
+
+    def test_too_few_samples_fit_nothing(self, calibration):
+        """SWEA types below min_samples should keep the fixed thresholds"""
+        calibration.record("frontend", _matches([True, True, True]), True)
+        assert calibration.refit() == {}
+        assert calibration.model_for("frontend", RULE_IDS) is None
+
+
+@pytest.mark.unit
+class TestCalibratedRouting:
+    """Test that the rule engine uses calibration models for uncertain results"""
+
+    def _engine(self, calibration, bias, approve=0.9, reject=0.1):
+        engine = ValidationRuleEngine(calibration=calibration)
+        rule_ids = [rule.rule_id for rule in engine.list_rules("backend")]
+        calibration.models["backend"] = CalibrationModel(
+            swea_type="backend",
+            rule_ids=rule_ids,
+            weights=[0.0] * len(rule_ids),
+            bias=bias,
+            approve_threshold=approve,
+            reject_threshold=reject,
+        )
+        return engine
+
+    def test_uncertain_without_model(self):
+        """Without calibration the fixed thresholds should apply"""
+        result = ValidationRuleEngine().validate_code(UNCERTAIN_BACKEND, "backend")
+        assert result.overall_outcome == "uncertain"
+        assert result.calibrated_probability is None
+
+    def test_calibrated_approval(self, calibration):
+        """A confident calibrated probability should approve an uncertain result"""
+        result = self._engine(calibration, bias=5.0).validate_code(UNCERTAIN_BACKEND, "backend")
+        assert result.overall_outcome == "confident_approval"
+        assert not result.requires_llm
+        assert result.calibrated_probability > 0.99
+
+    def test_calibrated_rejection_lists_failed_rules(self, calibration):
+        """Calibrated rejections should carry the failed rules as feedback"""
+        result = self._engine(calibration, bias=-5.0).validate_code(UNCERTAIN_BACKEND, "backend")
+        assert result.overall_outcome == "confident_rejection"
+        assert "[BE001]" in result.feedback_message
+
+    def test_probability_between_thresholds_stays_uncertain(self, calibration):
+        """Probabilities inside the model's uncertain band should still go to the LLM"""
+        result = self._engine(calibration, bias=0.0).validate_code(UNCERTAIN_BACKEND, "backend")
+        assert result.overall_outcome == "uncertain"
+        assert result.calibrated_probability == 0.5
+
+
+@pytest.mark.unit
+class TestTechLeadCalibrationSamples:
+    """Test that TechLeadSWEA learns from LLM verdicts and keeps its Standards checks"""
+
+    @pytest.fixture
+    def techlead(self, calibration):
+        from baes.swea_agents.techlead_swea import TechLeadSWEA
+
+        techlead = TechLeadSWEA()
+        techlead.validation_engine.calibration = calibration
+        return techlead
+
+    def _verdict(self, techlead):
+        from baes.standards.code_analysis import CodeAnalysis
+
+        return techlead._validate_code_verdict(
+            "Student",
+            "BackendSWEA",
+            "generate_api",
+            UNCERTAIN_BACKEND,
+            CodeAnalysis.of(UNCERTAIN_BACKEND),
+            "routes.py",
+        )
+
+    def test_llm_verdict_labels_uncertain_result(self, techlead, calibration):
+        """An LLM verdict (standards unavailable) should be recorded as a sample"""
+        verdict = {
+            "is_valid": False,
+            "quality_score": 0.4,
+            "details": "Missing try/except",
+            "validation_method": "LLMValidation",
+        }
+        with patch.object(techlead, "_validate_backend_with_standards", return_value=verdict):
+            assert self._verdict(techlead) == verdict
+
+        (sample,) = calibration.load_samples("backend")
+        assert sample["approved"] is False
+        assert sample["passed"][:3] == [False, True, False]
+
+    def test_standards_verdict_is_not_recorded(self, techlead, calibration):
+        """Deterministic Standards verdicts are not what calibration replaces"""
+        verdict = {"is_valid": False, "quality_score": 0.4, "details": "Missing try/except"}
+        with patch.object(techlead, "_validate_backend_with_standards", return_value=verdict):
+            self._verdict(techlead)
+
+        assert calibration.load_samples("backend") == []
+
+    def test_calibrated_approval_still_runs_standards(self, techlead, calibration):
+        """A calibrated decision should not skip the exact Standards check"""
+        engine = techlead.validation_engine
+        rule_ids = [rule.rule_id for rule in engine.list_rules("backend")]
+        calibration.models["backend"] = CalibrationModel(
+            swea_type="backend",
+            rule_ids=rule_ids,
+            weights=[0.0] * len(rule_ids),
+            bias=5.0,
+            approve_threshold=0.9,
+            reject_threshold=0.1,
+        )
+        verdict = {"is_valid": False, "quality_score": 0.4, "details": "Missing try/except"}
+        with patch.object(
+            techlead, "_validate_backend_with_standards", return_value=verdict
+        ) as standards:
+            assert self._verdict(techlead) == verdict
+
+        standards.assert_called_once()
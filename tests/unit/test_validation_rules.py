@@ -6,14 +6,20 @@ Tests rule-based validation with regex patterns and AST analysis
 for confident approval/rejection without LLM calls.
 """
 
+import re
+from unittest.mock import patch
+
 import pytest
 
+from baes.standards.code_analysis import LineIndex, lowercase_for_matching
 from baes.standards.validation_rules import (
     ValidationOutcome,
     ValidationResult,
     ValidationRule,
     ValidationRuleEngine,
     SWEAType,
+    _first_match_spans,
+    fold_pattern,
 )
 
 
@@ -599,3 +605,237 @@ class TestEdgeCases:
         
         assert result.passed_count == len(engine.rules["backend"])
         assert result.failed_count == 0
+
+
+class TestCompiledRules:
+    """Test precompiled rule patterns and line number resolution"""
+    
+    def test_pattern_compiled_once_and_on_update(self):
+        """Rules should compile when defined and recompile only when the pattern changes"""
+        engine = ValidationRuleEngine()
+        rule = next(r for r in engine.rules["backend"] if r.rule_id == "BE001")
+        compiled = rule.compile()
+        
+        engine.validate_code("with get_db():\n    pass", "backend")
+        assert rule.compile() is compiled
+        
+        engine.update_rule("BE001", pattern=r"async\s+with")
+        assert rule.compile() is not compiled
+        assert rule.matches("async  with session:") == (True, 1)
+    
+    def test_invalid_pattern_fails_on_definition(self):
+        """Invalid regular expressions should be rejected when the rule is created"""
+        with pytest.raises(re.error):
+            ValidationRule(
+                rule_id="BE998",
+                rule_name="broken",
+                swea_type=SWEAType.BACKEND,
+                pattern=r"([unclosed",
+                pattern_type="must_have",
+                confidence=0.5,
+                message="Broken rule"
+            )
+    
+    def test_line_index(self):
+        """Offsets should map to 1-based line numbers"""
+        code = "first\nsecond\n\nfourth"
+        index = LineIndex(code)
+        assert index.line_number(0) == 1
+        assert index.line_number(code.index("second")) == 2
+        assert index.line_number(code.index("fourth")) == 4
+    
+    def test_ignorecase_line_numbers(self):
+        """Rules should match case-insensitively and report the matching line"""
+        engine = ValidationRuleEngine()
+        code = "CREATE TABLE students (\n    ID SERIAL PRIMARY KEY,\n    Name TEXT NOT NULL\n);"
+        for rule in engine.list_rules("database"):
+            assert rule.matches(code) == rule.matches(code.lower())
+        
+        result = engine.validate_code(code, "database")
+        primary_key = next(m for m in result.rule_results if m.rule_id == "DB001")
+        assert primary_key.passed and primary_key.line_number == 2
+        
+        rule = ValidationRule("DB999", "keyword", SWEAType.DATABASE, r"SKIP", "must_have", 0.5, "m")
+        assert rule.folded_pattern == "skip"
+        assert rule.matches("# \u017fkip") == (True, 1)  # LATIN SMALL LETTER LONG S
+    
+    def test_folded_patterns_match_ignorecase_semantics(self):
+        """Folded patterns on lowercased text should find the same offsets as IGNORECASE"""
+        code = "class Student(BaseModel):\n    Name: STR = Field(..., alias='N_1')\n    x = [A-Z]\n"
+        lowered = lowercase_for_matching(code)
+        for pattern in (
+            r"[A-Z]\w+", r"[^a-z\s]+", r"\bNAME\b", r"\S+\(", r"(?P<Cls>class)\s+\w",
+            r"(?<=\()\.{3}", r"[_A-Z0-9]{3}", r"\[A-Z\]",
+        ):
+            folded = fold_pattern(pattern)
+            assert folded is not None, pattern
+            expected = re.search(pattern, code, re.MULTILINE | re.IGNORECASE)
+            actual = re.search(folded, lowered, re.MULTILINE)
+            assert (actual and actual.span()) == (expected and expected.span()), pattern
+    
+    def test_unfoldable_patterns(self):
+        """Patterns whose case folding is not exact should not be folded"""
+        for pattern in (r"(?i)x", r"\x41", r"[0-z]", r"[A-z]", "\u00e9t\u00e9", r"(?-i:X)"):
+            assert fold_pattern(pattern) is None, pattern
+    
+    def test_combined_scan_matches_per_rule_search(self):
+        """One combined scan should find the same first match per rule as separate searches"""
+        import random
+        
+        def rule(pattern):
+            return ValidationRule("X1", "x", SWEAType.BACKEND, pattern, "must_have", 0.5, "m")
+        
+        rules = ValidationRuleEngine().list_rules() + [
+            rule(r"st\.error"),  # Same position as FE001, later in the alternation
+            rule(r"(\w)\1"),  # Back-reference: searched on its own
+            rule(r"(?<=\()\w+"),
+            rule(r"^\s*def"),
+        ]
+        assert not rules[-3].combinable and rules[-4].combinable
+        
+        rng = random.Random(11)
+        words = PATCHABLE_API.split() + ["st.error(", "assert x", "\n", "INDEX ix", "yield"]
+        for _ in range(50):
+            code = " ".join(rng.choice(words) for _ in range(rng.randrange(1, 40)))
+            pos = rng.randrange(len(code) + 1)
+            endpos = rng.randrange(pos, len(code) + 1)
+            lowered = lowercase_for_matching(code)
+            expected = [r.search_span(code) for r in rules]
+            assert _first_match_spans(rules, code) == expected
+            assert _first_match_spans(rules, code, lowered) == expected
+            assert _first_match_spans(rules, code, lowered, pos, endpos) == [
+                r.search_span(code, None, pos, endpos) for r in rules
+            ]
+    
+    def test_catalog_rules_use_combined_scan(self):
+        """Catalog rules should be scanned through the combined pattern, not one by one"""
+        engine = ValidationRuleEngine()
+        code = PATCHABLE_API * 20
+        with patch.object(ValidationRule, "search_span", side_effect=AssertionError):
+            result = engine.validate_code(code, "backend")
+        assert result.passed_count + result.failed_count == len(engine.rules["backend"])
+
+PATCHABLE_API = '''from fastapi import APIRouter, HTTPException
+import sqlite3
+
+router = APIRouter()
+
+
+def get_db_connection():
+    conn = sqlite3.connect("app.db")
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@router.post("/", status_code=200)
+def create_student(student: dict):
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO students VALUES (?)", (student["name"],))
+    return student
+'''
+
+
+class TestIncrementalValidation:
+    """Test diff-aware re-validation of patched code"""
+    
+    def _assert_same_as_full_scan(self, engine, code, swea_type, previous=None):
+        incremental = engine.validate_code(code, swea_type, previous=previous)
+        full = ValidationRuleEngine().validate_code(code, swea_type)
+        assert incremental.rule_results == full.rule_results
+        assert incremental.overall_outcome == full.overall_outcome
+        return incremental
+    
+    def test_line_local_patterns(self):
+        """Patterns that cannot match a newline should be detected as line-local"""
+        def rule(pattern):
+            return ValidationRule("X1", "x", SWEAType.BACKEND, pattern, "must_have", 0.5, "m")
+        
+        assert rule(r"st\.error|st\.warning").line_local
+        assert rule(r"def\s?test_[a-z]+").line_local is False  # \s matches newlines
+        assert rule(r"password[^=]*=").line_local is False
+        assert rule(r"\Aimport").line_local is False
+        assert rule(r"(?=foo)bar").line_local is False
+        assert rule(r"(?s)a.b").line_local is False
+        assert rule(r"[^\n]+x").line_local
+    
+    def test_patched_code_matches_full_scan(self):
+        """CodePatcher edits should give the same rule results as a full scan"""
+        from baes.utils.code_patcher import CodePatcher
+        
+        patcher = CodePatcher()
+        engine = ValidationRuleEngine()
+        previous = engine.validate_code(PATCHABLE_API, "backend")
+        
+        patched = patcher.add_decorator(PATCHABLE_API, "get_db_connection", "contextmanager")
+        assert patched.success
+        result = self._assert_same_as_full_scan(
+            engine, patched.patched_code, "backend", previous
+        )
+        # Only line-local rules are derived from the previous scan
+        assert result.reused_rule_count == sum(rule.line_local for rule in engine.list_rules("backend"))
+        
+        imported = patcher.add_import(
+            patched.patched_code, "from contextlib import contextmanager"
+        )
+        assert imported.success
+        self._assert_same_as_full_scan(engine, imported.patched_code, "backend", result)
+    
+    def test_random_line_edits_match_full_scan(self):
+        """Inserting, deleting and replacing lines should never change rule results"""
+        import random
+        
+        rng = random.Random(7)
+        snippets = [
+            "    st.error('failed')",
+            "def test_create(): pass",
+            "CREATE TABLE t (id INTEGER PRIMARY KEY)",
+            "password = 'secret'",
+            "    except Exception as e:",
+            "",
+            "try:",
+        ]
+        for swea_type in ("backend", "database", "frontend", "test"):
+            engine = ValidationRuleEngine()
+            lines = PATCHABLE_API.split("\n")
+            previous = engine.validate_code(PATCHABLE_API, swea_type)
+            for _ in range(40):
+                index = rng.randrange(len(lines) + 1)
+                action = rng.choice(["insert", "delete", "replace"])
+                if action == "insert" or not lines:
+                    lines.insert(index, rng.choice(snippets))
+                elif action == "delete":
+                    del lines[min(index, len(lines) - 1)]
+                else:
+                    lines[min(index, len(lines) - 1)] = rng.choice(snippets)
+                previous = self._assert_same_as_full_scan(
+                    engine, "\n".join(lines), swea_type, previous
+                )
+    
+    def test_multiline_match_completed_by_edit(self):
+        """An edit completing an earlier multi-line match should not reuse the old span"""
+        engine = ValidationRuleEngine()
+        engine.rules["backend"] = []
+        engine.add_rule(
+            ValidationRule("X1", "x", SWEAType.BACKEND, r"x[\s\S]*?y|c", "must_have", 0.5, "m")
+        )
+        previous = engine.validate_code("line1\nx\nq c\nzzz\nend\n", "backend")
+        assert previous.rule_results[0].line_number == 3
+
+        result = engine.validate_code("line1\nx\nq c\nzyz\nend\n", "backend", previous=previous)
+        assert result.rule_results[0].line_number == 2
+
+    def test_recent_scan_used_without_previous(self):
+        """Re-validating an artifact of the same SWEA type should reuse the recent scan"""
+        engine = ValidationRuleEngine()
+        engine.validate_code(PATCHABLE_API, "backend")
+        again = engine.validate_code(PATCHABLE_API, "backend")
+        assert again.reused_rule_count == len(engine.list_rules("backend"))
+        
+        rewritten = engine.validate_code("x = 1\n" * 5, "backend")
+        assert rewritten.reused_rule_count == 0  # Too different for an incremental scan
+
+        engine.validate_code(PATCHABLE_API, "backend")
+        engine.reset_incremental_state()
+        assert engine.validate_code(PATCHABLE_API, "backend").reused_rule_count == 0